@@ -0,0 +1,10 @@
+"""
+시뮬레이션 핫패스 벤치마크 - 시드 고정, 오프라인 실행
+
+실행: python -m bench  (프로젝트 폴더에서, --help로 옵션 확인)
+
+구성:
+- cases: 벤치마크 정의와 등록 (@benchmark로 새 엔진 추가)
+- runner: 측정, 결과 JSON 저장, 기준(baseline) 대비 회귀 판정
+- baseline.json: 저장된 기준 결과 (--save-baseline으로 갱신)
+"""
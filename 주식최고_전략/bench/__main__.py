@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""python -m bench 진입점 (프로젝트 폴더 밖에서 실행해도 modules/를 찾도록 경로 추가)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.runner import main
+
+sys.exit(main())
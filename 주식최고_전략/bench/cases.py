@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크 정의 - 시뮬레이션 핫패스별 시드 고정 마이크로/매크로 벤치마크
+각 벤치마크의 준비 함수는 (실행 함수, 처리량)을 반환하고 실행 함수만 시간을 잰다
+(처리량이 None이면 실행 함수의 반환값을 처리량으로 사용)
+새 엔진(벡터화/병렬)은 @benchmark로 등록하면 같은 명령으로 측정/비교된다
+"""
+
+import copy
+import io
+import os
+import random
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+from modules.path_config import PROJECT_DIR
+
+try:
+    import numpy  # noqa: F401 (설치 여부만 확인)
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BENCHMARKS = {}
+
+# 규모별 설정 (quick: 수 초 안에 전체 측정, full: 실제 실행에 가까운 규모)
+SCALES = {
+    'quick': {'strategies': 2000, 'days': 10, 'weeks': 2, 'engine_strategies': 200, 'engine_days': 30, 'fast_weeks': 60,
+              'cycles': 2},
+    'full': {'strategies': 10000, 'days': 30, 'weeks': 6, 'engine_strategies': 1000, 'engine_days': 135, 'fast_weeks': 300,
+             'cycles': 5}
+}
+
+# 벤치마크마다 사본을 만들어 쓰는 데이터 파일 (원본은 수정하지 않음)
+DATA_FILES = ("탈락전략_압축.json", "영구제외_전략_히스토리_압축.json")
+
+class Benchmark:
+    """등록된 벤치마크 하나"""
+
+    def __init__(self, name, kind, unit, description, prepare, requires_numpy=False):
+        self.name = name
+        self.kind = kind  # 'micro' 또는 'macro'
+        self.unit = unit
+        self.description = description
+        self.prepare = prepare
+        self.requires_numpy = requires_numpy
+
+def benchmark(name, kind, unit, description, requires_numpy=False):
+    """벤치마크 등록 데코레이터"""
+    def register(prepare):
+        BENCHMARKS[name] = Benchmark(name, kind, unit, description, prepare, requires_numpy)
+        return prepare
+    return register
+
+class BenchContext:
+    """벤치마크 공용 준비물 (데이터 사본 폴더, 시드 고정 분석기/시장 데이터/전략 표본)"""
+
+    def __init__(self, seed=1234, scale='quick', data_dir=None):
+        self.seed = seed
+        self.scale = scale
+        self.params = SCALES[scale]
+        self.source_dir = data_dir or PROJECT_DIR
+        self.work_dir = tempfile.mkdtemp(prefix='bench_')
+        self._copies = 0
+        self._cache = {}
+
+    def close(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def quiet(self):
+        """분석기/엔진의 진행 출력 버림"""
+        return redirect_stdout(io.StringIO())
+
+    def fresh_data_dir(self):
+        """원본 데이터 파일 사본 폴더 (반복마다 같은 입력으로 시작)"""
+        self._copies += 1
+        path = os.path.join(self.work_dir, f"data{self._copies}")
+        os.makedirs(path)
+        for name in DATA_FILES:
+            source = os.path.join(self.source_dir, name)
+            if os.path.exists(source):
+                shutil.copy2(source, path)
+        return path
+
+    def new_analyzer(self, weeks=None):
+        """시드 고정 분석기 (데이터 사본 폴더 사용, 시나리오 저장소 없음)"""
+        from 최적화_투자_분석 import 최적화투자분석
+
+        with self.quiet():
+            analyzer = 최적화투자분석(100, self.fresh_data_dir(), 시드=self.seed, 시나리오캐시=False)
+        analyzer.시뮬레이션주수 = weeks or self.params['weeks']
+        return analyzer
+
+    def analyzer(self):
+        """시장 데이터까지 생성한 공용 분석기 (처음 한 번만 생성)"""
+        if 'analyzer' not in self._cache:
+            analyzer = self.new_analyzer(weeks=max(self.params['weeks'], (self.params['days'] + 4) // 5))
+            with self.quiet():
+                analyzer.시장데이터_생성()
+                analyzer._가격경로_조회()
+            self._cache['analyzer'] = analyzer
+        return self._cache['analyzer']
+
+    def strategy_sample(self):
+        """탈락 제외 후 전략 조합에서 시드로 뽑은 표본 (원본, 실행마다 fresh_strategies로 복사)"""
+        if 'strategies' not in self._cache:
+            analyzer = self.analyzer()
+            with self.quiet():
+                combinations = analyzer._전략조합_생성(analyzer._탈락전략_로드())
+            count = min(self.params['strategies'], len(combinations))
+            self._cache['strategies'] = random.Random(self.seed).sample(combinations, count)
+        return self._cache['strategies']
+
+    def fresh_strategies(self):
+        return copy.deepcopy(self.strategy_sample())
+
+@benchmark('daily_simulation', 'micro', '전략-일', "_일일_시뮬레이션: 전략별 하루 7시간 매매")
+def _daily_simulation(ctx):
+    analyzer = ctx.analyzer()
+    strategies = ctx.fresh_strategies()
+    days = ctx.params['days']
+
+    def run():
+        for day in range(days):
+            for strategy in strategies:
+                analyzer._일일_시뮬레이션(strategy, day)
+    return run, len(strategies) * days
+
+@benchmark('batch_simulate_day', 'micro', '전략-일', "BatchSimulator.simulate_day: numpy 일괄 하루 매매", requires_numpy=True)
+def _batch_simulate_day(ctx):
+    analyzer = ctx.analyzer()
+    strategies = ctx.fresh_strategies()
+    engine = analyzer._배치엔진_생성(strategies)
+    price_path = analyzer._가격경로_조회()
+    days = ctx.params['days']
+
+    def run():
+        for day in range(days):
+            engine.simulate_day(strategies, day, price_path)
+    return run, len(strategies) * days
+
+@benchmark('engine_strategy_simulation', 'micro', '전략-일', "SimulationEngine.run_strategy_simulation: 모듈 엔진 단일 전략 전체 기간")
+def _engine_strategy_simulation(ctx):
+    from modules.simulation_engine import SimulationEngine
+    from modules.strategy_generator import StrategyGenerator
+
+    if 'engine' not in ctx._cache:
+        with ctx.quiet():
+            engine = SimulationEngine(seed=ctx.seed)
+            market_data = engine.generate_market_data(ctx.params['engine_days'], seed=ctx.seed)
+            strategies = StrategyGenerator().generate_sample_strategies(
+                ctx.params['engine_strategies'], rng=random.Random(ctx.seed))
+        ctx._cache['engine'] = (engine, market_data, strategies)
+    engine, market_data, strategies = ctx._cache['engine']
+
+    def run():
+        for strategy in strategies:
+            engine.run_strategy_simulation(strategy, market_data)
+    return run, len(strategies) * len(market_data['일간데이터'])
+
+@benchmark('fast_strategy_process', 'micro', '전략-주', "_fast_strategy_process: 300주 고속검증 주간 처리")
+def _fast_strategy_process(ctx):
+    if 'fast' not in ctx._cache:
+        analyzer = ctx.new_analyzer()
+        with ctx.quiet():
+            analyzer._calculate_300week_weekly(analyzer._generate_300week_data(random.Random(ctx.seed)))
+        ctx._cache['fast'] = analyzer
+    analyzer = ctx._cache['fast']
+    weeks = min(ctx.params['fast_weeks'], len(analyzer.주간데이터))
+
+    # _run_fast_strategy_simulation_300week와 같은 초기 상태
+    strategies = []
+    for template in ctx.strategy_sample():
+        strategy = template.copy()
+        strategy.update({'자본': 100000, '주식수': 0, '옐로우카드': {'개수': 0, '획득일차': []},
+                         '이동평균': [], '매수횟수': 0, '매도횟수': 0, '매수금액합': 0, '매수수량합': 0})
+        strategies.append(strategy)
+
+    def run():
+        for week in range(weeks):
+            change = analyzer.주간데이터[week]
+            for strategy in strategies:
+                analyzer._fast_strategy_process(strategy, week + 1, change)
+    return run, len(strategies) * weeks
+
+@benchmark('strategy_combinations', 'macro', '전략', "_전략조합_생성: 탈락 제외 전체 전략 조합 생성")
+def _strategy_combinations(ctx):
+    analyzer = ctx.new_analyzer()
+    with ctx.quiet():
+        dropouts = analyzer._탈락전략_로드()
+
+    def run():
+        return len(analyzer._전략조합_생성(dropouts))
+    return run, None
+
+@benchmark('analyzer_dropout_loader', 'macro', '기록', "_탈락전략_로드: 분석기 압축 탈락 기록 로드")
+def _analyzer_dropout_loader(ctx):
+    analyzer = ctx.new_analyzer()
+
+    def run():
+        loaded = analyzer._탈락전략_로드()
+        return len(loaded.get('영구제외', [])) + len(loaded.get('임시기록', {}))
+    return run, None
+
+@benchmark('data_manager_dropout_loader', 'macro', '기록', "DataManager.load_compressed_dropout_strategies")
+def _data_manager_dropout_loader(ctx):
+    from modules.data_manager import DataManager
+
+    manager = DataManager(ctx.fresh_data_dir())
+
+    def run():
+        loaded = manager.load_compressed_dropout_strategies()
+        return len(loaded['영구제외']) + len(loaded['임시기록'])
+    return run, None
+
+@benchmark('data_manager_binary_loader', 'macro', '기록', "DataManager(storage='binary'): .npz 압축 탈락 기록 로드",
+           requires_numpy=True)
+def _data_manager_binary_loader(ctx):
+    from modules.data_manager import DataManager
+
+    manager = DataManager(ctx.fresh_data_dir(), storage='binary')
+    for file_key in ('dropout_compressed', 'permanent_exclusion_compressed'):
+        manager.convert_json_to_binary(file_key)
+
+    def run():
+        loaded = manager.load_compressed_dropout_strategies()
+        return len(loaded['영구제외']) + len(loaded['임시기록'])
+    return run, None
+
+@benchmark('exclusion_loader', 'macro', '기록', "ExclusionManager.load_exclusion_data: 제외 키 캐시 생성")
+def _exclusion_loader(ctx):
+    from modules.data_manager import DataManager
+    from modules.exclusion_manager import ExclusionManager
+
+    manager = ExclusionManager(DataManager(ctx.fresh_data_dir()))
+
+    def run():
+        manager.load_exclusion_data()
+        stats = manager.get_exclusion_stats()
+        return stats.get('총완전제외', 0) + stats.get('총시장별제외', 0) + stats.get('총탈락기록', 0)
+    return run, None
+
+@benchmark('exclusion_mmap_loader', 'macro', '기록', "ExclusionManager(cache_mode='mmap'): 저장된 제외 캐시 매핑",
+           requires_numpy=True)
+def _exclusion_mmap_loader(ctx):
+    from modules.data_manager import DataManager
+    from modules.exclusion_manager import ExclusionManager
+
+    # 첫 로드가 제외캐시/를 만들고, 측정은 다음 실행처럼 새 관리자가 캐시를 매핑하는 시간
+    data_manager = DataManager(ctx.fresh_data_dir())
+    with ctx.quiet():
+        ExclusionManager(data_manager, cache_mode='mmap').load_exclusion_data()
+    manager = ExclusionManager(data_manager, cache_mode='mmap')
+
+    def run():
+        manager.load_exclusion_data()
+        stats = manager.get_exclusion_stats()
+        return stats.get('총완전제외', 0) + stats.get('총시장별제외', 0) + stats.get('총탈락기록', 0)
+    return run, None
+
+@benchmark('strategy_comparison', 'macro', '전략-일(투입)', "전략_비교_시뮬레이션: 전체 조합 일별 필터링 (탈락/옐로우카드 포함)")
+def _strategy_comparison(ctx):
+    analyzer = ctx.new_analyzer()
+    with ctx.quiet():
+        analyzer.시장데이터_생성()
+        count = len(analyzer._전략조합_생성(analyzer._탈락전략_로드()))
+
+    def run():
+        analyzer.전략_비교_시뮬레이션()
+    return run, count * analyzer.시뮬레이션주수 * 5
+
+@benchmark('parallel_cycles', 'macro', '전략-일(투입)', "_사이클_병렬_실행: 프로세스 풀 사이클 병렬 실행 (작업 수 = min(cpu, 사이클))")
+def _parallel_cycles(ctx):
+    analyzer = ctx.new_analyzer()
+    cycles = ctx.params['cycles']
+    analyzer.사이클_병렬작업수 = min(os.cpu_count() or 1, cycles)
+    with ctx.quiet():
+        count = len(analyzer._전략조합_생성(analyzer._탈락전략_로드()))
+
+    def run():
+        analyzer._사이클_병렬_실행(range(1, cycles + 1), ctx.seed, 히스토리저장=False)
+    return run, count * analyzer.시뮬레이션주수 * 5 * cycles
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크 실행기 - 측정, 결과 JSON 저장, 기준(baseline) 대비 회귀 판정
+처리율(초당 처리량)은 반복 중 가장 빠른 실행 기준, 기준보다 threshold 이상 느리면 회귀 (종료 코드 1)
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+
+from bench.cases import BENCHMARKS, SCALES, BenchContext, NUMPY_AVAILABLE
+from modules.progress_reporter import get_logger
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+RESULT_FILE = os.path.join(BENCH_DIR, "최근결과.json")
+
+def _environment(scale, seed, repeat):
+    """결과 비교용 실행 환경 정보"""
+    environment = {
+        '시각': time.strftime("%Y-%m-%d %H:%M:%S"),
+        '규모': scale,
+        '시드': seed,
+        '반복': repeat,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu수': os.cpu_count(),
+        'numpy': None
+    }
+    if NUMPY_AVAILABLE:
+        import numpy as np
+        environment['numpy'] = np.__version__
+    return environment
+
+def run_benchmarks(names=None, scale='quick', repeat=3, seed=1234, data_dir=None):
+    """벤치마크 실행 후 {'환경': ..., '결과': {이름: 측정값}} 반환"""
+    context = BenchContext(seed=seed, scale=scale, data_dir=data_dir)
+    logger = get_logger()
+    previous_level = logger.level
+    logger.setLevel(logging.WARNING)  # 일별 진행 로그 생략 (측정 대상 아님)
+
+    results = {}
+    try:
+        for name in names or list(BENCHMARKS):
+            bench = BENCHMARKS[name]
+            if bench.requires_numpy and not NUMPY_AVAILABLE:
+                results[name] = {'종류': bench.kind, '단위': bench.unit, '건너뜀': "numpy 없음"}
+                print(f"  {name:<30} 건너뜀 (numpy 없음)")
+                continue
+
+            seconds = []
+            amount = 0
+            for _ in range(repeat):
+                run, amount = bench.prepare(context)
+                with context.quiet():
+                    start = time.perf_counter()
+                    returned = run()
+                    seconds.append(time.perf_counter() - start)
+                if amount is None:
+                    amount = returned
+
+            best = min(seconds)
+            results[name] = {
+                '종류': bench.kind,
+                '단위': bench.unit,
+                '설명': bench.description,
+                '처리량': amount,
+                '최소초': round(best, 6),
+                '중앙초': round(statistics.median(seconds), 6),
+                '초당처리': round(amount / best, 2) if best > 0 else None
+            }
+            print(f"  {name:<30} {results[name]['초당처리']:>14,.0f} {bench.unit}/초  ({best:.3f}초, 처리량 {amount:,})")
+    finally:
+        logger.setLevel(previous_level)
+        context.close()
+
+    return {'환경': _environment(scale, seed, repeat), '결과': results}
+
+def compare_with_baseline(report, baseline, threshold=0.25):
+    """기준 대비 처리율 비교, [(이름, 기준, 현재, 비율, 판정)] 반환 (판정: 회귀/개선/유지/기준없음)"""
+    rows = []
+    baseline_results = baseline.get('결과', {}) if baseline else {}
+    for name, result in report['결과'].items():
+        current = result.get('초당처리')
+        reference = baseline_results.get(name, {}).get('초당처리')
+        if not current or not reference:
+            rows.append((name, reference, current, None, '기준없음'))
+            continue
+        ratio = current / reference
+        if ratio < 1 - threshold:
+            verdict = '회귀'
+        elif ratio > 1 + threshold:
+            verdict = '개선'
+        else:
+            verdict = '유지'
+        rows.append((name, reference, current, ratio, verdict))
+    return rows
+
+def _load_json(path):
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def parse_args(argv=None):
+    """명령행 인자 해석"""
+    parser = argparse.ArgumentParser(
+        prog="python -m bench",
+        description="시뮬레이션 핫패스 벤치마크 (시드 고정, 결과 JSON 저장, 기준 대비 회귀 판정)"
+    )
+    parser.add_argument('names', nargs='*', help="실행할 벤치마크 이름 (기본: 전체, --list로 확인)")
+    parser.add_argument('--list', action='store_true', help="등록된 벤치마크 목록")
+    parser.add_argument('--scale', choices=list(SCALES), default='quick', help="측정 규모 (기본 quick)")
+    parser.add_argument('--repeat', type=int, default=3, help="벤치마크별 반복 횟수, 최솟값 사용 (기본 3)")
+    parser.add_argument('--seed', type=int, default=1234, help="시장 데이터/전략 표본 시드 (기본 1234)")
+    parser.add_argument('--data-dir', help="탈락/영구제외 원본 파일 폴더 (기본: 프로젝트 폴더, 사본으로 측정)")
+    parser.add_argument('--output', default=RESULT_FILE, help="결과 JSON 파일 (기본 bench/최근결과.json)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="비교할 기준 JSON (기본 bench/baseline.json)")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="회귀 판정 기준: 처리율이 기준보다 이 비율 이상 낮으면 회귀 (기본 0.25 = 25%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 기준으로 저장")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """벤치마크 실행 → 결과 저장 → 기준 비교 (회귀가 있으면 종료 코드 1)"""
+    args = parse_args(argv)
+    if args.list:
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<30} [{bench.kind}] {bench.description}")
+        return 0
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        print(f"알 수 없는 벤치마크: {', '.join(unknown)} (--list로 확인)")
+        return 2
+
+    print(f"=== 벤치마크 ({args.scale}, 시드 {args.seed}, 반복 {args.repeat}) ===")
+    report = run_benchmarks(args.names or None, args.scale, max(1, args.repeat), args.seed, args.data_dir)
+    _save_json(args.output, report)
+    print(f"결과 저장: {args.output}")
+
+    if args.save_baseline:
+        _save_json(args.baseline, report)
+        print(f"기준 저장: {args.baseline}")
+        return 0
+
+    baseline = _load_json(args.baseline)
+    if baseline is None:
+        print("기준 파일이 없습니다 (--save-baseline으로 생성)")
+        return 0
+
+    기준환경 = baseline.get('환경', {})
+    if (기준환경.get('규모'), 기준환경.get('시드')) != (args.scale, args.seed):
+        print(f"주의: 기준은 규모 {기준환경.get('규모')}, 시드 {기준환경.get('시드')}로 측정됨")
+
+    print(f"\n=== 기준 대비 ({기준환경.get('시각', '?')}, 허용 {args.threshold:.0%}) ===")
+    regressions = 0
+    for name, reference, current, ratio, verdict in compare_with_baseline(report, baseline, args.threshold):
+        if ratio is None:
+            print(f"  {name:<30} {verdict}")
+            continue
+        print(f"  {name:<30} {reference:>14,.0f} → {current:>14,.0f}  ({ratio:.2f}배) {verdict}")
+        regressions += verdict == '회귀'
+
+    if regressions:
+        print(f"\n회귀 {regressions}건")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
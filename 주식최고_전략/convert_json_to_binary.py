@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배열 형태 JSON 파일을 열 단위 바이너리(.npz)로 변환하는 스크립트
+DataManager(base_path, storage='binary')가 같은 load_*/save_* 메서드로 읽고 쓴다
+(optimized_investment_system.py --storage binary로 실행하면 .npz 사용)
+"""
+
+import json
+import os
+import sys
+
+from modules.data_manager import DataManager, NUMPY_AVAILABLE
+from modules.path_config import resolve_paths
+
+# 'strategies' 행 배열 구조의 파일만 변환 대상
+변환대상 = [
+    'dropout_compressed',
+    'permanent_exclusion_compressed'
+]
+
+def convert_json_to_binary(기본경로=None):
+    """탈락전략/영구제외 압축 JSON을 .npz로 변환 (JSON 원본은 유지, 작업경로 설정시 작업경로 파일 변환)"""
+
+    if not NUMPY_AVAILABLE:
+        print("numpy가 설치되지 않아 변환할 수 없습니다. (pip install numpy)")
+        return
+
+    기본경로, 작업경로 = resolve_paths(기본경로)
+    관리자 = DataManager(기본경로, storage='binary', scratch_path=작업경로)
+
+    print("JSON → 바이너리(.npz) 변환 시작...")
+    for 파일키 in 변환대상:
+        원본파일 = 관리자.get_file_path(파일키)
+        if not os.path.exists(원본파일):
+            print(f"원본 파일이 없습니다: {원본파일}")
+            continue
+
+        try:
+            결과 = 관리자.convert_json_to_binary(파일키)
+            if not 결과:
+                continue
+
+            # 변환 결과 검증 (JSON과 동일하게 복원되는지)
+            with open(원본파일, 'r', encoding='utf-8') as f:
+                원본데이터 = json.load(f)
+            if 관리자.load_binary(파일키) != 원본데이터:
+                print(f"검증 실패, 바이너리 파일 삭제: {파일키}")
+                os.remove(관리자.get_binary_path(파일키))
+                continue
+
+            원본크기 = 결과[0] / 1024
+            압축크기 = 결과[1] / 1024
+            절약률 = (1 - 압축크기/원본크기) * 100 if 원본크기 > 0 else 0
+            print(f"   {os.path.basename(원본파일)} → {os.path.basename(관리자.get_binary_path(파일키))}")
+            print(f"   용량: {원본크기:.1f}KB → {압축크기:.1f}KB ({절약률:.1f}% 절약)")
+
+        except Exception as e:
+            print(f"변환 실패 [{파일키}]: {e}")
+
+    print("바이너리 변환 완료! (optimized_investment_system.py --storage binary로 실행하면 .npz 사용)")
+
+if __name__ == "__main__":
+    convert_json_to_binary(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -7,12 +7,15 @@
 
 import json
 import os
+import sys
 from datetime import datetime
 
-def convert_permanent_exclusion_to_array():
-    """영구제외 전략 히스토리를 배열 형태로 변환"""
+from modules.path_config import resolve_paths
+
+def convert_permanent_exclusion_to_array(기본경로=None):
+    """영구제외 전략 히스토리를 배열 형태로 변환 (경로: 인자 > 환경변수 > 경로설정.json > 프로젝트 폴더)"""
     
-    기본경로 = r"C:\Users\ksj\OneDrive\바탕 화면\gemini\제작파일\주식최고_전략"
+    기본경로, _ = resolve_paths(기본경로)
     원본파일 = os.path.join(기본경로, "영구제외_전략_히스토리.json")
     압축파일 = os.path.join(기본경로, "영구제외_전략_히스토리_압축.json")
     백업폴더 = os.path.join(기본경로, "백업")
@@ -108,4 +111,4 @@ def convert_permanent_exclusion_to_array():
         return
 
 if __name__ == "__main__":
-    convert_permanent_exclusion_to_array()
\ No newline at end of file
+    convert_permanent_exclusion_to_array(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file
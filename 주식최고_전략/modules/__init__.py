@@ -3,10 +3,18 @@
 주식 투자 전략 최적화 시스템 - 모듈화된 구조
 
 모듈 구성:
-- data_manager: JSON 데이터 관리 (압축/로드/저장)
+- data_manager: JSON 데이터 관리 (압축/로드/저장, 선택: .npz 열 단위 바이너리)
 - strategy_generator: 전략 조합 생성
 - strategy_attributes: 전략 속성 시스템 (고유 식별자 포함)
-- exclusion_manager: 제외/탈락 관리 (옐로우카드 포함)
+- exclusion_manager: 제외/탈락 관리 (옐로우카드 포함, 선택: 메모리 매핑 ID 비트맵 캐시)
 - simulation_engine: 시뮬레이션 실행
 - analysis_reporter: 결과 분석 및 리포팅
+- price_path: 공유 가격경로 (시간별 가격/시가/종가/이동평균)
+- batch_simulator: numpy 배열 기반 전략 일괄 시뮬레이션
+- progress_reporter: logging 기반 실행 로그 (레벨별 출력, 시간 간격 진행상황)
+- path_config: 데이터/작업(scratch) 폴더 경로 설정 (환경변수, 명령행, 경로설정.json)
+- scenario_store: 생성한 시장 시나리오 배열 저장/재사용 (시드, 생성기, 인자 키)
+- checkpoint_store: 긴 실행(5사이클/300주) 체크포인트 저장/재개
+- run_profiler: 구간별 시간/카운터 계측과 실행 프로파일 JSON 저장
+- top_k: 상위 K개 추적 (크기 제한 힙, 전략 키로 결정적 동점 처리)
 """
\ No newline at end of file
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배치 시뮬레이션 모듈 - NumPy 배열 기반 전략 일괄 실행
+생존 전략 전체의 상태(자본, 주식수, 매수가격, 최고가격, 절반매도완료)를 배열로 보관하고
+_전략_매매_실행의 손절/매수/매도 규칙을 시간 단위 마스크 연산으로 처리한다
+(고무줄 매수/매도처럼 배열화하지 않은 전략은 기존 단일 전략 시뮬레이션으로 처리)
+"""
+
+import numpy as np
+
+# 배열로 처리하는 매수기준 / 매도전략
+지원_매수기준 = {'1', '2', '3', '4', '5', '6', '7', '8', '9'}
+지원_매도전략 = {'1', '2', '3'}
+
+# 매수기준별 필요한 전략 매개변수
+매수기준_매개변수 = {
+    '1': '매수하락률', '2': '매수하락률', '3': '매수하락률', '4': '매수하락률', '5': '매수하락률',
+    '6': '매수상승률', '7': '매수상승률', '8': '연속횟수', '9': '모멘텀기준'
+}
+
+def _숫자여부(값):
+    return isinstance(값, (int, float)) and not isinstance(값, bool)
+
+class BatchSimulator:
+    """전략 상태 배열 기반 일괄 시뮬레이터 (결과는 _일일_시뮬레이션과 동일)"""
+
+    def __init__(self, strategies, cost_settings, initial_price, fallback, hours_per_day=7, final_day=134):
+        self.strategies = strategies
+        self.cost_settings = cost_settings  # 분석기의 거래비용설정 (참조)
+        self.initial_price = initial_price
+        self.fallback = fallback  # 배열화하지 않은 전략용 단일 시뮬레이션 함수
+        self.hours_per_day = hours_per_day
+
+        self._position = {id(전략): i for i, 전략 in enumerate(strategies)}
+        self._last_rows = None  # 직전 simulate_day 입력 순서의 배열 행 번호
+        self.supported = np.array([self._지원여부(전략) for 전략 in strategies], dtype=bool)
+
+        # 동적 상태
+        self.cash = self._열(strategies, '자본')
+        self.shares = self._열(strategies, '주식수')
+        self.buy_price = self._열(strategies, '매수가격')
+        self.peak = self._열(strategies, '최고가격')
+        self.half_sold = np.array([bool(전략.get('절반매도완료', False)) for 전략 in strategies], dtype=bool)
+
+        # 정적 매개변수
+        self.criterion = np.array([int(전략['매수기준']) if 지원 else 0
+                                   for 전략, 지원 in zip(strategies, self.supported)], dtype=np.int64)
+        self.sell_kind = np.array([int(전략['매도전략']) if 지원 else 0
+                                   for 전략, 지원 in zip(strategies, self.supported)], dtype=np.int64)
+        self.neg_drop = -self._열(strategies, '매수하락률')
+        self.rise = self._열(strategies, '매수상승률')
+        self.streak = self._열(strategies, '연속횟수')
+        self.momentum = self._열(strategies, '모멘텀기준')
+        self.qty = self._열(strategies, '매수수량')
+        self.percent_buy = np.array([전략.get('구매방식') == '1' for 전략 in strategies], dtype=bool)
+        self.stop_line = self._열(strategies, '손절라인')
+        self.profit_line = self._열(strategies, '수익라인')
+        # 기간매도일 (매도기간이 없으면 마지막 날 final_day)
+        self.sell_day = np.array([전략.get('매도기간', final_day) if _숫자여부(전략.get('매도기간', final_day)) else -1
+                                  for 전략 in strategies], dtype=np.float64)
+
+    # compact에서 함께 압축하는 전략별 배열
+    _상태배열 = ('supported', 'cash', 'shares', 'buy_price', 'peak', 'half_sold', 'criterion', 'sell_kind',
+                'neg_drop', 'rise', 'streak', 'momentum', 'qty', 'percent_buy', 'stop_line', 'profit_line', 'sell_day')
+
+    def compact(self, keep, strategies):
+        """직전 simulate_day 입력 순서의 생존 여부(keep)로 배열을 생존 전략만 남기고 압축
+
+        strategies는 같은 순서의 생존 전략 목록이며, 다음 simulate_day에 이 목록을 그대로 넘기면
+        전략별 위치 조회 없이 배열 전체를 사용한다.
+        """
+        keep_rows = self._last_rows[np.asarray(keep, dtype=bool)]
+        for 이름 in self._상태배열:
+            setattr(self, 이름, getattr(self, 이름)[keep_rows])
+        self.strategies = strategies
+        self._position = None  # 다른 목록이 들어오면 그때 다시 생성
+        self._last_rows = None
+
+    def _행번호(self, strategies):
+        """전략 목록의 배열 행 번호 (압축된 목록 그대로면 0..n-1)"""
+        if strategies is self.strategies:
+            return np.arange(len(strategies), dtype=np.int64)
+        if self._position is None:
+            self._position = {id(전략): i for i, 전략 in enumerate(self.strategies)}
+        return np.array([self._position[id(전략)] for 전략 in strategies], dtype=np.int64)
+
+    @staticmethod
+    def _열(strategies, key):
+        """전략 목록의 숫자 속성을 배열로 변환 (없거나 숫자가 아니면 NaN)"""
+        return np.array([float(전략[key]) if _숫자여부(전략.get(key)) else np.nan
+                         for 전략 in strategies], dtype=np.float64)
+
+    @staticmethod
+    def _지원여부(전략):
+        """배열 연산으로 처리 가능한 전략인지 확인"""
+        if 전략.get('고무줄매수', False):
+            return False
+        기준 = 전략.get('매수기준')
+        if 기준 not in 지원_매수기준 or 전략.get('매도전략') not in 지원_매도전략:
+            return False
+        필수키 = ['자본', '주식수', '매수가격', '최고가격', '매수수량', '손절라인', '수익라인', 매수기준_매개변수[기준]]
+        return all(_숫자여부(전략.get(키)) for 키 in 필수키)
+
+    def _매수비용포함(self, 금액):
+        """거래비용을 포함한 실제 매수 필요금액 (_실제매수가_계산과 같은 연산 순서)"""
+        설정 = self.cost_settings
+        if not 설정['거래비용반영']:
+            return 금액
+        return 금액 + (금액 * 설정['매매수수료'] + 금액 * 설정['슬리피지'])
+
+    def _매도비용차감(self, 금액):
+        """거래비용을 차감한 실제 매도 수령금액 (_실제매도금_계산과 같은 연산 순서)"""
+        설정 = self.cost_settings
+        if not 설정['거래비용반영']:
+            return 금액
+        비용 = 금액 * 설정['매매수수료'] + 금액 * 설정['증권거래세'] + 금액 * 설정['농특세'] + 금액 * 설정['슬리피지']
+        return 금액 - 비용
+
+    @staticmethod
+    def _주식수_값(값, 절반매도):
+        """기존 dict 상태와 같은 타입으로 주식수 반환 (분할매도 후에만 실수)"""
+        return float(값) if 절반매도 else int(값)
+
+    def _일별_신호(self, rows, day, price_path):
+        """하루 동안 고정된 매수 조건 (연속상승/모멘텀) 계산"""
+        criterion = self.criterion[rows]
+        fixed = np.zeros(len(rows), dtype=bool)
+
+        연속행 = criterion == 8
+        if 연속행.any():
+            streak = self.streak[rows]
+            for 횟수 in np.unique(streak[연속행]).tolist():
+                k = int(횟수)
+                if price_path.history_length(day) >= 횟수:
+                    가격들 = price_path.recent_prices(day, k)
+                    최근가격들 = 가격들[-k:]
+                    연속상승 = len(가격들) >= k and all(최근가격들[i] > 최근가격들[i-1] for i in range(1, len(최근가격들)))
+                    if 연속상승:
+                        fixed |= 연속행 & (streak == 횟수)
+
+        모멘텀행 = criterion == 9
+        if 모멘텀행.any() and price_path.history_length(day) >= 5:
+            가격들 = price_path.recent_prices(day, 5)
+            모멘텀 = ((가격들[-1] - 가격들[0]) / 가격들[0]) * 100 if len(가격들) >= 2 else 0
+            fixed |= 모멘텀행 & (모멘텀 >= self.momentum[rows])
+
+        return fixed
+
+    def _매수신호(self, rows, criterion, price, prev_close, day_open, averages, day):
+        """시간별 매수 신호 (_전략_매매_실행의 매수기준 1~7)"""
+        neg_drop = self.neg_drop[rows]
+        signal = np.zeros(len(rows), dtype=bool)
+
+        시가대비 = ((price - day_open) / day_open) * 100
+        signal |= (criterion == 1) & (시가대비 <= neg_drop)
+        signal |= (criterion == 6) & (시가대비 >= self.rise[rows])
+
+        기준가 = prev_close if day > 0 else self.initial_price
+        전일대비 = ((price - 기준가) / 기준가) * 100
+        signal |= (criterion == 2) & (전일대비 <= neg_drop)
+
+        for 기준, 평균가 in ((3, averages[20]), (4, averages[60]), (5, averages[120])):
+            if 평균가 is not None:
+                평균대비 = ((price - 평균가) / 평균가) * 100
+                signal |= (criterion == 기준) & (평균대비 <= neg_drop)
+
+        if averages[20] is not None:
+            평균대비 = ((price - averages[20]) / averages[20]) * 100
+            signal |= (criterion == 7) & (평균대비 >= self.rise[rows])
+
+        return signal
+
+    def simulate_day(self, strategies, day, price_path):
+        """생존 전략 전체의 하루 시뮬레이션 (_일일_시뮬레이션 결과 목록과 동일한 형식)"""
+        all_rows = self._행번호(strategies)
+        self._last_rows = all_rows
+        batch_mask = self.supported[all_rows]
+        rows = all_rows[batch_mask]
+        batch_strategies = [전략 for 전략, 지원 in zip(strategies, batch_mask.tolist()) if 지원]
+
+        cash = self.cash[rows]
+        shares = self.shares[rows]
+        buy_price = self.buy_price[rows]
+        peak = self.peak[rows]
+        half_sold = self.half_sold[rows]
+
+        criterion = self.criterion[rows]
+        sell_kind = self.sell_kind[rows]
+        qty = self.qty[rows]
+        percent_buy = self.percent_buy[rows]
+        stop_line = self.stop_line[rows]
+        profit_line = self.profit_line[rows]
+        period_sell_day = self.sell_day[rows] == day
+
+        prev_close = price_path.last_close(day)
+        day_open = price_path.day_open(day)
+        averages = {창: price_path.moving_average(day, 창) for 창 in (20, 60, 120)}
+        fixed_signal = self._일별_신호(rows, day, price_path)
+
+        price = prev_close
+        start_eval = cash + shares * prev_close
+        trade_counts = np.zeros(len(rows), dtype=np.int64)
+        changed = np.zeros(len(rows), dtype=bool)
+
+        for hour in range(self.hours_per_day):
+            시간가격 = price_path.hour_price(day, hour)
+            if 시간가격 is None:
+                break
+            price = 시간가격
+            if hour == 0:  # 첫 번째 시간은 매수/매도 금지
+                continue
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # 1. 손절 (발생한 전략은 이번 시간 매수/매도 없음)
+                holding = (shares > 0) & (buy_price > 0)
+                손실률 = ((price - buy_price) / buy_price) * 100
+                stopped = holding & (손실률 <= stop_line)
+                if stopped.any():
+                    for i in np.flatnonzero(stopped).tolist():
+                        batch_strategies[i]['거래내역'].append(
+                            ('손절', day+1, hour+1, price, self._주식수_값(shares[i], half_sold[i])))
+                    cash[stopped] += self._매도비용차감(price * shares[stopped])
+                    shares[stopped] = 0
+                    buy_price[stopped] = 0
+                    half_sold[stopped] = False
+
+                # 2. 매수
+                buyable = ~stopped & (cash > price) & (shares == 0)
+                buyable &= fixed_signal | self._매수신호(rows, criterion, price, prev_close, day_open, averages, day)
+                bought = np.zeros(len(rows), dtype=bool)
+                if buyable.any():
+                    목표매수금액 = np.where(percent_buy, cash * qty, np.minimum(price * qty, cash))
+                    매수주식 = np.trunc(목표매수금액 / price)
+                    실제필요자본 = self._매수비용포함(price * 매수주식)
+                    bought = buyable & (실제필요자본 <= cash)
+                    if bought.any():
+                        if (매수주식[bought] == 0).any():
+                            raise ZeroDivisionError("float division by zero")
+                        cash[bought] -= 실제필요자본[bought]
+                        shares[bought] = 매수주식[bought]
+                        buy_price[bought] = (매수주식[bought] * price) / 매수주식[bought]
+                        for i in np.flatnonzero(bought).tolist():
+                            batch_strategies[i]['거래내역'].append(('매수', day+1, hour+1, price, int(매수주식[i])))
+
+                # 3. 매도
+                holding = ~stopped & (shares > 0) & (buy_price > 0)
+                수익률 = ((price - buy_price) / buy_price) * 100
+                new_peak = holding & (price > peak)
+                peak[new_peak] = price
+                changed |= new_peak
+
+                half_sell = holding & (sell_kind == 1) & ~half_sold & (수익률 >= profit_line)
+                full_sell = holding & (sell_kind == 2) & (수익률 >= profit_line)
+                period_sell = holding & (sell_kind == 3) & period_sell_day
+
+                if half_sell.any():
+                    매도주식 = shares * 0.5
+                    for i in np.flatnonzero(half_sell).tolist():
+                        batch_strategies[i]['거래내역'].append(('절반매도', day+1, hour+1, price, float(매도주식[i])))
+                    shares[half_sell] -= 매도주식[half_sell]
+                    cash[half_sell] += self._매도비용차감(price * 매도주식[half_sell])
+                    half_sold[half_sell] = True
+
+                if full_sell.any():
+                    for i in np.flatnonzero(full_sell).tolist():
+                        batch_strategies[i]['거래내역'].append(
+                            ('전량매도', day+1, hour+1, price, self._주식수_값(shares[i], half_sold[i])))
+                    cash[full_sell] += self._매도비용차감(price * shares[full_sell])
+                    shares[full_sell] = 0
+                    buy_price[full_sell] = 0
+                    half_sold[full_sell] = False
+                    peak[full_sell] = 0
+
+                if period_sell.any():
+                    for i in np.flatnonzero(period_sell).tolist():
+                        batch_strategies[i]['거래내역'].append(
+                            ('기간매도', day+1, hour+1, price, self._주식수_값(shares[i], half_sold[i])))
+                    cash[period_sell] += self._매도비용차감(price * shares[period_sell])
+                    shares[period_sell] = 0
+
+            traded = stopped | bought | half_sell | full_sell | period_sell
+            trade_counts += traded
+            changed |= traded
+
+        # 배열 상태 저장 및 변경된 전략만 dict에 반영
+        self.cash[rows] = cash
+        self.shares[rows] = shares
+        self.buy_price[rows] = buy_price
+        self.peak[rows] = peak
+        self.half_sold[rows] = half_sold
+        for i in np.flatnonzero(changed).tolist():
+            전략 = batch_strategies[i]
+            전략['자본'] = float(cash[i])
+            전략['주식수'] = self._주식수_값(shares[i], half_sold[i]) if shares[i] != 0 else 0
+            전략['매수가격'] = float(buy_price[i]) if buy_price[i] != 0 else 0
+            전략['최고가격'] = float(peak[i]) if peak[i] != 0 else 0
+            전략['절반매도완료'] = bool(half_sold[i])
+
+        final_eval = cash + shares * price
+        with np.errstate(divide='ignore', invalid='ignore'):
+            daily_return = np.where(start_eval > 0, ((final_eval - start_eval) / start_eval) * 100, 0)
+        total_return = ((final_eval - 100000) / 100000) * 100
+
+        # 결과 목록 (입력 순서 유지, 배열화하지 않은 전략은 단일 시뮬레이션)
+        총수익률 = total_return.tolist()
+        일수익률 = daily_return.tolist()
+        평가자산 = final_eval.tolist()
+        거래횟수 = trade_counts.tolist()
+        결과목록 = []
+        b = 0
+        for 전략, 지원 in zip(strategies, batch_mask.tolist()):
+            if 지원:
+                전략['경로일차'] = day + 1
+                결과목록.append({
+                    '전략': 전략,
+                    '수익률': 총수익률[b],
+                    '일수익률': 일수익률[b],
+                    '평가자산': 평가자산[b],
+                    '거래횟수': 거래횟수[b],
+                    '현재가격': price
+                })
+                b += 1
+            else:
+                결과목록.append(self.fallback(전략, day))
+        return 결과목록
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+체크포인트 모듈 - 긴 실행(5사이클 누적, 300주 고속검증)의 중간 상태 저장/복원
+상태 dict 하나를 pickle 바이너리 파일 하나에 원자적으로 저장한다 (전략 dict 공유 참조 유지)
+시장 데이터는 시드로 다시 만들 수 있으므로 시드와 진행 위치, 생존전략, 누적 통계만 저장
+300주 단계의 수집 전략처럼 단계 동안 바뀌지 않는 큰 상태는 단계 파일(.stage)에 한 번만 저장
+체크포인트 파일은 pickle이므로 이 프로그램이 직접 쓴 파일만 불러올 것
+"""
+
+import os
+import pickle
+import time
+
+CHECKPOINT_FILE_NAME = "실행_체크포인트.pkl"
+CHECKPOINT_VERSION = 2
+
+class CheckpointStore:
+    """실행 상태 체크포인트 저장/로드 전담 모듈"""
+
+    def __init__(self, path):
+        self.path = path
+        self.saves = 0
+        self.last_seconds = 0.0
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    @property
+    def stage_path(self):
+        """단계 시작시 한 번 저장하는 큰 고정 상태 파일 (진행 체크포인트마다 다시 쓰지 않음)"""
+        return self.path + '.stage'
+
+    def save(self, state):
+        """상태 저장 (임시 파일에 쓴 뒤 교체, 중단되어도 이전 체크포인트 유지), 걸린 초 반환"""
+        start = time.perf_counter()
+        self._write(self.path, state)
+
+        self.saves += 1
+        self.last_seconds = time.perf_counter() - start
+        return self.last_seconds
+
+    def save_stage(self, state):
+        """단계 고정 상태 저장 (진행 체크포인트보다 먼저 저장), 걸린 초 반환"""
+        start = time.perf_counter()
+        self._write(self.stage_path, state)
+        return time.perf_counter() - start
+
+    def load(self):
+        """저장된 상태 반환 (없거나 버전이 다르거나 읽을 수 없으면 None)"""
+        return self._read(self.path)
+
+    def load_stage(self):
+        """단계 고정 상태 반환 (없거나 버전이 다르거나 읽을 수 없으면 None)"""
+        return self._read(self.stage_path)
+
+    def clear(self):
+        """실행 완료 후 체크포인트 삭제 (단계 고정 상태 포함)"""
+        for path in (self.path, self.path + '.tmp', self.stage_path, self.stage_path + '.tmp'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write(self, path, state):
+        payload = dict(state, 버전=CHECKPOINT_VERSION, 저장시각=time.strftime("%Y-%m-%d %H:%M:%S"))
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    def _read(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"체크포인트 로드 실패 ({path}): {e}")
+            return None
+        if not isinstance(state, dict) or state.get('버전') != CHECKPOINT_VERSION:
+            print(f"체크포인트 버전 불일치, 무시: {path}")
+            return None
+        return state
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 데이터 관리자 모듈 - JSON 압축/로드/저장 전담
-모든 JSON 파일 관련 작업 처리
+모든 JSON 파일 관련 작업 처리 (선택: numpy 열 단위 바이너리 .npz 저장)
 """
 
 import json
@@ -10,19 +10,31 @@ import os
 import shutil
 from datetime import datetime
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 class DataManager:
     """JSON 데이터 압축, 로드, 저장을 전담하는 모듈"""
     
-    def __init__(self, base_path):
+    def __init__(self, base_path, storage='json', scratch_path=None):
         self.base_path = base_path
+        # 잦은 쓰기 파일(탈락/영구제외)과 캐시를 두는 작업 폴더 (없으면 base_path)
+        self.scratch_path = scratch_path
+        work_path = scratch_path or base_path
+        
+        # 저장 형식: 'json' 또는 'binary' (numpy 있을 때만 .npz 사용, 없으면 json)
+        self.storage = storage if (storage != 'binary' or NUMPY_AVAILABLE) else 'json'
         
         # 파일 경로 설정
         self.files = {
-            'dropout_strategies': os.path.join(base_path, "탈락전략.json"),
-            'dropout_compressed': os.path.join(base_path, "탈락전략_압축.json"),
+            'dropout_strategies': os.path.join(work_path, "탈락전략.json"),
+            'dropout_compressed': os.path.join(work_path, "탈락전략_압축.json"),
             'best_strategies': os.path.join(base_path, "최고전략_히스토리.json"),
-            'permanent_exclusion': os.path.join(base_path, "영구제외_전략_히스토리.json"),
-            'permanent_exclusion_compressed': os.path.join(base_path, "영구제외_전략_히스토리_압축.json"),
+            'permanent_exclusion': os.path.join(work_path, "영구제외_전략_히스토리.json"),
+            'permanent_exclusion_compressed': os.path.join(work_path, "영구제외_전략_히스토리_압축.json"),
             'portfolio': os.path.join(base_path, "전략포트폴리오.json"),
             'comprehensive_ranking': os.path.join(base_path, "종합전략랭킹.json"),
             'comprehensive_ranking_backup': os.path.join(base_path, "종합전략랭킹_백업.json"),
@@ -30,8 +42,19 @@ class DataManager:
             'portfolio_composition': os.path.join(base_path, "포트폴리오_구성.json")
         }
     
+    @property
+    def work_path(self):
+        """잦은 쓰기 파일/캐시 폴더 (작업 폴더가 없으면 기본 폴더)"""
+        return self.scratch_path or self.base_path
+    
     def load_json_safe(self, file_key, default=None):
-        """안전한 JSON 파일 로드"""
+        """안전한 JSON 파일 로드 (바이너리 저장 형식이면 최신 .npz 우선)"""
+        if self._binary_is_current(file_key):
+            try:
+                return self.load_binary(file_key)
+            except Exception as e:
+                print(f"바이너리 로드 실패 ({file_key}), JSON 사용: {e}")
+        
         file_path = self.files.get(file_key)
         if not file_path or not os.path.exists(file_path):
             return default if default is not None else []
@@ -44,11 +67,22 @@ class DataManager:
             return default if default is not None else []
     
     def save_json_safe(self, file_key, data, backup=True):
-        """안전한 JSON 파일 저장"""
+        """안전한 JSON 파일 저장 (바이너리 저장 형식이면 변환 가능한 데이터는 .npz로 저장)"""
         file_path = self.files.get(file_key)
         if not file_path:
             raise ValueError(f"알 수 없는 파일 키: {file_key}")
         
+        if self.storage == 'binary':
+            arrays = self._encode_binary(data)
+            if arrays is not None:
+                return self._save_binary_arrays(file_key, arrays, backup)
+        
+        return self._write_json_file(file_key, data, backup)
+    
+    def _write_json_file(self, file_key, data, backup=True):
+        """JSON 파일 저장 (백업 후 임시 파일에 쓰고 원자적 이동)"""
+        file_path = self.files[file_key]
+        
         # 백업 생성
         if backup and os.path.exists(file_path):
             backup_path = f"{file_path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -76,17 +110,16 @@ class DataManager:
         """압축된 탈락전략 로드"""
         compressed_file = self.files['dropout_compressed']
         
-        if os.path.exists(compressed_file):
-            return self._load_compressed_format(compressed_file)
+        if os.path.exists(compressed_file) or self._binary_is_current('dropout_compressed'):
+            return self._load_compressed_format('dropout_compressed')
         else:
             # 압축 파일이 없으면 원본에서 변환
             return self._convert_from_original_dropout()
     
-    def _load_compressed_format(self, file_path):
+    def _load_compressed_format(self, file_key):
         """압축된 형태의 탈락전략 파일 로드"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                compressed_data = json.load(f)
+            compressed_data = self._load_data_file(file_key)
             
             영구제외_전략들 = set()
             임시기록_전략들 = {}
@@ -139,10 +172,9 @@ class DataManager:
         """영구제외 전략 로드 (압축 형태 우선)"""
         compressed_file = self.files['permanent_exclusion_compressed']
         
-        if os.path.exists(compressed_file):
+        if os.path.exists(compressed_file) or self._binary_is_current('permanent_exclusion_compressed'):
             try:
-                with open(compressed_file, 'r', encoding='utf-8') as f:
-                    compressed_data = json.load(f)
+                compressed_data = self._load_data_file('permanent_exclusion_compressed')
                 
                 시장별제외_전략들 = {}
                 완전제외_전략들 = set()
@@ -248,6 +280,252 @@ class DataManager:
         """파일 경로 반환"""
         return self.files.get(file_key)
     
+    def get_binary_path(self, file_key):
+        """바이너리(.npz) 파일 경로 반환"""
+        file_path = self.files.get(file_key)
+        if not file_path:
+            return None
+        return os.path.splitext(file_path)[0] + '.npz'
+    
+    def _binary_is_current(self, file_key):
+        """바이너리 저장 형식이고 .npz가 JSON보다 최신(또는 JSON 없음)인지 확인"""
+        if self.storage != 'binary':
+            return False
+        binary_path = self.get_binary_path(file_key)
+        if not binary_path or not os.path.exists(binary_path):
+            return False
+        
+        # 다른 프로그램이 JSON을 나중에 갱신했으면 JSON이 기준
+        file_path = self.files[file_key]
+        return not os.path.exists(file_path) or os.path.getmtime(binary_path) >= os.path.getmtime(file_path)
+    
+    def _load_data_file(self, file_key):
+        """데이터 파일 로드 (최신 .npz 또는 JSON, 실패시 예외)"""
+        if self._binary_is_current(file_key):
+            return self.load_binary(file_key)
+        with open(self.files[file_key], 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def load_binary(self, file_key):
+        """.npz 파일을 JSON과 같은 형태의 데이터로 로드"""
+        with np.load(self.get_binary_path(file_key), allow_pickle=False) as arrays:
+            return self._decode_binary(arrays)
+    
+    def _save_binary_arrays(self, file_key, arrays, backup=True):
+        """열 배열을 .npz로 저장 (임시 파일 후 원자적 교체)"""
+        binary_path = self.get_binary_path(file_key)
+        
+        # 백업 생성
+        if backup and os.path.exists(binary_path):
+            backup_path = f"{binary_path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            shutil.copy2(binary_path, backup_path)
+        
+        temp_path = f"{binary_path}.temp"
+        try:
+            with open(temp_path, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(temp_path, binary_path)
+            return True
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            print(f"바이너리 저장 실패 ({file_key}): {e}")
+            return False
+    
+    def sync_json_mirrors(self):
+        """바이너리 저장 형식: JSON보다 새 .npz를 JSON에도 반영, 반영 수 반환
+        
+        .npz만 갱신하면 JSON만 읽는 프로그램(최적화_투자_분석.py)이 이전 기록을 보므로 실행 끝에 한 번 맞춘다.
+        반영한 JSON의 수정 시각은 .npz와 같게 두어 다음 로드도 .npz를 쓴다.
+        """
+        if self.storage != 'binary':
+            return 0
+        
+        synced = 0
+        for file_key, file_path in self.files.items():
+            binary_path = self.get_binary_path(file_key)
+            if not os.path.exists(binary_path):
+                continue
+            binary_mtime = os.path.getmtime(binary_path)
+            if os.path.exists(file_path) and os.path.getmtime(file_path) >= binary_mtime:
+                continue
+            if self._write_json_file(file_key, self.load_binary(file_key), backup=False):
+                os.utime(file_path, (binary_mtime, binary_mtime))
+                synced += 1
+        return synced
+    
+    def convert_json_to_binary(self, file_key):
+        """기존 JSON 파일을 .npz로 변환 (JSON 파일은 유지), (JSON 크기, .npz 크기) 반환"""
+        if not NUMPY_AVAILABLE:
+            print("numpy가 설치되지 않아 바이너리 변환을 할 수 없습니다.")
+            return None
+        
+        file_path = self.files.get(file_key)
+        if not file_path or not os.path.exists(file_path):
+            return None
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        arrays = self._encode_binary(data)
+        if arrays is None:
+            print(f"열 단위 변환을 지원하지 않는 구조입니다 ({file_key})")
+            return None
+        
+        if not self._save_binary_arrays(file_key, arrays, backup=False):
+            return None
+        return os.path.getsize(file_path), os.path.getsize(self.get_binary_path(file_key))
+    
+    def _encode_binary(self, data):
+        """'strategies' 행 배열을 열 단위 고정폭 배열로 변환 (지원하지 않는 구조는 None)
+        
+        각 열은 최소 크기 정수, 10진 배율 정수(실수), 범주 코드(반복 문자열), 패딩 배열(정수 목록)로
+        저장하고 나머지 키는 meta JSON 문자열로 저장한다.
+        """
+        if not NUMPY_AVAILABLE or not isinstance(data, dict):
+            return None
+        rows = data.get('strategies')
+        if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+            return None
+        widths = {len(row) for row in rows}
+        if len(widths) > 1:
+            return None
+        width = widths.pop() if widths else 0
+        
+        arrays = {}
+        columns = []
+        for index in range(width):
+            name = f"c{index}"
+            column_arrays, spec = self._encode_column([row[index] for row in rows], name)
+            arrays.update(column_arrays)
+            columns.append(spec)
+        
+        meta = {
+            'order': list(data.keys()),
+            'data': {key: value for key, value in data.items() if key != 'strategies'},
+            'rows': len(rows),
+            'columns': columns
+        }
+        arrays['meta'] = np.array(json.dumps(meta, ensure_ascii=False))
+        return arrays
+    
+    def _encode_column(self, values, name):
+        """열 하나를 배열들과 복원 정보로 변환"""
+        if values and all(isinstance(v, bool) for v in values):
+            return {name: np.array(values, dtype='?')}, {'name': name, 'kind': 'bool'}
+        
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            is_int = [isinstance(v, int) for v in values]
+            scale = self._decimal_scale(values)
+            if scale is not None:
+                scaled = [round(v * 10 ** scale) for v in values]
+                arrays = {name: np.array(scaled, dtype=self._narrow_int_dtype(scaled))}
+            else:
+                arrays = {name: np.array(values, dtype='f8')}
+            mixed = not all(is_int) and any(is_int)
+            if mixed:
+                arrays[f"{name}_int"] = np.array(is_int, dtype='?')
+            return arrays, {'name': name, 'kind': 'number', 'scale': scale,
+                            'mixed': mixed, 'int': all(is_int)}
+        
+        if all(isinstance(v, list) and all(isinstance(x, int) and not isinstance(x, bool) for x in v) for v in values):
+            max_len = max((len(v) for v in values), default=0)
+            padded = [v + [0] * (max_len - len(v)) for v in values]
+            flat = [x for v in padded for x in v]
+            matrix = np.array(padded, dtype=self._narrow_int_dtype(flat)).reshape(len(values), max_len)
+            lengths = [len(v) for v in values]
+            return ({name: matrix, f"{name}_len": np.array(lengths, dtype=self._narrow_int_dtype(lengths))},
+                    {'name': name, 'kind': 'int_list'})
+        
+        if all(isinstance(v, str) for v in values):
+            arrays, spec = self._encode_strings(values, name)
+            spec['kind'] = 'str'
+            return arrays, spec
+        
+        # 그 외 값은 JSON 문자열로 저장
+        arrays, spec = self._encode_strings([json.dumps(v, ensure_ascii=False) for v in values], name)
+        spec['kind'] = 'json'
+        return arrays, spec
+    
+    def _encode_strings(self, values, name):
+        """문자열 열 변환 (반복이 많으면 범주 코드, 아니면 UTF-8 고정폭)"""
+        categories = list(dict.fromkeys(values))
+        if len(categories) * 4 <= len(values):
+            index = {value: i for i, value in enumerate(categories)}
+            codes = [index[value] for value in values]
+            return ({name: np.array(codes, dtype=self._narrow_int_dtype(codes))},
+                    {'name': name, 'categories': categories})
+        
+        encoded = [value.encode('utf-8') for value in values]
+        max_bytes = max((len(value) for value in encoded), default=0)
+        return {name: np.array(encoded, dtype=f'S{max(max_bytes, 1)}')}, {'name': name}
+    
+    def _decimal_scale(self, values):
+        """모든 값을 손실 없이 정수로 바꾸는 최소 10진 배율 (없으면 None)"""
+        for scale in range(7):
+            factor = 10 ** scale
+            try:
+                scaled = [round(v * factor) for v in values]
+            except (OverflowError, ValueError):
+                return None
+            if all(s / factor == v for s, v in zip(scaled, values)) and all(-2**62 < s < 2**62 for s in scaled):
+                return scale
+        return None
+    
+    def _narrow_int_dtype(self, values):
+        """값 범위를 담는 가장 작은 정수 dtype"""
+        low = min(values, default=0)
+        high = max(values, default=0)
+        for dtype in ('i1', 'i2', 'i4'):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return dtype
+        return 'i8'
+    
+    def _decode_binary(self, arrays):
+        """.npz 배열을 원래 JSON 데이터 형태로 복원"""
+        meta = json.loads(str(arrays['meta']))
+        columns = []
+        for spec in meta['columns']:
+            name = spec['name']
+            raw = arrays[name].tolist()
+            kind = spec['kind']
+            
+            if kind == 'number':
+                scale = spec['scale']
+                if scale is not None:
+                    factor = 10 ** scale
+                    if spec['int']:
+                        values = raw
+                    elif spec['mixed']:
+                        values = [v // factor if is_int else v / factor
+                                  for v, is_int in zip(raw, arrays[f"{name}_int"].tolist())]
+                    else:
+                        values = [v / factor for v in raw]
+                else:
+                    values = raw
+                    if spec['int'] or spec['mixed']:
+                        flags = [True] * len(raw) if spec['int'] else arrays[f"{name}_int"].tolist()
+                        values = [int(v) if is_int else v for v, is_int in zip(raw, flags)]
+            elif kind == 'int_list':
+                values = [row[:length] for row, length in zip(raw, arrays[f"{name}_len"].tolist())]
+            elif kind == 'bool':
+                values = raw
+            else:
+                if 'categories' in spec:
+                    values = [spec['categories'][code] for code in raw]
+                else:
+                    values = [value.decode('utf-8') for value in raw]
+                if kind == 'json':
+                    values = [json.loads(value) for value in values]
+            columns.append(values)
+        
+        rows = [list(row) for row in zip(*columns)] if columns else [[] for _ in range(meta['rows'])]
+        data = {}
+        for key in meta['order']:
+            data[key] = rows if key == 'strategies' else meta['data'][key]
+        return data
+    
     def create_backup(self, file_key, suffix=""):
         """파일 백업 생성"""
         file_path = self.files.get(file_key)
@@ -2,23 +2,45 @@
 # -*- coding: utf-8 -*-
 """
 제외/탈락 관리 모듈 - 완전제외/임시탈락 전담
-옐로우카드 패널티 시스템 포함
+옐로우카드 패널티 시스템 포함 (선택: 메모리 매핑 정수 ID 캐시)
 """
 
+import json
+import os
+
 from .strategy_attributes import StrategyAttributes
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 메모리 매핑 캐시 폴더 (기본경로 아래)
+EXCLUSION_CACHE_DIR = "제외캐시"
+
 class ExclusionManager:
     """전략 제외 및 탈락 관리 전담 모듈"""
     
-    def __init__(self, data_manager):
+    def __init__(self, data_manager, cache_mode='memory'):
         self.data_manager = data_manager
         self.strategy_attributes = StrategyAttributes()
         
+        # 캐시 형식: 'memory' (파이썬 집합) 또는 'mmap' (정수 ID 비트맵 파일, numpy 필요)
+        self.cache_mode = cache_mode if (cache_mode != 'mmap' or NUMPY_AVAILABLE) else 'memory'
+        self.cache_dir = os.path.join(data_manager.work_path, EXCLUSION_CACHE_DIR)
+        
         # 캐시된 제외 데이터
         self._dropout_data = None
         self._permanent_exclusion_data = None
         self._cached_exclusion_keys = None
         
+        # 메모리 매핑 배열 (mmap 모드, 읽기 전용 - 변경분은 _cached_exclusion_keys에 보관)
+        self._mapped_exclusion = None
+        
+        # 실행 프로파일 (RunProfiler, 붙였을 때만 '제외.검사'에 확인한 전략 수 집계 - 적중률 분모)
+        self.profiler = None
+        
         # 성능 카운터
         self.exclusion_stats = {
             '완전제외': 0,
@@ -29,6 +51,29 @@ class ExclusionManager:
     
     def load_exclusion_data(self):
         """제외 데이터 로드 (캐시 포함)"""
+        if self._cached_exclusion_keys is not None:
+            return
+        
+        # 최신 메모리 매핑 캐시가 있으면 원본 데이터를 읽지 않음
+        if self.cache_mode == 'mmap':
+            signature = self._source_signature()
+            if self._map_exclusion_cache(signature):
+                return
+        
+        self._load_source_data()
+        
+        # 통합 제외 키 생성 (성능 최적화)
+        self._generate_cached_exclusion_keys()
+        
+        if self.cache_mode == 'mmap':
+            self._write_exclusion_cache(signature)
+            if self._map_exclusion_cache(signature):
+                # 원본 데이터는 변경 작업이 있을 때 다시 로드
+                self._dropout_data = None
+                self._permanent_exclusion_data = None
+    
+    def _load_source_data(self):
+        """원본 탈락/영구제외 데이터 로드"""
         if self._dropout_data is None:
             print("탈락전략 데이터 로드 중...")
             self._dropout_data = self.data_manager.load_compressed_dropout_strategies()
@@ -40,13 +85,21 @@ class ExclusionManager:
             완전제외수 = len(self._permanent_exclusion_data['완전제외'])
             시장별제외수 = sum(len(strategies) for strategies in self._permanent_exclusion_data['시장별제외'].values())
             print(f"영구제외 로드 완료: 완전제외 {완전제외수}개, 시장별제외 {시장별제외수}개")
-        
-        # 통합 제외 키 생성 (성능 최적화)
-        if self._cached_exclusion_keys is None:
-            self._generate_cached_exclusion_keys()
+    
+    def _cache_key_from_key(self, strategy_key):
+        """저장된 문자열 키를 캐시 키로 변환 (정수 ID, 변환 불가한 구버전 키는 문자열 유지)"""
+        strategy_id = self.strategy_attributes.convert_key_to_id(strategy_key)
+        return strategy_id if strategy_id is not None else strategy_key
+    
+    def _cache_key_from_strategy(self, strategy):
+        """전략의 캐시 키 (정수 ID, 격자 밖 전략은 문자열 키)"""
+        strategy_id = self.strategy_attributes.encode_strategy_id(strategy)
+        if strategy_id is not None:
+            return strategy_id
+        return self.strategy_attributes.convert_strategy_to_key(strategy)
     
     def _generate_cached_exclusion_keys(self):
-        """제외 키 캐시 생성 (성능 최적화)"""
+        """제외 키 캐시 생성 (정수 ID 기반, 성능 최적화)"""
         print("제외 키 캐시 생성 중...")
         self._cached_exclusion_keys = {
             '완전제외': set(),
@@ -56,22 +109,22 @@ class ExclusionManager:
         
         # 완전제외 키
         if self._permanent_exclusion_data:
-            self._cached_exclusion_keys['완전제외'] = self._permanent_exclusion_data['완전제외'].copy()
+            self._cached_exclusion_keys['완전제외'] = {self._cache_key_from_key(key) for key in self._permanent_exclusion_data['완전제외']}
         
         # 시장별제외 키
         if self._permanent_exclusion_data:
             for market_num, strategies in self._permanent_exclusion_data['시장별제외'].items():
-                self._cached_exclusion_keys['시장별제외'][market_num] = strategies.copy()
+                self._cached_exclusion_keys['시장별제외'][market_num] = {self._cache_key_from_key(key) for key in strategies}
         
         # 탈락기록 키 (옐로우카드 적용)
         if self._dropout_data:
             # 영구제외된 탈락전략
             for strategy_key in self._dropout_data['영구제외']:
-                self._cached_exclusion_keys['탈락기록'][strategy_key] = 10
+                self._cached_exclusion_keys['탈락기록'][self._cache_key_from_key(strategy_key)] = 10
             
             # 임시기록 탈락전략
             for strategy_key, count in self._dropout_data['임시기록'].items():
-                self._cached_exclusion_keys['탈락기록'][strategy_key] = count
+                self._cached_exclusion_keys['탈락기록'][self._cache_key_from_key(strategy_key)] = count
         
         total_cached = (
             len(self._cached_exclusion_keys['완전제외']) +
@@ -80,14 +133,149 @@ class ExclusionManager:
         )
         print(f"제외 키 캐시 생성 완료: {total_cached:,}개")
     
+    def _source_signature(self):
+        """캐시 원본 파일들의 (크기, 수정시각) 목록 - 바뀌면 캐시 재생성"""
+        signature = {}
+        for file_key in ('dropout_strategies', 'dropout_compressed', 'permanent_exclusion', 'permanent_exclusion_compressed'):
+            file_path = self.data_manager.get_file_path(file_key)
+            for path in (file_path, f"{file_path}.log", f"{file_path}.journal", self.data_manager.get_binary_path(file_key)):
+                if os.path.exists(path):
+                    stat = os.stat(path)
+                    signature[os.path.basename(path)] = [stat.st_size, stat.st_mtime_ns]
+        return signature
+    
+    def _write_exclusion_cache(self, signature):
+        """캐시 키를 정수 ID 공간 비트맵/탈락횟수 .npy 배열로 저장 (정수 ID가 아닌 구버전 키는 meta.json)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache = self._cached_exclusion_keys
+            id_count = self.strategy_attributes.strategy_id_count()
+            string_keys = {
+                '완전제외': sorted(key for key in cache['완전제외'] if not isinstance(key, int)),
+                '시장별제외': {str(market_num): sorted(key for key in keys if not isinstance(key, int))
+                              for market_num, keys in cache['시장별제외'].items()},
+                '탈락기록': {key: count for key, count in cache['탈락기록'].items() if not isinstance(key, int)}
+            }
+            
+            def bitmap(keys):
+                bits = np.zeros(id_count, dtype=bool)
+                bits[[key for key in keys if isinstance(key, int)]] = True
+                return np.packbits(bits, bitorder='little')
+            
+            dropout_ids = [key for key in cache['탈락기록'] if isinstance(key, int)]
+            max_count = max((cache['탈락기록'][key] for key in dropout_ids), default=0)
+            dropout_counts = np.zeros(id_count, dtype='u1' if max_count <= 255 else 'i4')
+            dropout_counts[dropout_ids] = [cache['탈락기록'][key] for key in dropout_ids]
+            
+            arrays = {'complete': bitmap(cache['완전제외']), 'dropout_counts': dropout_counts}
+            for market_num, keys in cache['시장별제외'].items():
+                arrays[f"market_{market_num}"] = bitmap(keys)
+            
+            # 배열 먼저, meta.json은 마지막에 교체 (meta가 캐시 유효 표시)
+            suffix = f".{os.getpid()}.temp"
+            for name, array in arrays.items():
+                array_path = os.path.join(self.cache_dir, f"{name}.npy")
+                with open(array_path + suffix, 'wb') as f:
+                    np.save(f, array)
+                os.replace(array_path + suffix, array_path)
+            
+            meta = {
+                'signature': signature,
+                'id_count': id_count,
+                'arrays': sorted(arrays),
+                'markets': sorted(cache['시장별제외']),
+                'string_keys': string_keys
+            }
+            meta_path = os.path.join(self.cache_dir, 'meta.json')
+            with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + suffix, meta_path)
+        except Exception as e:
+            print(f"제외 캐시 저장 실패: {e}")
+    
+    def _map_exclusion_cache(self, signature):
+        """최신 캐시 파일을 읽기 전용으로 메모리 매핑 (없거나 오래되었으면 False)"""
+        try:
+            with open(os.path.join(self.cache_dir, 'meta.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('signature') != signature or meta.get('id_count') != self.strategy_attributes.strategy_id_count():
+                return False
+            
+            arrays = {name: np.load(os.path.join(self.cache_dir, f"{name}.npy"), mmap_mode='r')
+                      for name in meta['arrays']}
+        except (OSError, ValueError, KeyError):
+            return False
+        
+        # memoryview 인덱싱은 파이썬 int를 바로 반환 (numpy 스칼라보다 빠름)
+        self._mapped_exclusion = {
+            'id_count': meta['id_count'],
+            '완전제외': memoryview(arrays['complete']),
+            '시장별제외': {market_num: memoryview(arrays[f"market_{market_num}"]) for market_num in meta['markets']},
+            '탈락기록': memoryview(arrays['dropout_counts'])
+        }
+        
+        # 구버전 키와 이후 변경분은 메모리 집합에 보관
+        string_keys = meta['string_keys']
+        self._cached_exclusion_keys = {
+            '완전제외': set(string_keys['완전제외']),
+            '시장별제외': {int(market_num): set(keys) for market_num, keys in string_keys['시장별제외'].items()},
+            '탈락기록': dict(string_keys['탈락기록'])
+        }
+        print(f"제외 캐시 메모리 매핑 완료: 정수 ID {meta['id_count']:,}개 공간")
+        return True
+    
+    def _mapped_bit(self, bits, strategy_key):
+        """비트맵에서 정수 ID 포함 여부 (문자열 키는 False)"""
+        if not isinstance(strategy_key, int) or not 0 <= strategy_key < self._mapped_exclusion['id_count']:
+            return False
+        return (bits[strategy_key >> 3] >> (strategy_key & 7)) & 1 == 1
+    
+    def _mapped_count(self, strategy_key):
+        """매핑된 탈락횟수 배열의 값 (문자열 키는 0)"""
+        if not isinstance(strategy_key, int) or not 0 <= strategy_key < self._mapped_exclusion['id_count']:
+            return 0
+        return self._mapped_exclusion['탈락기록'][strategy_key]
+    
+    def _in_complete_exclusion(self, strategy_key):
+        """완전제외 캐시 포함 여부 (메모리 집합 + 비트맵)"""
+        if strategy_key in self._cached_exclusion_keys['완전제외']:
+            return True
+        return self._mapped_exclusion is not None and self._mapped_bit(self._mapped_exclusion['완전제외'], strategy_key)
+    
+    def _in_market_exclusion(self, strategy_key, market_num):
+        """시장별제외 캐시 포함 여부 (메모리 집합 + 비트맵)"""
+        if strategy_key in self._cached_exclusion_keys['시장별제외'].get(market_num, ()):
+            return True
+        if self._mapped_exclusion is None or market_num not in self._mapped_exclusion['시장별제외']:
+            return False
+        return self._mapped_bit(self._mapped_exclusion['시장별제외'][market_num], strategy_key)
+    
+    def _cached_dropout_count(self, strategy_key):
+        """탈락기록 캐시의 탈락횟수 (메모리 변경분 우선)"""
+        dropout_count = self._cached_exclusion_keys['탈락기록'].get(strategy_key)
+        if dropout_count is not None:
+            return dropout_count
+        if self._mapped_exclusion is None:
+            return 0
+        return self._mapped_count(strategy_key)
+    
+    def _market_numbers(self):
+        """시장별제외가 있는 시장 번호 목록"""
+        market_nums = set(self._cached_exclusion_keys['시장별제외'])
+        if self._mapped_exclusion is not None:
+            market_nums.update(self._mapped_exclusion['시장별제외'])
+        return sorted(market_nums)
+    
     def should_exclude(self, strategy, current_market=None):
         """전략이 제외되어야 하는지 확인"""
         # 제외 데이터 로드 (캐시 포함)
         self.load_exclusion_data()
         
-        # 전략 키 생성
-        strategy_key = self.strategy_attributes.convert_strategy_to_key(strategy)
-        if not strategy_key:
+        # 전략 캐시 키 생성 (정수 ID)
+        if self.profiler is not None:
+            self.profiler.count('제외.검사')
+        strategy_key = self._cache_key_from_strategy(strategy)
+        if strategy_key is None:
             return False
         
         # 1. 완전제외 확인
@@ -102,12 +290,44 @@ class ExclusionManager:
         
         return False
     
+    def exclusion_mask(self, strategy_ids, current_market=None):
+        """정수 ID 배열의 제외 여부 (should_exclude와 같은 판정을 한 번에, numpy 필요)"""
+        self.load_exclusion_data()
+        ids = np.asarray(strategy_ids, dtype='i8')
+        if self.profiler is not None:
+            self.profiler.count('제외.검사', len(ids))
+        
+        mapped = self._mapped_exclusion
+        excluded = self._id_membership(ids, self._cached_exclusion_keys['완전제외'],
+                                       mapped['완전제외'] if mapped is not None else None)
+        self.exclusion_stats['완전제외'] += int(excluded.sum())
+        
+        market_num = self._market_condition_to_number(current_market) if current_market else 0
+        if market_num:
+            market_bits = mapped['시장별제외'].get(market_num) if mapped is not None else None
+            market_excluded = self._id_membership(ids, self._cached_exclusion_keys['시장별제외'].get(market_num, ()), market_bits)
+            market_excluded &= ~excluded
+            self.exclusion_stats['시장별제외'] += int(market_excluded.sum())
+            excluded |= market_excluded
+        
+        return excluded
+    
+    def _id_membership(self, ids, keys, bits=None):
+        """정수 ID 배열이 키 집합(정수 키만) 또는 매핑 비트맵에 있는지 여부"""
+        member = np.zeros(len(ids), dtype=bool)
+        if bits is not None:
+            member |= np.unpackbits(np.frombuffer(bits, dtype='u1'), bitorder='little').astype(bool)[ids]
+        int_keys = [key for key in keys if isinstance(key, int)]
+        if int_keys:
+            member |= np.isin(ids, int_keys)
+        return member
+    
     def _is_completely_excluded(self, strategy_key):
         """완전제외 전략인지 확인"""
         if not self._cached_exclusion_keys:
             return False
         
-        return strategy_key in self._cached_exclusion_keys['완전제외']
+        return self._in_complete_exclusion(strategy_key)
     
     def _is_market_excluded(self, strategy_key, market_condition):
         """시장별제외 전략인지 확인"""
@@ -119,8 +339,7 @@ class ExclusionManager:
         if market_num == 0:
             return False
         
-        market_excluded = self._cached_exclusion_keys['시장별제외'].get(market_num, set())
-        return strategy_key in market_excluded
+        return self._in_market_exclusion(strategy_key, market_num)
     
     def _market_condition_to_number(self, market_condition):
         """시장상황을 숫자로 변환"""
@@ -132,11 +351,11 @@ class ExclusionManager:
         if not self._cached_exclusion_keys:
             return 0
         
-        strategy_key = self.strategy_attributes.convert_strategy_to_key(strategy)
-        if not strategy_key:
+        strategy_key = self._cache_key_from_strategy(strategy)
+        if strategy_key is None:
             return 0
         
-        dropout_count = self._cached_exclusion_keys['탈락기록'].get(strategy_key, 0)
+        dropout_count = self._cached_dropout_count(strategy_key)
         if dropout_count > 0:
             penalty = dropout_count * 2
             self.exclusion_stats['옐로우카드적용'] += 1
@@ -149,21 +368,21 @@ class ExclusionManager:
         if not self._cached_exclusion_keys:
             return {'탈락횟수': 0, '옐로우카드': 0, '제외유형': None}
         
-        strategy_key = self.strategy_attributes.convert_strategy_to_key(strategy)
-        if not strategy_key:
+        strategy_key = self._cache_key_from_strategy(strategy)
+        if strategy_key is None:
             return {'탈락횟수': 0, '옐로우카드': 0, '제외유형': None}
         
         # 탈락횟수 확인
-        dropout_count = self._cached_exclusion_keys['탈락기록'].get(strategy_key, 0)
+        dropout_count = self._cached_dropout_count(strategy_key)
         yellow_card = dropout_count * 2 if dropout_count > 0 else 0
         
         # 제외유형 확인
         exclusion_type = None
-        if strategy_key in self._cached_exclusion_keys['완전제외']:
+        if self._in_complete_exclusion(strategy_key):
             exclusion_type = '완전제외'
         else:
-            for market_num, strategies in self._cached_exclusion_keys['시장별제외'].items():
-                if strategy_key in strategies:
+            for market_num in self._market_numbers():
+                if self._in_market_exclusion(strategy_key, market_num):
                     exclusion_type = f'시장별제외({market_num})'
                     break
         
@@ -179,6 +398,10 @@ class ExclusionManager:
         if not strategy_key:
             return False
         
+        # 메모리 매핑 모드는 원본 데이터를 변경 시점에 로드 (저장용)
+        if self._mapped_exclusion is not None:
+            self._load_source_data()
+        
         dropout_date = dropout_info.get('탈락일', '')
         dropout_reason = dropout_info.get('탈락사유', '')
         market_condition = dropout_info.get('시장상황', '')
@@ -217,7 +440,7 @@ class ExclusionManager:
         
         # 캐시 업데이트
         if self._cached_exclusion_keys:
-            self._cached_exclusion_keys['탈락기록'][strategy_key] = new_count
+            self._cached_exclusion_keys['탈락기록'][self._cache_key_from_strategy(strategy)] = new_count
         
         # 파일 저장은 배치로 처리 (성능 최적화)
         return True
@@ -234,6 +457,10 @@ class ExclusionManager:
         if not strategy_key:
             return False
         
+        # 메모리 매핑 모드는 원본 데이터를 변경 시점에 로드 (저장용)
+        if self._mapped_exclusion is not None:
+            self._load_source_data()
+        
         exclusion_type = exclusion_info.get('제외유형', '완전제외')
         market_condition = exclusion_info.get('시장상황', '')
         exclusion_reason = exclusion_info.get('제외사유', '')
@@ -243,7 +470,7 @@ class ExclusionManager:
             if self._permanent_exclusion_data:
                 self._permanent_exclusion_data['완전제외'].add(strategy_key)
             if self._cached_exclusion_keys:
-                self._cached_exclusion_keys['완전제외'].add(strategy_key)
+                self._cached_exclusion_keys['완전제외'].add(self._cache_key_from_strategy(strategy))
         else:
             # 시장별제외 추가
             market_num = self._market_condition_to_number(market_condition)
@@ -256,7 +483,7 @@ class ExclusionManager:
                 if self._cached_exclusion_keys:
                     if market_num not in self._cached_exclusion_keys['시장별제외']:
                         self._cached_exclusion_keys['시장별제외'][market_num] = set()
-                    self._cached_exclusion_keys['시장별제외'][market_num].add(strategy_key)
+                    self._cached_exclusion_keys['시장별제외'][market_num].add(self._cache_key_from_strategy(strategy))
         
         return True
     
@@ -268,7 +495,19 @@ class ExclusionManager:
             stats['총완전제외'] = len(self._cached_exclusion_keys['완전제외'])
             stats['총시장별제외'] = sum(len(s) for s in self._cached_exclusion_keys['시장별제외'].values())
             stats['총탈락기록'] = len(self._cached_exclusion_keys['탈락기록'])
-        
+            
+            # 메모리 매핑 비트맵 (메모리 변경분과 겹치는 키는 한 번만)
+            if self._mapped_exclusion is not None:
+                mapped = self._mapped_exclusion
+                complete = np.frombuffer(mapped['완전제외'], dtype='u1')
+                stats['총완전제외'] += int(np.unpackbits(complete).sum()) - sum(
+                    1 for key in self._cached_exclusion_keys['완전제외'] if self._mapped_bit(mapped['완전제외'], key))
+                for market_num, bits in mapped['시장별제외'].items():
+                    stats['총시장별제외'] += int(np.unpackbits(np.frombuffer(bits, dtype='u1')).sum()) - sum(
+                        1 for key in self._cached_exclusion_keys['시장별제외'].get(market_num, ()) if self._mapped_bit(bits, key))
+                stats['총탈락기록'] += int(np.count_nonzero(np.asarray(mapped['탈락기록']))) - sum(
+                    1 for key in self._cached_exclusion_keys['탈락기록'] if self._mapped_count(key) > 0)
+            
         return stats
     
     def clear_cache(self):
@@ -276,6 +515,7 @@ class ExclusionManager:
         self._dropout_data = None
         self._permanent_exclusion_data = None
         self._cached_exclusion_keys = None
+        self._mapped_exclusion = None
         
         # 통계 초기화
         for key in self.exclusion_stats:
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+경로 설정 모듈 - 데이터 폴더와 작업(scratch) 폴더 결정
+우선순위: 명시 인자(명령행) > 환경변수 > 경로설정.json > 기존 OneDrive 폴더(있을 때만) > 프로젝트 폴더
+작업 폴더(예: tmpfs)를 지정하면 자주 쓰는 탈락/영구제외 파일만 그곳에서 읽고 쓰고, 끝나면 데이터 폴더로 반영한다
+"""
+
+import json
+import os
+import shutil
+
+ENV_DATA_DIR = "STOCK_STRATEGY_DATA_DIR"
+ENV_SCRATCH_DIR = "STOCK_STRATEGY_SCRATCH_DIR"
+ENV_CONFIG_FILE = "STOCK_STRATEGY_CONFIG"
+
+CONFIG_FILE_NAME = "경로설정.json"  # {"data_dir": "...", "scratch_dir": "..."}
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEGACY_DATA_DIR = r"C:\Users\ksj\OneDrive\바탕 화면\gemini\제작파일\주식최고_전략"
+
+# 작업 폴더로 옮기는 잦은 쓰기 파일 (.npz는 DataManager 바이너리 저장, 사이드카: 탈락 로그 .log, 영구제외 저널 .journal)
+SCRATCH_FILES = (
+    "탈락전략.json",
+    "탈락전략_압축.json",
+    "영구제외_전략_히스토리.json",
+    "영구제외_전략_히스토리_압축.json",
+    "탈락전략_압축.npz",
+    "영구제외_전략_히스토리_압축.npz"
+)
+SIDECAR_SUFFIXES = ('.log', '.journal')
+
+def load_path_config(config_file=None):
+    """경로설정 파일 로드 (인자 > 환경변수 > 프로젝트 폴더의 경로설정.json, 없으면 빈 dict)"""
+    config_file = config_file or os.environ.get(ENV_CONFIG_FILE) or os.path.join(PROJECT_DIR, CONFIG_FILE_NAME)
+    if not os.path.exists(config_file):
+        return {}
+
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except Exception as e:
+        print(f"경로설정 로드 실패 ({config_file}): {e}")
+        return {}
+
+    # 상대경로는 설정 파일 위치 기준
+    config_dir = os.path.dirname(os.path.abspath(config_file))
+    for key in ('data_dir', 'scratch_dir'):
+        if config.get(key):
+            config[key] = os.path.join(config_dir, os.path.expanduser(config[key]))
+    return config
+
+def _normalize(path):
+    return os.path.abspath(os.path.expanduser(path)) if path else None
+
+def resolve_paths(data_dir=None, scratch_dir=None, config_file=None):
+    """(데이터 폴더, 작업 폴더 또는 None) 결정"""
+    config = load_path_config(config_file)
+
+    data_dir = data_dir or os.environ.get(ENV_DATA_DIR) or config.get('data_dir')
+    if not data_dir:
+        data_dir = LEGACY_DATA_DIR if os.path.isdir(LEGACY_DATA_DIR) else PROJECT_DIR
+    scratch_dir = scratch_dir or os.environ.get(ENV_SCRATCH_DIR) or config.get('scratch_dir')
+
+    data_dir = _normalize(data_dir)
+    scratch_dir = _normalize(scratch_dir)
+    if scratch_dir == data_dir:
+        scratch_dir = None
+    return data_dir, scratch_dir
+
+def _tracked_names(names):
+    """파일 이름 + 사이드카 이름"""
+    for name in names:
+        yield name, False
+        for suffix in SIDECAR_SUFFIXES:
+            yield name + suffix, True
+
+def _copy_atomic(source, target):
+    """임시 파일로 복사 후 교체 (중단시 대상 파일 보존)"""
+    temp_path = target + '.tmp'
+    shutil.copy2(source, temp_path)
+    os.replace(temp_path, target)
+
+def stage_scratch_files(data_dir, scratch_dir, names=SCRATCH_FILES):
+    """데이터 폴더의 파일을 작업 폴더로 복사 (작업 폴더 사본이 없거나 더 오래된 경우만), 복사 수 반환"""
+    if not scratch_dir or _normalize(scratch_dir) == _normalize(data_dir):
+        return 0
+
+    os.makedirs(scratch_dir, exist_ok=True)
+    copied = 0
+    for name, _ in _tracked_names(names):
+        source = os.path.join(data_dir, name)
+        target = os.path.join(scratch_dir, name)
+        if not os.path.exists(source):
+            continue
+        if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+            continue
+        _copy_atomic(source, target)
+        copied += 1
+    return copied
+
+def sync_scratch_files(scratch_dir, data_dir, names=SCRATCH_FILES):
+    """작업 폴더에서 바뀐 파일을 데이터 폴더로 반영, 반영 수 반환
+
+    작업 폴더에서 이미 반영되어 사라진 사이드카(로그/저널)는 데이터 폴더에서도 지워
+    다음 실행에서 같은 변경이 두 번 적용되지 않게 한다
+    """
+    if not scratch_dir or _normalize(scratch_dir) == _normalize(data_dir):
+        return 0
+
+    os.makedirs(data_dir, exist_ok=True)
+    synced = 0
+    for name, is_sidecar in _tracked_names(names):
+        source = os.path.join(scratch_dir, name)
+        target = os.path.join(data_dir, name)
+        if not os.path.exists(source):
+            if is_sidecar and os.path.exists(target):
+                os.remove(target)
+                synced += 1
+            continue
+        if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+            continue
+        _copy_atomic(source, target)
+        synced += 1
+    return synced
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공유 가격경로 모듈 - 시장 시나리오당 한 번만 계산
+모든 전략이 같은 시간데이터를 보므로 시간별 가격, 일별 시가/종가, 이동평균을
+전략마다 복사하지 않고 이 객체 하나를 일차 인덱스로 참조한다
+"""
+
+class PricePath:
+    """시장 시나리오 가격경로 전담 모듈 (전략은 '경로일차'만 보관)"""
+
+    def __init__(self, past_prices, hourly_changes, initial_price, days=0, hours_per_day=7, max_history=120):
+        self.hourly_changes = hourly_changes  # 원본 참조 (시나리오 변경 감지용)
+        self.initial_price = initial_price
+        self.hours_per_day = hours_per_day
+        self.max_history = max_history
+
+        # 과거 120일 + 시뮬레이션 일별 종가 (기존 전략별 '이동평균' 리스트와 동일한 순서)
+        self.past_prices = list(past_prices)
+        # 데이터가 모자란 일차는 가격 변동 없이 전일 종가를 유지 (기존 시뮬레이션과 동일)
+        self.num_days = max((len(hourly_changes) + hours_per_day - 1) // hours_per_day, days)
+
+        self.hourly_prices = []  # 인덱스: 일차 * 7 + 시간
+        self.daily_closes = []
+        self.daily_opens = []
+        self.history = []
+
+        # (진행일수, 기간) → 이동평균 (일차·기간당 한 번만 합산, 이력 부족은 None)
+        self._average_cache = {}
+
+        self._build_path()
+
+    def _build_path(self):
+        """시간별 가격, 일별 종가, 일별 시가를 한 번에 계산"""
+        # 1. 시뮬레이션 가격 (전일 종가에서 출발, 소수점 1자리 버림)
+        price = self.past_prices[-1] if self.past_prices else self.initial_price
+        for change in self.hourly_changes:
+            price = price * (1 + change / 100)
+            price = int(price * 10) / 10
+            self.hourly_prices.append(price)
+
+        start_price = self.past_prices[-1] if self.past_prices else self.initial_price
+        for day in range(self.num_days):
+            last_index = min((day + 1) * self.hours_per_day, len(self.hourly_prices)) - 1
+            self.daily_closes.append(self.hourly_prices[last_index] if last_index >= 0 else start_price)
+
+        self.history = self.past_prices + self.daily_closes
+
+        # 2. 시가 (초기가격에서 출발해 전일 마지막 시간까지 누적한 가격)
+        price = self.initial_price
+        self.daily_opens.append(price)
+        for index, change in enumerate(self.hourly_changes):
+            price = price * (1 + change / 100)
+            price = int(price * 10) / 10
+            if (index + 1) % self.hours_per_day == 0:
+                self.daily_opens.append(price)
+        self._final_open = price
+
+    def matches(self, hourly_changes, past_prices):
+        """같은 시나리오 데이터로 만든 경로인지 확인"""
+        return (hourly_changes is self.hourly_changes
+                and len(hourly_changes) == len(self.hourly_prices)
+                and len(past_prices) == len(self.past_prices)
+                and (not past_prices or past_prices[-1] == self.past_prices[-1]))
+
+    def hour_price(self, day, hour):
+        """해당 일차/시간의 가격 (데이터 범위 밖이면 None)"""
+        index = day * self.hours_per_day + hour
+        if index >= len(self.hourly_prices):
+            return None
+        return self.hourly_prices[index]
+
+    def day_open(self, day):
+        """해당 일의 시가 (전일 마지막 시간 가격)"""
+        if day < len(self.daily_opens):
+            return self.daily_opens[day]
+        return self._final_open
+
+    def _history_end(self, days_done):
+        """days_done일 진행 후 가격이력의 끝 인덱스"""
+        return len(self.past_prices) + min(days_done, self.num_days)
+
+    def last_close(self, days_done):
+        """days_done일 진행 후 마지막 종가 (기존 이동평균[-1])"""
+        end = self._history_end(days_done)
+        if end == 0:
+            return self.initial_price
+        return self.history[end - 1]
+
+    def history_length(self, days_done):
+        """최대 120일로 잘린 가격이력 길이 (기존 len(이동평균))"""
+        return min(self._history_end(days_done), self.max_history)
+
+    def recent_prices(self, days_done, count):
+        """최근 count일 종가 목록 (기존 이동평균[-count:])"""
+        end = self._history_end(days_done)
+        start = max(end - min(count, self.max_history), 0)
+        return self.history[start:end]
+
+    def moving_average(self, days_done, window):
+        """days_done일 진행 시점의 window일 이동평균 (이력이 부족하면 None)
+
+        같은 일차·기간은 모든 전략·시간이 같은 값을 보므로 처음 한 번만 합산해 보관한다.
+        (누적합 차감 대신 구간 합을 그대로 써서 기존 계산과 비트 단위로 같은 값)
+        """
+        key = (days_done, window)
+        if key in self._average_cache:
+            return self._average_cache[key]
+
+        average = None
+        if self.history_length(days_done) >= window:
+            end = self._history_end(days_done)
+            average = sum(self.history[end - window:end]) / window
+        self._average_cache[key] = average
+        return average
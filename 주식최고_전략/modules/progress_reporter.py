@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 로그 모듈 - 반복 구간 출력을 logging 레벨로 관리
+일별/시간별 상세 출력은 DEBUG, 진행상황과 요약은 INFO로 내보내고
+진행상황은 시간 간격(기본 1초)으로 묶어 배치 실행 중 터미널 출력 비용을 줄인다
+"""
+
+import logging
+import sys
+import time
+
+LOGGER_NAME = "주식최고전략"
+
+# 레벨 이름 → logging 레벨 (명령행/설정값용)
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'quiet': logging.WARNING
+}
+
+class _ConsoleHandler(logging.StreamHandler):
+    """기존 print와 같은 곳(호출 시점의 sys.stdout)으로 메시지만 출력"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        # 출력 대상은 항상 현재 sys.stdout (redirect_stdout 캡처 유지)
+        pass
+
+def get_logger():
+    """공용 로거 반환 (처음 호출시 콘솔 출력 핸들러 설치, 기본 INFO)"""
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        handler = _ConsoleHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+def set_log_level(level):
+    """로그 레벨 변경 ('debug'/'info'/'warning'/'quiet' 또는 logging 레벨 값)"""
+    if isinstance(level, str):
+        level = LOG_LEVELS.get(level.lower(), logging.INFO)
+    get_logger().setLevel(level)
+
+class ProgressReporter:
+    """시간 간격 진행상황 출력기 (interval초에 한 번만 INFO로 출력, 생략분은 DEBUG)"""
+
+    def __init__(self, logger=None, interval=1.0):
+        self.logger = logger or get_logger()
+        self.interval = interval
+        self._last_time = None
+        self.skipped = 0
+
+    def update(self, message, *args, force=False):
+        """진행상황 보고 (마지막 출력 후 interval이 지났거나 force면 INFO 출력)"""
+        now = time.monotonic()
+        if force or self._last_time is None or now - self._last_time >= self.interval:
+            self._last_time = now
+            self.skipped = 0
+            self.logger.info(message, *args)
+            return True
+
+        self.skipped += 1
+        self.logger.debug(message, *args)
+        return False
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 프로파일 모듈 - 구간별 시간(컨텍스트 관리자)과 카운터를 모아 실행당 프로파일 JSON으로 저장
+계측은 구간(데이터 생성, 조합 생성, 일별 시뮬레이션, 탈락 처리, 파일 저장) 단위로만 하므로 켜도 비용이 작고,
+꺼져 있으면 phase()는 공용 빈 컨텍스트를 돌려주고 count()는 바로 반환한다
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+PROFILE_VERSION = 1
+BYTES_WRITTEN = "저장바이트"  # count_file로 기록한 모든 파일 쓰기의 합계 카운터
+
+class _NullPhase:
+    """계측 꺼짐: 아무것도 하지 않는 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class _PhaseTimer:
+    """구간 하나의 시간 측정 (중첩 가능, 같은 이름은 누적)"""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        phase = self.profiler.phases.setdefault(self.name, [0, 0.0])
+        phase[0] += 1
+        phase[1] += time.perf_counter() - self.start
+        return False
+
+class RunProfiler:
+    """실행 한 번의 구간 시간/카운터 수집기 (enabled=False면 모든 호출이 무시됨)"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        """수집값 초기화 (실행 시작 시각도 지금으로)"""
+        self.phases = {}  # 구간이름: [횟수, 누적초]
+        self.counters = {}  # 카운터이름: 누적값
+        self.started = time.perf_counter()
+        self.started_at = datetime.now()
+
+    def phase(self, name):
+        """with profiler.phase('구간'): ... 으로 구간 시간 누적"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _PhaseTimer(self, name)
+
+    def count(self, name, amount=1):
+        """카운터 누적"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def count_file(self, name, path, before=0):
+        """방금 쓴 파일의 바이트 수(추가 쓰기면 before 이후 늘어난 만큼)를 name과 저장바이트 합계에 누적"""
+        if self.enabled and path:
+            try:
+                written = os.path.getsize(path) - before
+            except OSError:
+                return
+            self.count(name, written)
+            self.count(BYTES_WRITTEN, written)
+
+    def file_size(self, path):
+        """추가 쓰기 전 파일 크기 (count_file의 before용, 꺼져 있거나 없으면 0)"""
+        if self.enabled and path and os.path.exists(path):
+            return os.path.getsize(path)
+        return 0
+
+    def merge(self, report):
+        """다른 프로세스(병렬 사이클)의 report()를 이 수집기에 합침"""
+        if not self.enabled or not report:
+            return
+        for name, phase in report.get('구간', {}).items():
+            total = self.phases.setdefault(name, [0, 0.0])
+            total[0] += phase['횟수']
+            total[1] += phase['초']
+        for name, value in report.get('카운터', {}).items():
+            self.count(name, value)
+
+    def seconds(self, name):
+        phase = self.phases.get(name)
+        return phase[1] if phase else 0.0
+
+    def report(self, rates=None, ratios=None, info=None):
+        """프로파일 dict 생성
+
+        rates: {이름: (카운터, 구간)} → 카운터 / 구간 누적초 (초당 처리량)
+        ratios: {이름: (분자 카운터들, 분모 카운터들)} → 합계 비율 (예: 제외 적중률)
+        """
+        elapsed = time.perf_counter() - self.started
+        phases = {
+            name: {'횟수': calls, '초': round(seconds, 6),
+                   '비율': round(seconds / elapsed, 4) if elapsed > 0 else 0}
+            for name, (calls, seconds) in sorted(self.phases.items(), key=lambda item: -item[1][1])
+        }
+
+        derived = {}
+        for name, (counter, phase) in (rates or {}).items():
+            seconds = self.seconds(phase)
+            if counter in self.counters and seconds > 0:
+                derived[name] = round(self.counters[counter] / seconds, 2)
+        for name, (numerators, denominators) in (ratios or {}).items():
+            denominator = sum(self.counters.get(counter, 0) for counter in denominators)
+            if denominator:
+                derived[name] = round(sum(self.counters.get(counter, 0) for counter in numerators) / denominator, 6)
+
+        return {
+            '버전': PROFILE_VERSION,
+            '시작시각': self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            '전체초': round(elapsed, 6),
+            '실행정보': info or {},
+            '구간': phases,
+            '카운터': dict(sorted(self.counters.items())),
+            '파생지표': derived
+        }
+
+    def save(self, path, rates=None, ratios=None, info=None):
+        """프로파일 JSON 저장, 저장한 dict 반환"""
+        report = self.report(rates, ratios, info)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
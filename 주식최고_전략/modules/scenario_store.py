@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시나리오 저장소 모듈 - 생성한 시장 데이터(과거 120일, 일간/주간/시간 변동률)를 재사용
+(시드, 생성기, 인자, 생성 직전 난수 상태)를 키로 숫자 배열을 저장하고, 같은 키면 생성 대신 불러온다
+생성 직후 난수 상태도 함께 저장해 불러온 뒤의 난수 순서가 직접 생성한 경우와 같다
+numpy가 있으면 .npz(float64), 없으면 .json으로 저장 (둘 다 float 값이 그대로 복원됨)
+"""
+
+import hashlib
+import json
+import os
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+STORE_DIR_NAME = "시나리오저장소"
+STORE_VERSION = 1  # 생성기 로직이 바뀌면 올려서 기존 저장본 무효화
+
+class ScenarioStore:
+    """시장 시나리오 배열 저장/로드 전담 모듈"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, seed, generator, params, rng_state=None):
+        """저장 키 (시드, 생성기 이름, 생성 인자, 생성 직전 난수 상태의 해시)"""
+        payload = json.dumps([STORE_VERSION, seed, generator, params], ensure_ascii=False, sort_keys=True)
+        if rng_state is not None:
+            payload += repr(rng_state)
+        digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:20]
+        return f"{generator}_{seed}_{digest}"
+
+    def _path(self, key, binary):
+        return os.path.join(self.directory, key + ('.npz' if binary else '.json'))
+
+    def load(self, key):
+        """(배열 dict, 생성 직후 난수 상태) 반환, 저장본이 없거나 읽을 수 없으면 None"""
+        for binary in ((True, False) if NUMPY_AVAILABLE else (False,)):
+            path = self._path(key, binary)
+            if not os.path.exists(path):
+                continue
+            try:
+                if binary:
+                    with np.load(path, allow_pickle=False) as stored:
+                        meta = json.loads(str(stored['meta']))
+                        arrays = {name: stored[name].tolist() for name in meta['arrays']}
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        stored = json.load(f)
+                    meta = stored['meta']
+                    arrays = {name: stored['arrays'][name] for name in meta['arrays']}
+            except Exception as e:
+                print(f"시나리오 저장본 로드 실패 ({os.path.basename(path)}): {e}")
+                continue
+            self.hits += 1
+            return arrays, _decode_rng_state(meta.get('rng_state'))
+
+        self.misses += 1
+        return None
+
+    def save(self, key, arrays, rng_state=None, info=None):
+        """배열 dict 저장 (임시 파일에 쓴 뒤 교체, 병렬 작업이 같은 폴더를 써도 안전), 저장한 경로 반환 (실패시 None)"""
+        os.makedirs(self.directory, exist_ok=True)
+        meta = {
+            'arrays': list(arrays),
+            'rng_state': _encode_rng_state(rng_state),
+            'info': info or {}
+        }
+        path = self._path(key, NUMPY_AVAILABLE)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if NUMPY_AVAILABLE:
+                with open(temp_path, 'wb') as f:
+                    np.savez(f, meta=np.array(json.dumps(meta, ensure_ascii=False)),
+                             **{name: np.asarray(values, dtype='f8') for name, values in arrays.items()})
+            else:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'meta': meta, 'arrays': arrays}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+            return path
+        except Exception as e:
+            print(f"시나리오 저장 실패 ({os.path.basename(path)}): {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+def _encode_rng_state(state):
+    """random.Random.getstate() → JSON 저장 형식"""
+    if state is None:
+        return None
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+def _decode_rng_state(state):
+    """JSON 저장 형식 → random.Random.setstate() 인자"""
+    if state is None:
+        return None
+    version, internal, gauss_next = state
+    return (version, tuple(internal), gauss_next)
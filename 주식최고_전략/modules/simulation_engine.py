@@ -12,10 +12,14 @@ from datetime import datetime
 class SimulationEngine:
     """시뮬레이션 실행을 전담하는 모듈"""
     
-    def __init__(self, initial_price=100):
+    def __init__(self, initial_price=100, seed=None):
         self.initial_price = initial_price
         self.current_price = initial_price
         
+        # 실행 시드 (같은 시드 = 같은 과거 데이터와 같은 시장 시나리오 순서)
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        
         # 시뮬레이션 설정
         self.trading_costs = {
             '매매수수료': 0.00015,  # 0.015%
@@ -32,6 +36,9 @@ class SimulationEngine:
         # 가격 기록
         self.price_history = []
         
+        # 모멘텀용 과거 20일 합계 캐시 (과거 데이터 리스트, 합계)
+        self._momentum_cache = None
+        
         # 시뮬레이션 통계
         self.simulation_stats = {
             '총시뮬레이션': 0,
@@ -40,16 +47,17 @@ class SimulationEngine:
             '평균수익률': 0.0
         }
     
-    def _generate_historical_data(self):
+    def _generate_historical_data(self, rng=None):
         """과거 120일 데이터 생성 (이동평균용)"""
         print("과거 120일 데이터 생성 중...")
+        rng = rng or self.rng
         
         prices = []
         current = self.initial_price
         
         # 120일 전부터 현재까지의 자연스러운 가격 변동
         for day in range(120):
-            daily_change = random.uniform(-2.5, 2.5)  # 일일 변동률 -2.5% ~ +2.5%
+            daily_change = rng.uniform(-2.5, 2.5)  # 일일 변동률 -2.5% ~ +2.5%
             current = current * (1 + daily_change / 100)
             current = max(50, min(200, current))  # 50~200원 범위 제한
             prices.append(current)
@@ -60,12 +68,16 @@ class SimulationEngine:
         
         print(f"과거 데이터 생성 완료: {self.historical_data[0]:.1f}원 → {self.historical_data[-1]:.1f}원")
     
-    def generate_market_data(self, days=135):
-        """시장 데이터 생성"""
+    def generate_market_data(self, days=135, seed=None):
+        """시장 데이터 생성 (seed가 없으면 엔진 난수에서 시나리오 시드를 뽑음, 결과의 '시드'로 재현)"""
         print(f"=== {days}일간 시장 데이터 생성 ===")
         
+        if seed is None:
+            seed = self.rng.randrange(2**32)
+        rng = random.Random(seed)
+        
         # 시장 분위기 결정
-        market_sentiment = random.choices(
+        market_sentiment = rng.choices(
             ['강세장', '약세장', '횡보장', '변동성장'],
             weights=[25, 25, 35, 15]
         )[0]
@@ -88,13 +100,13 @@ class SimulationEngine:
         
         for day in range(days):
             # 기본 변동률
-            base_change = random.normalvariate(0, config['volatility'])
+            base_change = rng.normalvariate(0, config['volatility'])
             
             # 추세 적용
             trend_change = config['trend'] * (1 + day / days)  # 시간에 따른 추세 강화
             
             # 바이어스 적용
-            bias_change = config['bias'] * random.uniform(0.5, 1.5)
+            bias_change = config['bias'] * rng.uniform(0.5, 1.5)
             
             # 최종 변동률
             total_change = base_change + trend_change + bias_change
@@ -118,17 +130,33 @@ class SimulationEngine:
         # 시간별 데이터 생성 (일간 데이터 기반)
         hourly_data = []
         for daily in daily_data:
-            hourly_data.extend(self._generate_hourly_data_from_daily(daily))
+            hourly_data.extend(self._generate_hourly_data_from_daily(daily, rng))
         
         return {
             '시장분위기': market_sentiment,
+            '시드': seed,
             '일간데이터': daily_data,
             '시간데이터': hourly_data,
+            '일별시간데이터': self._build_day_index(hourly_data),
             '최종수익률': (current_price - self.initial_price) / self.initial_price * 100
         }
     
-    def _generate_hourly_data_from_daily(self, daily_data):
+    def _build_day_index(self, hourly_data):
+        """일차별 시간데이터 표 생성 (전략마다 시간데이터 전체를 훑지 않도록 시장 데이터당 한 번만 계산)"""
+        hourly_by_day = {}
+        for hour_data in hourly_data:
+            hourly_by_day.setdefault(hour_data['일차'], []).append(hour_data)
+        return hourly_by_day
+    
+    def _get_day_index(self, market_data):
+        """시장 데이터의 일차별 시간데이터 표 (없으면 한 번 만들어 저장)"""
+        if '일별시간데이터' not in market_data:
+            market_data['일별시간데이터'] = self._build_day_index(market_data['시간데이터'])
+        return market_data['일별시간데이터']
+    
+    def _generate_hourly_data_from_daily(self, daily_data, rng=None):
         """일간 데이터에서 시간별 데이터 생성"""
+        rng = rng or self.rng
         start_price = daily_data['시가']
         end_price = daily_data['종가']
         day_num = daily_data['일차']
@@ -147,7 +175,7 @@ class SimulationEngine:
             target_progress_price = start_price + (end_price - start_price) * progress
             
             # 실제 변동 (목표가 ± 랜덤 변동)
-            random_factor = random.uniform(-0.5, 0.5) * vol_factor
+            random_factor = rng.uniform(-0.5, 0.5) * vol_factor
             new_price = target_progress_price * (1 + random_factor / 100)
             
             # 시간별 기록
@@ -174,9 +202,11 @@ class SimulationEngine:
                 strategy_state['초기패널티'] = yellow_card_penalty
                 strategy_state['현재자산'] -= yellow_card_penalty
             
-            # 일일 시뮬레이션 실행
+            # 일일 시뮬레이션 실행 (일차별 시간데이터는 표에서 바로 조회)
+            day_index = self._get_day_index(market_data)
             for day_data in market_data['일간데이터']:
-                daily_result = self._simulate_daily_trading(strategy, strategy_state, day_data, market_data['시간데이터'])
+                day_hourly_data = day_index.get(day_data['일차'], [])
+                daily_result = self._simulate_daily_trading(strategy, strategy_state, day_data, day_hourly_data)
                 
                 # 손절 체크
                 current_return = (strategy_state['현재자산'] - strategy_state['초기자산']) / strategy_state['초기자산'] * 100
@@ -226,10 +256,9 @@ class SimulationEngine:
             '초기패널티': 0
         }
     
-    def _simulate_daily_trading(self, strategy, strategy_state, day_data, hourly_data):
-        """일일 거래 시뮬레이션"""
+    def _simulate_daily_trading(self, strategy, strategy_state, day_data, day_hourly_data):
+        """일일 거래 시뮬레이션 (day_hourly_data: 해당 일차의 시간데이터)"""
         day_num = day_data['일차']
-        day_hourly_data = [h for h in hourly_data if h['일차'] == day_num]
         
         daily_trades = []
         
@@ -418,9 +447,10 @@ class SimulationEngine:
         if len(self.historical_data) < 20:
             return False
         
-        # 20일 이동평균 계산
-        recent_20 = self.historical_data[-20:] + [current_price]
-        ma_20 = sum(recent_20) / len(recent_20)
+        # 20일 이동평균 계산 (과거 20일 합계는 과거 데이터가 바뀔 때만 다시 계산)
+        if self._momentum_cache is None or self._momentum_cache[0] is not self.historical_data:
+            self._momentum_cache = (self.historical_data, sum(self.historical_data[-20:]))
+        ma_20 = (self._momentum_cache[1] + current_price) / 21
         
         # 상승 모멘텀 확인
         return current_price > ma_20 * 1.02  # 20일 평균보다 2% 이상 상승
@@ -5,6 +5,8 @@
 매수전략타입을 포함한 완전한 고유 식별자 시스템
 """
 
+from .strategy_generator import StrategyGenerator
+
 class StrategyAttributes:
     """전략 속성 변환 및 고유 식별자 생성 전담 모듈"""
     
@@ -33,6 +35,202 @@ class StrategyAttributes:
             "4": "급진고무줄",
             "5": "일존버"
         }
+        
+        # 정수 ID 인코딩 테이블 (StrategyGenerator 격자 기준)
+        self._build_id_tables(StrategyGenerator())
+    
+    def _build_id_tables(self, generator):
+        """혼합 진법 정수 ID 테이블 생성
+        
+        자릿수 순서: 매수전략타입, 하락률 인덱스, 구매방식, 수량 인덱스, 손절 인덱스, 매도전략, 수익파라미터 인덱스
+        """
+        # 매수전략타입 (buy_strategy_mapping 순서)
+        self._id_buy_types = list(self.buy_strategy_mapping.keys())
+        self._id_buy_index = {name: i for i, name in enumerate(self._id_buy_types)}
+        
+        # 하락률 (매수전략타입별 범위, 범위 없는 전략은 0.0 하나)
+        self._id_decline_values = {}
+        for name in self._id_buy_types:
+            config = generator.buy_strategies.get(name, {})
+            self._id_decline_values[name] = [round(float(rate), 1) for rate in config.get("범위", [0.0])]
+        self._id_decline_index = {name: {rate: i for i, rate in enumerate(values)}
+                                  for name, values in self._id_decline_values.items()}
+        
+        # 구매방식별 매수수량 (퍼센트는 비율로 정규화)
+        self._id_quantity_values = {
+            1: [round(percent / 100.0, 3) for percent in generator.buy_quantities["퍼센트"]["범위"]],
+            2: [round(float(shares), 3) for shares in generator.buy_quantities["고정주식"]["범위"]]
+        }
+        self._id_quantity_index = {method: {quantity: i for i, quantity in enumerate(values)}
+                                   for method, values in self._id_quantity_values.items()}
+        
+        # 손절라인
+        self._id_stop_values = [round(float(stop), 1) for stop in generator.stop_loss_lines]
+        self._id_stop_index = {stop: i for i, stop in enumerate(self._id_stop_values)}
+        
+        # 매도전략별 수익파라미터 (convert_strategy_to_attributes의 수익라인 형태)
+        self._id_sell_types = list(self.sell_strategy_mapping.keys())
+        self._id_sell_index = {sell_type: i for i, sell_type in enumerate(self._id_sell_types)}
+        self._id_profit_values = {}
+        for config in generator.sell_strategies.values():
+            sell_type = config["타입"]
+            if "수익률" in config:
+                values = [float(rate) for rate in config["수익률"]]
+            elif "일수" in config:
+                values = [int(days) for days in config["일수"]]
+            else:
+                values = [f"{float(start)},{float(increase)}" for start in config["시작"] for increase in config["증가"]]
+            self._id_profit_values[sell_type] = values
+        self._id_profit_index = {sell_type: {profit: i for i, profit in enumerate(values)}
+                                 for sell_type, values in self._id_profit_values.items()}
+        
+        # 진법 (각 자리의 최대 크기)
+        self._id_radix_decline = max(len(values) for values in self._id_decline_values.values())
+        self._id_radix_quantity = max(len(values) for values in self._id_quantity_values.values())
+        self._id_radix_stop = len(self._id_stop_values)
+        self._id_radix_profit = max(len(values) for values in self._id_profit_values.values())
+        
+        # 원본 값 → 자릿값 빠른 조회 (생성기 전략은 속성 변환 없이 자릿값 합으로 ID 계산)
+        self._id_fast_buy = {name: self._combine_id(i, 0, 1, 0, 0, 0, 0)
+                             for name, i in self._id_buy_index.items()}
+        self._id_fast_decline = {name: {rate: self._combine_id(0, i, 1, 0, 0, 0, 0)
+                                        for rate, i in index.items()}
+                                 for name, index in self._id_decline_index.items()}
+        self._id_fast_quantity = {
+            "1": {percent: self._combine_id(0, 0, 1, i, 0, 0, 0)
+                  for i, percent in enumerate(generator.buy_quantities["퍼센트"]["범위"])},
+            "2": {shares: self._combine_id(0, 0, 2, i, 0, 0, 0)
+                  for i, shares in enumerate(generator.buy_quantities["고정주식"]["범위"])}
+        }
+        self._id_fast_stop = {stop: self._combine_id(0, 0, 1, 0, i, 0, 0)
+                              for stop, i in self._id_stop_index.items()}
+        self._id_fast_profit = {}
+        for config in generator.sell_strategies.values():
+            sell_type = config["타입"]
+            if "수익률" in config:
+                raw_values = config["수익률"]
+            elif "일수" in config:
+                raw_values = config["일수"]
+            else:
+                raw_values = [f"{start},{increase}" for start in config["시작"] for increase in config["증가"]]
+            self._id_fast_profit[sell_type] = {profit: self._combine_id(0, 0, 1, 0, 0, self._id_sell_index[sell_type], i)
+                                               for i, profit in enumerate(raw_values)}
+    
+    def _combine_id(self, buy, decline, method, quantity, stop, sell, profit):
+        """자릿수 인덱스를 정수 ID로 결합"""
+        strategy_id = buy
+        strategy_id = strategy_id * self._id_radix_decline + decline
+        strategy_id = strategy_id * 2 + (method - 1)
+        strategy_id = strategy_id * self._id_radix_quantity + quantity
+        strategy_id = strategy_id * self._id_radix_stop + stop
+        strategy_id = strategy_id * len(self._id_sell_types) + sell
+        strategy_id = strategy_id * self._id_radix_profit + profit
+        return strategy_id
+    
+    def strategy_id_count(self):
+        """정수 ID 공간 크기 (최대 ID + 1, 비트맵 길이)"""
+        return self._combine_id(len(self._id_buy_types) - 1, self._id_radix_decline - 1, 2,
+                                self._id_radix_quantity - 1, self._id_radix_stop - 1,
+                                len(self._id_sell_types) - 1, self._id_radix_profit - 1) + 1
+    
+    def grid_component_ids(self, buy_strategies, buy_quantities, stop_losses, sell_strategies):
+        """생성기 구성요소별 ID 자릿값 목록 (격자 칸 ID = 네 자릿값의 합, 격자 밖 값이 있으면 None)"""
+        try:
+            buy_ids = [self._id_fast_buy[buy["매수기준"]] + self._id_fast_decline[buy["매수기준"]][buy["매수하락률"]]
+                       for buy in buy_strategies]
+            quantity_ids = [self._id_fast_quantity[quantity["구매방식"]][quantity["매수수량"]] for quantity in buy_quantities]
+            stop_ids = [self._id_fast_stop[stop] for stop in stop_losses]
+            sell_ids = [self._id_fast_profit[sell["매도전략"]][sell["수익라인"]] for sell in sell_strategies]
+        except (KeyError, TypeError):
+            return None
+        return buy_ids, quantity_ids, stop_ids, sell_ids
+    
+    def encode_strategy_id(self, strategy):
+        """전략을 정수 ID로 변환 (격자 밖 전략은 None)"""
+        # 생성기 전략은 원본 값 그대로 자릿값 조회
+        try:
+            buy_type = strategy['매수기준']
+            return (self._id_fast_buy[buy_type]
+                    + self._id_fast_decline[buy_type][strategy['매수하락률']]
+                    + self._id_fast_quantity[strategy['구매방식']][strategy['매수수량']]
+                    + self._id_fast_stop[strategy['손절라인']]
+                    + self._id_fast_profit[strategy['매도전략']][strategy['수익라인']])
+        except (KeyError, TypeError):
+            pass
+        
+        # 그 외 형태는 키와 같은 정규화를 거쳐 변환
+        attributes = self.convert_strategy_to_attributes(strategy)
+        if not attributes:
+            return None
+        return self.convert_attributes_to_id(attributes)
+    
+    def convert_attributes_to_id(self, attributes):
+        """속성을 정수 ID로 변환 (격자 밖 속성은 None)"""
+        try:
+            buy_type = self.reverse_buy_mapping[attributes['매수전략타입']]
+            method = int(attributes['구매방식'])
+            sell_type = str(attributes['매도전략'])
+            
+            profit_line = attributes['수익라인']
+            if isinstance(profit_line, str) and ',' in profit_line:
+                profit_parts = profit_line.split(',')
+                profit_line = f"{float(profit_parts[0])},{float(profit_parts[1])}"
+            elif sell_type == '5':
+                profit_line = int(float(profit_line))
+            else:
+                profit_line = float(profit_line)
+            
+            return self._combine_id(
+                self._id_buy_index[buy_type],
+                self._id_decline_index[buy_type][round(float(attributes['매수하락률']), 1)],
+                method,
+                self._id_quantity_index[method][round(float(attributes['매수수량']), 3)],
+                self._id_stop_index[round(float(attributes['손절라인']), 1)],
+                self._id_sell_index[sell_type],
+                self._id_profit_index[sell_type][profit_line]
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def convert_key_to_id(self, strategy_key):
+        """고유 키를 정수 ID로 변환 (구버전 키 등 변환 불가하면 None)"""
+        if not isinstance(strategy_key, str) or strategy_key.count('_') != 6:
+            return None
+        attributes = self.convert_key_to_attributes(strategy_key)
+        if not attributes:
+            return None
+        return self.convert_attributes_to_id(attributes)
+    
+    def decode_strategy_id(self, strategy_id):
+        """정수 ID를 속성으로 복원 (범위 밖 ID는 None)"""
+        if not isinstance(strategy_id, int) or strategy_id < 0:
+            return None
+        
+        strategy_id, profit = divmod(strategy_id, self._id_radix_profit)
+        strategy_id, sell = divmod(strategy_id, len(self._id_sell_types))
+        strategy_id, stop = divmod(strategy_id, self._id_radix_stop)
+        strategy_id, quantity = divmod(strategy_id, self._id_radix_quantity)
+        strategy_id, method = divmod(strategy_id, 2)
+        buy, decline = divmod(strategy_id, self._id_radix_decline)
+        method += 1
+        
+        if buy >= len(self._id_buy_types):
+            return None
+        buy_type = self._id_buy_types[buy]
+        sell_type = self._id_sell_types[sell]
+        
+        try:
+            return {
+                '매수전략타입': self.buy_strategy_mapping[buy_type],
+                '매수하락률': self._id_decline_values[buy_type][decline],
+                '구매방식': method,
+                '매수수량': self._id_quantity_values[method][quantity],
+                '손절라인': self._id_stop_values[stop],
+                '매도전략': sell_type,
+                '수익라인': self._id_profit_values[sell_type][profit]
+            }
+        except (IndexError, KeyError):
+            return None
     
     def convert_strategy_to_attributes(self, strategy):
         """전략을 속성으로 변환 (새로운 고유 식별자 포함)"""
@@ -8,10 +8,22 @@
 import random
 from itertools import product
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# iter_combinations(compact=True) 레코드 필드 순서
+STRATEGY_RECORD_FIELDS = ("매수기준", "매수하락률", "구매방식", "매수수량", "손절라인", "매도전략", "수익라인")
+
 class StrategyGenerator:
     """전략 조합 생성을 전담하는 모듈"""
     
     def __init__(self):
+        # 마지막 iter_combinations 집계 (총조합/유효/제외)
+        self.last_generation_stats = None
+        
         # 매수 전략 정의
         self.buy_strategies = {
             "시가매수": {"타입": "시가매수", "조건": "시가에서 즉시 매수"},
@@ -145,7 +157,25 @@ class StrategyGenerator:
         return strategies
     
     def generate_all_combinations(self, exclusion_manager=None):
-        """모든 전략 조합 생성"""
+        """모든 전략 조합 생성 (전체 목록, iter_combinations 묶음을 이어붙임)"""
+        valid_strategies = []
+        for batch in self.iter_combinations(exclusion_manager):
+            valid_strategies.extend(batch)
+        
+        stats = self.last_generation_stats
+        print(f"\n전략 조합 생성 완료:")
+        print(f"  총 조합: {stats['총조합']:,}개")
+        print(f"  유효 전략: {stats['유효']:,}개")
+        print(f"  제외된 전략: {stats['제외']:,}개")
+        print(f"  제외율: {stats['제외']/stats['총조합']*100:.1f}%")
+        
+        return valid_strategies
+    
+    def iter_combinations(self, exclusion_manager=None, batch_size=10000, compact=False):
+        """모든 전략 조합을 batch_size개씩 목록으로 생성
+        
+        compact=True면 전략 객체 대신 STRATEGY_RECORD_FIELDS 순서의 튜플을 생성한다 (record_to_strategy로 복원).
+        """
         print("=== 전체 전략 조합 생성 시작 ===")
         
         # 각 전략 요소 생성
@@ -153,80 +183,130 @@ class StrategyGenerator:
         buy_quantities = self.generate_buy_quantities()
         stop_losses = self.generate_stop_loss_strategies()
         sell_strategies = self.generate_sell_strategies()
+        components = (buy_strategies, buy_quantities, stop_losses, sell_strategies)
         
         print(f"구성 요소: 매수({len(buy_strategies)}) × 수량({len(buy_quantities)}) × 손절({len(stop_losses)}) × 매도({len(sell_strategies)})")
         
         total_combinations = len(buy_strategies) * len(buy_quantities) * len(stop_losses) * len(sell_strategies)
         print(f"이론적 총 조합 수: {total_combinations:,}개")
         
-        # 조합 생성
-        valid_strategies = []
+        make = self._record_from_parts if compact else self._build_strategy
+        valid_count = 0
         excluded_count = 0
         
-        for i, (buy_strategy, quantity, stop_loss, sell_strategy) in enumerate(
-            product(buy_strategies, buy_quantities, stop_losses, sell_strategies)
-        ):
-            # 전략 객체 생성
-            strategy = {
-                "매수기준": buy_strategy["매수기준"],
-                "매수하락률": buy_strategy["매수하락률"],
-                "구매방식": quantity["구매방식"],
-                "매수수량": quantity["매수수량"],
-                "손절라인": stop_loss,
-                "매도전략": sell_strategy["매도전략"],
-                "수익라인": sell_strategy["수익라인"],
-                "전략설명": f"{buy_strategy['전략설명']} + {quantity['설명']} + 손절{stop_loss}% + {sell_strategy['설명']}"
-            }
-            
-            # 제외 여부 확인
-            if exclusion_manager and exclusion_manager.should_exclude(strategy):
-                excluded_count += 1
-                continue
-            
-            valid_strategies.append(strategy)
+        # 제외 비트마스크가 있으면 살아남은 칸만 전략으로 만듦
+        survivor_mask = self.build_survivor_mask(components, exclusion_manager) if exclusion_manager else None
+        if survivor_mask is not None:
+            survivors = np.flatnonzero(survivor_mask)
+            excluded_count = total_combinations - len(survivors)
+            for start in range(0, len(survivors), batch_size):
+                batch = [make(*self._cell_parts(int(index), components)) for index in survivors[start:start + batch_size]]
+                valid_count += len(batch)
+                yield batch
+        else:
+            batch = []
+            for i, parts in enumerate(product(*components)):
+                strategy = self._build_strategy(*parts) if (exclusion_manager or not compact) else None
+                
+                # 제외 여부 확인
+                if exclusion_manager and exclusion_manager.should_exclude(strategy):
+                    excluded_count += 1
+                    continue
+                
+                batch.append(self._record_from_parts(*parts) if compact else strategy)
+                valid_count += 1
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                
+                # 진행률 출력 (10만개마다)
+                if (i + 1) % 100000 == 0:
+                    print(f"진행: {i+1:,} / {total_combinations:,} ({(i+1)/total_combinations*100:.1f}%) - 유효: {valid_count:,}, 제외: {excluded_count:,}")
             
-            # 진행률 출력 (10만개마다)
-            if (i + 1) % 100000 == 0:
-                print(f"진행: {i+1:,} / {total_combinations:,} ({(i+1)/total_combinations*100:.1f}%) - 유효: {len(valid_strategies):,}, 제외: {excluded_count:,}")
+            if batch:
+                yield batch
         
-        print(f"\n전략 조합 생성 완료:")
-        print(f"  총 조합: {total_combinations:,}개")
-        print(f"  유효 전략: {len(valid_strategies):,}개")
-        print(f"  제외된 전략: {excluded_count:,}개")
-        print(f"  제외율: {excluded_count/total_combinations*100:.1f}%")
+        self.last_generation_stats = {'총조합': total_combinations, '유효': valid_count, '제외': excluded_count}
+    
+    def build_survivor_mask(self, components, exclusion_manager, current_market=None):
+        """격자 칸별 생존 여부 배열 (매수 × 수량 × 손절 × 매도 product 순서, 만들 수 없으면 None)"""
+        if not NUMPY_AVAILABLE or not hasattr(exclusion_manager, 'exclusion_mask'):
+            return None
         
-        return valid_strategies
+        component_ids = exclusion_manager.strategy_attributes.grid_component_ids(*components)
+        if component_ids is None:
+            return None
+        
+        # 칸 ID = 구성요소 자릿값의 합 (브로드캐스트로 전체 격자 한 번에 계산)
+        buy_ids, quantity_ids, stop_ids, sell_ids = (np.array(ids, dtype='i8') for ids in component_ids)
+        cell_ids = (buy_ids[:, None, None, None] + quantity_ids[None, :, None, None]
+                    + stop_ids[None, None, :, None] + sell_ids[None, None, None, :]).ravel()
+        
+        return ~exclusion_manager.exclusion_mask(cell_ids, current_market)
     
-    def generate_sample_strategies(self, count=1000, exclusion_manager=None):
-        """샘플 전략 생성 (테스트용)"""
+    def _cell_parts(self, index, components):
+        """격자 칸 번호를 (매수, 수량, 손절, 매도) 구성요소로 변환 (product 순서와 동일)"""
+        buy_strategies, buy_quantities, stop_losses, sell_strategies = components
+        index, sell_index = divmod(index, len(sell_strategies))
+        index, stop_index = divmod(index, len(stop_losses))
+        buy_index, quantity_index = divmod(index, len(buy_quantities))
+        return (buy_strategies[buy_index], buy_quantities[quantity_index],
+                stop_losses[stop_index], sell_strategies[sell_index])
+    
+    def _record_from_parts(self, buy_strategy, quantity, stop_loss, sell_strategy):
+        """구성요소로 압축 레코드 생성 (STRATEGY_RECORD_FIELDS 순서 튜플)"""
+        return (buy_strategy["매수기준"], buy_strategy["매수하락률"], quantity["구매방식"], quantity["매수수량"],
+                stop_loss, sell_strategy["매도전략"], sell_strategy["수익라인"])
+    
+    def record_to_strategy(self, record):
+        """압축 레코드를 전략 객체로 복원 (전략설명 제외)"""
+        return dict(zip(STRATEGY_RECORD_FIELDS, record))
+    
+    def _build_strategy(self, buy_strategy, quantity, stop_loss, sell_strategy):
+        """구성요소로 전략 객체 생성"""
+        return {
+            "매수기준": buy_strategy["매수기준"],
+            "매수하락률": buy_strategy["매수하락률"],
+            "구매방식": quantity["구매방식"],
+            "매수수량": quantity["매수수량"],
+            "손절라인": stop_loss,
+            "매도전략": sell_strategy["매도전략"],
+            "수익라인": sell_strategy["수익라인"],
+            "전략설명": f"{buy_strategy['전략설명']} + {quantity['설명']} + 손절{stop_loss}% + {sell_strategy['설명']}"
+        }
+    
+    def generate_sample_strategies(self, count=1000, exclusion_manager=None, replacement=True, rng=None):
+        """샘플 전략 생성 (테스트용)
+        
+        replacement=False면 제외되지 않은 격자 칸 번호를 무작위 순열로 뽑아 재시도 없이 중복 없는 샘플을 만든다.
+        rng(random.Random)를 주면 그 난수로 뽑아 같은 시드에서 같은 샘플을 만든다.
+        """
         print(f"=== 샘플 전략 {count}개 생성 ===")
+        rng = rng or random
         
         buy_strategies = self.generate_buy_strategies()
         buy_quantities = self.generate_buy_quantities()
         stop_losses = self.generate_stop_loss_strategies()
         sell_strategies = self.generate_sell_strategies()
+        components = (buy_strategies, buy_quantities, stop_losses, sell_strategies)
+        
+        if not replacement:
+            return self._sample_without_replacement(count, components, exclusion_manager, rng)
         
         valid_strategies = []
+        seen_cells = set()  # 뽑힌 격자 칸 번호 (중복 체크 O(1))
         attempts = 0
         max_attempts = count * 10  # 최대 시도 횟수
         
         while len(valid_strategies) < count and attempts < max_attempts:
-            # 랜덤 조합 선택
-            buy_strategy = random.choice(buy_strategies)
-            quantity = random.choice(buy_quantities)
-            stop_loss = random.choice(stop_losses)
-            sell_strategy = random.choice(sell_strategies)
+            # 랜덤 조합 선택 (random.choice와 같은 난수 순서로 인덱스 선택)
+            buy_index = rng.randrange(len(buy_strategies))
+            quantity_index = rng.randrange(len(buy_quantities))
+            stop_index = rng.randrange(len(stop_losses))
+            sell_index = rng.randrange(len(sell_strategies))
             
-            strategy = {
-                "매수기준": buy_strategy["매수기준"],
-                "매수하락률": buy_strategy["매수하락률"],
-                "구매방식": quantity["구매방식"],
-                "매수수량": quantity["매수수량"],
-                "손절라인": stop_loss,
-                "매도전략": sell_strategy["매도전략"],
-                "수익라인": sell_strategy["수익라인"],
-                "전략설명": f"{buy_strategy['전략설명']} + {quantity['설명']} + 손절{stop_loss}% + {sell_strategy['설명']}"
-            }
+            strategy = self._build_strategy(buy_strategies[buy_index], buy_quantities[quantity_index],
+                                            stop_losses[stop_index], sell_strategies[sell_index])
             
             # 제외 여부 확인
             if exclusion_manager and exclusion_manager.should_exclude(strategy):
@@ -234,20 +314,60 @@ class StrategyGenerator:
                 continue
             
             # 중복 체크
-            strategy_key = self._generate_strategy_key(strategy)
-            if any(self._generate_strategy_key(s) == strategy_key for s in valid_strategies):
+            cell = ((buy_index * len(buy_quantities) + quantity_index) * len(stop_losses) + stop_index) * len(sell_strategies) + sell_index
+            if cell in seen_cells:
                 attempts += 1
                 continue
             
+            seen_cells.add(cell)
             valid_strategies.append(strategy)
             attempts += 1
         
         print(f"샘플 전략 생성 완료: {len(valid_strategies)}개 (시도: {attempts}회)")
         return valid_strategies
     
-    def _generate_strategy_key(self, strategy):
-        """전략 키 생성 (중복 체크용)"""
-        return f"{strategy['매수기준']}_{strategy['매수하락률']}_{strategy['구매방식']}_{strategy['매수수량']}_{strategy['손절라인']}_{strategy['매도전략']}_{strategy['수익라인']}"
+    def _sample_without_replacement(self, count, components, exclusion_manager=None, rng=None):
+        """제외되지 않은 격자 칸에서 중복 없이 count개 추출"""
+        rng = rng or random
+        total_combinations = 1
+        for component in components:
+            total_combinations *= len(component)
+        
+        # 생존 칸 번호를 알면 그 안에서 바로 추출
+        survivor_mask = self.build_survivor_mask(components, exclusion_manager) if exclusion_manager else None
+        if survivor_mask is not None:
+            survivors = np.flatnonzero(survivor_mask)
+            picks = rng.sample(range(len(survivors)), min(count, len(survivors)))
+            valid_strategies = [self._build_strategy(*self._cell_parts(int(survivors[pick]), components)) for pick in picks]
+            checked = len(picks)
+        elif not exclusion_manager:
+            # 제외 검사가 없으면 요청한 개수만 바로 추출
+            picks = rng.sample(range(total_combinations), min(count, total_combinations))
+            valid_strategies = [self._build_strategy(*self._cell_parts(cell, components)) for cell in picks]
+            checked = len(picks)
+        else:
+            # 마스크가 없으면 필요한 만큼만 순열을 펼치며 제외 전략만 건너뜀
+            valid_strategies = []
+            checked = 0
+            for cell in self._lazy_permutation(total_combinations, rng):
+                if len(valid_strategies) >= count:
+                    break
+                checked += 1
+                strategy = self._build_strategy(*self._cell_parts(cell, components))
+                if exclusion_manager.should_exclude(strategy):
+                    continue
+                valid_strategies.append(strategy)
+        
+        print(f"샘플 전략 생성 완료: {len(valid_strategies)}개 (비복원 추출, 확인: {checked}칸)")
+        return valid_strategies
+    
+    def _lazy_permutation(self, total, rng):
+        """0..total-1 무작위 순열을 앞에서부터 하나씩 생성 (바뀐 자리만 dict에 기록하는 Fisher-Yates)"""
+        swapped = {}
+        for position in range(total):
+            target = rng.randrange(position, total)
+            yield swapped.get(target, target)
+            swapped[target] = swapped.pop(position, position)
     
     def get_strategy_info(self):
         """전략 정보 요약 반환"""
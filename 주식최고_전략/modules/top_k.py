@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상위 K개 추적 모듈 - 크기 K로 제한한 최소 힙으로 한 번 훑으며 상위 K개 유지 (O(n log k))
+점수가 높은 순, 같은 점수는 tie_key(전략 키 등) 오름차순, 그것도 같으면 먼저 넣은 항목 우선이라
+입력 순서와 관계없이 결과가 결정적이다 (tie_key는 힙에 들어갈 후보에서만 계산)
+"""
+
+import heapq
+import itertools
+
+class _Descending:
+    """tie_key 역순 비교 래퍼 (힙 루트 = 가장 밀려날 항목이 되도록)"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+class TopK:
+    """점수 상위 k개 항목 추적기"""
+
+    def __init__(self, k, tie_key=None):
+        self.k = k
+        self.tie_key = tie_key
+        self._heap = []  # (점수, _Descending(tie), -순번, 항목), 루트 = 현재 k위
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _entry(self, score, item):
+        tie = self.tie_key(item) if self.tie_key else None
+        return (score, _Descending(tie), -next(self._counter), item)
+
+    def push(self, item, score):
+        """항목 추가 (상위 k개 밖이면 버림), 들어갔으면 True"""
+        if self.k <= 0:
+            return False
+        heap = self._heap
+        if len(heap) < self.k:
+            heapq.heappush(heap, self._entry(score, item))
+            return True
+        if score < heap[0][0]:
+            return False  # 현재 k위보다 낮으면 tie_key 계산 없이 버림
+        entry = self._entry(score, item)
+        if entry[:3] > heap[0][:3]:
+            heapq.heapreplace(heap, entry)
+            return True
+        return False
+
+    def extend(self, items, key):
+        """key(항목)을 점수로 여러 항목 추가"""
+        for item in items:
+            self.push(item, key(item))
+
+    def items(self):
+        """상위 항목 목록 (1위부터)"""
+        return [entry[3] for entry in self.ranked()]
+
+    def scored_items(self):
+        """(점수, 항목) 목록 (1위부터)"""
+        return [(entry[0], entry[3]) for entry in self.ranked()]
+
+    def ranked(self):
+        return sorted(self._heap, key=lambda entry: entry[:3], reverse=True)
+
+def top_k(items, k, key, tie_key=None):
+    """items 중 key 점수 상위 k개 (1위부터, 같은 점수는 tie_key 오름차순)"""
+    tracker = TopK(k, tie_key)
+    tracker.extend(items, key)
+    return tracker.items()
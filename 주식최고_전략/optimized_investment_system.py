@@ -11,6 +11,10 @@
 import os
 import sys
 import time
+import json
+import random
+import argparse
+import contextlib
 from datetime import datetime
 
 # 모듈 임포트
@@ -21,6 +25,8 @@ try:
     from modules.exclusion_manager import ExclusionManager
     from modules.simulation_engine import SimulationEngine
     from modules.analysis_reporter import AnalysisReporter
+    from modules.path_config import resolve_paths, stage_scratch_files, sync_scratch_files, ENV_CONFIG_FILE
+    from modules.run_profiler import RunProfiler
 except ImportError as e:
     print(f"모듈 임포트 오류: {e}")
     print("modules/ 폴더가 올바르게 설정되었는지 확인하세요.")
@@ -29,22 +35,34 @@ except ImportError as e:
 class OptimizedInvestmentSystem:
     """최적화된 투자 분석 시스템 - 메인 컨트롤러"""
     
-    def __init__(self, base_path=None):
-        if base_path is None:
-            base_path = r"C:\Users\ksj\OneDrive\바탕 화면\gemini\제작파일\주식최고_전략"
+    def __init__(self, base_path=None, scratch_path=None, seed=None, storage='json', exclusion_cache='memory'):
+        # 인자 > 환경변수 > 경로설정.json > 기존 OneDrive 폴더 > 프로젝트 폴더
+        base_path, scratch_path = resolve_paths(base_path, scratch_path)
         
         self.base_path = base_path
+        self.scratch_path = scratch_path
         print(f"=== 최적화된 투자 분석 시스템 초기화 ===")
         print(f"기본 경로: {base_path}")
         
+        # 실행 시드: 시장 데이터(엔진 시드)와 전략 샘플링이 모두 이 시드에서 결정됨
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        print(f"실행 시드: {self.seed}")
+        if scratch_path:
+            stage_scratch_files(base_path, scratch_path)
+            print(f"작업 경로: {scratch_path}")
+        
         # 모듈 초기화
-        self.data_manager = DataManager(base_path)
+        self.data_manager = DataManager(base_path, storage=storage, scratch_path=scratch_path)
         self.strategy_generator = StrategyGenerator()
         self.strategy_attributes = StrategyAttributes()
-        self.exclusion_manager = ExclusionManager(self.data_manager)
-        self.simulation_engine = SimulationEngine()
+        self.exclusion_manager = ExclusionManager(self.data_manager, cache_mode=exclusion_cache)
+        self.simulation_engine = SimulationEngine(seed=self.rng.randrange(2**32))
         self.analysis_reporter = AnalysisReporter()
         
+        # 구간별 시간/카운터 계측 (기본 꺼짐, --profile로 켜면 실행 끝에 프로파일 JSON 저장)
+        self.profiler = RunProfiler()
+        
         # 시스템 상태
         self.current_market_data = None
         self.last_simulation_results = []
@@ -65,7 +83,8 @@ class OptimizedInvestmentSystem:
         
         # 1. 시장 데이터 생성
         print("\n1. 시장 데이터 생성...")
-        self.current_market_data = self.simulation_engine.generate_market_data(market_days)
+        with self.profiler.phase('데이터생성'):
+            self.current_market_data = self.simulation_engine.generate_market_data(market_days)
         market_sentiment = self.current_market_data['시장분위기']
         market_return = self.current_market_data['최종수익률']
         print(f"   시장 분위기: {market_sentiment}")
@@ -73,7 +92,8 @@ class OptimizedInvestmentSystem:
         
         # 2. 제외 데이터 로드
         print("\n2. 제외 데이터 로드...")
-        self.exclusion_manager.load_exclusion_data()
+        with self.profiler.phase('제외데이터로드'):
+            self.exclusion_manager.load_exclusion_data()
         exclusion_stats = self.exclusion_manager.get_exclusion_stats()
         print(f"   완전제외: {exclusion_stats.get('총완전제외', 0):,}개")
         print(f"   시장별제외: {exclusion_stats.get('총시장별제외', 0):,}개")
@@ -81,10 +101,17 @@ class OptimizedInvestmentSystem:
         
         # 3. 전략 생성 (샘플)
         print(f"\n3. 전략 생성 (최대 {max_strategies:,}개)...")
-        valid_strategies = self.strategy_generator.generate_sample_strategies(
-            count=max_strategies,
-            exclusion_manager=self.exclusion_manager
-        )
+        stats_before = dict(self.exclusion_manager.exclusion_stats)
+        self.exclusion_manager.profiler = self.profiler if self.profiler.enabled else None  # 제외.검사 집계
+        with self.profiler.phase('전략생성'):
+            valid_strategies = self.strategy_generator.generate_sample_strategies(
+                count=max_strategies,
+                exclusion_manager=self.exclusion_manager,
+                rng=self.rng
+            )
+        # 이번 전략 생성에서 제외 적중한 수 (ExclusionManager 성능 카운터 증가분)
+        for name in ('완전제외', '시장별제외'):
+            self.profiler.count(f'제외.{name}', self.exclusion_manager.exclusion_stats[name] - stats_before[name])
         print(f"   유효 전략: {len(valid_strategies):,}개")
         
         if not valid_strategies:
@@ -103,25 +130,35 @@ class OptimizedInvestmentSystem:
                 remaining = estimated_total - elapsed
                 print(f"   진행: {i+1:,}/{len(valid_strategies):,} ({progress:.1f}%) - 남은 시간: {remaining/60:.1f}분")
             
-            result = self.simulation_engine.run_strategy_simulation(
-                strategy=strategy,
-                market_data=self.current_market_data,
-                exclusion_manager=self.exclusion_manager
-            )
+            with self.profiler.phase('전략시뮬레이션'):
+                result = self.simulation_engine.run_strategy_simulation(
+                    strategy=strategy,
+                    market_data=self.current_market_data,
+                    exclusion_manager=self.exclusion_manager
+                )
             self.last_simulation_results.append(result)
+        self.profiler.count('시뮬레이션.전략', len(valid_strategies))
+        self.profiler.count('시뮬레이션.전략일', len(valid_strategies) * len(self.current_market_data['일간데이터']))
         
         # 5. 결과 분석
         print("\n5. 결과 분석...")
-        analysis_data = self.analysis_reporter.analyze_simulation_results(
-            self.last_simulation_results,
-            self.current_market_data
-        )
+        with self.profiler.phase('결과분석'):
+            analysis_data = self.analysis_reporter.analyze_simulation_results(
+                self.last_simulation_results,
+                self.current_market_data
+            )
+        # 재현용 시드 (같은 실행 시드 = 같은 시장 데이터와 전략 샘플)
+        analysis_data['실행시드'] = self.seed
+        analysis_data['시장데이터시드'] = self.current_market_data['시드']
         
         # 6. 분석 리포트 생성
         print("\n6. 분석 리포트 생성...")
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_file = os.path.join(self.base_path, f"시뮬레이션_분석_{timestamp}.json")
-        self.analysis_reporter.save_analysis_report(analysis_data, report_file)
+        with self.profiler.phase('파일저장'):
+            self.analysis_reporter.save_analysis_report(analysis_data, report_file)
+        self.profiler.count_file('저장바이트.분석리포트', report_file)
+        self.profiler.count_file('저장바이트.텍스트리포트', report_file.replace('.json', '_리포트.txt'))
         
         # 7. 통계 업데이트
         self.system_stats['총시뮬레이션'] += len(valid_strategies)
@@ -149,7 +186,8 @@ class OptimizedInvestmentSystem:
         # 샘플 전략 생성
         strategies = self.strategy_generator.generate_sample_strategies(
             count=test_strategies,
-            exclusion_manager=self.exclusion_manager
+            exclusion_manager=self.exclusion_manager,
+            rng=self.rng
         )
         
         if not strategies:
@@ -262,6 +300,10 @@ class OptimizedInvestmentSystem:
             restored_attrs = self.strategy_attributes.convert_key_to_attributes(key)
             print(f"  복원속성: {restored_attrs}")
             
+            # 정수 ID 생성 및 복원
+            strategy_id = self.strategy_attributes.encode_strategy_id(strategy)
+            print(f"  정수ID: {strategy_id} → {self.strategy_attributes.decode_strategy_id(strategy_id)}")
+            
             # 속성 -> 전략 복원
             restored_strategy = self.strategy_attributes.convert_attributes_to_strategy(attributes)
             print(f"  복원전략: {restored_strategy}")
@@ -293,6 +335,31 @@ class OptimizedInvestmentSystem:
         print(f"   시장 초과율: {market.get('시장초과율', 0):.1f}%")
         print(f"   샤프 비율: {performance.get('샤프비율', 0):.3f}")
     
+    def sync_scratch(self):
+        """바이너리 저장분을 JSON에도 반영하고 작업 경로의 탈락/영구제외 파일을 기본 경로로 반영"""
+        self.data_manager.sync_json_mirrors()
+        if not self.scratch_path:
+            return 0
+        return sync_scratch_files(self.scratch_path, self.base_path)
+    
+    def save_profile(self, file_path, **run_info):
+        """구간별 시간/카운터와 파생지표(초당 처리량, 제외 적중률, 저장 바이트)를 프로파일 JSON으로 저장"""
+        rates = {
+            '전략시뮬레이션_전략_초당': ('시뮬레이션.전략', '전략시뮬레이션'),
+            '전략시뮬레이션_전략일_초당': ('시뮬레이션.전략일', '전략시뮬레이션'),
+            '전략생성_검사_초당': ('제외.검사', '전략생성'),
+            '저장_바이트_초당': ('저장바이트', '파일저장')
+        }
+        ratios = {
+            '제외적중률': (['제외.완전제외', '제외.시장별제외'], ['제외.검사']),
+            '완전제외적중률': (['제외.완전제외'], ['제외.검사']),
+            '시장별제외적중률': (['제외.시장별제외'], ['제외.검사'])
+        }
+        info = dict(run_info, 시드=self.seed)
+        report = self.profiler.save(file_path, rates, ratios, info)
+        print(f"실행 프로파일 저장: {file_path} ({report['전체초']:.1f}초)")
+        return report
+    
     def get_system_status(self):
         """시스템 상태 조회"""
         uptime = datetime.now() - self.system_stats['시스템시작시간']
@@ -312,9 +379,104 @@ class OptimizedInvestmentSystem:
         }
 
 
-def main():
-    """메인 함수 - 대화형 인터페이스"""
-    system = OptimizedInvestmentSystem()
+def parse_args(argv=None):
+    """명령행 인자 해석 (--mode 없으면 대화형 메뉴)"""
+    parser = argparse.ArgumentParser(
+        description="최적화된 투자 분석 시스템 - --mode를 주면 입력 없이 실행하고 stdout에 JSON 요약 출력"
+    )
+    parser.add_argument('--mode', choices=['1', '2', '3', '4', '5', '6'],
+                        help="1 종합 시뮬레이션, 2 빠른 테스트, 3 결과 분석, 4 전략 정보, 5 속성 시스템 테스트, 6 시스템 상태")
+    parser.add_argument('--strategies', type=int, help="전략 수 (기본: 종합 1000, 빠른 테스트 100)")
+    parser.add_argument('--weeks', type=int, default=27, help="종합 시뮬레이션 주수, 1주 = 5거래일 (기본 27)")
+    parser.add_argument('--seed', type=int, help="난수 시드")
+    parser.add_argument('--data-dir', '--output-dir', dest='data_dir',
+                        help="데이터/리포트 폴더 (기본: 환경변수 STOCK_STRATEGY_DATA_DIR, 경로설정.json, 프로젝트 폴더)")
+    parser.add_argument('--scratch-dir', help="탈락/영구제외 파일 작업 폴더 (예: tmpfs, 종료시 데이터 폴더에 반영)")
+    parser.add_argument('--config', help="경로설정 JSON 파일")
+    parser.add_argument('--storage', choices=['json', 'binary'], default='json',
+                        help="탈락/영구제외 압축 파일 저장 형식 (binary: numpy .npz, 종료시 JSON에도 반영, 기본 json)")
+    parser.add_argument('--exclusion-cache', choices=['memory', 'mmap'], default='memory',
+                        help="제외 전략 캐시 (mmap: 작업/데이터 폴더의 제외캐시/에 정수 ID 비트맵 파일, 기본 memory)")
+    parser.add_argument('--profile', metavar='FILE',
+                        help="구간별 시간/카운터를 계측해 실행 프로파일 JSON으로 저장 (기본: 계측 안 함)")
+    parser.add_argument('--quiet', action='store_true', help="진행 출력 없이 JSON 요약만 출력")
+    return parser.parse_args(argv)
+
+def _summarize_result(result):
+    """실행 결과를 JSON 요약용 dict로 축약"""
+    if isinstance(result, dict) and '기본통계' in result:
+        summary = {key: result.get(key) for key in ('총전략수', '시장정보', '기본통계', '시장분석', '시장데이터시드')}
+        summary['상위전략'] = result.get('상위전략', [])[:5]
+        return summary
+    if isinstance(result, list):
+        returns = [r.get('수익률', 0) for r in result]
+        return {
+            '총전략수': len(result),
+            '성공전략수': len([r for r in returns if r > 0]),
+            '평균수익률': sum(returns) / len(returns) if returns else 0
+        }
+    return result
+
+def run_batch(args):
+    """명령행 인자로 한 가지 모드만 실행하고 JSON 요약 dict 반환"""
+    start_time = time.time()
+    summary = {'모드': args.mode, '시드': args.seed}
+    system = None
+    try:
+        system = OptimizedInvestmentSystem(args.data_dir, args.scratch_dir, seed=args.seed, storage=args.storage,
+                                           exclusion_cache=args.exclusion_cache)
+        summary['시드'] = system.seed
+        summary['데이터폴더'] = system.base_path
+        summary['작업폴더'] = system.scratch_path
+        if args.profile:
+            system.profiler = RunProfiler(enabled=True)
+            summary['프로파일'] = args.profile
+        if args.mode == '1':
+            result = system.run_comprehensive_simulation(
+                max_strategies=args.strategies or 1000,
+                market_days=max(1, args.weeks) * 5
+            )
+        elif args.mode == '2':
+            result = system.run_quick_test(test_strategies=args.strategies or 100)
+        elif args.mode == '3':
+            result = system.analyze_existing_results()
+        elif args.mode == '4':
+            result = system.get_strategy_info()
+        elif args.mode == '5':
+            system.test_new_attribute_system()
+            result = True
+        else:
+            result = system.get_system_status()
+        summary['성공'] = result is not None
+        summary['결과'] = _summarize_result(result)
+    except Exception as e:
+        summary['성공'] = False
+        summary['오류'] = f"{type(e).__name__}: {e}"
+    finally:
+        if system is not None:
+            system.sync_scratch()
+            if args.profile:
+                system.save_profile(args.profile, 모드=args.mode, 성공=summary.get('성공', False))
+    
+    summary['소요시간'] = round(time.time() - start_time, 2)
+    return summary
+
+def main(argv=None):
+    """메인 함수 - 대화형 인터페이스 (--mode: 비대화형 실행, 종료 코드 반환)"""
+    args = parse_args(argv)
+    if args.config:
+        os.environ[ENV_CONFIG_FILE] = os.path.abspath(args.config)
+    if args.mode is not None:
+        # stdout에는 JSON 요약만 (진행 출력은 stderr, --quiet면 버림)
+        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+            with contextlib.redirect_stdout(devnull if args.quiet else sys.stderr):
+                summary = run_batch(args)
+        print(json.dumps(summary, ensure_ascii=False, default=str))
+        # 실패한 실행은 종료 코드로도 알림 (일괄 실행 스크립트용)
+        return 0 if summary.get('성공') else 1
+    
+    system = OptimizedInvestmentSystem(args.data_dir, args.scratch_dir, seed=args.seed, storage=args.storage,
+                                       exclusion_cache=args.exclusion_cache)
     
     while True:
         print("\n" + "=" * 50)
@@ -352,6 +514,7 @@ def main():
                 system.get_system_status()
                 
             elif choice == '7':
+                system.sync_scratch()
                 print("\n시스템을 종료합니다.")
                 break
                 
@@ -359,6 +522,7 @@ def main():
                 print("잘못된 선택입니다.")
                 
         except KeyboardInterrupt:
+            system.sync_scratch()
             print("\n\n시스템을 종료합니다.")
             break
         except Exception as e:
@@ -367,4 +531,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""테스트 공용 설정 - 프로젝트 폴더를 경로에 추가하고 임시 데이터 폴더의 분석기 생성"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import 최적화_투자_분석 as 분석모듈
+
+@pytest.fixture
+def 분석기(tmp_path):
+    """시드 고정, 빈 임시 데이터 폴더, 2주(10거래일) 시장 데이터를 만든 분석기"""
+    분석기 = 분석모듈.최적화투자분석(100, 기본경로=str(tmp_path), 시드=1234, 시나리오캐시=False)
+    분석기.시뮬레이션주수 = 2
+    분석기.시장데이터_생성()
+    return 분석기
+
+@pytest.fixture
+def 전략조합(분석기):
+    """탈락 기록 없이 생성한 전체 전략 조합"""
+    return 분석기._전략조합_생성(분석기._탈락전략_로드())
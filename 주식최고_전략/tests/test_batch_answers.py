@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""--mode 일괄 실행의 --answers 응답 입력 (전역 input 교체 없이 분석기에 주입)"""
+
+import builtins
+
+import pytest
+
+import 최적화_투자_분석 as 분석모듈
+
+def test_응답은_순서대로_모자라면_EOFError():
+    입력 = 분석모듈._응답입력(['y', '2'])
+    
+    assert 입력("첫 질문: ") == 'y'
+    assert 입력("둘째 질문: ") == '2'
+    with pytest.raises(EOFError):
+        입력("셋째 질문: ")
+    assert 입력.부족질문 == "셋째 질문:"
+
+def _일괄(tmp_path, monkeypatch, 모드실행, *추가인자):
+    monkeypatch.setattr(분석모듈, '_모드_실행', 모드실행)
+    인자 = 분석모듈._명령행_인자_해석(['--mode', '6', '--seed', '1', '--data-dir', str(tmp_path), *추가인자])
+    return 분석모듈._일괄_실행(인자)
+
+def test_응답이_분석기에_주입되고_전역_input은_그대로(tmp_path, monkeypatch):
+    받은응답 = []
+    def 모드실행(분석기, 모드, 환경선택=None):
+        assert builtins.input is input
+        받은응답.extend([분석기.입력("구성 방식: "), 분석기.입력("리밸런싱: ")])
+    
+    실행정보 = _일괄(tmp_path, monkeypatch, 모드실행, '--answers', '1, b')
+    
+    assert '오류' not in 실행정보
+    assert 받은응답 == ['1', 'b']
+
+def test_모드가_예외를_삼켜도_응답_부족은_실패로_보고(tmp_path, monkeypatch):
+    def 모드실행(분석기, 모드, 환경선택=None):
+        try:
+            분석기.입력("저장하시겠습니까? (y/n): ")
+        except Exception:
+            pass  # 기본 분기로 진행하는 기존 코드 흉내
+    
+    실행정보 = _일괄(tmp_path, monkeypatch, 모드실행)
+    
+    assert 실행정보['오류'].startswith("EOFError")
+    assert "저장하시겠습니까?" in 실행정보['오류']
+
+def test_실패한_일괄_실행은_종료코드_1(tmp_path, capsys):
+    인자 = ['--mode', '1', '--resume', '--data-dir', str(tmp_path), '--quiet']
+    
+    assert 분석모듈.main(인자) == 1  # 재개할 체크포인트 없음
+    assert '"성공": false' in capsys.readouterr().out
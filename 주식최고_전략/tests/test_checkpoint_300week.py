@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""300주 주차 체크포인트 압축 저장/재개, 완료 후 체크포인트 삭제, 재개시 저장 주기 유지"""
+
+import os
+
+import pytest
+
+import 최적화_투자_분석 as 분석모듈
+from modules.checkpoint_store import CheckpointStore
+
+def _300주_분석기(기본경로):
+    분석기 = 분석모듈.최적화투자분석(100, 기본경로=기본경로, 시드=1234, 시나리오캐시=False)
+    분석기._calculate_300week_weekly(분석기._generate_300week_data())
+    return 분석기
+
+def _상태(분석기, 전략):
+    return (분석기._전략을_키로_변환(전략), 전략['자본'], 전략['주식수'], 전략['옐로우카드'],
+            전략['이동평균'], 전략['매수횟수'], 전략['매도횟수'], 전략['매수금액합'], 전략['매수수량합'])
+
+def test_압축_체크포인트에서_재개한_300주는_끊김없는_실행과_같음(분석기, 전략조합, tmp_path):
+    템플릿 = [분석기._전략구성_추출(전략) for 전략 in 전략조합[::400]]
+    실행기 = _300주_분석기(str(tmp_path))
+    실행기.체크포인트_주기 = 50
+    실행기._체크포인트_설정('300주', 0, 실행기.사이클수 + 1, 사이클결과=[])
+
+    끊김없음 = 실행기._run_fast_strategy_simulation_300week(템플릿)
+    체크포인트 = CheckpointStore(실행기.체크포인트_파일).load()
+
+    assert 체크포인트['진행']['주차'] == 249
+    assert '전체생존전략' not in 체크포인트
+    assert all(isinstance(열, tuple) for 열 in 체크포인트['진행']['생존'].values())
+
+    재개기 = _300주_분석기(str(tmp_path))
+    재개기._재개진행 = 체크포인트['진행']
+    재개 = 재개기._run_fast_strategy_simulation_300week(템플릿)
+
+    assert [_상태(재개기, 전략) for 전략 in 재개['생존전략']] == [_상태(실행기, 전략) for 전략 in 끊김없음['생존전략']]
+    assert 재개['탈락기록'] == 끊김없음['탈락기록']
+
+def test_집계가_실패해도_체크포인트_삭제(분석기, monkeypatch):
+    분석기.시뮬레이션주수 = 1
+    분석기.사이클수 = 1
+    분석기.체크포인트_주기 = 1
+    def 실패(*인자):
+        raise RuntimeError("히스토리 저장 실패")
+    monkeypatch.setattr(분석기, '_종합랭킹_히스토리_저장', 실패)
+
+    with pytest.raises(RuntimeError):
+        분석기._5사이클_누적_시뮬레이션()
+
+    assert not os.path.exists(분석기.체크포인트_파일)
+    assert 분석기._체크포인트_문맥 is None
+
+def test_재개시_체크포인트_저장_주기를_이어받음(분석기):
+    분석기.체크포인트_주기 = 3
+    분석기._체크포인트_설정('5사이클', 0, 2, 사이클결과들=[], 전략성과누적={})
+    분석기._체크포인트_저장()
+
+    인자 = 분석모듈._명령행_인자_해석(['--resume', '--data-dir', 분석기.기본경로])
+    분석모듈._체크포인트_불러오기(인자)
+
+    assert 인자.checkpoint_every == 3
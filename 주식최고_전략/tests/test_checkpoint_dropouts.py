@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""체크포인트 이후 추가된 탈락 기록이 --resume에서 다시 쌓이지 않는지 확인"""
+
+import json
+
+import 최적화_투자_분석 as 분석모듈
+from modules.checkpoint_store import CheckpointStore
+
+def _탈락기록(수익라인):
+    return [["시가매수", 0.0, 1, 0.5, -5, "1", str(수익라인), 1]]
+
+def _재개(분석기):
+    재개분석기 = 분석모듈.최적화투자분석(100, 기본경로=분석기.기본경로, 시드=1234, 시나리오캐시=False)
+    재개분석기._재개상태_설정(CheckpointStore(분석기.체크포인트_파일).load())
+    return 재개분석기
+
+def _로그줄(분석기):
+    with open(분석기._탈락로그_파일(), encoding='utf-8') as f:
+        return [json.loads(줄) for 줄 in f]
+
+def test_체크포인트_이후_탈락_기록은_재개시_잘라냄(분석기):
+    분석기.체크포인트_주기 = 1
+    분석기._체크포인트_설정('5사이클', 0, 2, 사이클결과들=[], 전략성과누적={})
+    분석기._탈락전략_저장(_탈락기록(3))
+    분석기._체크포인트_저장()
+    분석기._탈락전략_저장(_탈락기록(5))  # 다음 사이클 완료 체크포인트 전에 중단
+    
+    재개분석기 = _재개(분석기)
+    
+    assert _로그줄(재개분석기) == _탈락기록(3)
+    assert 재개분석기._재개상태['사이클'] == 2
+
+def test_체크포인트_직후_합친_로그는_다시_합치지_않음(분석기):
+    분석기.체크포인트_주기 = 1
+    분석기.탈락로그_압축크기 = 1
+    분석기._체크포인트_설정('5사이클', 0, 2, 사이클결과들=[], 전략성과누적={})
+    분석기._탈락전략_저장(_탈락기록(3))
+    assert 분석기._탈락로그_크기() > 0  # 체크포인트 실행 중에는 바로 합치지 않음
+    
+    분석기._체크포인트_저장()
+    assert CheckpointStore(분석기.체크포인트_파일).load()['탈락로그크기'] == 0
+    분석기._탈락전략_저장(_탈락기록(3))  # 다음 사이클에서 같은 전략 탈락 후 중단
+    
+    재개분석기 = _재개(분석기)
+    
+    assert 재개분석기._탈락로그_크기() == 0
+    with open(재개분석기.탈락전략_파일.replace('.json', '_압축.json'), encoding='utf-8') as f:
+        assert json.load(f)['strategies'] == _탈락기록(3)
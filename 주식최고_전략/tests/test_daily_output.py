@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""_일일결과_출력 회귀 테스트 (극심손실 탈락이 1~3개인 날 INFO 로그에서 호출됨)"""
+
+def _하위_순위(출력):
+    """출력에서 '하위 3개 전략:' 이후 순위 번호 목록"""
+    하위 = 출력.split("하위 3개 전략:")[1].split("전체 ")[0]
+    return [int(줄.split('.')[0]) for 줄 in 하위.splitlines() if 줄[:1].isdigit()]
+
+def _이틀_결과(분석기, 전략들):
+    for 전략 in 전략들:
+        분석기._일일_시뮬레이션(전략, 0)
+    return [분석기._일일_시뮬레이션(전략, 1) for 전략 in 전략들]
+
+def test_하위_순위는_전체_결과_기준(분석기, 전략조합, capsys):
+    일일결과 = _이틀_결과(분석기, 전략조합[:5])
+    capsys.readouterr()
+    
+    분석기._일일결과_출력(일일결과, 1)
+    
+    assert _하위_순위(capsys.readouterr().out) == [3, 4, 5]
+
+def test_결과가_3개보다_적어도_출력(분석기, 전략조합, capsys):
+    일일결과 = _이틀_결과(분석기, 전략조합[:2])
+    capsys.readouterr()
+    
+    분석기._일일결과_출력(일일결과, 1)
+    
+    출력 = capsys.readouterr().out
+    assert "상위 3개 전략" in 출력
+    assert _하위_순위(출력) == [1, 2]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""DataManager 바이너리(.npz) 저장분을 JSON에도 반영 (JSON만 읽는 메인 스크립트용)"""
+
+import json
+import os
+
+import pytest
+
+from modules.data_manager import DataManager
+
+pytest.importorskip('numpy')
+
+def _압축데이터(수익라인들):
+    return {'version': '3.0', 'strategies': [["시가매수", 0.5, 1, 0.5, -5, "1", str(수익라인), 1] for 수익라인 in 수익라인들]}
+
+def test_바이너리_저장분을_JSON에_반영하고_다음_로드는_npz_사용(tmp_path):
+    관리자 = DataManager(str(tmp_path), storage='binary')
+    관리자._write_json_file('dropout_compressed', _압축데이터([3]))
+    관리자.save_json_safe('dropout_compressed', _압축데이터([3, 5]), backup=False)
+    os.utime(관리자.get_binary_path('dropout_compressed'))  # 같은 초에 저장해도 .npz가 더 새 파일
+
+    assert 관리자.sync_json_mirrors() == 1
+    with open(관리자.get_file_path('dropout_compressed'), encoding='utf-8') as f:
+        assert json.load(f) == 관리자.load_binary('dropout_compressed')
+    assert 관리자._binary_is_current('dropout_compressed')
+    assert 관리자.sync_json_mirrors() == 0
+
+def test_JSON_저장_형식이면_반영하지_않음(tmp_path):
+    관리자 = DataManager(str(tmp_path))
+    관리자.save_json_safe('dropout_compressed', _압축데이터([3]))
+
+    assert 관리자.sync_json_mirrors() == 0
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""일별 탈락 판정(한 번 훑기 + 배치엔진 압축)이 기존 정렬 경로와 같은 결과인지 확인"""
+
+import copy
+
+import pytest
+
+np = pytest.importorskip("numpy")  # 배치엔진(선택 의존성) 테스트
+
+from modules.batch_simulator import BatchSimulator
+
+def _기존_탈락판정(일일결과, 일차):
+    """user-015 이전 경로: 총수익률로 전체 정렬 후 옐로우카드 발급, 12개 또는 -30% 이하 탈락"""
+    일일결과 = sorted(일일결과, key=lambda x: x['수익률'], reverse=True)
+    생존전략 = []
+    탈락자 = []
+    주차 = (일차 // 5) + 1
+    for 결과 in 일일결과:
+        전략 = 결과['전략']
+        현재수익률 = ((결과['평가자산'] - 100000) / 100000) * 100
+        if '옐로우카드' not in 전략:
+            전략['옐로우카드'] = {'개수': 0, '마지막카드주차': 0}
+        if 주차 > 전략['옐로우카드']['마지막카드주차']:
+            요구수익률 = max(0, (주차 - 1))
+            카드수 = 0
+            if 현재수익률 <= -5:
+                카드수 += 1
+            if 주차 >= 2 and 현재수익률 < 요구수익률:
+                카드수 += 1
+            if 카드수:
+                전략['옐로우카드']['개수'] += 카드수
+                전략['옐로우카드']['마지막카드주차'] = 주차
+        if 전략['옐로우카드']['개수'] >= 12:
+            탈락자.append(전략)
+        elif 현재수익률 <= -30:
+            탈락자.append(전략)
+        else:
+            생존전략.append(전략)
+    return 생존전략, 탈락자
+
+def test_한번_훑기와_압축이_기존_정렬_경로와_같음(분석기, 전략조합):
+    분석기.시뮬레이션주수 = 8  # 옐로우카드/극심손실 탈락이 생기는 기간
+    분석기.시장데이터_생성()
+    가격경로 = 분석기._가격경로_조회()
+    
+    전략들 = 전략조합[::20]
+    기준전략들 = copy.deepcopy(전략들)
+    번호 = {id(전략): i for i, 전략 in enumerate(전략들)}
+    기준번호 = {id(전략): i for i, 전략 in enumerate(기준전략들)}
+    
+    엔진 = 분석기._배치엔진_생성(전략들)
+    기준엔진 = 분석기._배치엔진_생성(기준전략들)  # 압축하지 않고 매일 위치 조회
+    생존전략, 기준생존 = 전략들, 기준전략들
+    총탈락 = 0
+    
+    for 일차 in range(분석기.시뮬레이션주수 * 5):
+        판정 = 분석기._탈락_판정(엔진.simulate_day(생존전략, 일차, 가격경로), 일차, 엔진)
+        기준결과 = 기준엔진.simulate_day(기준생존, 일차, 가격경로)
+        기준수익률 = {기준번호[id(결과['전략'])]: 결과['수익률'] for 결과 in 기준결과}
+        기준생존, 기준탈락 = _기존_탈락판정(기준결과, 일차)
+        생존전략 = 판정['생존전략']
+        
+        assert sorted(번호[id(전략)] for 전략 in 판정['탈락자']) == sorted(기준번호[id(전략)] for 전략 in 기준탈락)
+        assert {번호[id(전략)]: (전략['자본'], 전략['주식수']) for 전략 in 생존전략} == \
+               {기준번호[id(전략)]: (전략['자본'], 전략['주식수']) for 전략 in 기준생존}
+        
+        # 생존 수익률 합계와 탈락자 수익률은 기존 경로의 값(탈락자는 현재가로 다시 계산)과 같음
+        assert 판정['생존수익률합계'] == pytest.approx(sum(기준수익률[기준번호[id(전략)]] for 전략 in 기준생존))
+        for 전략, 수익률 in zip(판정['탈락자'], 판정['탈락수익률']):
+            평가자산 = 전략['자본'] + 전략['주식수'] * 분석기._전략_현재가(전략)
+            assert 수익률 == ((평가자산 - 100000) / 100000) * 100
+        총탈락 += len(판정['탈락자'])
+    
+    assert 총탈락 > 0
+    assert len(엔진.cash) == len(생존전략)
+
+def _단순_결과(전략, 일차):
+    """배열화하지 않은 전략용 대체 시뮬레이션 (상태 변경 없음)"""
+    평가자산 = 전략['자본'] + 전략['주식수'] * 100
+    return {'전략': 전략, '수익률': (평가자산 - 100000) / 1000, '일수익률': 0,
+            '평가자산': 평가자산, '거래횟수': 0, '현재가격': 100}
+
+def test_compact는_상태배열_행을_전략_목록과_맞춤(분석기, 전략조합):
+    전략들 = copy.deepcopy(전략조합[::400])
+    for 전략 in 전략들[::7]:
+        전략['고무줄매수'] = True  # 배열화하지 않는 전략도 섞음
+    가격경로 = 분석기._가격경로_조회()
+    엔진 = BatchSimulator(전략들, 분석기.거래비용설정, 분석기.초기가격, _단순_결과)
+    
+    for 일차 in range(3):
+        엔진.simulate_day(전략들, 일차, 가격경로)
+    유지 = [i % 3 != 1 for i in range(len(전략들))]
+    생존전략 = [전략 for 전략, 남김 in zip(전략들, 유지) if 남김]
+    엔진.compact(유지, 생존전략)
+    
+    # 압축된 배열 = 생존 전략 dict로 새로 만든 엔진의 배열 (행 순서까지 같음)
+    새엔진 = BatchSimulator(생존전략, 분석기.거래비용설정, 분석기.초기가격, _단순_결과)
+    for 이름 in BatchSimulator._상태배열:
+        np.testing.assert_array_equal(getattr(엔진, 이름), getattr(새엔진, 이름), err_msg=이름)
+    
+    # 다음 날도 압축된 엔진과 새 엔진의 결과가 같음
+    비교전략 = copy.deepcopy(생존전략)
+    새엔진 = BatchSimulator(비교전략, 분석기.거래비용설정, 분석기.초기가격, _단순_결과)
+    결과 = 엔진.simulate_day(생존전략, 3, 가격경로)
+    기준 = 새엔진.simulate_day(비교전략, 3, 가격경로)
+    assert [(r['수익률'], r['평가자산'], r['거래횟수']) for r in 결과] == \
+           [(r['수익률'], r['평가자산'], r['거래횟수']) for r in 기준]
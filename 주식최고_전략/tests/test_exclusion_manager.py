@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""ExclusionManager 제외 검사 수 집계 (프로파일을 붙였을 때만), 명령행 mmap 캐시 옵션"""
+
+import os
+import random
+
+import pytest
+
+from modules.data_manager import DataManager
+from modules.exclusion_manager import EXCLUSION_CACHE_DIR, ExclusionManager
+from modules.run_profiler import RunProfiler
+from modules.strategy_generator import StrategyGenerator
+
+def _샘플(관리자, 개수, replacement=True):
+    return StrategyGenerator().generate_sample_strategies(
+        개수, exclusion_manager=관리자, replacement=replacement, rng=random.Random(7))
+
+def test_프로파일이_없으면_검사_수를_세지_않음(tmp_path):
+    관리자 = ExclusionManager(DataManager(str(tmp_path)))
+    
+    _샘플(관리자, 50)
+    
+    assert '검사' not in 관리자.exclusion_stats
+
+def test_프로파일을_붙이면_확인한_전략_수_집계(tmp_path):
+    관리자 = ExclusionManager(DataManager(str(tmp_path)))
+    관리자.profiler = RunProfiler(enabled=True)
+    
+    _샘플(관리자, 50)
+    
+    assert 관리자.profiler.counters['제외.검사'] == 50
+
+def test_명령행_mmap_캐시_옵션으로_제외캐시_사용(tmp_path):
+    pytest.importorskip('numpy')
+    import optimized_investment_system as 시스템모듈
+    인자 = 시스템모듈.parse_args(['--mode', '2', '--exclusion-cache', 'mmap', '--seed', '3', '--data-dir', str(tmp_path)])
+    
+    요약 = 시스템모듈.run_batch(인자)
+    
+    assert 요약['성공'], 요약.get('오류')
+    assert os.path.exists(os.path.join(str(tmp_path), EXCLUSION_CACHE_DIR, 'meta.json'))
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""최고전략 히스토리 기록 (종합랭킹은 저장된 평균수익률/안정성점수로 기록)"""
+
+import json
+
+def test_종합랭킹은_간소화된_전략정보로_저장(분석기, 전략조합):
+    종합랭킹 = [{
+        '전략설명': f"전략{순위}",
+        '전략정보': {필드: 전략[필드] for 필드 in ('매수기준', '매수기준명', '매수하락률', '구매방식', '구매방식명',
+                                                '매수수량', '손절라인', '매도전략', '매도전략명', '수익라인')},
+        '출현횟수': 3,
+        '평균수익률': 10.0 - 순위,
+        '안정성점수': 30.0 - 3 * 순위
+    } for 순위, 전략 in enumerate(전략조합[:6])]
+    
+    분석기._종합랭킹_히스토리_저장(종합랭킹, [{'단순보유수익률': 4.0}, {'단순보유수익률': -2.0}])
+    
+    with open(분석기.최고전략_파일, encoding='utf-8') as f:
+        기록 = json.load(f)[-1]
+    assert 기록['시뮬레이션타입'] == "5사이클_종합랭킹"
+    assert [항목['전략설명'] for 항목 in 기록['최고전략_순위']] == [f"전략{순위}" for 순위 in range(5)]
+    assert [항목['수익률'] for 항목 in 기록['최고전략_순위']] == [10.0, 9.0, 8.0, 7.0, 6.0]
+    assert 기록['시장환경']['시장수익률'] == 1.0
+
+def test_재검증은_방식별_구성_필드까지_복원(분석기, 전략조합):
+    모멘텀전략 = next(전략 for 전략 in 전략조합 if '모멘텀기준' in 전략)
+    분석기._최고전략_히스토리_저장([모멘텀전략], '단일시뮬레이션')
+    
+    분석기._히스토리_전략_재검증()
+    
+    with open(분석기.최고전략_파일, encoding='utf-8') as f:
+        재검증기록 = json.load(f)[-1]
+    assert 재검증기록['시뮬레이션타입'] == '재검증'
+    assert 재검증기록['최고전략_순위'][0]['전략']['모멘텀기준'] == 모멘텀전략['모멘텀기준']
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""--mode 1-9 일괄 실행 스모크 테스트 (모든 모드가 입력 없이 오류 없이 끝나는지)"""
+
+import pytest
+
+import 최적화_투자_분석 as 분석모듈
+
+@pytest.fixture(scope='module')
+def 데이터폴더(tmp_path_factory):
+    """모드 4-7이 읽을 시장 상황별 전략 성과를 미리 저장한 데이터 폴더"""
+    폴더 = str(tmp_path_factory.mktemp('modes'))
+    분석기 = 분석모듈.최적화투자분석(100, 기본경로=폴더, 시드=3, 시나리오캐시=False)
+    분석기.시뮬레이션주수 = 1
+    분석기.시장데이터_생성()
+
+    전략들 = 분석기._전략조합_생성(분석기._탈락전략_로드())[::2000]
+    for 일차 in range(분석기.시뮬레이션주수 * 5):
+        for 전략 in 전략들:
+            분석기._일일_시뮬레이션(전략, 일차)
+
+    저장용전략들 = [{
+        '전략설명': 분석기._전략설명_생성(전략),
+        '수익률': (전략['자본'] + 전략['주식수'] * 분석기._전략_현재가(전략) - 100000) / 1000,
+        '거래횟수': len(전략['거래내역']),
+        '전략상세': {
+            '매수기준': 전략.get('매수기준명', ''),
+            '매수하락률': 전략.get('매수하락률', 0),
+            '구매방식': 전략.get('구매방식명', ''),
+            '손절라인': 전략.get('손절라인', 0),
+            '매도전략': 전략.get('매도전략명', '')
+        }
+    } for 전략 in 전략들]
+    분석기.전략성과_저장(분석기.시장상황_분석(), 저장용전략들)
+    return 폴더
+
+# 모드 7은 모드 6이 저장한 포트폴리오를 조회하므로 순서대로 실행
+@pytest.mark.parametrize('모드, 추가인자', [
+    ('1', []),
+    ('2', []),
+    ('3', ['--env', '2']),
+    ('4', []),
+    ('5', []),
+    ('6', ['--answers', '1,b,y']),
+    ('7', ['--answers', '1,1']),
+    ('8', []),
+    ('9', []),
+])
+def test_모드_일괄실행(데이터폴더, 모드, 추가인자, capsys):
+    인자 = 분석모듈._명령행_인자_해석(['--mode', 모드, '--seed', '3', '--weeks', '1', '--cycles', '1',
+                                  '--no-scenario-cache', '--data-dir', 데이터폴더, *추가인자])
+
+    실행정보 = 분석모듈._일괄_실행(인자)
+
+    assert '오류' not in 실행정보, 실행정보.get('오류')
+    assert '실패:' not in capsys.readouterr().out
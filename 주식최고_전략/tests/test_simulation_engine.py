@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""SimulationEngine 일차별 시간데이터 표"""
+
+import contextlib
+import io
+
+from modules.simulation_engine import SimulationEngine
+
+def test_일차별_시간데이터는_전체_목록을_거른_것과_같음():
+    with contextlib.redirect_stdout(io.StringIO()):
+        엔진 = SimulationEngine(seed=5)
+        시장데이터 = 엔진.generate_market_data(10, seed=5)
+    
+    for 일간 in 시장데이터['일간데이터']:
+        기대값 = [시간 for 시간 in 시장데이터['시간데이터'] if 시간['일차'] == 일간['일차']]
+        assert 시장데이터['일별시간데이터'][일간['일차']] == 기대값
+    
+    # 다른 곳에서 만든 시장 데이터는 처음 쓸 때 표를 만듦
+    del 시장데이터['일별시간데이터']
+    assert 엔진._get_day_index(시장데이터)[1] == [시간 for 시간 in 시장데이터['시간데이터'] if 시간['일차'] == 1]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""비복원 샘플 추출이 요청한 개수만큼만 뽑는지 확인"""
+
+import random
+
+from modules.strategy_generator import STRATEGY_RECORD_FIELDS, StrategyGenerator
+
+class _셈하는난수(random.Random):
+    """sample에 넘어온 k 기록"""
+    
+    def sample(self, population, k, **kwargs):
+        self.뽑은수 = k
+        return super().sample(population, k, **kwargs)
+
+def _칸(전략):
+    """전략의 (매수, 수량, 손절, 매도) 격자 칸 필드 튜플"""
+    return tuple(전략[필드] for 필드 in STRATEGY_RECORD_FIELDS)
+
+class _홀수칸제외:
+    """마스크 없이 should_exclude만 제공하는 제외 관리자"""
+    
+    def __init__(self):
+        self.검사수 = 0
+    
+    def should_exclude(self, strategy):
+        self.검사수 += 1
+        return self.검사수 % 2 == 1
+
+def test_제외가_없으면_요청한_개수만_추출():
+    난수 = _셈하는난수(3)
+    
+    전략들 = StrategyGenerator().generate_sample_strategies(20, replacement=False, rng=난수)
+    
+    assert 난수.뽑은수 == 20
+    assert len({_칸(전략) for 전략 in 전략들}) == 20
+
+def test_순열은_필요한_만큼만_펼침():
+    생성기 = StrategyGenerator()
+    순열 = list(생성기._lazy_permutation(1000, random.Random(5)))
+    
+    assert sorted(순열) == list(range(1000))
+
+def test_마스크가_없으면_제외만_건너뛰고_필요한_만큼_확인():
+    관리자 = _홀수칸제외()
+    
+    전략들 = StrategyGenerator().generate_sample_strategies(
+        15, exclusion_manager=관리자, replacement=False, rng=random.Random(9))
+    
+    assert len(전략들) == 15
+    assert 관리자.검사수 == 30
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""시뮬레이션 기간(--weeks = 시뮬레이션주수)이 모든 시뮬레이션 경로에 반영되는지 확인"""
+
+import copy
+
+import 최적화_투자_분석 as 분석모듈
+
+def test_누적추적은_시뮬레이션주수만큼_진행(분석기, 전략조합):
+    분석기._전략조합_생성 = lambda *인자: 전략조합[::200]
+    
+    상위결과 = 분석기.전략_비교_시뮬레이션_누적추적()
+    
+    assert 상위결과
+    assert {결과['일수'] for 결과 in 상위결과} == {분석기.시뮬레이션주수 * 5}
+
+def test_기간매도는_마지막_날(분석기, 전략조합):
+    존버전략 = [전략 for 전략 in 전략조합 if 전략['매도전략'] == '3'][::50]
+    배치전략 = copy.deepcopy(존버전략)
+    
+    엔진 = 분석기._배치엔진_생성(배치전략)
+    for 일차 in range(분석기.시뮬레이션주수 * 5):
+        for 전략 in 존버전략:
+            분석기._일일_시뮬레이션(전략, 일차)
+        if 엔진 is not None:
+            엔진.simulate_day(배치전략, 일차, 분석기._가격경로_조회())
+    
+    for 전략들 in (존버전략, 배치전략 if 엔진 is not None else []):
+        매도일 = {거래[1] for 전략 in 전략들 for 거래 in 전략['거래내역'] if 거래[0] == '기간매도'}
+        assert 매도일 == {분석기.시뮬레이션주수 * 5}
+
+def test_극한검증은_시뮬레이션주수만큼_진행(분석기, 전략조합, monkeypatch):
+    진행일수 = []
+    원본 = 분석기._일일_시뮬레이션_시나리오
+    def 기록(전략, 일차, 시나리오경로):
+        진행일수.append(일차)
+        return 원본(전략, 일차, 시나리오경로)
+    monkeypatch.setattr(분석기, '_일일_시뮬레이션_시나리오', 기록)
+    
+    분석기._극한검증_시뮬레이션(전략조합[:1])
+    
+    assert max(진행일수) == 분석기.시뮬레이션주수 * 5 - 1
+
+def test_모드1_안내는_시뮬레이션주수(분석기, monkeypatch, capsys):
+    monkeypatch.setattr(분석기, '전략_비교_시뮬레이션', lambda: None)
+    
+    분석모듈._모드_실행(분석기, '1')
+    
+    assert f"{분석기.시뮬레이션주수}주 투자 패턴 분석 시작!" in capsys.readouterr().out
@@ -2,7 +2,11 @@ import random
 import time
 import json
 import os
+import sys
+import argparse
+import contextlib
 import math
+import logging
 from datetime import datetime
 
 try:
@@ -12,24 +16,70 @@ except ImportError:
     NUMPY_AVAILABLE = False
     print("[경고] numpy가 설치되지 않았습니다. 기본 수학 라이브러리를 사용합니다.")
 
+from modules.price_path import PricePath
+from modules.progress_reporter import get_logger, set_log_level, ProgressReporter
+from modules.path_config import resolve_paths, stage_scratch_files, sync_scratch_files, ENV_CONFIG_FILE
+from modules.scenario_store import ScenarioStore, STORE_DIR_NAME
+from modules.checkpoint_store import CheckpointStore, CHECKPOINT_FILE_NAME
+from modules.run_profiler import RunProfiler
+from modules.top_k import TopK, top_k
+if NUMPY_AVAILABLE:
+    from modules.batch_simulator import BatchSimulator
+
+# 반복 구간 출력용 로거 (일별/시간별 상세는 DEBUG, 진행상황/요약은 INFO)
+로그 = get_logger()
+
+# 체크포인트 종류 → 재개할 실행 모드
+체크포인트_모드 = {'5사이클': '8', '300주': '9'}
+# 300주 주차 체크포인트에 열(튜플)로 저장하는 생존전략 숫자 상태 (구성은 템플릿순번으로 참조)
+_300주_상태열 = ('템플릿순번', '자본', '주식수', '매수횟수', '매도횟수', '매수금액합', '매수수량합')
+
+# 최고전략 히스토리/300주 수집 전략에 저장하는 전략 구성 필드 (재검증시 _전략_초기화로 복원)
+전략구성_필드 = ('매수기준', '매수기준명', '매수하락률', '구매방식', '구매방식명', '매수수량',
+                 '손절라인', '매도전략', '매도전략명', '수익라인')
+# 매수/매도 방식에 따라 있는 구성 필드 (상승매수, 연속상승, 모멘텀, 고무줄매도)
+전략구성_선택필드 = ('매수상승률', '연속횟수', '모멘텀기준', '고무줄설정')
+
 class 최적화투자분석:
-    def __init__(self, 초기가격=100):
+    def __init__(self, 초기가격=100, 기본경로=None, 작업경로=None, 시드=None, 시나리오캐시=None):
         self.주간데이터 = []
         self.일간데이터 = []
         self.시간데이터 = []
         self.초기가격 = 초기가격
         self.현재가격 = 초기가격
         self.과거데이터 = []  # 이동평균용 과거 120일 데이터
-        self._과거데이터_생성()
-        self.가격기록 = []  # 시간별 가격 기록
         
-        # JSON 파일 경로 설정 (제작파일/주식최고_전략 폴더)
-        self.기본경로 = r"C:\Users\ksj\OneDrive\바탕 화면\gemini\제작파일\주식최고_전략"
-        self.탈락전략_파일 = os.path.join(self.기본경로, "탈락전략.json")
+        # 실행 시드: 모든 데이터 생성기는 이 시드로 만든 난수 생성기를 씀 (저장 결과에 기록)
+        # 데이터시드는 현재 시장 데이터를 만든 시드 (사이클마다 사이클 시드로 재설정)
+        self.시드 = 시드 if 시드 is not None else random.randrange(2**32)
+        self._난수_재설정(self.시드)
+        
+        # 구간별 시간/카운터 계측 (기본 꺼짐, --profile로 켜면 실행 끝에 프로파일 JSON 저장)
+        self.프로파일 = RunProfiler()
+        
+        # 추가 질문 입력 함수 (대화형은 input, --mode 일괄 실행은 --answers 응답을 순서대로 돌려주는 함수)
+        self.입력 = input
+        self.가격기록 = []  # 시간별 가격 기록
+        self.가격경로 = None  # 전략 공유 가격경로 (시간데이터 기준, 필요할 때 생성)
+        
+        # JSON 파일 경로 설정 (인자 > 환경변수 > 경로설정.json > 기존 OneDrive 폴더 > 프로젝트 폴더)
+        # 작업경로(예: tmpfs)가 있으면 잦은 쓰기 파일(탈락/영구제외)은 그곳에서 읽고 쓰고 종료시 반영
+        self.기본경로, self.작업경로 = resolve_paths(기본경로, 작업경로)
+        잦은쓰기경로 = self.작업경로 or self.기본경로
+        if self.작업경로:
+            stage_scratch_files(self.기본경로, self.작업경로)
+        self.탈락전략_파일 = os.path.join(잦은쓰기경로, "탈락전략.json")
         self.최고전략_파일 = os.path.join(self.기본경로, "최고전략_히스토리.json")
-        self.영구제외_파일 = os.path.join(self.기본경로, "영구제외_전략_히스토리_압축.json")
+        self.영구제외_파일 = os.path.join(잦은쓰기경로, "영구제외_전략_히스토리_압축.json")
         self.포트폴리오_파일 = os.path.join(self.기본경로, "전략포트폴리오.json")
         
+        # 시나리오 저장소: 생성한 시장 데이터를 시드/인자별로 저장해 반복 검증시 재생성 생략
+        # (기본: 시드를 지정한 실행만 사용, 무작위 시드는 다시 나오지 않으므로 저장하지 않음)
+        if 시나리오캐시 is None:
+            시나리오캐시 = 시드 is not None
+        self.시나리오저장소 = ScenarioStore(os.path.join(self.기본경로, STORE_DIR_NAME)) if 시나리오캐시 else None
+        self._과거데이터_준비()
+        
         # 성능 최적화를 위한 캐시 시스템
         self.위험전략_캐시 = {}  # 옐로우카드 11개 전략 캐시
         self.전략_해시_캐시 = {}  # 전략 해시 캐시
@@ -45,10 +95,96 @@ class 최적화투자분석:
             '슬리피지': 0.0002,     # 0.02% (시장충격비용, 매수/매도 모두)
             '거래비용반영': True     # 거래비용 적용 여부 
         }
+        
+        # numpy 배열 기반 일괄 시뮬레이션 사용 여부 (numpy 없으면 전략별 시뮬레이션)
+        self.배치시뮬레이션 = NUMPY_AVAILABLE
+        
+        # 5사이클 병렬 실행 프로세스 수 (1 = 순차 실행)
+        self.사이클_병렬작업수 = 1
+        
+        # 시뮬레이션 기간 (주, 1주 = 5거래일)과 사이클 모드(8, 9)의 사이클 수
+        self.시뮬레이션주수 = 27
+        self.사이클수 = 5
+        
+        # 영구제외 변경 저널 (실행 중에는 메모리 사본만 수정, 반영시 한 번에 저장)
+        self.영구제외_반영주기 = 0  # N일마다 파일 반영 (0 = 시뮬레이션 종료시 한 번)
+        self._영구제외_메모리 = None
+        self._영구제외_배열색인 = None
+        self._영구제외_변경수 = 0
+        
+        # 탈락 로그가 이 크기(바이트)를 넘으면 압축파일에 합침 (로드시에도 합침)
+        self.탈락로그_압축크기 = 4 * 1024 * 1024
+        
+        # 체크포인트 (모드 8/9 순차 실행 중단 대비): N일마다(300주 구간은 N주마다) 상태 저장, 0 = 사용 안 함
+        self.체크포인트_주기 = 0
+        self.체크포인트_파일 = os.path.join(self.기본경로, CHECKPOINT_FILE_NAME)
+        self._체크포인트_문맥 = None  # 진행 중인 긴 실행의 사이클 단위 상태 (일차 체크포인트에 함께 저장)
+        self._재개상태 = None  # --resume으로 불러온 체크포인트
+        self._재개진행 = None  # 재개할 일차/주차 진행 상태 (해당 시뮬레이션이 한 번 꺼내 씀)
+        self._재개완료 = False  # 체크포인트를 이어받아 실행 중 (완료시 체크포인트 삭제)
+    
+    def _난수_재설정(self, 시드):
+        """시드로 데이터 생성용 난수 생성기 재설정 (같은 시드 = 같은 시장 데이터)"""
+        self.데이터시드 = 시드
+        self.난수 = random.Random(시드)
     
-    def _과거데이터_생성(self):
+    def _시나리오_저장소_사용(self, 생성기, 인자, 생성함수):
+        """저장된 시나리오가 있으면 불러오고 없으면 생성함수()로 만든 뒤 저장 ({배열이름: 숫자 목록} 반환)
+        
+        키에 생성 직전 난수 상태를 포함하고, 불러올 때 생성 직후 난수 상태로 복원하므로
+        이후 난수 순서와 결과가 직접 생성한 경우와 같다
+        """
+        if self.시나리오저장소 is None:
+            with self.프로파일.phase('데이터생성'):
+                return 생성함수()
+        
+        키 = self.시나리오저장소.make_key(self.데이터시드, 생성기, 인자, self.난수.getstate())
+        with self.프로파일.phase('시나리오로드'):
+            저장본 = self.시나리오저장소.load(키)
+        if 저장본 is not None:
+            배열들, 난수상태 = 저장본
+            if 난수상태 is not None:
+                self.난수.setstate(난수상태)
+            self.프로파일.count('시나리오.적중')
+            로그.info("저장된 시나리오 사용: %s (시드 %s)", 생성기, self.데이터시드)
+            return 배열들
+        
+        with self.프로파일.phase('데이터생성'):
+            배열들 = 생성함수()
+        self.프로파일.count('시나리오.생성')
+        with self.프로파일.phase('파일저장'):
+            저장경로 = self.시나리오저장소.save(키, 배열들, self.난수.getstate(), {'시드': self.데이터시드, '생성기': 생성기, '인자': 인자})
+        self.프로파일.count_file('저장바이트.시나리오', 저장경로)
+        return 배열들
+    
+    def _과거데이터_준비(self):
+        """과거 120일 데이터 준비 (시나리오 저장소에 있으면 불러옴)"""
+        def 생성():
+            self._과거데이터_생성()
+            return {'과거데이터': self.과거데이터}
+        
+        self.과거데이터 = self._시나리오_저장소_사용('과거데이터', {'초기가격': self.초기가격}, 생성)['과거데이터']
+    
+    def 시장데이터_생성(self):
+        """일간 변동률 → 주간 집계 → 시간별 변동률 생성 (시나리오 저장소에 있으면 불러옴), 일간데이터 반환"""
+        def 생성():
+            일간데이터 = self.랜덤_일별_데이터_생성()
+            self.주간_집계_계산(일간데이터)
+            return {'일간데이터': 일간데이터, '주간데이터': self.주간데이터,
+                    '시간데이터': self.시간데이터, '최종가격': [self.최종가격]}
+        
+        인자 = {'초기가격': self.초기가격, '주수': self.시뮬레이션주수}
+        배열들 = self._시나리오_저장소_사용('일별데이터', 인자, 생성)
+        self.일간데이터 = 배열들['일간데이터']
+        self.주간데이터 = 배열들['주간데이터']
+        self.시간데이터 = 배열들['시간데이터']
+        self.최종가격 = 배열들['최종가격'][0]
+        return self.일간데이터
+    
+    def _과거데이터_생성(self, 난수=None):
         """이동평균 계산용 과거 120일 데이터 생성"""
-        print("과거 120일 주가 데이터 생성 중...")
+        난수 = 난수 or self.난수
+        로그.debug("과거 120일 주가 데이터 생성 중...")
         
         # 현재 초기가격(100원)에서 역산하여 자연스러운 과거 데이터 생성
         과거가격들 = []
@@ -57,9 +193,9 @@ class 최적화투자분석:
         # 120일 전부터 현재까지의 가격 데이터 생성
         for 일차 in range(120, 0, -1):  # 120일 전부터 역순으로
             # 일일 변동률 (-3% ~ +3% 정도의 현실적 범위)
-            일일변동률 = random.uniform(-3, 3)
+            일일변동률 = 난수.uniform(-3, 3)
             # 과거일수록 현재가격과 차이가 날 수 있도록 약간의 추세 반영
-            추세보정 = (일차 / 120) * random.uniform(-0.5, 0.5)  # 장기간일수록 변동 가능성 증가
+            추세보정 = (일차 / 120) * 난수.uniform(-0.5, 0.5)  # 장기간일수록 변동 가능성 증가
             최종변동률 = 일일변동률 + 추세보정
             
             현재가격 = 현재가격 * (1 + 최종변동률/100)
@@ -70,7 +206,7 @@ class 최적화투자분석:
         과거가격들 = [시작가격]
         
         for 일차 in range(1, 120):
-            일일변동률 = random.uniform(-2.5, 2.5)  # 현실적 일일 변동률
+            일일변동률 = 난수.uniform(-2.5, 2.5)  # 현실적 일일 변동률
             새가격 = 과거가격들[-1] * (1 + 일일변동률/100)
             새가격 = max(50, min(200, 새가격))  # 범위 제한
             과거가격들.append(새가격)
@@ -80,32 +216,34 @@ class 최적화투자분석:
         보정비율 = self.초기가격 / 마지막가격
         self.과거데이터 = [가격 * 보정비율 for 가격 in 과거가격들]
         
-        print(f"   과거 데이터 생성 완료: {self.과거데이터[0]:.1f}원 → {self.과거데이터[-1]:.1f}원")
-        print(f"   20일 평균: {sum(self.과거데이터[-20:])/20:.1f}원")
-        print(f"   60일 평균: {sum(self.과거데이터[-60:])/60:.1f}원") 
-        print(f"   120일 평균: {sum(self.과거데이터)/120:.1f}원")
+        if 로그.isEnabledFor(logging.INFO):
+            로그.info("   과거 데이터 생성 완료: %.1f원 → %.1f원", self.과거데이터[0], self.과거데이터[-1])
+            로그.info("   20일 평균: %.1f원", sum(self.과거데이터[-20:])/20)
+            로그.info("   60일 평균: %.1f원", sum(self.과거데이터[-60:])/60)
+            로그.info("   120일 평균: %.1f원", sum(self.과거데이터)/120)
         
-    def 랜덤_일별_데이터_생성(self):
+    def 랜덤_일별_데이터_생성(self, 난수=None):
         """현실적인 일간 변동률 우선 생성 후 주간 집계"""
-        print("=== 135일간 일간 변동률 우선 생성 ===")
+        난수 = 난수 or self.난수
+        로그.info("=== %d일간 일간 변동률 우선 생성 ===", self.시뮬레이션주수 * 5)
         
         # 135일간 다양한 변동폭의 일간 변동률 생성
         일간변동률들 = []
         누적가격 = self.초기가격
         
-        print("\n일별 변동률 (다양한 변동폭):")
+        로그.debug("\n일별 변동률 (다양한 변동폭):")
         
         # 시장 분위기 결정 (전체 기간에 영향)
-        시장분위기 = random.choices(
+        시장분위기 = 난수.choices(
             ['안정장', '보통장', '변동장', '급변장'],
             weights=[25, 40, 25, 10],
             k=1
         )[0]
         
-        print(f"시장 분위기: {시장분위기}")
-        print("   안정 보통 활발 급변동 극단\n")
+        로그.info("시장 분위기: %s", 시장분위기)
+        로그.debug("   안정 보통 활발 급변동 극단\n")
         
-        for 일차 in range(135):
+        for 일차 in range(self.시뮬레이션주수 * 5):
             # 시장분위기에 따른 가중치 조정
             if 시장분위기 == '안정장':
                 가중치 = [50, 35, 10, 4, 1]  # 안정적 변동 선호
@@ -117,7 +255,7 @@ class 최적화투자분석:
                 가중치 = [10, 15, 25, 35, 15]  # 급변동 자주 발생
             
             # 변동폭 타입 선택
-            변동타입 = random.choices(
+            변동타입 = 난수.choices(
                 ['안정', '보통', '활발', '급변동', '극단'],
                 weights=가중치,
                 k=1
@@ -125,25 +263,25 @@ class 최적화투자분석:
             
             # 변동타입별 범위 설정
             if 변동타입 == '안정':
-                일간변동 = random.uniform(-2, 2)  # 안정적 시장
+                일간변동 = 난수.uniform(-2, 2)  # 안정적 시장
                 타입표시 = "안정"
             elif 변동타입 == '보통':
-                일간변동 = random.uniform(-5, 5)  # 일반적 시장
+                일간변동 = 난수.uniform(-5, 5)  # 일반적 시장
                 타입표시 = "보통"
             elif 변동타입 == '활발':
-                일간변동 = random.uniform(-10, 10)  # 활발한 시장
+                일간변동 = 난수.uniform(-10, 10)  # 활발한 시장
                 타입표시 = "활발"
             elif 변동타입 == '급변동':
-                일간변동 = random.uniform(-20, 20)  # 급격한 시장
+                일간변동 = 난수.uniform(-20, 20)  # 급격한 시장
                 타입표시 = "급변"
             else:  # 극단
                 # 극단적 변동은 방향성을 가지도록 (폭락 또는 폭등)
-                방향 = random.choice(['폭락', '폭등'])
+                방향 = 난수.choice(['폭락', '폭등'])
                 if 방향 == '폭락':
-                    일간변동 = random.uniform(-30, -15)  # 대폭 하락
+                    일간변동 = 난수.uniform(-30, -15)  # 대폭 하락
                     타입표시 = "폭락"
                 else:
-                    일간변동 = random.uniform(15, 30)   # 대폭 상승
+                    일간변동 = 난수.uniform(15, 30)   # 대폭 상승
                     타입표시 = "폭등"
                 
             일간변동률들.append(일간변동)
@@ -155,22 +293,22 @@ class 최적화투자분석:
             주차 = (일차 // 5) + 1
             주내일차 = (일차 % 5) + 1
             
-            print(f"  {주차}주 {주내일차}일: {타입표시} {일간변동:+.2f}% [{변동타입}] (누적: {누적가격:.1f}원)")
+            로그.debug("  %d주 %d일: %s %+.2f%% [%s] (누적: %.1f원)", 주차, 주내일차, 타입표시, 일간변동, 변동타입, 누적가격)
         
         self.일간데이터 = 일간변동률들
         return 일간변동률들
     
-    def 주간_집계_계산(self, 일간데이터):
+    def 주간_집계_계산(self, 일간데이터, 난수=None):
         """일간 데이터를 기반으로 주간 변동률 집계"""
-        print("\n=== 일간 → 주간 집계 계산 ===")
+        로그.info("\n=== 일간 → 주간 집계 계산 ===")
         
         self.주간데이터 = []
         누적가격 = self.초기가격
         
-        print("\n주간 집계 결과:")
+        로그.debug("\n주간 집계 결과:")
         
-        # 27주간 데이터 처리
-        for 주차 in range(27):
+        # 주간 데이터 처리 (5일 단위)
+        for 주차 in range(len(일간데이터) // 5):
             주시작_인덱스 = 주차 * 5
             주종료_인덱스 = 주시작_인덱스 + 5
             
@@ -192,20 +330,23 @@ class 최적화투자분석:
             # 초기가격 대비 총 변동률
             총변동률 = ((누적가격 - self.초기가격) / self.초기가격) * 100
             
-            print(f"  {주차+1}주차: {[f'{x:+.1f}' for x in 주간_일별데이터]} → 주간: {주간변동률:+.1f}% (누적: {총변동률:+.1f}%)")
+            if 로그.isEnabledFor(logging.DEBUG):
+                로그.debug("  %d주차: %s → 주간: %+.1f%% (누적: %+.1f%%)", 주차+1, [f'{x:+.1f}' for x in 주간_일별데이터], 주간변동률, 총변동률)
         
-        print(f"\n주간 변동률 집계: {[f'{x:+.1f}%' for x in self.주간데이터]}")
-        print(f"최종 가격: {self.초기가격:.1f}원 → {누적가격:.1f}원 ({((누적가격-self.초기가격)/self.초기가격*100):+.1f}%)")
+        if 로그.isEnabledFor(logging.INFO):
+            로그.info("\n주간 변동률 집계: %s", [f'{x:+.1f}%' for x in self.주간데이터])
+            로그.info("최종 가격: %.1f원 → %.1f원 (%+.1f%%)", self.초기가격, 누적가격, (누적가격-self.초기가격)/self.초기가격*100)
         
         # 시장 상황 판단을 위한 최종가격 저장
         self.최종가격 = 누적가격
         
         # 시간별 변동률 생성 (7시간 기반)
-        self._시간별_변동률_생성()
+        self._시간별_변동률_생성(난수)
     
-    def _시간별_변동률_생성(self):
+    def _시간별_변동률_생성(self, 난수=None):
         """일간데이터에 맞춰 자연스러운 시간별 변동률 생성"""
-        print("\n=== 일간 목표에 맞춘 시간별 변동률 생성 ===")
+        난수 = 난수 or self.난수
+        로그.info("\n=== 일간 목표에 맞춘 시간별 변동률 생성 ===")
         
         self.시간데이터 = []
         
@@ -214,17 +355,17 @@ class 최적화투자분석:
             목표배수 = 1 + 목표일변동/100
             
             # 변동성 패턴 결정
-            변동성타입 = self._변동성_패턴_결정(목표일변동)
+            변동성타입 = self._변동성_패턴_결정(목표일변동, 난수)
             
             if 변동성타입 == '급변형':
                 # 1-2시간에 큰 변동 집중, 나머지에서 조정
-                시간변동들 = self._급변형_시간분산(목표일변동)
+                시간변동들 = self._급변형_시간분산(목표일변동, 난수)
             elif 변동성타입 == '롤러코스터':
                 # 여러 번 급변동과 회복
-                시간변동들 = self._롤러코스터_시간분산(목표일변동)
+                시간변동들 = self._롤러코스터_시간분산(목표일변동, 난수)
             else:
                 # 기존 안정형 (균등 분산)
-                시간변동들 = self._안정형_시간분산(목표일변동)
+                시간변동들 = self._안정형_시간분산(목표일변동, 난수)
             
             # 누적 배수 계산
             누적배수 = 1
@@ -282,17 +423,26 @@ class 최적화투자분석:
             
             # 목표와 실제의 차이가 1% 이상이면 경고
             if abs(실제일변동 - 목표일변동) > 1:
-                print(f"[경고] 목표 달성 실패: 목표 {목표일변동:+.1f}% vs 실제 {실제일변동:+.1f}% (차이: {abs(실제일변동 - 목표일변동):.1f}%)")
+                로그.warning("[경고] 목표 달성 실패: 목표 %+.1f%% vs 실제 %+.1f%% (차이: %.1f%%)", 목표일변동, 실제일변동, abs(실제일변동 - 목표일변동))
             
             self.시간데이터.extend(시간변동들)
         
-        # 검증 및 표시
-        print("일간 목표 vs 시간별 실제 결과:")
-        print(f"DEBUG: 총 시간데이터 길이: {len(self.시간데이터)}, 일간데이터 길이: {len(self.일간데이터)}")
-        print(f"DEBUG: 예상 시간데이터 길이: {len(self.일간데이터) * 7}")
+        # 검증 및 표시 (일별 상세는 DEBUG 레벨일 때만 계산)
+        if 로그.isEnabledFor(logging.DEBUG):
+            self._시간별_변동률_검증출력()
+        
+        로그.info("\n시간별 변동률 생성 완료: %d개", len(self.시간데이터))
+        if 로그.isEnabledFor(logging.INFO):
+            로그.info("평균 시간별 변동폭: %.2f%%", sum(abs(x) for x in self.시간데이터) / len(self.시간데이터))
+    
+    def _시간별_변동률_검증출력(self):
+        """일간 목표 vs 시간별 실제 결과 일별 출력 (DEBUG)"""
+        로그.debug("일간 목표 vs 시간별 실제 결과:")
+        로그.debug("DEBUG: 총 시간데이터 길이: %d, 일간데이터 길이: %d", len(self.시간데이터), len(self.일간데이터))
+        로그.debug("DEBUG: 예상 시간데이터 길이: %d", len(self.일간데이터) * 7)
         현재가격 = self.초기가격
         
-        for 일차 in range(135):
+        for 일차 in range(len(self.일간데이터)):
             주차 = (일차 // 5) + 1
             주내일차 = (일차 % 5) + 1
             
@@ -303,7 +453,7 @@ class 최적화투자분석:
             
             # 디버그: 빈 데이터 체크
             if len(일일시간데이터) == 0:
-                print(f"WARNING: {일차+1}일차 시간데이터 없음 - 시작인덱스:{시작인덱스}, 끝인덱스:{끝인덱스}, 전체데이터길이:{len(self.시간데이터)}")
+                로그.warning("WARNING: %d일차 시간데이터 없음 - 시작인덱스:%d, 끝인덱스:%d, 전체데이터길이:%d", 일차+1, 시작인덱스, 끝인덱스, len(self.시간데이터))
                 continue
             
             # 실제 누적 변동 계산
@@ -330,10 +480,7 @@ class 최적화투자분석:
             else:
                 변동표시 = ""
             
-            print(f"  {주차}주 {주내일차}일: {[f'{x:+.1f}' for x in 일일시간데이터]} → {실제일변동:+.1f}%{변동표시}")
-        
-        print(f"\n시간별 변동률 생성 완료: {len(self.시간데이터)}개")
-        print(f"평균 시간별 변동폭: {sum(abs(x) for x in self.시간데이터) / len(self.시간데이터):.2f}%")
+            로그.debug("  %d주 %d일: %s → %+.1f%%%s", 주차, 주내일차, [f'{x:+.1f}' for x in 일일시간데이터], 실제일변동, 변동표시)
     
     def _거래비용_계산(self, 거래유형, 거래금액):
         """거래비용 계산"""
@@ -401,48 +548,48 @@ class 최적화투자분석:
             '거래횟수': len(거래내역)
         }
     
-    def _변동성_패턴_결정(self, 목표일변동):
+    def _변동성_패턴_결정(self, 목표일변동, 난수):
         """변동성 패턴 타입 결정"""
         변동폭 = abs(목표일변동)
         
         if 변동폭 >= 8:  # ±8% 이상
             # 70% 확률로 급변형, 20% 롤러코스터, 10% 안정형
-            return random.choices(['급변형', '롤러코스터', '안정형'], 
+            return 난수.choices(['급변형', '롤러코스터', '안정형'], 
                                 weights=[70, 20, 10], k=1)[0]
         elif 변동폭 >= 4:  # ±4~8%
             # 40% 급변형, 30% 롤러코스터, 30% 안정형
-            return random.choices(['급변형', '롤러코스터', '안정형'], 
+            return 난수.choices(['급변형', '롤러코스터', '안정형'], 
                                 weights=[40, 30, 30], k=1)[0]
         else:  # ±4% 미만
             # 10% 급변형, 20% 롤러코스터, 70% 안정형
-            return random.choices(['급변형', '롤러코스터', '안정형'], 
+            return 난수.choices(['급변형', '롤러코스터', '안정형'], 
                                 weights=[10, 20, 70], k=1)[0]
     
-    def _안정형_시간분산(self, 목표일변동):
+    def _안정형_시간분산(self, 목표일변동, 난수):
         """기존 안정형 균등 분산 (7시간용)"""
         시간변동들 = []
         for i in range(6):  # 7시간 중 첫 6시간
             변동폭 = min(3.0, abs(목표일변동) * 0.8)
             
-            if random.random() < 0.6 and 목표일변동 != 0:
+            if 난수.random() < 0.6 and 목표일변동 != 0:
                 방향편향 = 1 if 목표일변동 > 0 else -1
-                시간변동 = random.uniform(0, 변동폭) * 방향편향
+                시간변동 = 난수.uniform(0, 변동폭) * 방향편향
             else:
-                시간변동 = random.uniform(-변동폭, 변동폭)
+                시간변동 = 난수.uniform(-변동폭, 변동폭)
             
             시간변동들.append(시간변동)
         return 시간변동들
     
-    def _급변형_시간분산(self, 목표일변동):
+    def _급변형_시간분산(self, 목표일변동, 난수):
         """1-2시간에 큰 변동 집중 (7시간용)"""
         시간변동들 = [0] * 6  # 7시간 중 첫 6시간
         
         # 급변동 시간 선택 (1-2개)
         급변동수 = 1 if abs(목표일변동) < 10 else 2
-        급변동시간들 = random.sample(range(6), 급변동수)
+        급변동시간들 = 난수.sample(range(6), 급변동수)
         
         # 목표의 120-180%를 급변동 시간에 집중
-        집중비율 = random.uniform(1.2, 1.8)
+        집중비율 = 난수.uniform(1.2, 1.8)
         집중변동 = 목표일변동 * 집중비율
         
         # 급변동 시간에 분배
@@ -461,17 +608,17 @@ class 최적화투자분석:
         for 시간인덱스 in 남은시간들:
             조정량 = 조정필요량 / len(남은시간들) * -1  # 반대 방향
             # 자연스러운 노이즈 추가
-            노이즈 = random.uniform(-1.5, 1.5)
+            노이즈 = 난수.uniform(-1.5, 1.5)
             시간변동들[시간인덱스] = 조정량 + 노이즈
         
         return 시간변동들
     
-    def _롤러코스터_시간분산(self, 목표일변동):
+    def _롤러코스터_시간분산(self, 목표일변동, 난수):
         """여러 번 급변동과 회복 패턴"""
         시간변동들 = []
         
         # 목표의 150-250%를 2-3번에 걸쳐 급변동
-        총집중비율 = random.uniform(1.5, 2.5)
+        총집중비율 = 난수.uniform(1.5, 2.5)
         변동횟수 = 2 if abs(목표일변동) < 8 else 3
         
         # 급변동 패턴: 상승->하락->상승 또는 하락->상승->하락
@@ -488,7 +635,7 @@ class 최적화투자분석:
         기본크기 = abs(목표일변동) * 총집중비율 / 변동횟수
         
         for i in range(변동횟수):
-            크기변동 = random.uniform(0.7, 1.3)  # ±30% 변동
+            크기변동 = 난수.uniform(0.7, 1.3)  # ±30% 변동
             변동크기 = 기본크기 * 크기변동 * 패턴방향들[i]
             시간변동들.append(변동크기)
         
@@ -498,39 +645,46 @@ class 최적화투자분석:
         
         for i in range(남은시간수):
             조정량 = 총조정필요 / 남은시간수 * -1
-            노이즈 = random.uniform(-1.0, 1.0)
+            노이즈 = 난수.uniform(-1.0, 1.0)
             시간변동들.append(조정량 + 노이즈)
         
         # 순서를 랜덤하게 섞기
-        random.shuffle(시간변동들)
+        난수.shuffle(시간변동들)
         return 시간변동들
     
-    def 랜덤_주별_데이터_생성(self, 주수=5):
+    def 랜덤_주별_데이터_생성(self, 주수=5, 난수=None):
         """랜덤하게 주별 데이터를 생성"""
+        난수 = 난수 or self.난수
         주별데이터 = []
         for _ in range(주수):
             # -10% ~ +10% 범위의 랜덤 주간 변동률
-            주변동 = random.uniform(-10, 10)
+            주변동 = 난수.uniform(-10, 10)
             주별데이터.append(주변동)
         return 주별데이터
     
-    def 계층적_변동률_생성(self, 주별데이터):
+    def 계층적_변동률_생성(self, 주별데이터, 난수=None):
         """기존 방식 호환 - 주간 목표 기반 일간 데이터 생성 (특수 시나리오용)"""
-        print(f"\n특수 시나리오용 주간 목표 기반 생성")
+        self.주간데이터, self.일간데이터, self.시간데이터 = self._계층적_변동률_계산(주별데이터, 난수)
+    
+    def _계층적_변동률_계산(self, 주별데이터, 난수=None):
+        """주간 목표 → 일간 → 시간별 변동률 계산 (분석기 상태 변경 없이 (주간, 일간, 시간) 반환)"""
+        난수 = 난수 or self.난수
+        로그.info("\n특수 시나리오용 주간 목표 기반 생성")
         
-        self.주간데이터 = 주별데이터.copy()
-        print(f"주간 변동률: {[f'{x:+.1f}%' for x in self.주간데이터]}")
+        주간데이터 = 주별데이터.copy()
+        if 로그.isEnabledFor(logging.INFO):
+            로그.info("주간 변동률: %s", [f'{x:+.1f}%' for x in 주간데이터])
         
         # 일간 변동률 생성 (5일 복리 계산이 주 변동률과 같게)
-        self.일간데이터 = []
+        일간데이터 = []
         
-        for 주변동 in self.주간데이터:
+        for 주변동 in 주간데이터:
             목표배수 = 1 + 주변동/100
             
             # 랜덤 일간 변동 생성
             일변동들 = []
             for i in range(4):  # 처음 4일은 랜덤
-                일변동 = random.uniform(-6, 6)  # 범위 약간 줄임
+                일변동 = 난수.uniform(-6, 6)  # 범위 약간 줄임
                 일변동들.append(일변동)
             
             # 마지막 날은 목표에 맞춰 계산 (기존 로직)
@@ -554,16 +708,17 @@ class 최적화투자분석:
                 실제누적 *= (1 + 일변동/100)
             실제주변동 = (실제누적 - 1) * 100
             
-            print(f"  주 {주변동:+.1f}% → 일간: {[f'{x:+.1f}' for x in 일변동들]} → 실제: {실제주변동:+.1f}%")
+            if 로그.isEnabledFor(logging.DEBUG):
+                로그.debug("  주 %+.1f%% → 일간: %s → 실제: %+.1f%%", 주변동, [f'{x:+.1f}' for x in 일변동들], 실제주변동)
             
-            self.일간데이터.extend(일변동들)
+            일간데이터.extend(일변동들)
         
-        print(f"일간 변동률 생성 완료: {len(self.일간데이터)}개")
+        로그.info("일간 변동률 생성 완료: %d개", len(일간데이터))
         
         # 시간별 변동률 생성 (6시간 복리 계산이 일 변동률과 같게)
-        self.시간데이터 = []
+        시간데이터 = []
         
-        for 일변동 in self.일간데이터:
+        for 일변동 in 일간데이터:
             # 목표: 6시간의 복리 변동이 일변동과 같도록
             목표배수 = 1 + 일변동/100
             
@@ -572,9 +727,9 @@ class 최적화투자분석:
             for i in range(5):  # 처음 5시간은 랜덤
                 # 목표에 따라 변동 범위 조정
                 if abs(일변동) > 5:
-                    시간변동 = random.uniform(-4, 4)  # 큰 목표일 때 더 큰 범위
+                    시간변동 = 난수.uniform(-4, 4)  # 큰 목표일 때 더 큰 범위
                 else:
-                    시간변동 = random.uniform(-3, 3)  # 기본 범위 확대
+                    시간변동 = 난수.uniform(-3, 3)  # 기본 범위 확대
                 시간변동들.append(시간변동)
             
             # 마지막 시간은 목표에 맞춰 계산
@@ -625,23 +780,24 @@ class 최적화투자분석:
                 # 마지막 시간이 제한 범위 내면 그대로 사용
                 시간변동들.append(필요변동)
             
-            self.시간데이터.extend(시간변동들)
-        
-        # 검증 출력
-        print(f"\n검증: 첫째 주 첫날 시간별 변동")
-        첫날시간 = self.시간데이터[:6]
-        누적 = 100
-        for i, 변동 in enumerate(첫날시간):
-            누적 = 누적 * (1 + 변동/100)
-            # 소수점 1자리까지만 표시 (버림)
-            누적 = int(누적 * 10) / 10
-            print(f"  {i+1}시간: {변동:+.2f}% → 가격: {누적:.1f}")
+            시간데이터.extend(시간변동들)
         
-        첫날변동 = ((누적 - 100) / 100) * 100
-        print(f"  첫날 총 변동: {첫날변동:+.1f}% (목표: {self.일간데이터[0]:+.1f}%)")
+        # 검증 출력 (DEBUG)
+        if 로그.isEnabledFor(logging.DEBUG):
+            로그.debug("\n검증: 첫째 주 첫날 시간별 변동")
+            첫날시간 = 시간데이터[:6]
+            누적 = 100
+            for i, 변동 in enumerate(첫날시간):
+                누적 = 누적 * (1 + 변동/100)
+                # 소수점 1자리까지만 표시 (버림)
+                누적 = int(누적 * 10) / 10
+                로그.debug("  %d시간: %+.2f%% → 가격: %.1f", i+1, 변동, 누적)
+            
+            첫날변동 = ((누적 - 100) / 100) * 100
+            로그.debug("  첫날 총 변동: %+.1f%% (목표: %+.1f%%)", 첫날변동, 일간데이터[0])
         
-        print(f"\n시간별 변동률 생성 완료: {len(self.시간데이터)}개")
-        print()
+        로그.info("\n시간별 변동률 생성 완료: %d개\n", len(시간데이터))
+        return 주간데이터, 일간데이터, 시간데이터
     
     def 전략_비교_시뮬레이션(self):
         """다양한 전략을 자동 비교하며 점진적 필터링"""
@@ -649,184 +805,150 @@ class 최적화투자분석:
         print(f"초기 주식 가격: {self.초기가격}원")
         print("="*60)
         
-        # 기존 탈락 전략 로드
-        탈락전략목록 = self._탈락전략_로드()
-        
-        # 다양한 전략 조합 생성 (탈락 전략 제외)
-        전략조합 = self._전략조합_생성(탈락전략목록)
-        print(f"\n실제 시뮬레이션 투입: {len(전략조합)}개 전략")
-        
-        # 탈락 전략 통계 출력 (한 번만)
-        영구제외수 = len(탈락전략목록.get('영구제외', [])) if isinstance(탈락전략목록, dict) else len(탈락전략목록) if 탈락전략목록 else 0
-        임시탈락수 = len(탈락전략목록.get('임시기록', {})) if isinstance(탈락전략목록, dict) else 0
-        
-        if 영구제외수 > 0 or 임시탈락수 > 0:
-            # 5회 탈락 통계 계산
-            오회탈락수 = 0
-            for 기록 in 탈락전략목록.get('영구제외', []):
-                if 기록.get('탈락횟수', 0) == 5:
-                    오회탈락수 += 1
-            
-            print(f"탈락 전략 현황:")
-            print(f"  5회+ 탈락: {영구제외수}개")
-            print(f"  임시탈락: {임시탈락수}개")
-        
-        # 일별 점진적 필터링
-        생존전략 = 전략조합.copy()
-        탈락기록 = []
-        
-        for 일차 in range(135):  # 27주 = 135일
+        # 체크포인트에서 재개하면 전략 생성 대신 저장된 생존전략/탈락기록에서 이어서 진행
+        재개진행 = self._재개진행_꺼내기('일차')
+        if 재개진행 is None:
+            # 기존 탈락 전략 로드
+            탈락전략목록 = self._탈락전략_로드()
+            
+            # 다양한 전략 조합 생성 (탈락 전략 제외)
+            with self.프로파일.phase('조합생성'):
+                전략조합 = self._전략조합_생성(탈락전략목록)
+            print(f"\n실제 시뮬레이션 투입: {len(전략조합)}개 전략")
+            
+            # 탈락 전략 통계 출력 (한 번만)
+            영구제외수 = len(탈락전략목록.get('영구제외', [])) if isinstance(탈락전략목록, dict) else len(탈락전략목록) if 탈락전략목록 else 0
+            임시탈락수 = len(탈락전략목록.get('임시기록', {})) if isinstance(탈락전략목록, dict) else 0
+            
+            if 영구제외수 > 0 or 임시탈락수 > 0:
+                # 5회 탈락 통계 계산
+                오회탈락수 = 0
+                for 기록 in 탈락전략목록.get('영구제외', []):
+                    if 기록.get('탈락횟수', 0) == 5:
+                        오회탈락수 += 1
+                
+                print(f"탈락 전략 현황:")
+                print(f"  5회+ 탈락: {영구제외수}개")
+                print(f"  임시탈락: {임시탈락수}개")
+            
+            # 일별 점진적 필터링
+            생존전략 = 전략조합.copy()
+            탈락기록 = []
+            시작일차 = 0
+        else:
+            생존전략 = 재개진행['생존전략']
+            탈락기록 = 재개진행['탈락기록']
+            시작일차 = 재개진행['일차'] + 1
+            print(f"\n체크포인트에서 {시작일차 + 1}일차부터 재개: 생존 {len(생존전략):,}개 전략")
+        배치엔진 = self._배치엔진_생성(생존전략)
+        진행 = ProgressReporter(로그)  # 일별 진행상황은 1초에 한 번만 INFO 출력
+        총일수 = self.시뮬레이션주수 * 5  # 기본 27주 = 135일
+        
+        for 일차 in range(시작일차, 총일수):
             주차 = (일차 // 5) + 1
             주내일차 = (일차 % 5) + 1
             
             # 주간 단위로만 출력 (매주 월요일 = 주내일차 1일 때)
             if 주내일차 == 1:
-                print(f"\n{'='*60}")
-                print(f"{주차}주차 시뮬레이션 시작")
-                print(f"현재 생존 전략: {len(생존전략)}개")
+                로그.info("\n%s", '='*60)
+                로그.info("%d주차 시뮬레이션 시작", 주차)
+                로그.info("현재 생존 전략: %d개", len(생존전략))
             
             # 각 전략별 시뮬레이션 실행
-            일일결과 = []
-            for 전략 in 생존전략:
-                결과 = self._일일_시뮬레이션(전략, 일차)
-                일일결과.append(결과)
-            
-            # 성과 기준 정렬 (총수익률 기준)
-            일일결과.sort(key=lambda x: x['수익률'], reverse=True)
-            
-            # 자산 기준 탈락: 평가자산이 60,000원(60%) 이하인 전략 탈락 (40% 손실)
-            # 옐로우카드 시스템 (점진적 경고 방식)
-            생존전략 = []
-            탈락자 = []
-            옐로우카드발급 = []
-            
-            # 주차별 체크 (매주 금요일: 4, 9, 14, 19, 24, 29...)
-            주차 = (일차 // 5) + 1
-            
-            for 결과 in 일일결과:
-                전략 = 결과['전략']
-                현재평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
-                현재수익률 = ((현재평가자산 - 100000) / 100000) * 100
-                
-                # 개선된 옐로우카드 관리 (매주 체크, 12개 누적시 탈락)
-                # 옐로우카드는 전략 생성시 이미 복원됨
-                if '옐로우카드' not in 전략:
-                    전략['옐로우카드'] = {'개수': 0, '마지막카드주차': 0}  # 새 전략인 경우만
-                
-                # 주차별 수익률 요구사항 체크 - 주차가 바뀔 때마다
-                if 주차 > 전략['옐로우카드']['마지막카드주차']:
-                    # 주차별 요구 수익률 계산 (1주차: 0%, 2주차: 1%, 3주차: 2%, ...)
-                    요구수익률 = max(0, (주차 - 1))  # 2주차부터 1%씩 증가
-                    
-                    # 기존 -5% 조건과 주차별 요구사항 모두 체크
-                    카드발급사유 = []
-                    if 현재수익률 <= -5:  # 기존 -5% 기준
-                        카드발급사유.append(f"-5%손실")
-                    if 주차 >= 2 and 현재수익률 < 요구수익률:  # 주차별 요구사항
-                        카드발급사유.append(f"{주차}주차 {요구수익률}% 미달({현재수익률:.1f}%)")
-                    
-                    if 카드발급사유:
-                        전략['옐로우카드']['개수'] += len(카드발급사유)  # 여러 사유시 여러 카드
-                        전략['옐로우카드']['마지막카드주차'] = 주차
-                        옐로우카드발급.append({
-                            '전략': 전략, 
-                            '주차': 주차, 
-                            '수익률': 현재수익률, 
-                            '카드개수': 전략['옐로우카드']['개수'],
-                            '사유': ' + '.join(카드발급사유)
-                        })
-                
-                # 개선된 탈락 판정: 옐로우카드 12개 OR 극심한 손실 (50% 이하)
-                if 전략['옐로우카드']['개수'] >= 12:
-                    탈락자.append(전략)
-                elif 현재수익률 <= -30:  # -30% 이하 = 극심한 손실로 즉시 탈락
-                    탈락자.append(전략)  
+            self.프로파일.count('시뮬레이션.전략일', len(생존전략))
+            with self.프로파일.phase('일별시뮬레이션'):
+                if 배치엔진 is not None:
+                    일일결과 = 배치엔진.simulate_day(생존전략, 일차, self._가격경로_조회())
                 else:
-                    생존전략.append(전략)
-            
-            # 매일 간단한 진행상황 출력 (성능 최적화)
-            # dict는 set에 넣을 수 없으므로 id 기반으로 최적화
-            생존전략_ids = {id(전략) for 전략 in 생존전략}
-            생존전략수익률 = [결과['수익률'] for 결과 in 일일결과 if id(결과['전략']) in 생존전략_ids]
-            평균수익률 = sum(생존전략수익률)/len(생존전략수익률) if 생존전략수익률 else 0
-            print(f"{일차+1}일차: 생존 {len(생존전략):,}개 전략 (평균 누적수익률 {평균수익률:+.1f}%)")
+                    일일결과 = []
+                    for 전략 in 생존전략:
+                        결과 = self._일일_시뮬레이션(전략, 일차)
+                        일일결과.append(결과)
+            
+            with self.프로파일.phase('탈락판정'):
+                판정 = self._탈락_판정(일일결과, 일차, 배치엔진)
+            생존전략 = 판정['생존전략']
+            생존수익률합계 = 판정['생존수익률합계']
+            탈락자 = 판정['탈락자']
+            탈락수익률 = 판정['탈락수익률']
+            옐로우카드발급 = 판정['옐로우카드발급']
+            
+            # 일별 진행상황 (시간 간격 출력, 마지막 날은 항상 출력)
+            평균수익률 = 생존수익률합계/len(생존전략) if 생존전략 else 0
+            마지막날 = 일차 == 총일수 - 1 or len(생존전략) <= 5
+            진행.update("%d일차: 생존 %s개 전략 (평균 누적수익률 %+.1f%%)",
+                        일차+1, format(len(생존전략), ','), 평균수익률, force=마지막날)
             
             # 상태 출력 (간단히) - 생존 정보 이후에 표시
             if 옐로우카드발급:
-                print(f"   [!!] 옐로우카드 {len(옐로우카드발급)}개")
+                로그.debug("   [!!] 옐로우카드 %d개", len(옐로우카드발급))
             
             # 탈락 출력 (옐로우카드 이후에 표시)
-            # 생존전략 기준 옐로우카드 현황 확인
-            최대옐로우카드 = max([전략['옐로우카드']['개수'] for 전략 in 생존전략]) if 생존전략 else 0
-
             if 탈락자:
-                옐로우탈락 = sum(1 for t in 탈락자 if t['옐로우카드']['개수'] >= 12)
-                극심탈락 = len(탈락자) - 옐로우탈락
-                print(f"   탈락: {len(탈락자)}개")
+                로그.debug("   탈락: %d개", len(탈락자))
 
             # 탈락 기록 (모든 탈락자 저장)
-            for 전략 in 탈락자:
-                # 탈락 횟수 누적
-                if '탈락횟수' not in 전략:
-                    전략['탈락횟수'] = 0  
-                전략['탈락횟수'] += 1
-                
-                # 실시간 영구 제외 조건 확인 및 저장
-                self._실시간_영구제외_확인(전략, 일차+1)
-                
-                # 극심손실 체크 및 영구제외 처리
-                현재가격 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
-                평가자산 = 전략['자본'] + 전략['주식수'] * 현재가격
-                수익률 = ((평가자산 - 100000) / 100000) * 100
-                
-                if 수익률 <= -30.0:
-                    탈락사유 = "극심한손실(-30%)"
-                    self._극심손실_영구제외_처리(전략, 수익률, 일차+1)
-                elif 전략['옐로우카드']['개수'] >= 12:
-                    탈락사유 = "옐로우카드12개(12주부진)"
-                else:
-                    # 예상치 못한 탈락 조건 - 로그 기록
-                    탈락사유 = "기타탈락조건"
-                    print(f"   ⚠️ 예상치 못한 탈락: 수익률={수익률:.1f}%, 옐로우카드={전략['옐로우카드']['개수']}개")
-                
-                # 탈락 기록 저장 (배열 형태로 직접 저장)
-                매수전략타입 = 전략.get('매수기준', 'Unknown')
-                매수하락률 = 전략.get('매수하락률', 0.0)
-                구매방식 = int(전략.get('구매방식', '1'))
-                
-                # 매수수량 처리
-                if isinstance(전략.get('매수수량'), dict):
-                    매수수량 = 전략['매수수량']['수량']
-                    if 구매방식 == 1 and 매수수량 > 1:  # 퍼센트를 소수로 변환
-                        매수수량 = 매수수량 / 100
-                else:
-                    매수수량 = 전략.get('매수수량', 0.5)
-                    if 구매방식 == 1 and 매수수량 > 1:
-                        매수수량 = 매수수량 / 100
-                
-                손절라인 = 전략.get('손절라인', 0.0)
-                매도타입 = 전략.get('매도전략', '1')
-                if isinstance(매도타입, str) and '일괄' in 매도타입:
-                    매도타입 = 1
-                elif isinstance(매도타입, str):
-                    매도타입 = 1  # 기본값
-                
-                매도파라미터 = str(전략.get('수익라인', 0.0))
-                
-                탈락기록.append([
-                    매수전략타입,
-                    매수하락률, 
-                    구매방식,
-                    매수수량,
-                    손절라인,
-                    매도타입,
-                    매도파라미터,
-                    1  # 탈락횟수
-                ])
+            self.프로파일.count('탈락.전략', len(탈락자))
+            self.프로파일.count('옐로우카드.발급', len(옐로우카드발급))
+            with self.프로파일.phase('탈락처리'):
+                for 전략, 수익률 in zip(탈락자, 탈락수익률):
+                    # 탈락 횟수 누적
+                    if '탈락횟수' not in 전략:
+                        전략['탈락횟수'] = 0  
+                    전략['탈락횟수'] += 1
+                
+                    # 실시간 영구 제외 조건 확인 및 저장
+                    self._실시간_영구제외_확인(전략, 일차+1)
+                
+                    # 극심손실 체크 및 영구제외 처리 (수익률은 당일 시뮬레이션 평가자산 기준)
+                    if 수익률 <= -30.0:
+                        탈락사유 = "극심한손실(-30%)"
+                        self._극심손실_영구제외_처리(전략, 수익률, 일차+1)
+                    elif 전략['옐로우카드']['개수'] >= 12:
+                        탈락사유 = "옐로우카드12개(12주부진)"
+                    else:
+                        # 예상치 못한 탈락 조건 - 로그 기록
+                        탈락사유 = "기타탈락조건"
+                        로그.warning("   ⚠️ 예상치 못한 탈락: 수익률=%.1f%%, 옐로우카드=%d개", 수익률, 전략['옐로우카드']['개수'])
+                
+                    # 탈락 기록 저장 (배열 형태로 직접 저장)
+                    매수전략타입 = 전략.get('매수기준', 'Unknown')
+                    매수하락률 = 전략.get('매수하락률', 0.0)
+                    구매방식 = int(전략.get('구매방식', '1'))
+                
+                    # 매수수량 처리
+                    if isinstance(전략.get('매수수량'), dict):
+                        매수수량 = 전략['매수수량']['수량']
+                        if 구매방식 == 1 and 매수수량 > 1:  # 퍼센트를 소수로 변환
+                            매수수량 = 매수수량 / 100
+                    else:
+                        매수수량 = 전략.get('매수수량', 0.5)
+                        if 구매방식 == 1 and 매수수량 > 1:
+                            매수수량 = 매수수량 / 100
+                
+                    손절라인 = 전략.get('손절라인', 0.0)
+                    매도타입 = 전략.get('매도전략', '1')
+                    if isinstance(매도타입, str) and '일괄' in 매도타입:
+                        매도타입 = 1
+                    elif isinstance(매도타입, str):
+                        매도타입 = 1  # 기본값
+                
+                    매도파라미터 = str(전략.get('수익라인', 0.0))
+                
+                    탈락기록.append([
+                        매수전략타입,
+                        매수하락률, 
+                        구매방식,
+                        매수수량,
+                        손절라인,
+                        매도타입,
+                        매도파라미터,
+                        1  # 탈락횟수
+                    ])
             
             # 극심탈락자 수가 적을 때만 상세 출력
             극심탈락자 = [t for t in 탈락자 if t['옐로우카드']['개수'] < 12]
-            if 극심탈락자 and len(극심탈락자) <= 3:
+            if 극심탈락자 and len(극심탈락자) <= 3 and 로그.isEnabledFor(logging.INFO):
                 self._일일결과_출력(일일결과, 일차)
                 
                 # 생존 전략 중 상위 2개 표시 (최적화된 버전)
@@ -836,14 +958,14 @@ class 최적화투자분석:
                     # 생존전략에서 직접 수익률 계산하여 상위 2개 선택 (O(n log n) - 훨씬 효율적)
                     def 수익률_계산(전략):
                         try:
-                            현재가 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+                            현재가 = self._전략_현재가(전략)
                             평가자산 = 전략['자본'] + 전략['주식수'] * 현재가
                             return ((평가자산 - 100000) / 100000) * 100
                         except:
                             return -100
                     
-                    # 생존전략 중 상위 2개 선택
-                    상위전략들 = sorted(생존전략, key=수익률_계산, reverse=True)[:2]
+                    # 생존전략 중 상위 2개 선택 (전체 정렬 없이, 같은 수익률은 전략 키 순)
+                    상위전략들 = top_k(생존전략, 2, key=수익률_계산, tie_key=self._전략을_키로_변환)
                     
                     for i, 전략 in enumerate(상위전략들):
                         try:
@@ -853,7 +975,7 @@ class 최적화투자분석:
                             총손절 = len([t for t in 총거래내역 if t[0] == '손절'])
                             
                             전략설명 = self._전략설명_생성(전략)
-                            현재가 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+                            현재가 = self._전략_현재가(전략)
                             평가자산 = 전략['자본'] + 전략['주식수'] * 현재가
                             수익률 = 수익률_계산(전략)
                             보유상태 = f"보유{전략['주식수']:.1f}주@{현재가:.1f}원" if 전략['주식수'] > 0 else "현금상태"
@@ -867,18 +989,33 @@ class 최적화투자분석:
                     print(f"\n생존 전략 출력 오류: {e}")
                     print()
             
+            # N일마다 영구제외 변경 반영 (설정시)
+            if self.영구제외_반영주기 and (일차 + 1) % self.영구제외_반영주기 == 0:
+                self._영구제외_저널_반영()
+            
             # 생존 전략이 5개 이하면 종료
             if len(생존전략) <= 5:
-                print(f"\n최종 {len(생존전략)}개 전략만 남음. 시뮬레이션 종료")
+                로그.info("\n최종 %d개 전략만 남음. 시뮬레이션 종료", len(생존전략))
                 break
             
             # 주간 요약 출력
-            if 일차 < 134 and (일차 % 5 == 4):  # 금요일
+            if 일차 < 총일수 - 1 and (일차 % 5 == 4):  # 금요일
                 주차 = (일차 // 5) + 1
-                print(f"\n{주차}주차 요약")
-                print(f"   생존 전략: {len(생존전략)}개")
+                로그.info("\n%d주차 요약", 주차)
+                로그.info("   생존 전략: %d개", len(생존전략))
                 if 탈락기록:
-                    print(f"   탈락: {len(탈락기록)}개")
+                    로그.info("   탈락: %d개", len(탈락기록))
+            
+            # N일마다 체크포인트 저장 (긴 실행 중이고 재개할 날이 남아 있을 때만)
+            if self._체크포인트_문맥 is not None and 일차 < 총일수 - 1 and (일차 + 1) % self.체크포인트_주기 == 0:
+                self._체크포인트_저장({'단계': '일차', '일차': 일차, '생존전략': 생존전략, '탈락기록': 탈락기록})
+        
+        # 실행 중 누적된 영구제외 변경을 한 번에 저장
+        self._영구제외_저널_반영()
+        
+        # 최종 생존 전략은 마지막 날 수익률 순으로 한 번만 정렬 (반환 순서 유지)
+        최종수익률 = {id(결과['전략']): 결과['수익률'] for 결과 in 일일결과}
+        생존전략.sort(key=lambda 전략: 최종수익률[id(전략)], reverse=True)
         
         # 모든 탈락 전략을 누적 횟수 기반으로 저장
         if 탈락기록:
@@ -911,8 +1048,8 @@ class 최적화투자분석:
         생존전략 = 전략조합.copy()
         탈락기록 = []
         
-        # 135일간 시뮬레이션 (조용히)
-        for 일차 in range(135):
+        # 시뮬레이션 기간(기본 27주 = 135일) 동안 시뮬레이션 (조용히)
+        for 일차 in range(self.시뮬레이션주수 * 5):
             if len(생존전략) <= 5:
                 break
                 
@@ -925,11 +1062,12 @@ class 최적화투자분석:
             # 옐로우카드 및 탈락 체크
             생존전략 = []
             탈락자 = []
+            탈락수익률 = []  # 탈락자별 당일 수익률 (평가자산 재계산 방지)
             주차 = (일차 // 5) + 1
             
             for 결과 in 일일결과:
                 전략 = 결과['전략']
-                현재평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+                현재평가자산 = 결과['평가자산']  # 당일 종가 기준 평가자산 (시뮬레이션 결과 재사용)
                 현재수익률 = ((현재평가자산 - 100000) / 100000) * 100
                 
                 # 옐로우카드 관리 (전략 생성시 이미 복원됨)
@@ -943,15 +1081,14 @@ class 최적화투자분석:
                         전략['옐로우카드']['마지막음성주차'] = 주차
                 
                 # 탈락 판정
-                if 전략['옐로우카드']['개수'] >= 2:
-                    탈락자.append(전략)
-                elif 현재평가자산 <= 50000:
+                if 전략['옐로우카드']['개수'] >= 2 or 현재평가자산 <= 50000:
                     탈락자.append(전략)
+                    탈락수익률.append(현재수익률)
                 else:
                     생존전략.append(전략)
             
             # 탈락 기록 저장
-            for 전략 in 탈락자:
+            for 전략, 수익률 in zip(탈락자, 탈락수익률):
                 # 탈락 횟수 누적
                 # 탈락 횟수 증가 (전략 생성시 이미 복원됨)
                 if '탈락횟수' not in 전략:
@@ -961,11 +1098,7 @@ class 최적화투자분석:
                 # 실시간 영구 제외 조건 확인 및 저장
                 self._실시간_영구제외_확인(전략, 일차+1)
                 
-                # 극심손실 체크 및 영구제외 처리
-                현재가격 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
-                평가자산 = 전략['자본'] + 전략['주식수'] * 현재가격
-                수익률 = ((평가자산 - 100000) / 100000) * 100
-                
+                # 극심손실 체크 및 영구제외 처리 (수익률은 당일 시뮬레이션 평가자산 기준)
                 if 수익률 <= -30.0:
                     탈락사유 = "극심한손실(-30%)"
                     # 극심손실인 경우 영구제외 처리 (시장 상황별)
@@ -1011,6 +1144,9 @@ class 최적화투자분석:
                     전략.get('탈락횟수', 1)  # 누적 탈락횟수 사용
                 ])
         
+        # 실행 중 누적된 영구제외 변경을 한 번에 저장
+        self._영구제외_저널_반영()
+        
         # 탈락 전략 저장
         if 탈락기록:
             self._탈락전략_저장(탈락기록)
@@ -1018,7 +1154,7 @@ class 최적화투자분석:
         # 최고전략 분석
         최고전략 = None
         if 생존전략:
-            최고전략 = max(생존전략, key=lambda x: ((x['자본'] + x['주식수'] * (x['이동평균'][-1] if x['이동평균'] else self.초기가격)) - 100000) / 100000 * 100)
+            최고전략 = max(생존전략, key=lambda x: ((x['자본'] + x['주식수'] * self._전략_현재가(x)) - 100000) / 100000 * 100)
             if 최고전략:
                 self._최고전략_히스토리_저장(생존전략, '5사이클자동')
         
@@ -1048,7 +1184,7 @@ class 최적화투자분석:
         # 생존 전략들을 저장 형식으로 변환 (전략 설명 추가)
         저장용전략들 = []
         for 전략 in 생존전략:
-            평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+            평가자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
             수익률 = ((평가자산 - 100000) / 100000) * 100
             거래횟수 = len(전략['거래내역'])
             
@@ -1081,7 +1217,7 @@ class 최적화투자분석:
         if len(생존전략) <= 10:
             print(f"\n2단계 극한 검증을 실행하시겠습니까?")
             print(f"현재 {len(생존전략)}개 후보 전략을 다양한 극한 환경에서 테스트합니다.")
-            극한검증 = input("극한 검증 실행? (y/n): ")
+            극한검증 = self.입력("극한 검증 실행? (y/n): ")
             if 극한검증.lower() == 'y':
                 self._극한검증_시뮬레이션(생존전략)
     
@@ -1093,9 +1229,13 @@ class 최적화투자분석:
             
         압축파일경로 = self.탈락전략_파일.replace('.json', '_압축.json')
         
+        # 아직 합쳐지지 않은 탈락 로그 반영
+        self._탈락로그_압축()
+        
         # 압축 파일 로드
         if os.path.exists(압축파일경로):
-            결과 = self._압축된_탈락전략_로드(압축파일경로)
+            with self.프로파일.phase('탈락기록로드'):
+                결과 = self._압축된_탈락전략_로드(압축파일경로)
             self._cached_탈락전략_데이터 = 결과
             return 결과
         
@@ -1168,11 +1308,35 @@ class 최적화투자분석:
             print(f"신버전 압축 탈락전략 로드 실패: {e}")
             return {'영구제외': [], '임시기록': {}}
     
-    def _신버전_압축파일_업데이트(self, 전체탈락기록):
-        """신버전 3.0 압축파일을 업데이트 - 배열 직접 저장"""
+    def _탈락로그_파일(self):
+        """탈락 증가분 append-only 로그 (한 줄에 탈락 기록 하나)"""
+        return self.탈락전략_파일.replace('.json', '_압축.json') + '.log'
+    
+    def _탈락로그_크기(self):
+        """아직 합쳐지지 않은 탈락 로그 바이트 수 (없으면 0)"""
+        로그파일 = self._탈락로그_파일()
+        return os.path.getsize(로그파일) if os.path.exists(로그파일) else 0
+    
+    def _탈락로그_압축(self):
+        """탈락 로그를 신버전 3.0 압축파일에 합침 (7필드 튜플 색인으로 O(전체))"""
+        압축파일경로 = self.탈락전략_파일.replace('.json', '_압축.json')
+        로그파일 = self._탈락로그_파일()
+        
+        # 합칠 로그 조각 (이전 압축이 중단되어 남은 조각 포함, 이름순 = 시간순)
+        로그폴더 = os.path.dirname(로그파일) or '.'
+        로그이름 = os.path.basename(로그파일)
+        조각들 = []
+        if os.path.isdir(로그폴더):
+            조각들 = sorted(os.path.join(로그폴더, 이름) for 이름 in os.listdir(로그폴더)
+                         if 이름.startswith(로그이름 + '.'))
+        if os.path.exists(로그파일):
+            조각 = f"{로그파일}.{time.time_ns()}"
+            os.replace(로그파일, 조각)
+            조각들.append(조각)
+        if not 조각들:
+            return
+        
         try:
-            압축파일경로 = self.탈락전략_파일.replace('.json', '_압축.json')
-            
             # 기존 압축 데이터 로드
             압축데이터 = {
                 "version": "3.0",
@@ -1184,39 +1348,57 @@ class 최적화투자분석:
                 },
                 "strategies": []
             }
+            반영된조각 = set()
             
             if os.path.exists(압축파일경로):
                 try:
                     with open(압축파일경로, 'r', encoding='utf-8') as f:
                         기존데이터 = json.load(f)
                         압축데이터["strategies"] = 기존데이터.get("strategies", [])
+                        반영된조각 = set(기존데이터.get("반영된로그", []))
                 except:
                     pass  # 기존 파일 오류시 새로 시작
             
-            # 새로운 탈락 기록 추가 (이미 배열 형태)
-            for 기록 in 전체탈락기록:
-                if isinstance(기록, list) and len(기록) >= 8:
-                    # 중복 확인
-                    중복 = False
-                    for 기존기록 in 압축데이터["strategies"]:
-                        if (기존기록[0] == 기록[0] and  # 매수전략타입
-                            기존기록[1] == 기록[1] and  # 매수하락률
-                            기존기록[2] == 기록[2] and  # 구매방식
-                            기존기록[3] == 기록[3] and  # 매수수량
-                            기존기록[4] == 기록[4] and  # 손절라인
-                            기존기록[5] == 기록[5] and  # 매도타입
-                            기존기록[6] == 기록[6]):    # 매도파라미터
+            # 7필드(탈락횟수 제외) 튜플 → 첫 번째 일치 기록
+            색인 = {}
+            for 기존기록 in 압축데이터["strategies"]:
+                if isinstance(기존기록, list) and len(기존기록) >= 7:
+                    색인.setdefault(tuple(기존기록[:7]), 기존기록)
+            
+            for 조각 in 조각들:
+                # 파일 저장 후 조각 삭제 전에 중단된 경우 중복 반영 방지
+                if os.path.basename(조각) in 반영된조각:
+                    continue
+                with open(조각, 'r', encoding='utf-8') as f:
+                    for 줄 in f:
+                        try:
+                            기록 = json.loads(줄)
+                        except ValueError:
+                            continue  # 중단 시점의 불완전한 줄
+                        
+                        키 = tuple(기록[:7])
+                        if 키 in 색인:
                             # 탈락횟수 증가
-                            기존기록[7] = 기존기록[7] + 기록[7]
-                            중복 = True
-                            break
-                    
-                    if not 중복:
-                        압축데이터["strategies"].append(기록)
+                            색인[키][7] = 색인[키][7] + 기록[7]
+                        else:
+                            압축데이터["strategies"].append(기록)
+                            색인[키] = 기록
             
-            # 압축파일 저장
-            with open(압축파일경로, 'w', encoding='utf-8') as f:
-                json.dump(압축데이터, f, ensure_ascii=False, separators=(',', ':'))
+            압축데이터["반영된로그"] = [os.path.basename(조각) for 조각 in 조각들]
+            
+            # 압축파일 저장 (임시파일 → 원자적 교체)
+            임시파일 = 압축파일경로 + '.tmp'
+            with self.프로파일.phase('파일저장'):
+                with open(임시파일, 'w', encoding='utf-8') as f:
+                    json.dump(압축데이터, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(임시파일, 압축파일경로)
+            self.프로파일.count_file('저장바이트.탈락압축', 압축파일경로)
+            
+            for 조각 in 조각들:
+                os.remove(조각)
+            
+            # 합친 로그는 체크포인트 기준점에서 빠짐 (재개시 잘라낼 크기 갱신)
+            self._체크포인트_탈락로그크기_갱신()
                 
             print(f"   신버전 압축파일 업데이트: {len(압축데이터['strategies'])}개 전략")
             
@@ -1224,9 +1406,20 @@ class 최적화투자분석:
             print(f"신버전 압축파일 업데이트 실패: {e}")
     
     def _탈락전략_저장(self, 새탈락전략_정보):
-        """배열 형태 탈락전략 직접 저장"""
-        # 배열 형태로 직접 압축파일에 저장
-        self._신버전_압축파일_업데이트(새탈락전략_정보)
+        """배열 형태 탈락전략 저장 (로그에 추가, 로그가 커지면 압축파일에 합침)"""
+        로그파일 = self._탈락로그_파일()
+        이전크기 = self.프로파일.file_size(로그파일)
+        with self.프로파일.phase('파일저장'):
+            with open(로그파일, 'a', encoding='utf-8') as f:
+                for 기록 in 새탈락전략_정보:
+                    if isinstance(기록, list) and len(기록) >= 8:
+                        f.write(json.dumps(기록, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.프로파일.count_file('저장바이트.탈락로그', 로그파일, 이전크기)
+        
+        # 체크포인트를 쓰는 실행이면 체크포인트 저장 직후에만 합침 (체크포인트 이후 추가분은 재개시 잘라냄)
+        체크포인트중 = self._체크포인트_문맥 is not None or self._재개완료
+        if not 체크포인트중 and os.path.getsize(로그파일) >= self.탈락로그_압축크기:
+            self._탈락로그_압축()
         print(f"탈락 전략 {len(새탈락전략_정보)}개 저장 완료 (배열 형태)")
     
     def _전략을_키로_변환(self, 전략):
@@ -1395,9 +1588,33 @@ class 최적화투자분석:
             
         return True
     
+    def _전략속성_색인키(self, 전략속성):
+        """속성 일치확인용 정규화 튜플 (허용오차 0.01 → 소수점 둘째 자리 반올림)"""
+        def 양자화(값):
+            try:
+                return round(float(값), 2)
+            except (TypeError, ValueError):
+                return 값
+        
+        return (
+            전략속성.get('매수전략타입'),
+            전략속성.get('구매방식'),
+            양자화(전략속성.get('매수하락률', 0)),
+            양자화(전략속성.get('매수수량', 0)),
+            양자화(전략속성.get('손절라인', 0)),
+            양자화(전략속성.get('수익라인', 0))
+        )
+    
     def _전략조합_생성(self, 탈락전략목록=None):
-        """다양한 전략 조합 자동 생성"""
+        """다양한 전략 조합 자동 생성 (전체 목록)"""
         전략조합 = []
+        for 묶음 in self._전략조합_스트림(탈락전략목록):
+            전략조합.extend(묶음)
+        return 전략조합
+    
+    def _전략조합_스트림(self, 탈락전략목록=None, 묶음크기=10000):
+        """전략 조합을 묶음크기개씩 목록으로 생성 (전체 목록을 한 번에 만들지 않음)"""
+        묶음 = []
         
         # 탈락 기록 로드 (탈락 횟수 복원용)
         탈락기록 = self._탈락전략_로드()
@@ -1461,7 +1678,7 @@ class 최적화투자분석:
             {'전략': '3', '이름': '45일존버', '수익라인': 999, '매도기간': 44},  # 45일차에 매도 (9주)
             {'전략': '3', '이름': '90일존버', '수익라인': 999, '매도기간': 89},  # 90일차에 매도 (18주)
             {'전략': '3', '이름': '120일존버', '수익라인': 999, '매도기간': 119}, # 120일차에 매도 (24주)
-            {'전략': '3', '이름': '최종존버', '수익라인': 999, '매도기간': 134}   # 135일차에 매도 (27주)
+            {'전략': '3', '이름': '최종존버', '수익라인': 999, '매도기간': self.시뮬레이션주수 * 5 - 1}  # 마지막 날 매도 (기본 27주 = 135일차)
         ]
         
         for 존버 in 존버전략들:
@@ -1489,6 +1706,8 @@ class 최적화투자분석:
         시장별제외전략들 = {}  # 압축된 속성 기반 시장별 제외: {'상승장': [], '하락장': [], '횡보장': []}
         완전제외전략들 = []  # 속성 기반 완전제외 전략 목록
         완전제외_중복확인 = set()  # 중복 제거용
+        완전제외색인 = set()  # 속성 정규화 튜플 색인 (조합마다 O(1) 확인)
+        시장별제외색인 = {}  # {'상승장': set(), ...}
         
         try:
             if os.path.exists(self.영구제외_파일):
@@ -1525,12 +1744,15 @@ class 최적화투자분석:
                         # 중복이 아니면 추가
                         완전제외_중복확인.add(전략키)
                         완전제외전략들.append(전략속성)
+                        완전제외색인.add(self._전략속성_색인키(전략속성))
                     else:
                         # 시장별 제외 전략
                         for 시장 in 전략속성['탈락시장들']:
                             if 시장 not in 시장별제외전략들:
                                 시장별제외전략들[시장] = []
+                                시장별제외색인[시장] = set()
                             시장별제외전략들[시장].append(전략속성)
+                            시장별제외색인[시장].add(self._전략속성_색인키(전략속성))
                 
                 # 통계 출력 (필요시만)
                 if len(전략들) > 0:
@@ -1553,11 +1775,15 @@ class 최적화투자분석:
         if 현재시장상황 in 시장별제외전략들:
             print(f"  - {현재시장상황} 제외: {len(시장별제외전략들[현재시장상황])} (압축)")
         
+        현재시장제외색인 = 시장별제외색인.get(현재시장상황, set())
+        
         # 모든 조합 생성 (탈락 전략 제외)
         생성수 = 0
         제외수 = 0
         완전제외카운트 = 0
         시장별제외카운트 = 0
+        옐로우카드_전략수 = 0
+        총_옐로우카드수 = 0
         
         for 매수전략 in 매수전략들:
             # 전략 타입에 따라 다른 매개변수 처리
@@ -1614,12 +1840,12 @@ class 최적화투자분석:
                             if 키 in 완전제외키들:
                                 완전제외여부 = True
                             
-                            # 압축된 완전제외 전략과 속성 매칭
-                            if not 완전제외여부 and 전략속성:
-                                for 완전제외전략속성 in 완전제외전략들:
-                                    if self._전략속성_일치확인(전략속성, 완전제외전략속성):
-                                        완전제외여부 = True
-                                        break
+                            # 압축된 완전제외 전략과 속성 매칭 (정규화 튜플 색인)
+                            속성색인키 = None
+                            if 전략속성 and (완전제외색인 or 현재시장제외색인):
+                                속성색인키 = self._전략속성_색인키(전략속성)
+                            if not 완전제외여부 and 속성색인키 in 완전제외색인:
+                                완전제외여부 = True
                             
                             if 완전제외여부:
                                 제외수 += 1
@@ -1636,12 +1862,9 @@ class 최적화투자분석:
                             if 현재시장상황 in 시장별제외키들 and 키 in 시장별제외키들[현재시장상황]:
                                 시장별제외여부 = True
                             
-                            # 압축된 시장별 제외 전략과 속성 매칭
-                            if not 시장별제외여부 and 전략속성 and 현재시장상황 in 시장별제외전략들:
-                                for 시장별제외전략속성 in 시장별제외전략들[현재시장상황]:
-                                    if self._전략속성_일치확인(전략속성, 시장별제외전략속성):
-                                        시장별제외여부 = True
-                                        break
+                            # 압축된 시장별 제외 전략과 속성 매칭 (정규화 튜플 색인)
+                            if not 시장별제외여부 and 속성색인키 in 현재시장제외색인:
+                                시장별제외여부 = True
                             
                             if 시장별제외여부:
                                 제외수 += 1
@@ -1681,7 +1904,7 @@ class 최적화투자분석:
                                 '매수가격': 0,
                                 '최고가격': 0,
                                 '절반매도완료': False,
-                                '이동평균': self.과거데이터.copy(),  # 과거 120일 데이터로 초기화
+                                '경로일차': 0,  # 공유 가격경로에서 진행한 일수
                                 '거래내역': [],
                             }
                             
@@ -1718,26 +1941,120 @@ class 최적화투자분석:
                             else:
                                 전략데이터['탈락횟수'] = 0
                                 전략데이터['옐로우카드'] = {'개수': 0, '마지막카드주차': 0}
+                            
+                            if 전략데이터['옐로우카드']['개수'] > 0:
+                                옐로우카드_전략수 += 1
+                                총_옐로우카드수 += 전략데이터['옐로우카드']['개수']
                                 
-                            전략조합.append(전략데이터)
+                            묶음.append(전략데이터)
+                            if len(묶음) >= 묶음크기:
+                                yield 묶음
+                                묶음 = []
                             
                             생성수 += 1
         
+        if 묶음:
+            yield 묶음
+        
         print(f"제외된 전략: {제외수}개 (완전제외:{완전제외카운트}개, 시장별제외:{시장별제외카운트}개), 실제 투입: {생성수}개")
+        self.프로파일.count('조합.검사', 생성수 + 제외수)
+        self.프로파일.count('조합.완전제외', 완전제외카운트)
+        self.프로파일.count('조합.시장별제외', 시장별제외카운트)
+        self.프로파일.count('조합.투입', 생성수)
+        self.프로파일.count('조합.옐로우카드복원', 옐로우카드_전략수)
         
         # 옐로우카드 적용 요약
-        옐로우카드_전략수 = len([전략 for 전략 in 전략조합 if 전략.get('옐로우카드', {}).get('개수', 0) > 0])
-        총_옐로우카드수 = sum(전략.get('옐로우카드', {}).get('개수', 0) for 전략 in 전략조합)
         if 옐로우카드_전략수 > 0:
             print(f"옐로우카드 적용: {옐로우카드_전략수}개 전략에 총 {총_옐로우카드수}개 카드 적용")
+    
+    def _탈락_판정(self, 일일결과, 일차, 배치엔진=None):
+        """하루 결과로 옐로우카드 발급과 탈락 판정 (시뮬레이션 순서대로 한 번 훑음)
+        
+        반환: 생존전략/생존여부(일일결과 순서)/생존수익률합계/탈락자/탈락수익률/옐로우카드발급
+        배치엔진이 있으면 상태 배열도 생존 전략만 남기고 압축
+        """
+        # 자산 기준 탈락: 평가자산이 60,000원(60%) 이하인 전략 탈락 (40% 손실)
+        # 옐로우카드 시스템 (점진적 경고 방식)
+        # 전체 정렬 없이 시뮬레이션 순서대로 한 번 훑으며 생존 전략만 남김 (상위 출력은 top_k로)
+        생존전략 = []
+        생존여부 = []
+        생존수익률합계 = 0
+        탈락자 = []
+        탈락수익률 = []  # 탈락자별 당일 수익률 (평가자산 재계산 방지)
+        옐로우카드발급 = []
         
+        # 주차별 체크 (매주 금요일: 4, 9, 14, 19, 24, 29...)
+        주차 = (일차 // 5) + 1
         
-        return 전략조합
+        for 결과 in 일일결과:
+            전략 = 결과['전략']
+            현재평가자산 = 결과['평가자산']  # 당일 종가 기준 평가자산 (시뮬레이션 결과 재사용)
+            현재수익률 = ((현재평가자산 - 100000) / 100000) * 100
+        
+            # 개선된 옐로우카드 관리 (매주 체크, 12개 누적시 탈락)
+            # 옐로우카드는 전략 생성시 이미 복원됨
+            if '옐로우카드' not in 전략:
+                전략['옐로우카드'] = {'개수': 0, '마지막카드주차': 0}  # 새 전략인 경우만
+        
+            # 주차별 수익률 요구사항 체크 - 주차가 바뀔 때마다
+            if 주차 > 전략['옐로우카드']['마지막카드주차']:
+                # 주차별 요구 수익률 계산 (1주차: 0%, 2주차: 1%, 3주차: 2%, ...)
+                요구수익률 = max(0, (주차 - 1))  # 2주차부터 1%씩 증가
+            
+                # 기존 -5% 조건과 주차별 요구사항 모두 체크
+                카드발급사유 = []
+                if 현재수익률 <= -5:  # 기존 -5% 기준
+                    카드발급사유.append(f"-5%손실")
+                if 주차 >= 2 and 현재수익률 < 요구수익률:  # 주차별 요구사항
+                    카드발급사유.append(f"{주차}주차 {요구수익률}% 미달({현재수익률:.1f}%)")
+            
+                if 카드발급사유:
+                    전략['옐로우카드']['개수'] += len(카드발급사유)  # 여러 사유시 여러 카드
+                    전략['옐로우카드']['마지막카드주차'] = 주차
+                    옐로우카드발급.append({
+                        '전략': 전략, 
+                        '주차': 주차, 
+                        '수익률': 현재수익률, 
+                        '카드개수': 전략['옐로우카드']['개수'],
+                        '사유': ' + '.join(카드발급사유)
+                    })
+        
+            # 개선된 탈락 판정: 옐로우카드 12개 OR 극심한 손실 (-30% 이하 = 극심한 손실로 즉시 탈락)
+            if 전략['옐로우카드']['개수'] >= 12 or 현재수익률 <= -30:
+                탈락자.append(전략)
+                탈락수익률.append(현재수익률)
+                생존여부.append(False)
+            else:
+                생존전략.append(전략)
+                생존여부.append(True)
+                생존수익률합계 += 결과['수익률']
+        
+        # 배치엔진 상태 배열도 생존 전략만 남기고 압축 (다음 날 위치 조회 불필요)
+        if 배치엔진 is not None:
+            배치엔진.compact(생존여부, 생존전략)
+        
+        return {
+            '생존전략': 생존전략,
+            '생존여부': 생존여부,
+            '생존수익률합계': 생존수익률합계,
+            '탈락자': 탈락자,
+            '탈락수익률': 탈락수익률,
+            '옐로우카드발급': 옐로우카드발급
+        }
+    
+    def _배치엔진_생성(self, 전략목록):
+        """numpy 일괄 시뮬레이터 생성 (사용 불가하면 None → 전략별 시뮬레이션)"""
+        if not self.배치시뮬레이션 or not NUMPY_AVAILABLE or not 전략목록:
+            return None
+        return BatchSimulator(전략목록, self.거래비용설정, self.초기가격, self._일일_시뮬레이션,
+                              final_day=self.시뮬레이션주수 * 5 - 1)
     
     def _일일_시뮬레이션(self, 전략, 일차):
         """하루 동안의 특정 전략 시뮬레이션"""
-        # 전일 종가 계산 (이동평균에서)
-        전일종가 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+        가격경로 = self._가격경로_조회()
+        
+        # 전일 종가 (공유 가격경로에서 조회)
+        전일종가 = 가격경로.last_close(일차)
         
         # 시작 가격 (전일 종가)
         현재가격 = 전일종가
@@ -1746,15 +2063,12 @@ class 최적화투자분석:
         
         거래횟수 = 0
         
-        # 하루 7시간 시뮬레이션
+        # 하루 7시간 시뮬레이션 (가격은 경로에 미리 계산됨)
         for 시간 in range(7):
-            시간인덱스 = 일차 * 7 + 시간
-            if 시간인덱스 >= len(self.시간데이터):
+            시간가격 = 가격경로.hour_price(일차, 시간)
+            if 시간가격 is None:
                 break
-                
-            변동률 = self.시간데이터[시간인덱스]
-            현재가격 = 현재가격 * (1 + 변동률/100)
-            현재가격 = int(현재가격 * 10) / 10  # 소수점 1자리 버림
+            현재가격 = 시간가격
             
             # 매매 로직 실행 (첫 시간 제외)
             if 시간 > 0:  # 첫 번째 시간은 매수/매도 금지
@@ -1762,10 +2076,8 @@ class 최적화투자분석:
                 if 거래발생:
                     거래횟수 += 1
         
-        # 이동평균 업데이트 (최대 120일 유지)
-        전략['이동평균'].append(현재가격)
-        if len(전략['이동평균']) > 120:
-            전략['이동평균'].pop(0)
+        # 진행 일차 기록 (이동평균은 가격경로가 관리)
+        전략['경로일차'] = 일차 + 1
         
         # 최종 평가자산 및 수익률 계산
         최종평가 = 전략['자본'] + 전략['주식수'] * 현재가격
@@ -1804,6 +2116,7 @@ class 최적화투자분석:
         # 매수 체크
         if 전략['자본'] > 현재가격 and 전략['주식수'] == 0:
             매수신호 = False
+            가격경로 = self._가격경로_조회()
             
             if 전략['매수기준'] == '1':  # 시가 대비 하락
                 시가 = self._시가_계산(일차)
@@ -1822,22 +2135,22 @@ class 최적화투자분석:
                         매수신호 = True
                     
             elif 전략['매수기준'] == '3':  # 20일선 이탈
-                if len(전략['이동평균']) >= 20:
-                    평균가 = sum(전략['이동평균'][-20:]) / 20
+                평균가 = 가격경로.moving_average(일차, 20)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         매수신호 = True
                         
             elif 전략['매수기준'] == '4':  # 60일선 이탈
-                if len(전략['이동평균']) >= 60:
-                    평균가 = sum(전략['이동평균'][-60:]) / 60
+                평균가 = 가격경로.moving_average(일차, 60)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         매수신호 = True
                         
             elif 전략['매수기준'] == '5':  # 120일선 이탈
-                if len(전략['이동평균']) >= 120:
-                    평균가 = sum(전략['이동평균'][-120:]) / 120
+                평균가 = 가격경로.moving_average(일차, 120)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         매수신호 = True
@@ -1849,21 +2162,21 @@ class 최적화투자분석:
                     매수신호 = True
                     
             elif 전략['매수기준'] == '7':  # 20일선 돌파 상승
-                if len(전략['이동평균']) >= 20:
-                    평균가 = sum(전략['이동평균'][-20:]) / 20
+                평균가 = 가격경로.moving_average(일차, 20)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 >= 전략['매수상승률']:
                         매수신호 = True
                         
             elif 전략['매수기준'] == '8':  # 연속상승 매수
-                if len(전략['이동평균']) >= 전략['연속횟수']:
-                    연속상승 = self._연속상승_체크(전략['이동평균'], 전략['연속횟수'])
+                if 가격경로.history_length(일차) >= 전략['연속횟수']:
+                    연속상승 = self._연속상승_체크(가격경로.recent_prices(일차, 전략['연속횟수']), 전략['연속횟수'])
                     if 연속상승:
                         매수신호 = True
                         
             elif 전략['매수기준'] == '9':  # 모멘텀 매수
-                if len(전략['이동평균']) >= 5:  # 최근 5일 모멘텀 체크
-                    모멘텀 = self._모멘텀_계산(전략['이동평균'][-5:])
+                if 가격경로.history_length(일차) >= 5:  # 최근 5일 모멘텀 체크
+                    모멘텀 = self._모멘텀_계산(가격경로.recent_prices(일차, 5))
                     if 모멘텀 >= 전략['모멘텀기준']:
                         매수신호 = True
                         
@@ -1875,8 +2188,8 @@ class 최적화투자분석:
                     매수신호 = self._고무줄_매수_체크(전략, 일대비변동)
                         
             elif 전략['매수기준'] == '11':  # 고무줄 20일선하락 매수
-                if len(전략['이동평균']) >= 20:
-                    평균가 = sum(전략['이동평균'][-20:]) / 20
+                평균가 = 가격경로.moving_average(일차, 20)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         # 고무줄 매수 신호 - 해당 하락률에 따른 매수를 합드뇝
@@ -1943,7 +2256,7 @@ class 최적화투자분석:
                     
             elif 전략['매도전략'] == '3':  # 존버 전략
                 # 기간별 존버: 정해진 기간에 도달하면 매도
-                매도기간 = 전략.get('매도기간', 134)  # 기본값: 134일차
+                매도기간 = 전략.get('매도기간', self.시뮬레이션주수 * 5 - 1)  # 기본값: 마지막 날 (기본 134일차)
                 if 일차 == 매도기간:  # 정해진 기간에 매도
                     실제매도금 = self._실제매도금_계산(현재가격, 전략['주식수'])
                     전략['자본'] += 실제매도금
@@ -2073,8 +2386,8 @@ class 최적화투자분석:
             시가 = self._시가_계산(일차)
             하락률 = ((현재가격 - 시가) / 시가) * 100
         elif 전략['매수기준'] == '11':  # 20일선하락
-            if len(전략['이동평균']) >= 20:
-                평균가 = sum(전략['이동평균'][-20:]) / 20
+            평균가 = self._가격경로_조회().moving_average(일차, 20)
+            if 평균가 is not None:
                 하락률 = ((현재가격 - 평균가) / 평균가) * 100
             else:
                 return False
@@ -2206,20 +2519,22 @@ class 최적화투자분석:
             return f"전략설명_오류_{str(e)[:20]}"
     
     def _시가_계산(self, 일차):
-        """해당 일의 시가 계산"""
-        if 일차 == 0:
-            return self.초기가격
-        
-        # 전일 종가 기준으로 시가 계산 (간단히 전일 마지막 가격 사용)
-        이전일마지막시간 = (일차 - 1) * 7 + 6
-        현재가격 = self.초기가격
-        
-        for i in range(이전일마지막시간 + 1):
-            if i < len(self.시간데이터):
-                현재가격 = 현재가격 * (1 + self.시간데이터[i]/100)
-                현재가격 = int(현재가격 * 10) / 10
-        
-        return 현재가격
+        """해당 일의 시가 계산 (전일 마지막 가격, 가격경로에 미리 계산됨)"""
+        return self._가격경로_조회().day_open(일차)
+    
+    def _가격경로_조회(self):
+        """현재 시간데이터의 공유 가격경로 (시간데이터가 바뀌면 다시 생성)"""
+        if self.가격경로 is None or not self.가격경로.matches(self.시간데이터, self.과거데이터):
+            self.가격경로 = PricePath(self.과거데이터, self.시간데이터, self.초기가격, days=self.시뮬레이션주수 * 5)
+        return self.가격경로
+    
+    def _전략_현재가(self, 전략, 가격경로=None):
+        """전략이 마지막으로 진행한 일차의 종가 (기존 이동평균[-1])"""
+        if '이동평균' in 전략:  # 자체 가격 기록을 쓰는 전략 (300주 고속검증 등)
+            return 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+        if 가격경로 is None:
+            가격경로 = self._가격경로_조회()
+        return 가격경로.last_close(전략.get('경로일차', 0))
     
     def _연속상승_체크(self, 이동평균, 연속횟수):
         """연속 상승 여부 체크"""
@@ -2245,18 +2560,19 @@ class 최적화투자분석:
     
     def _일일결과_출력(self, 일일결과, 일차):
         """일일 시뮬레이션 결과 요약 출력"""
-        # 일일수익률 기준으로 정렬
-        일일정렬 = sorted(일일결과, key=lambda x: x['일수익률'], reverse=True)
-        상위3 = 일일정렬[:3]
-        하위3 = 일일정렬[-3:]
+        # 일일수익률 기준 상위/하위 3개 (전체 정렬 없이, 같은 수익률은 전략 키 순)
+        결과키 = lambda x: self._전략을_키로_변환(x['전략'])
+        상위3 = top_k(일일결과, 3, key=lambda x: x['일수익률'], tie_key=결과키)
+        하위3 = top_k(일일결과, 3, key=lambda x: -x['일수익률'], tie_key=결과키)[::-1]
         
         # 전날 대비 주가 변동률 계산
         if 일차 > 0 and len(일일결과) > 0:
-            # 첫 번째 전략의 이동평균으로 주가 변동 계산
+            # 공유 가격경로의 최근 종가로 주가 변동 계산
             전략 = 일일결과[0]['전략']
-            if len(전략['이동평균']) >= 2:
-                현재가 = 전략['이동평균'][-1]
-                전일가 = 전략['이동평균'][-2]
+            최근가격 = self._가격경로_조회().recent_prices(전략.get('경로일차', 0), 2)
+            if len(최근가격) >= 2:
+                현재가 = 최근가격[-1]
+                전일가 = 최근가격[-2]
                 변동률 = ((현재가 - 전일가) / 전일가) * 100
                 변동표시 = f" {변동률:+.1f}%"
             else:
@@ -2307,7 +2623,7 @@ class 최적화투자분석:
             전략설명 = self._전략설명_생성(전략)
             # 보유 상태 표시
             보유상태 = f"보유{전략['주식수']:.0f}주" if 전략['주식수'] > 0 else "현금상태"
-            print(f"{len(일일정렬)-2+i}. [{전략설명}] (매수{오늘매수} 매도{오늘매도} 손절{오늘손절})")
+            print(f"{len(일일결과)-len(하위3)+1+i}. [{전략설명}] (매수{오늘매수} 매도{오늘매도} 손절{오늘손절})")
             print(f"   일일: {결과['일수익률']:+.1f}% | 누적: {결과['수익률']:+.1f}% | {보유상태}")
         
         # 통계 요약
@@ -2332,10 +2648,10 @@ class 최적화투자분석:
         
         # 최고 성과 전략 상세 분석
         if 생존전략:
-            최고전략 = max(생존전략, key=lambda x: ((x['자본'] + x['주식수'] * (x['이동평균'][-1] if x['이동평균'] else self.초기가격)) - 100000) / 100000 * 100)
+            최고전략 = max(생존전략, key=lambda x: ((x['자본'] + x['주식수'] * self._전략_현재가(x)) - 100000) / 100000 * 100)
             
             print(f"\n최고 성과 전략 상세:")
-            평가자산 = 최고전략['자본'] + 최고전략['주식수'] * (최고전략['이동평균'][-1] if 최고전략['이동평균'] else self.초기가격)
+            평가자산 = 최고전략['자본'] + 최고전략['주식수'] * self._전략_현재가(최고전략)
             수익률 = ((평가자산 - 100000) / 100000) * 100
             
             print(f"전략: {최고전략['매수기준명']}-{최고전략['매수하락률']}% + {최고전략['구매방식명']} + 손절{최고전략['손절라인']}% + {최고전략['매도전략명']}")
@@ -2375,12 +2691,11 @@ class 최적화투자분석:
             print("저장할 생존 전략이 없습니다.")
             return
             
-        정렬된전략들 = sorted(생존전략들, key=lambda x: self._전략수익률_계산(x), reverse=True)
-        상위5전략 = 정렬된전략들[:5]
+        상위5전략 = top_k(생존전략들, 5, key=self._전략수익률_계산, tie_key=self._전략을_키로_변환)
         print(f"상위 5개 전략 추출 완료 (총 {len(생존전략들)}개 중)")
         
         # 실제 시장환경 정보 (구체적 데이터)
-        최종가격 = 상위5전략[0]['이동평균'][-1] if 상위5전략[0]['이동평균'] else self.초기가격
+        최종가격 = self._전략_현재가(상위5전략[0])
         시장수익률 = round(((최종가격 - self.초기가격) / self.초기가격) * 100, 2)
         현재시장상황 = self._시장상황_판정(self.초기가격, 최종가격)
         
@@ -2391,15 +2706,8 @@ class 최적화투자분석:
             '시장상황': 현재시장상황
         }
         
-        # 새로운 히스토리 데이터 생성 (간소화)
-        새로운_기록 = {
-            '발견날짜': time.strftime("%Y-%m-%d %H:%M:%S"),
-            '시뮬레이션타입': 시뮬레이션타입,
-            '시장환경': 시장환경,
-            '최고전략_순위': []
-        }
-        
         # 상위 5개 전략을 직접 저장 (그룹화 없이)
+        최고전략_순위 = []
         for 순위, 전략 in enumerate(상위5전략, 1):
             수익률 = self._전략수익률_계산(전략)
             거래내역 = 전략.get('거래내역', [])
@@ -2416,10 +2724,77 @@ class 최적화투자분석:
                 '총거래횟수': len(거래내역),
                 '매수': 매수횟수,
                 '매도': 매도횟수,
-                '손절': 손절횟수
+                '손절': 손절횟수,
+                '전략': self._전략구성_추출(전략)
             }
-            새로운_기록['최고전략_순위'].append(전략정보)
+            최고전략_순위.append(전략정보)
+        
+        try:
+            총기록수 = self._최고전략_기록_추가([self._히스토리_기록_생성(시뮬레이션타입, 시장환경, 최고전략_순위)])
+            
+            print(f"\n최고전략 히스토리 저장 완료")
+            if 상위5전략:
+                최고전략 = 상위5전략[0]  # 가장 수익률이 높은 전략
+                print(f"   전략: {최고전략['매수기준명']}-{최고전략['매수하락률']}% + {최고전략['매도전략명']}")
+                # 거래 내역 분석
+                거래내역 = 최고전략['거래내역']
+                매수횟수 = len([t for t in 거래내역 if t[0] == '매수'])
+                손절횟수 = len([t for t in 거래내역 if t[0] == '손절'])
+                매도횟수 = len(거래내역) - 매수횟수 - 손절횟수
+                
+                # 수익률 계산
+                수익률 = self._전략수익률_계산(최고전략)
+                print(f"   수익률: {수익률:+.1f}% | 총 거래: {매수횟수+매도횟수+손절횟수}회 (매수:{매수횟수}, 매도:{매도횟수}, 손절:{손절횟수})")
+            print(f"   총 기록: {총기록수}개")
+            
+        except Exception as e:
+            print(f"최고전략 히스토리 저장 실패: {e}")
+    
+    def _전략구성_추출(self, 전략):
+        """히스토리/수집용 전략 구성 필드 (상태/거래내역 제외, 방식별 필드는 있을 때만)"""
+        구성 = {필드: 전략.get(필드) for 필드 in 전략구성_필드}
+        구성.update({필드: 전략[필드] for 필드 in 전략구성_선택필드 if 필드 in 전략})
+        return 구성
+    
+    def _히스토리_기록_생성(self, 시뮬레이션타입, 시장환경, 최고전략_순위):
+        """최고전략 히스토리 기록 하나 (실행/데이터 시드 포함)"""
+        return {
+            '발견날짜': time.strftime("%Y-%m-%d %H:%M:%S"),
+            '시뮬레이션타입': 시뮬레이션타입,
+            '실행시드': self.시드,
+            '데이터시드': self.데이터시드,  # 이 시드로 같은 시장 데이터 재현
+            '시장환경': 시장환경,
+            '최고전략_순위': 최고전략_순위
+        }
+    
+    def _종합랭킹_히스토리_저장(self, 종합랭킹, 사이클결과들):
+        """종합랭킹 상위 5개를 히스토리에 저장 (저장된 평균수익률/안정성점수 사용, 시장은 사이클 평균)"""
+        # 랭킹 항목은 간소화된 전략정보라 자본/거래내역이 없음 - 평가자산을 다시 계산하지 않음
+        최고전략_순위 = [{
+            '순위': 순위,
+            '전략설명': 전략데이터['전략설명'],
+            '수익률': round(전략데이터['평균수익률'], 1),
+            '출현횟수': 전략데이터['출현횟수'],
+            '안정성점수': round(전략데이터['안정성점수'], 1),
+            '전략': self._전략구성_추출(전략데이터['전략정보'])
+        } for 순위, 전략데이터 in enumerate(종합랭킹[:5], 1)]
+        
+        시장수익률 = round(sum(결과['단순보유수익률'] for 결과 in 사이클결과들) / len(사이클결과들), 2) if 사이클결과들 else 0
+        시장환경 = {
+            '초기가격': self.초기가격,
+            '최종가격': self.초기가격 * (1 + 시장수익률 / 100),
+            '시장수익률': 시장수익률,
+            '시장상황': '사이클평균'
+        }
         
+        try:
+            총기록수 = self._최고전략_기록_추가([self._히스토리_기록_생성("5사이클_종합랭킹", 시장환경, 최고전략_순위)])
+            print(f"\n  → 5사이클 종합랭킹 히스토리 저장 완료 (총 기록: {총기록수}개)")
+        except Exception as e:
+            print(f"종합랭킹 히스토리 저장 실패: {e}")
+    
+    def _최고전략_기록_추가(self, 새기록들):
+        """최고전략 히스토리 파일에 기록 추가 (최근 50개 유지), 총 기록 수 반환"""
         # 기존 히스토리 로드
         히스토리_파일 = self.최고전략_파일
         기존히스토리 = []
@@ -2437,32 +2812,14 @@ class 최적화투자분석:
             print("  기존 히스토리 로드 실패, 새로 시작")
         
         # 새 기록 추가
-        기존히스토리.append(새로운_기록)
+        기존히스토리.extend(새기록들)
         
         # 저장 (최근 50개만 유지)
         if len(기존히스토리) > 50:
             기존히스토리 = 기존히스토리[-50:]
         
-        try:
-            self._안전한_json_저장(히스토리_파일, 기존히스토리)
-            
-            print(f"\n최고전략 히스토리 저장 완료")
-            if 상위5전략:
-                최고전략 = 상위5전략[0]  # 가장 수익률이 높은 전략
-                print(f"   전략: {최고전략['매수기준명']}-{최고전략['매수하락률']}% + {최고전략['매도전략명']}")
-                # 거래 내역 분석
-                거래내역 = 최고전략['거래내역']
-                매수횟수 = len([t for t in 거래내역 if t[0] == '매수'])
-                손절횟수 = len([t for t in 거래내역 if t[0] == '손절'])
-                매도횟수 = len(거래내역) - 매수횟수 - 손절횟수
-                
-                # 수익률 계산
-                수익률 = self._전략수익률_계산(최고전략)
-                print(f"   수익률: {수익률:+.1f}% | 총 거래: {매수횟수+매도횟수+손절횟수}회 (매수:{매수횟수}, 매도:{매도횟수}, 손절:{손절횟수})")
-            print(f"   총 기록: {len(기존히스토리)}개")
-            
-        except Exception as e:
-            print(f"최고전략 히스토리 저장 실패: {e}")
+        self._안전한_json_저장(히스토리_파일, 기존히스토리)
+        return len(기존히스토리)
     
     def _시장상황_판정(self, 초기가격, 최종가격):
         """시장 상황 판정: 상승장/하락장/횡보장 (27주 기준, 최초-최종 가격만 비교)"""
@@ -2493,11 +2850,14 @@ class 최적화투자분석:
     def _시장상황별_제외대상인지_확인(self, 전략키, 현재시장상황):
         """특정 전략이 현재 시장 상황에서 제외 대상인지 확인 (배열 구조)"""
         try:
-            if not os.path.exists(self.영구제외_파일):
-                return False
-                
-            with open(self.영구제외_파일, 'r', encoding='utf-8') as f:
-                압축데이터 = json.load(f)
+            if self._영구제외_메모리 is not None:
+                압축데이터 = self._영구제외_메모리  # 아직 반영되지 않은 변경 포함
+            else:
+                if not os.path.exists(self.영구제외_파일):
+                    return False
+                    
+                with open(self.영구제외_파일, 'r', encoding='utf-8') as f:
+                    압축데이터 = json.load(f)
             
             시장매핑 = {"상승장": 1, "하락장": 2, "횡보장": 3}
             현재시장번호 = 시장매핑.get(현재시장상황, 0)
@@ -2531,42 +2891,16 @@ class 최적화투자분석:
             return ""
     
     def _실시간_영구제외_확인(self, 전략, 탈락일):
-        """실시간으로 영구 제외 조건 확인 및 간소화된 JSON 저장"""
+        """실시간으로 영구 제외 조건 확인 및 간소화된 JSON 저장 (저널에 기록, 반영시 저장)"""
         try:
             탈락횟수 = 전략.get('탈락횟수', 0)
             
             # 5회 이상 탈락시에만 영구제외 처리
             if 탈락횟수 >= 5:
-                현재시장상황 = self._시장상황_판정(self.초기가격, 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+                현재시장상황 = self._시장상황_판정(self.초기가격, self._전략_현재가(전략))
                 전략키 = self._전략을_키로_변환(전략)
                 
-                # 영구제외 전략 JSON 파일 로드 (새 구조)
-                영구제외_파일 = self.영구제외_파일
-                기존기록 = {}
-                
-                try:
-                    if os.path.exists(영구제외_파일):
-                        with open(영구제외_파일, 'r', encoding='utf-8') as f:
-                            기존기록 = json.load(f)
-                except:
-                    기존기록 = {}
-                
-                # 전략이 이미 기록되어 있는지 확인
-                if 전략키 in 기존기록:
-                    # 기존 전략 - 탈락시장 추가
-                    if 현재시장상황 not in 기존기록[전략키]["탈락시장"]:
-                        기존기록[전략키]["탈락시장"].append(현재시장상황)
-                        # 완전제외 여부 업데이트
-                        기존기록[전략키]["완전제외"] = len(기존기록[전략키]["탈락시장"]) >= 3
-                else:
-                    # 새로운 전략
-                    기존기록[전략키] = {
-                        "탈락시장": [현재시장상황],
-                        "완전제외": False
-                    }
-                
-                # 안전한 JSON 파일 저장 (원자적 쓰기)
-                self._안전한_json_저장(영구제외_파일, 기존기록)
+                self._영구제외_변경_기록({'종류': '실시간', '전략키': 전략키, '시장': 현재시장상황}, {})
                 
         except Exception as e:
             print(f"   영구제외 확인 실패: {e}")
@@ -2583,7 +2917,7 @@ class 최적화투자분석:
             return f"알수없음: {제외유형}"
     
     def _극심손실_영구제외_처리(self, 전략, 수익률, 탈락일):
-        """극심손실 발생 시 영구제외 처리 (배열 방식)"""
+        """극심손실 발생 시 영구제외 처리 (배열 방식, 저널에 기록 후 반영시 저장)"""
         try:
             # 완전한 전략키 생성
             전략키 = self._전략설명_생성(전략)
@@ -2593,8 +2927,8 @@ class 최적화투자분석:
             시장매핑 = {"상승장": 1, "하락장": 2, "횡보장": 3}
             시장번호 = 시장매핑.get(시장상황, 3)
             
-            # 기존 배열 데이터 로드
-            압축데이터 = {
+            # 파일이 없을 때의 기본 배열 구조
+            기본데이터 = {
                 "version": "2.0",
                 "description": "영구제외 전략 히스토리 - 배열 형태",
                 "structure": ["전략설명", "탈락시장목록", "완전제외여부"],
@@ -2602,52 +2936,132 @@ class 최적화투자분석:
                 "strategies": []
             }
             
-            if os.path.exists(self.영구제외_파일):
-                try:
-                    with open(self.영구제외_파일, 'r', encoding='utf-8') as f:
-                        압축데이터 = json.load(f)
-                except:
-                    pass
-            
-            # 기존 전략 찾기
-            기존전략_인덱스 = -1
-            for i, 전략배열 in enumerate(압축데이터.get('strategies', [])):
-                if len(전략배열) >= 3 and 전략배열[0] == 전략키:
-                    기존전략_인덱스 = i
-                    break
-            
+            self._영구제외_변경_기록({'종류': '극심손실', '전략키': 전략키, '시장번호': 시장번호}, 기본데이터)
             
-            if 기존전략_인덱스 >= 0:
+        except Exception as e:
+            print(f"   극심손실 영구제외 처리 실패: {e}")
+    
+    def _영구제외_저널_파일(self):
+        """영구제외 변경 저널 (추가 전용 사이드카, 반영 전 중단시 복구용)"""
+        return self.영구제외_파일 + '.journal'
+    
+    def _영구제외_데이터_조회(self, 기본데이터):
+        """실행 중 영구제외 데이터 메모리 사본 (처음 한 번만 파일 로드, 남은 저널은 재생)"""
+        if self._영구제외_메모리 is None:
+            데이터 = None
+            try:
+                if os.path.exists(self.영구제외_파일):
+                    with open(self.영구제외_파일, 'r', encoding='utf-8') as f:
+                        데이터 = json.load(f)
+            except:
+                데이터 = None
+            
+            self._영구제외_메모리 = 데이터 if 데이터 is not None else 기본데이터
+            self._영구제외_배열색인 = None
+            self._영구제외_변경수 = 0
+            
+            # 이전 실행이 반영 전에 중단되었으면 저널 재생 (작업은 여러 번 적용해도 결과 동일)
+            저널파일 = self._영구제외_저널_파일()
+            if os.path.exists(저널파일):
+                복구수 = 0
+                with open(저널파일, 'r', encoding='utf-8') as f:
+                    for 줄 in f:
+                        try:
+                            self._영구제외_작업_적용(json.loads(줄))
+                            복구수 += 1
+                        except Exception:
+                            continue  # 중단 시점의 불완전한 줄
+                self._영구제외_변경수 += 복구수
+                print(f"   영구제외 저널 복구: {복구수}건")
+        
+        return self._영구제외_메모리
+    
+    def _영구제외_작업_적용(self, 작업):
+        """영구제외 변경 작업 하나를 메모리 사본에 적용"""
+        데이터 = self._영구제외_메모리
+        전략키 = 작업['전략키']
+        
+        if 작업['종류'] == '실시간':
+            현재시장상황 = 작업['시장']
+            # 전략이 이미 기록되어 있는지 확인
+            if 전략키 in 데이터:
                 # 기존 전략 - 탈락시장 추가
-                기존전략 = 압축데이터['strategies'][기존전략_인덱스]
-                탈락시장목록 = 기존전략[1] if isinstance(기존전략[1], list) else []
-                
-                if 시장번호 not in 탈락시장목록:
-                    탈락시장목록.append(시장번호)
-                
-                # 완전제외 여부 업데이트 (3개 시장 모두 탈락시)
-                완전제외 = len(set(탈락시장목록)) >= 3
-                
-                # 배열 업데이트
-                압축데이터['strategies'][기존전략_인덱스] = [
-                    전략키,
-                    탈락시장목록,
-                    완전제외
-                ]
+                if 현재시장상황 not in 데이터[전략키]["탈락시장"]:
+                    데이터[전략키]["탈락시장"].append(현재시장상황)
+                    # 완전제외 여부 업데이트
+                    데이터[전략키]["완전제외"] = len(데이터[전략키]["탈락시장"]) >= 3
             else:
-                # 새로운 전략 추가
-                새전략배열 = [
-                    전략키,
-                    [시장번호],
-                    False  # 완전제외 = False (첫 탈락)
-                ]
-                압축데이터['strategies'].append(새전략배열)
-            
-            # 배열 파일 저장
-            self._안전한_json_저장(self.영구제외_파일, 압축데이터)
-            
+                # 새로운 전략
+                데이터[전략키] = {
+                    "탈락시장": [현재시장상황],
+                    "완전제외": False
+                }
+            return
+        
+        # 극심손실 - 배열 형태 [전략설명, 탈락시장목록, 완전제외]
+        시장번호 = 작업['시장번호']
+        if self._영구제외_배열색인 is None:
+            self._영구제외_배열색인 = {}
+            for i, 전략배열 in enumerate(데이터.get('strategies', [])):
+                if len(전략배열) >= 3 and isinstance(전략배열[0], str):
+                    self._영구제외_배열색인.setdefault(전략배열[0], i)
+        
+        기존전략_인덱스 = self._영구제외_배열색인.get(전략키, -1)
+        
+        if 기존전략_인덱스 >= 0:
+            # 기존 전략 - 탈락시장 추가
+            기존전략 = 데이터['strategies'][기존전략_인덱스]
+            탈락시장목록 = 기존전략[1] if isinstance(기존전략[1], list) else []
+            
+            if 시장번호 not in 탈락시장목록:
+                탈락시장목록.append(시장번호)
+            
+            # 완전제외 여부 업데이트 (3개 시장 모두 탈락시)
+            완전제외 = len(set(탈락시장목록)) >= 3
+            
+            # 배열 업데이트
+            데이터['strategies'][기존전략_인덱스] = [
+                전략키,
+                탈락시장목록,
+                완전제외
+            ]
+        else:
+            # 새로운 전략 추가
+            데이터['strategies'].append([
+                전략키,
+                [시장번호],
+                False  # 완전제외 = False (첫 탈락)
+            ])
+            self._영구제외_배열색인[전략키] = len(데이터['strategies']) - 1
+    
+    def _영구제외_변경_기록(self, 작업, 기본데이터):
+        """영구제외 변경을 메모리 사본에 적용하고 저널에 한 줄 추가"""
+        self._영구제외_데이터_조회(기본데이터)
+        self._영구제외_작업_적용(작업)
+        self._영구제외_변경수 += 1
+        
+        with open(self._영구제외_저널_파일(), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(작업, ensure_ascii=False) + '\n')
+    
+    def _영구제외_저널_반영(self):
+        """누적된 영구제외 변경을 한 번의 원자적 쓰기로 저장하고 저널 정리"""
+        if self._영구제외_메모리 is None:
+            return
+        
+        try:
+            if self._영구제외_변경수 > 0:
+                self._안전한_json_저장(self.영구제외_파일, self._영구제외_메모리)
+            저널파일 = self._영구제외_저널_파일()
+            if os.path.exists(저널파일):
+                os.remove(저널파일)
         except Exception as e:
-            print(f"   극심손실 영구제외 처리 실패: {e}")
+            # 저널이 남아 있으므로 다음 로드시 복구됨
+            print(f"   영구제외 반영 실패 (저널 유지): {e}")
+        
+        # 반영 후에는 파일이 기준 (사이클 사이 병합 등 외부 변경 반영)
+        self._영구제외_메모리 = None
+        self._영구제외_배열색인 = None
+        self._영구제외_변경수 = 0
     
     def _안전한_json_저장(self, 파일경로, 데이터):
         """원자적 JSON 파일 저장 (중간 중단시에도 파일 손상 방지)"""
@@ -2658,18 +3072,20 @@ class 최적화투자분석:
             # 임시 파일에 먼저 저장
             임시파일 = 파일경로 + '.tmp'
             
-            with open(임시파일, 'w', encoding='utf-8') as f:
-                json.dump(데이터, f, ensure_ascii=False, indent=2)
-            
-            # JSON 유효성 검증
-            with open(임시파일, 'r', encoding='utf-8') as f:
-                json.load(f)  # 파싱 테스트
-            
-            # 원본 파일로 원자적 이동 (Windows)
-            if os.path.exists(파일경로):
-                shutil.copy2(파일경로, 파일경로 + '.backup')  # 백업
-            
-            shutil.move(임시파일, 파일경로)  # 원자적 교체
+            with self.프로파일.phase('파일저장'):
+                with open(임시파일, 'w', encoding='utf-8') as f:
+                    json.dump(데이터, f, ensure_ascii=False, indent=2)
+                
+                # JSON 유효성 검증
+                with open(임시파일, 'r', encoding='utf-8') as f:
+                    json.load(f)  # 파싱 테스트
+                
+                # 원본 파일로 원자적 이동 (Windows)
+                if os.path.exists(파일경로):
+                    shutil.copy2(파일경로, 파일경로 + '.backup')  # 백업
+                
+                shutil.move(임시파일, 파일경로)  # 원자적 교체
+            self.프로파일.count_file('저장바이트.' + os.path.splitext(os.path.basename(파일경로))[0], 파일경로)
             
             # 백업 파일 정리 (성공시)
             백업파일 = 파일경로 + '.backup'
@@ -2772,7 +3188,7 @@ class 최적화투자분석:
                 총존버 += 1
             
             # 개별 전략 요약
-            평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+            평가자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
             수익률 = ((평가자산 - 100000) / 100000) * 100
             
             if len(전략들) <= 5:  # 5개 이하면 개별 표시
@@ -2823,13 +3239,22 @@ class 최적화투자분석:
                     
                     # 최근 5개만 표시
                     for 기록 in 기록들[-5:]:
-                        전략 = 기록['전략정보']
-                        성과 = 기록['성과']
                         환경 = 기록['시장환경']
                         
                         print(f"  {기록['발견날짜']}")
-                        print(f"     전략: {전략['매수기준']}-{전략['매수하락률']}% + {전략['매도전략']}")
-                        print(f"     수익률: {성과['수익률']:+.1f}% | 거래: {성과['거래횟수']}회 | 승률: {성과['승률']}%")
+                        if '최고전략_순위' in 기록:
+                            for 순위정보 in 기록['최고전략_순위'][:3]:
+                                # 종합랭킹 기록은 사이클 평균수익률과 출현횟수
+                                횟수 = (f"출현: {순위정보['출현횟수']}회" if '출현횟수' in 순위정보
+                                      else f"거래: {순위정보['총거래횟수']}회")
+                                print(f"     {순위정보['순위']}위: {순위정보['전략설명']} | "
+                                      f"수익률: {순위정보['수익률']:+.1f}% | {횟수}")
+                        else:
+                            # 이전 형식 (기록 하나에 전략 하나)
+                            전략 = 기록['전략정보']
+                            성과 = 기록['성과']
+                            print(f"     전략: {전략['매수기준']}-{전략['매수하락률']}% + {전략['매도전략']}")
+                            print(f"     수익률: {성과['수익률']:+.1f}% | 거래: {성과['거래횟수']}회 | 승률: {성과['승률']}%")
                         print(f"     시장: {환경['시장수익률']:+.1f}% | 초기: {환경['초기가격']:.0f}원 → 최종: {환경['최종가격']:.0f}원")
                         
                         if 기록.get('추가정보') and '시나리오별성과' in 기록['추가정보']:
@@ -2862,35 +3287,18 @@ class 최적화투자분석:
         전략키들 = set()
         
         for 기록 in 히스토리:
-            전략정보 = 기록['전략정보']
-            키 = f"{전략정보['매수기준']}-{전략정보['매수하락률']}-{전략정보['구매방식']}-{전략정보['손절라인']}-{전략정보['매도전략']}"
+            if '최고전략_순위' in 기록:
+                # 순위별 전략 구성을 그대로 복원 (구성 필드가 없는 예전 기록은 건너뜀)
+                후보들 = [(순위정보['전략'], 순위정보['수익률']) for 순위정보 in 기록['최고전략_순위']
+                        if all(순위정보.get('전략', {}).get(필드) is not None for 필드 in 전략구성_필드)]
+            else:
+                후보들 = [(self._이전_히스토리_전략_복원(기록['전략정보']), 기록['성과']['수익률'])]
             
-            if 키 not in 전략키들:
-                전략키들.add(키)
-                
-                # 전략 객체 재구성
-                재구성전략 = {
-                    '매수기준': '1' if '시가' in 전략정보['매수기준'] else '2' if '전일' in 전략정보['매수기준'] else '3' if '20일' in 전략정보['매수기준'] else '4' if '60일' in 전략정보['매수기준'] else '5',
-                    '매수기준명': 전략정보['매수기준'],
-                    '매수하락률': 전략정보['매수하락률'],
-                    '구매방식': '1',
-                    '구매방식명': 전략정보['구매방식'],
-                    '매수수량': 0.1 if '10%' in 전략정보['구매방식'] else 0.3 if '30%' in 전략정보['구매방식'] else 0.5,
-                    '손절라인': 전략정보['손절라인'],
-                    '매도전략': '1' if '수익률' in 전략정보['매도전략'] else '2',
-                    '매도전략명': 전략정보['매도전략'],
-                    '수익라인': 전략정보.get('수익라인', 10),
-                    '자본': 100000,
-                    '주식수': 0,
-                    '매수가격': 0,
-                    '최고가격': 0,
-                    '절반매도완료': False,
-                    '이동평균': self.과거데이터.copy(),
-                    '거래내역': [],
-                    '가격기록': [],
-                    '원본기록': 기록  # 원본 히스토리 참조
-                }
-                고유전략들.append(재구성전략)
+            for 전략구성, 원본수익률 in 후보들:
+                키 = json.dumps(전략구성, sort_keys=True, ensure_ascii=False)
+                if 키 not in 전략키들:
+                    전략키들.add(키)
+                    고유전략들.append(dict(전략구성, 원본수익률=원본수익률))
         
         print(f"재검증할 고유 전략: {len(고유전략들)}개")
         
@@ -2901,19 +3309,20 @@ class 최적화투자분석:
             # 5주 시뮬레이션 실행
             임시전략 = self._전략_초기화(전략)
             
-            for 일차 in range(135):  # 27주 = 135일
+            for 일차 in range(self.시뮬레이션주수 * 5):  # 기본 27주 = 135일
                 self._일일_시뮬레이션(임시전략, 일차)
             
             # 결과 계산
-            최종평가 = 임시전략['자본'] + 임시전략['주식수'] * (임시전략['이동평균'][-1] if 임시전략['이동평균'] else self.초기가격)
+            최종평가 = 임시전략['자본'] + 임시전략['주식수'] * self._전략_현재가(임시전략)
             수익률 = ((최종평가 - 100000) / 100000) * 100
             
             재검증결과.append({
                 '전략': 전략,
                 '수익률': 수익률,
                 '거래횟수': len(임시전략['거래내역']),
-                '원본성과': 전략['원본기록']['성과']['수익률'],
-                '성과차이': 수익률 - 전략['원본기록']['성과']['수익률']
+                '원본성과': 전략['원본수익률'],
+                '성과차이': 수익률 - 전략['원본수익률'],
+                '실행전략': 임시전략
             })
         
         # 결과 정렬 및 출력
@@ -2938,7 +3347,22 @@ class 최적화투자분석:
                 '성과차이': 최고재검증['성과차이'],
                 '재검증전략수': len(재검증결과)
             }
-            self._최고전략_히스토리_저장([최고재검증['전략']], '재검증', 추가정보)
+            self._최고전략_히스토리_저장([최고재검증['실행전략']], '재검증', 추가정보)
+    
+    def _이전_히스토리_전략_복원(self, 전략정보):
+        """이전 형식 히스토리의 전략정보(표시 이름)로 전략 구성 복원"""
+        return {
+            '매수기준': '1' if '시가' in 전략정보['매수기준'] else '2' if '전일' in 전략정보['매수기준'] else '3' if '20일' in 전략정보['매수기준'] else '4' if '60일' in 전략정보['매수기준'] else '5',
+            '매수기준명': 전략정보['매수기준'],
+            '매수하락률': 전략정보['매수하락률'],
+            '구매방식': '1',
+            '구매방식명': 전략정보['구매방식'],
+            '매수수량': 0.1 if '10%' in 전략정보['구매방식'] else 0.3 if '30%' in 전략정보['구매방식'] else 0.5,
+            '손절라인': 전략정보['손절라인'],
+            '매도전략': '1' if '수익률' in 전략정보['매도전략'] else '2',
+            '매도전략명': 전략정보['매도전략'],
+            '수익라인': 전략정보.get('수익라인', 10)
+        }
     
     def _극한검증_시뮬레이션(self, 후보전략들):
         """극한 환경에서 최종 검증"""
@@ -2958,12 +3382,16 @@ class 최적화투자분석:
         
         전략별점수 = {i: 0 for i in range(len(후보전략들))}
         시나리오별결과 = []
+        총일수 = self.시뮬레이션주수 * 5  # 기본 27주 = 135일
         
         for 시나리오 in 극한시나리오들:
             print(f"\n{시나리오['이름']}: {시나리오['설명']}")
             
             # 시나리오별 데이터 생성
-            시나리오데이터 = self._시나리오_데이터_생성(시나리오)
+            시나리오데이터 = self._시나리오_저장소_사용(
+                '극한시나리오', 시나리오, lambda: {'시간데이터': self._시나리오_데이터_생성(시나리오)}
+            )['시간데이터']
+            시나리오경로 = PricePath(self.과거데이터, 시나리오데이터, self.초기가격, days=총일수)
             
             # 각 후보 전략 테스트
             시나리오결과 = []
@@ -2971,12 +3399,12 @@ class 최적화투자분석:
                 # 전략 초기화
                 테스트전략 = self._전략_초기화(전략)
                 
-                # 135일 (27주) 시뮬레이션
-                for 일차 in range(135):
-                    self._일일_시뮬레이션_시나리오(테스트전략, 일차, 시나리오데이터)
+                # 시뮬레이션 기간 전체 시뮬레이션
+                for 일차 in range(총일수):
+                    self._일일_시뮬레이션_시나리오(테스트전략, 일차, 시나리오경로)
                 
                 # 최종 결과 계산
-                최종평가 = 테스트전략['자본'] + 테스트전략['주식수'] * (테스트전략['이동평균'][-1] if 테스트전략['이동평균'] else self.초기가격)
+                최종평가 = 테스트전략['자본'] + 테스트전략['주식수'] * self._전략_현재가(테스트전략, 시나리오경로)
                 수익률 = ((최종평가 - 100000) / 100000) * 100
                 
                 시나리오결과.append({
@@ -3140,8 +3568,9 @@ class 최적화투자분석:
             '점수': 점수
         }
     
-    def _시나리오_데이터_생성(self, 시나리오):
+    def _시나리오_데이터_생성(self, 시나리오, 난수=None):
         """시나리오별 특수 데이터 생성"""
+        난수 = 난수 or self.난수
         if '패턴' in 시나리오:
             # 패턴 반복 모드
             주별데이터 = 시나리오['패턴'].copy()
@@ -3151,26 +3580,25 @@ class 최적화투자분석:
             for 주차 in range(5):
                 if '추세' in 시나리오:
                     # 추세가 있는 경우
-                    기본변동 = random.uniform(-시나리오['주변동범위'], 시나리오['주변동범위'])
+                    기본변동 = 난수.uniform(-시나리오['주변동범위'], 시나리오['주변동범위'])
                     추세변동 = 시나리오['추세'] * (주차 + 1)  # 시간에 따른 추세 강화
                     변동률 = 기본변동 + 추세변동
                 else:
                     # 일반 랜덤 변동
-                    변동률 = random.uniform(-시나리오['주변동범위'], 시나리오['주변동범위'])
+                    변동률 = 난수.uniform(-시나리오['주변동범위'], 시나리오['주변동범위'])
                 주별데이터.append(변동률)
         
-        # 계층적 데이터 생성
-        임시분석기 = 최적화투자분석(self.초기가격)
-        임시분석기.계층적_변동률_생성(주별데이터)
+        # 계층적 데이터 생성 (임시 분석기 없이 계산만 - 과거 120일 데이터 재생성/출력 방지)
+        _, 일간데이터, 시간데이터 = self._계층적_변동률_계산(주별데이터, 난수)
         
         # 특수 변동 적용
         if '일변동' in 시나리오:
             # 일별 극한 변동 추가
-            for i in range(len(임시분석기.일간데이터)):
-                극한변동 = random.uniform(-시나리오['일변동'], 시나리오['일변동'])
-                임시분석기.일간데이터[i] += 극한변동
+            for i in range(len(일간데이터)):
+                극한변동 = 난수.uniform(-시나리오['일변동'], 시나리오['일변동'])
+                일간데이터[i] += 극한변동
         
-        return 임시분석기.시간데이터
+        return 시간데이터
     
     def _전략_초기화(self, 원본전략):
         """전략 복사 및 초기화"""
@@ -3190,35 +3618,30 @@ class 최적화투자분석:
             '매수가격': 0,
             '최고가격': 0,
             '절반매도완료': False,
-            '이동평균': self.과거데이터.copy(),  # 과거 120일 데이터로 초기화
-            '거래내역': []
+            '경로일차': 0,  # 공유 가격경로에서 진행한 일수
+            '거래내역': [],
+            # 매수/매도 방식별 구성 필드
+            **{필드: 원본전략[필드] for 필드 in 전략구성_선택필드 if 필드 in 원본전략}
         }
     
-    def _일일_시뮬레이션_시나리오(self, 전략, 일차, 시나리오데이터):
-        """시나리오 데이터를 사용한 일일 시뮬레이션"""
-        # 기존 일일 시뮬레이션과 동일하지만 시나리오데이터 사용
-        전일종가 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
-        현재가격 = 전일종가
+    def _일일_시뮬레이션_시나리오(self, 전략, 일차, 시나리오경로):
+        """시나리오 가격경로를 사용한 일일 시뮬레이션"""
+        # 기존 일일 시뮬레이션과 동일하지만 시나리오 가격경로 사용
+        전일종가 = 시나리오경로.last_close(일차)
         
         for 시간 in range(7):
-            시간인덱스 = 일차 * 7 + 시간
-            if 시간인덱스 >= len(시나리오데이터):
+            현재가격 = 시나리오경로.hour_price(일차, 시간)
+            if 현재가격 is None:
                 break
-                
-            변동률 = 시나리오데이터[시간인덱스]
-            현재가격 = 현재가격 * (1 + 변동률/100)
-            현재가격 = int(현재가격 * 10) / 10
             
             # 매매 로직 실행 (첫 시간 제요)
             if 시간 > 0:  # 첫 번째 시간은 매수/매도 금지
-                self._전략_매매_실행_시나리오(전략, 현재가격, 전일종가, 일차, 시간, 시나리오데이터)
+                self._전략_매매_실행_시나리오(전략, 현재가격, 전일종가, 일차, 시간, 시나리오경로)
         
-        # 이동평균 업데이트 (최대 120일 유지)
-        전략['이동평균'].append(현재가격)
-        if len(전략['이동평균']) > 120:
-            전략['이동평균'].pop(0)
+        # 진행 일차 기록
+        전략['경로일차'] = 일차 + 1
     
-    def _전략_매매_실행_시나리오(self, 전략, 현재가격, 전일종가, 일차, 시간, 시나리오데이터):
+    def _전략_매매_실행_시나리오(self, 전략, 현재가격, 전일종가, 일차, 시간, 시나리오경로):
         """시나리오용 매매 실행 (기존 로직과 동일)"""
         # 기존 _전략_매매_실행과 동일한 로직
         # 손절 체크
@@ -3235,9 +3658,10 @@ class 최적화투자분석:
         # 매수 체크 (모든 기준 지원)
         if 전략['자본'] > 현재가격 and 전략['주식수'] == 0:
             매수신호 = False
+            가격경로 = 시나리오경로
             
             if 전략['매수기준'] == '1':  # 시가 대비 하락
-                시가 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+                시가 = 시나리오경로.last_close(일차)
                 시가대비변동 = ((현재가격 - 시가) / 시가) * 100
                 if 시가대비변동 <= -전략['매수하락률']:
                     매수신호 = True
@@ -3248,22 +3672,22 @@ class 최적화투자분석:
                     매수신호 = True
                     
             elif 전략['매수기준'] == '3':  # 20일선 이탈
-                if len(전략['이동평균']) >= 20:
-                    평균가 = sum(전략['이동평균'][-20:]) / 20
+                평균가 = 가격경로.moving_average(일차, 20)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         매수신호 = True
                         
             elif 전략['매수기준'] == '4':  # 60일선 이탈
-                if len(전략['이동평균']) >= 60:
-                    평균가 = sum(전략['이동평균'][-60:]) / 60
+                평균가 = 가격경로.moving_average(일차, 60)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         매수신호 = True
                         
             elif 전략['매수기준'] == '5':  # 120일선 이탈
-                if len(전략['이동평균']) >= 120:
-                    평균가 = sum(전략['이동평균'][-120:]) / 120
+                평균가 = 가격경로.moving_average(일차, 120)
+                if 평균가 is not None:
                     평균대비 = ((현재가격 - 평균가) / 평균가) * 100
                     if 평균대비 <= -전략['매수하락률']:
                         매수신호 = True
@@ -3311,40 +3735,40 @@ class 최적화투자분석:
         print("3. 20일선 이탈시 매수 (단기 기술적 분석)")
         print("4. 60일선 이탈시 매수 (중기 기술적 분석)")
         print("5. 120일선 이탈시 매수 (장기 기술적 분석)")
-        매수기준 = input("선택 (1, 2, 3, 4, 5): ")
+        매수기준 = self.입력("선택 (1, 2, 3, 4, 5): ")
         
-        매수하락률 = float(input("몇 % 하락시 매수? (예: 2는 -2%): "))
+        매수하락률 = float(self.입력("몇 % 하락시 매수? (예: 2는 -2%): "))
         
         print("\n구매 비율 선택:")
         print("1. 퍼센트 방식 (자본의 %)")
         print("2. 고정 주식수 방식")
-        방식 = input("선택 (1 또는 2): ")
+        방식 = self.입력("선택 (1 또는 2): ")
         
         if 방식 == "1":
-            매수비율 = float(input("자본의 몇 % 매수? (예: 30은 30%): ")) / 100
+            매수비율 = float(self.입력("자본의 몇 % 매수? (예: 30은 30%): ")) / 100
         else:
-            매수주식수 = int(input("몇 주씩 매수? (예: 10): "))
+            매수주식수 = int(self.입력("몇 주씩 매수? (예: 10): "))
             매수비율 = None
         
         # 매도 전략 선택
         print("\n=== 매도 전략 설정 ===")
         
         # 손절 라인 설정
-        손절라인 = float(input("손절 라인 설정 (예: -3은 -3%): "))
+        손절라인 = float(self.입력("손절 라인 설정 (예: -3은 -3%): "))
         
         # 익절 전략 선택
         print("\n익절 전략 선택:")
         print("1. 분할 매도 (절반씩)")
         print("2. 목표가 일괄 매도")
         print("3. 트레일링 스탑 (고점 대비 %)")
-        전략 = input("선택 (1, 2, 3): ")
+        전략 = self.입력("선택 (1, 2, 3): ")
         
         if 전략 == "1":
-            수익라인 = float(input("1차 매도 수익률 (예: 3은 +3%): "))
+            수익라인 = float(self.입력("1차 매도 수익률 (예: 3은 +3%): "))
         elif 전략 == "2":
-            수익라인 = float(input("목표 수익률 (예: 5는 +5%): "))
+            수익라인 = float(self.입력("목표 수익률 (예: 5는 +5%): "))
         else:  # 트레일링 스탑
-            수익라인 = float(input("최고점 대비 몇% 하락시 매도? (예: 2): "))
+            수익라인 = float(self.입력("최고점 대비 몇% 하락시 매도? (예: 2): "))
         
         return self._실행_시뮬레이션(매수기준, 매수하락률, 방식, 매수비율 if 방식 == "1" else 매수주식수, 
                                      손절라인, 전략, 수익라인)
@@ -3365,7 +3789,7 @@ class 최적화투자분석:
         print(f"시작 주가: {self.초기가격:.0f}원")
         print("="*60)
         
-        for 일차 in range(135):  # 27주 = 135일
+        for 일차 in range(self.시뮬레이션주수 * 5):  # 기본 27주 = 135일
             주차 = (일차 // 5) + 1  # 현재 주차 계산
             
             print(f"\n === {주차}주차 {일차+1}일 ===")
@@ -3557,7 +3981,7 @@ class 최적화투자분석:
             전일종가 = 현재가격
             
             # 자본 탈락 체크 후 엔터키 대기
-            if 일차 < 134 and (일차 % 5 == 4):  # 주내일차 5일째 (금요일)
+            if 일차 < self.시뮬레이션주수 * 5 - 1 and (일차 % 5 == 4):  # 마지막 날 제외 주내일차 5일째 (금요일)
                 현재자본 = 자본 + 주식수 * 현재가격
                 if 현재자본 <= 60000:  # 탈락 기준
                     주차 = (일차 // 5) + 1
@@ -3580,58 +4004,63 @@ class 최적화투자분석:
         """지정된 시간 범위에서 매매 시뮬레이션
         매수기준: 시가 대비 몇% 떨어질 때 매수 (음수, 시가하락 전용)
         매도기준: 시가 대비 몇% 오를 때 매도 (양수)
+        시간범위: 처음부터 진행할 시간 수 (하루 7시간)
         전략: 전체 전략 정보 (다양한 매수 기준 처리용)
         """
-        자본 = 100000
-        주식수 = 0
-        시작가격 = self.초기가격
-        현재가격 = 시작가격
-        거래내역 = []
-        
-        # 일별 시가 저장
-        일별시가 = {}
-        
-        데이터슬라이스 = self.시간데이터[:시간범위]
-        
-        for i, 변동률 in enumerate(데이터슬라이스):
-            일차 = i // 7 + 1
+        상태 = self._매매상태_생성()
+        self._매매상태_진행(상태, 매수기준, 매도기준, 시간범위, 전략)
+        return self._매매상태_결과(상태, 시간범위)
+    
+    def _매매상태_생성(self):
+        """매매시뮬레이션 진행 상태 (0시간 시점, _매매상태_진행으로 이어서 진행)"""
+        return {'자본': 100000, '주식수': 0, '현재가격': self.초기가격, '시가': None, '거래내역': [], '시간': 0}
+    
+    def _매매상태_진행(self, 상태, 매수기준, 매도기준, 끝시간, 전략=None):
+        """상태를 끝시간까지 진행 (이미 진행한 시간은 다시 계산하지 않음, 처음부터 진행한 결과와 같음)"""
+        자본 = 상태['자본']
+        주식수 = 상태['주식수']
+        현재가격 = 상태['현재가격']
+        시가 = 상태['시가']
+        거래내역 = 상태['거래내역']
+        
+        # 전략별 매수 기준 (시간마다 바뀌지 않으므로 한 번만 해석)
+        매수기준타입 = 전략['매수기준'] if 전략 and '매수기준' in 전략 else None
+        if 매수기준타입 == '6':  # 시가상승 (상승매수)
+            상승률 = 전략.get('매수상승률', 1.0)
+        elif 매수기준타입 in ['2', '3', '4', '5']:  # 기타 하락 전략들
+            # 단순화: 시가하락과 동일하게 처리 (임시)
+            하락률 = 전략.get('매수하락률', abs(매수기준))
+        손절라인 = 전략['손절라인'] if 전략 and '손절라인' in 전략 else None  # 음수값 (예: -3.0)
+        
+        끝시간 = min(끝시간, len(self.시간데이터))
+        for i in range(상태['시간'], 끝시간):
+            변동률 = self.시간데이터[i]
             
             # 가격 업데이트 먼저
-            이전가격 = 현재가격
-            현재가격 = 이전가격 * (1 + 변동률/100)
+            현재가격 = 현재가격 * (1 + 변동률/100)
             
             # 하루의 첫 시간에 시가 설정 (업데이트된 가격으로)
-            if i % 6 == 0:
-                일별시가[일차] = 현재가격
+            if i % 7 == 0:
+                시가 = 현재가격
             
-            # 시가 대비 변돐률 계산
-            시가 = 일별시가[일차]
-            시가대비변돐률 = ((현재가격 - 시가) / 시가) * 100
+            # 시가 대비 변동률 계산
+            시가대비변동률 = ((현재가격 - 시가) / 시가) * 100
             
             # 매수 조건: 전략별 다양한 매수 기준 처리
             매수신호 = False
             
-            if 전략 and '매수기준' in 전략:
-                매수기준타입 = 전략['매수기준']
-                
-                if 매수기준타입 == '1':  # 시가하락
-                    if 시가대비변돐률 <= 매수기준 and 자본 > 현재가격:
-                        매수신호 = True
-                        
-                elif 매수기준타입 == '6':  # 시가상승 (상승매수)
-                    상승률 = 전략.get('매수상승률', 1.0)
-                    if 시가대비변돐률 >= 상승률 and 자본 > 현재가격:
-                        매수신호 = True
-                        
-                elif 매수기준타입 in ['2', '3', '4', '5']:  # 기타 하락 전략들
-                    # 단순화: 시가하락과 동일하게 처리 (임시)
-                    하락률 = 전략.get('매수하락률', abs(매수기준))
-                    if 시가대비변돐률 <= -하락률 and 자본 > 현재가격:
-                        매수신호 = True
-                        
-            else:
+            if 매수기준타입 is None:
                 # 기존 방식: 시가하락만 (하위 호환성)
-                if 시가대비변돐률 <= 매수기준 and 자본 > 현재가격:
+                if 시가대비변동률 <= 매수기준 and 자본 > 현재가격:
+                    매수신호 = True
+            elif 매수기준타입 == '1':  # 시가하락
+                if 시가대비변동률 <= 매수기준 and 자본 > 현재가격:
+                    매수신호 = True
+            elif 매수기준타입 == '6':  # 시가상승 (상승매수)
+                if 시가대비변동률 >= 상승률 and 자본 > 현재가격:
+                    매수신호 = True
+            elif 매수기준타입 in ['2', '3', '4', '5']:  # 기타 하락 전략들
+                if 시가대비변동률 <= -하락률 and 자본 > 현재가격:
                     매수신호 = True
             
             if 매수신호:
@@ -3639,39 +4068,47 @@ class 최적화투자분석:
                 매수주식 = int(매수금액 / 현재가격)  # 정수 변환
                 주식수 += 매수주식
                 자본 -= 매수금액
-                거래내역.append(('매수', i, 시가대비변돐률, 현재가격))
+                거래내역.append(('매수', i, 시가대비변동률, 현재가격))
             
             # 매도 조건 확인 (보유 주식이 있을 때만)
             if 주식수 > 0:
                 # 손절 조건 우선 확인
-                if 전략 and '손절라인' in 전략:
-                    손절라인 = 전략['손절라인']  # 음수값 (예: -3.0)
-                    if 시가대비변돐률 <= 손절라인:
+                if 손절라인 is not None:
+                    if 시가대비변동률 <= 손절라인:
                         # 손절: 전량 매도
                         매도금액 = 주식수 * 현재가격
                         자본 += 매도금액
-                        거래내역.append(('손절', i, 시가대비변돐률, 현재가격))
+                        거래내역.append(('손절', i, 시가대비변동률, 현재가격))
                         주식수 = 0
                 # 익절 조건
-                elif 시가대비변돐률 >= 매도기준:
+                elif 시가대비변동률 >= 매도기준:
                     매도주식 = 주식수 * 0.4
                     매도금액 = 매도주식 * 현재가격
                     주식수 -= 매도주식
                     자본 += 매도금액
-                    거래내역.append(('익절', i, 시가대비변돐률, 현재가격))
-        
-        최종자산 = 자본 + 주식수 * 현재가격
+                    거래내역.append(('익절', i, 시가대비변동률, 현재가격))
+        
+        상태['자본'] = 자본
+        상태['주식수'] = 주식수
+        상태['현재가격'] = 현재가격
+        상태['시가'] = 시가
+        상태['시간'] = max(상태['시간'], 끝시간)
+        return 상태
+    
+    def _매매상태_결과(self, 상태, 시간범위):
+        """진행 상태 → 매매시뮬레이션 결과 dict"""
+        최종자산 = 상태['자본'] + 상태['주식수'] * 상태['현재가격']
         수익률 = (최종자산 - 100000) / 100000 * 100
         
         return {
             '수익률': 수익률,
             '최종자산': 최종자산,
-            '거래횟수': len(거래내역),
-            '거래내역': 거래내역,
+            '거래횟수': len(상태['거래내역']),
+            '거래내역': 상태['거래내역'],
             '시간범위': 시간범위,
             '일수': 시간범위 // 7,
-            '최종현금': 자본,
-            '최종주식수': 주식수
+            '최종현금': 상태['자본'],
+            '최종주식수': 상태['주식수']
         }
     
     def 전략_거래_상세보기(self, 전략, 시간범위=27):
@@ -3761,9 +4198,10 @@ class 최적화투자분석:
         print(f"   전략 조합: {len(전략조합):,}개 (탈락 제외: {len(탈락전략목록):,}개)")
         
         # 시장 데이터 요약 출력
-        print(f"\n   시장 데이터 요약 (27주간):")
+        총일수 = self.시뮬레이션주수 * 5  # 기본 27주 = 135일
+        print(f"\n   시장 데이터 요약 ({self.시뮬레이션주수}주간):")
         if hasattr(self, '주간데이터') and self.주간데이터:
-            주간데이터 = self.주간데이터[:27]  # 27주 데이터
+            주간데이터 = self.주간데이터[:self.시뮬레이션주수]
             총변동 = sum(주간데이터)
             최고주 = max(주간데이터)
             최저주 = min(주간데이터)
@@ -3772,7 +4210,7 @@ class 최적화투자분석:
             # 단순 보유 수익률 계산
             초기가격 = self.초기가격
             현재가격 = 초기가격
-            for 변동 in self.주간데이터[:27]:
+            for 변동 in 주간데이터:
                 현재가격 *= (1 + 변동/100)
             단순보유수익률 = (현재가격 - 초기가격) / 초기가격 * 100
             print(f"   ├ 단순 보유시 수익률: {단순보유수익률:+.1f}%")
@@ -3785,66 +4223,16 @@ class 최적화투자분석:
         
         # 일별 점진적 필터링 - 조용한 버전 (3주차 단위 출력)
         생존전략 = 전략조합.copy()
-        print(f"\n   27주 시뮬레이션 시작... (초기 생존: {len(생존전략):,}개)")
+        print(f"\n   {self.시뮬레이션주수}주 시뮬레이션 시작... (초기 생존: {len(생존전략):,}개)")
+        
+        # 전략별 매매 상태 (자본, 주식수, 시가, 거래내역)를 유지하며 하루 7시간씩만 진행
+        # (매일 0시간부터 다시 계산하지 않음, 결과는 매매시뮬레이션(..., (일차+1)*7, 전략)과 같음)
+        매매상태 = {id(전략): self._매매상태_생성() for 전략 in 생존전략}
         
-        for 일차 in range(135):  # 27주 = 135일
+        for 일차 in range(총일수):
             주차 = (일차 // 5) + 1
             주내일차 = (일차 % 5) + 1
-            
-            # 3주마다 진행상황 및 수익률 분포 출력 (상세 버전)
-            if 주차 % 3 == 0 and 주내일차 == 1:
-                # 현재 수익률 분포 계산
-                현재수익률들 = []
-                거래횟수들 = []
-                영수익전략수 = 0
-                매수못한전략 = []
-                
-                # 전체 전략 분석 (정확도를 위해 샘플링 없이 전체 분석)
-                샘플전략 = 생존전략
-                print(f"   >>> 전체 {len(생존전략):,}개 전략 분석 중... (시간이 걸릴 수 있음)")
-                
-                for i, 전략 in enumerate(샘플전략):
-                    # 진행률 표시 (매 10만개마다)
-                    if (i + 1) % 100000 == 0:
-                        진행률 = ((i + 1) / len(샘플전략)) * 100
-                        print(f"       진행: {i+1:,}/{len(샘플전략):,} ({진행률:.1f}%)")
-                    
-                    try:
-                        # 매수하락률이 양수면 음수로, 이미 음수면 그대로
-                        매수기준값 = -abs(전략['매수하락률']) if 전략['매수하락률'] > 0 else 전략['매수하락률']
-                        결과 = self.매매시뮬레이션(매수기준값, 전략['수익라인'], 일차 + 1, 전략)
-                        현재수익률들.append(결과['수익률'])
-                        거래횟수들.append(결과['거래횟수'])
-                        
-                        # 0% 수익률 전략 분석
-                        if abs(결과['수익률']) < 0.01:
-                            영수익전략수 += 1
-                            if 결과['거래횟수'] == 0:
-                                매수못한전략.append(전략)
-                    except:
-                        현재수익률들.append(0.0)
-                        거래횟수들.append(0)
-                
-                if 현재수익률들:
-                    최고 = max(현재수익률들)
-                    최저 = min(현재수익률들)
-                    평균 = sum(현재수익률들) / len(현재수익률들)
-                    평균거래 = sum(거래횟수들) / len(거래횟수들) if 거래횟수들 else 0
-                    
-                    print(f"\n   === {주차}주차 상세 현황 ===")
-                    print(f"   생존: {len(생존전략):,}개 (전체 분석 완료)")
-                    print(f"   ├ 수익률: 최고 {최고:+.1f}% | 최저 {최저:+.1f}% | 평균 {평균:+.1f}%")
-                    print(f"   ├ 거래: 평균 {평균거래:.1f}회 | 거래 없음 {영수익전략수}개")
-                    
-                    # 수익률 분포 표시
-                    플러스 = len([x for x in 현재수익률들 if x > 0])
-                    마이너스 = len([x for x in 현재수익률들 if x < 0])
-                    제로 = len([x for x in 현재수익률들 if abs(x) < 0.01])
-                    
-                    print(f"   ├ 분포: +수익 {플러스}개 | 0% {제로}개 | -손실 {마이너스}개")
-                    
-                else:
-                    print(f"   {주차}주차 진행 중... (생존: {len(생존전략):,}개)")
+            시간범위 = (일차 + 1) * 7
             
             # 시뮬레이션 실행 (제한된 로깅)
             일일결과 = []
@@ -3855,15 +4243,33 @@ class 최적화투자분석:
                 
                 # 매수하락률이 양수면 음수로 변환
                 매수기준값 = -abs(전략['매수하락률']) if 전략['매수하락률'] > 0 else 전략['매수하락률']
-                결과 = self.매매시뮬레이션(
-                    매수기준값,
-                    전략['수익라인'], 
-                    일차 + 1,
-                    전략  # 전략 정보 추가
-                )
+                상태 = self._매매상태_진행(매매상태[id(전략)], 매수기준값, 전략['수익라인'], 시간범위, 전략)
+                결과 = self._매매상태_결과(상태, 시간범위)
                 결과['전략'] = 전략
                 일일결과.append(결과)
             
+            # 3주마다 수익률 분포 출력 (당일 결과 전체 분석)
+            if 주차 % 3 == 0 and 주내일차 == 1 and 일일결과:
+                현재수익률들 = [결과['수익률'] for 결과 in 일일결과]
+                거래횟수들 = [결과['거래횟수'] for 결과 in 일일결과]
+                영수익전략수 = len([수익률 for 수익률 in 현재수익률들 if abs(수익률) < 0.01])
+                
+                최고 = max(현재수익률들)
+                최저 = min(현재수익률들)
+                평균 = sum(현재수익률들) / len(현재수익률들)
+                평균거래 = sum(거래횟수들) / len(거래횟수들)
+                
+                print(f"\n   === {주차}주차 상세 현황 ===")
+                print(f"   생존: {len(생존전략):,}개 (전체 분석 완료)")
+                print(f"   ├ 수익률: 최고 {최고:+.1f}% | 최저 {최저:+.1f}% | 평균 {평균:+.1f}%")
+                print(f"   ├ 거래: 평균 {평균거래:.1f}회 | 거래 없음 {영수익전략수}개")
+                
+                # 수익률 분포 표시
+                플러스 = len([x for x in 현재수익률들 if x > 0])
+                마이너스 = len([x for x in 현재수익률들 if x < 0])
+                
+                print(f"   ├ 분포: +수익 {플러스}개 | 0% {영수익전략수}개 | -손실 {마이너스}개")
+            
             # 옐로우카드 시스템 (6주 단위)
             if 주차 % 6 == 0 and 주내일차 == 1:  # 6주차마다 체크
                 탈락자 = []
@@ -3909,9 +4315,11 @@ class 최적화투자분석:
                     
                     try:
                         self._탈락전략_저장(탈락정보들)
-                        # 탈락자 제거 최적화 (O(n*m) → O(n+m))
+                        # 탈락자 제거 최적화 (O(n*m) → O(n+m)), 탈락자 매매 상태도 해제
                         탈락자_ids = {id(전략) for 전략 in 탈락자}
                         생존전략 = [전략 for 전략 in 생존전략 if id(전략) not in 탈락자_ids]
+                        for 전략id in 탈락자_ids:
+                            del 매매상태[전략id]
                         print(f"   → 탈락 처리 완료: {len(탈락자):,}개")
                     except Exception as e:
                         print(f"   →  탈락 저장 실패 (계속 진행): {e}")
@@ -3921,30 +4329,27 @@ class 최적화투자분석:
         # 최종 결과 - 상위 20개만 반환 (메모리 절약)
         print(f"   최종 생존: {len(생존전략):,}개 → 상위 20개 선발")
         
+        # 마지막 날까지 진행한 매매 상태에서 바로 결과 생성 (다시 계산하지 않음)
         최종결과 = []
         for 전략 in 생존전략:
-            try:
-                매수기준값 = -abs(전략['매수하락률']) if 전략['매수하락률'] > 0 else 전략['매수하락률']
-                결과 = self.매매시뮬레이션(매수기준값, 전략['수익라인'], 135, 전략)
-                결과['전략설명'] = f"{전략['매수기준']}-{전략['매수하락률']}-{전략['구매방식']}-{전략['매수수량']}-{전략['손절라인']}-{전략['매도전략']}-{전략['수익라인']}"
-                최종결과.append(결과)
-            except Exception as e:
-                print(f"   → 전략 처리 오류 (건너뛰기): {e}")
-                continue
+            결과 = self._매매상태_결과(매매상태[id(전략)], 총일수 * 7)
+            결과['전략'] = 전략
+            결과['전략설명'] = f"{전략['매수기준']}-{전략['매수하락률']}-{전략['구매방식']}-{전략['매수수량']}-{전략['손절라인']}-{전략['매도전략']}-{전략['수익라인']}"
+            최종결과.append(결과)
         
         # 매수 불가 전략 분석 (0% 수익률 원인 조사)
         try:
             if 최종결과:
-                self.매수불가_전략_분석([결과['전략'] for 결과 in 최종결과], 135)
+                self.매수불가_전략_분석([결과['전략'] for 결과 in 최종결과], 총일수 * 7)
         except Exception as e:
             print(f"   → 매수불가분석 오류: {e}")
         
-        # 상위 20개 선발 (안전한 정렬)
+        # 상위 20개 선발 (전체 정렬 없이, 같은 수익률은 전략 키 순)
         try:
-            최종결과.sort(key=lambda x: x['수익률'], reverse=True)
-            return 최종결과[:20]
+            return top_k(최종결과, 20, key=lambda x: x['수익률'],
+                         tie_key=lambda x: self._전략을_키로_변환(x['전략']))
         except Exception as e:
-            print(f"   → 정렬 오류: {e}")
+            print(f"   → 상위 선발 오류: {e}")
             return 최종결과[:20] if 최종결과 else []
     
     def _시장상황_분류(self, 단순보유수익률=None):
@@ -3958,7 +4363,7 @@ class 최적화투자분석:
             if not 주간데이터:
                 return "알수없음"
                 
-            # 전체 27주 수익률 계산
+            # 전체 시뮬레이션 기간 수익률 계산
             총수익률 = sum(주간데이터)
         
         if 총수익률 > 5:
@@ -4003,7 +4408,8 @@ class 최적화투자분석:
                             '손절라인': 원본전략정보.get('손절라인', 0),
                             '매도전략': 원본전략정보.get('매도전략', ''),
                             '매도전략명': 원본전략정보.get('매도전략명', ''),
-                            '수익라인': 원본전략정보.get('수익라인', 0)
+                            '수익라인': 원본전략정보.get('수익라인', 0),
+                            **{필드: 원본전략정보[필드] for 필드 in 전략구성_선택필드 if 필드 in 원본전략정보}
                         }
                         
                         랭킹목록.append({
@@ -4021,18 +4427,20 @@ class 최적화투자분석:
                         print(f"   → 전략 {전략설명} 계산 오류 (건너뛰기): {e}")
                         continue
             
-            # 안정성 점수로 정렬 (안전한 정렬)
+            # 안정성 점수 상위 50개 (전체 정렬 없이, 같은 점수는 전략설명 순)
             try:
-                랭킹목록.sort(key=lambda x: x['안정성점수'], reverse=True)
+                상위랭킹 = top_k(랭킹목록, 50, key=lambda x: x['안정성점수'], tie_key=lambda x: x['전략설명'])
             except Exception as e:
-                print(f"   → 랭킹 정렬 오류: {e}")
+                print(f"   → 랭킹 선발 오류: {e}")
+                상위랭킹 = 랭킹목록[:50]
             
             # JSON 안전 저장 (상위 50개만)
             저장데이터 = {
                 'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                '총사이클수': 5,
+                '실행시드': self.시드,
+                '총사이클수': self.사이클수,
                 '전략총개수': len(랭킹목록),
-                '종합랭킹': 랭킹목록[:50]  # 상위 50개만 저장
+                '종합랭킹': 상위랭킹  # 상위 50개만 저장
             }
             
             # 메인 파일 저장
@@ -4042,12 +4450,367 @@ class 최적화투자분석:
             except Exception as e:
                 print(f"    JSON 저장 실패: {e}")
             
-            return 랭킹목록[:50]  # 상위 50개만 반환
+            return 상위랭킹  # 상위 50개만 반환
             
         except Exception as e:
             print(f"    종합랭킹 생성 전체 실패: {e}")
             return []
     
+    def _사이클_실행(self, 사이클, 히스토리저장=True, 시드=None):
+        """사이클 하나 실행 (데이터 생성 → 전략 비교 → 요약), 실패하면 요약은 None"""
+        # 사이클 시드로 재설정하면 순차/병렬 실행 모두 사이클별 시장 데이터가 같음
+        if 시드 is not None:
+            self._난수_재설정(시드)
+        
+        # 새로운 랜덤 데이터 생성
+        self.시장데이터_생성()
+        
+        # 단일 시뮬레이션 실행 (누적 방식)
+        결과 = self.전략_비교_시뮬레이션()
+        
+        if not (결과 and '생존전략' in 결과):
+            return 결과, None
+        
+        요약 = self._사이클_요약_생성(결과)
+        
+        # 각 사이클마다 상위 5개 전략을 히스토리에 저장 (중간 저장)
+        if 히스토리저장 and len(결과['생존전략']) > 0:
+            self._최고전략_히스토리_저장(
+                결과['생존전략'], 
+                f"5사이클_{사이클}차", 
+                {
+                    '현재사이클': 사이클,
+                    '총사이클': self.사이클수,
+                    '시장상황': 요약['시장상황'],
+                    '생존전략수': len(결과['생존전략']),
+                    '탈락전략수': len(결과.get('탈락기록', []))
+                }
+            )
+            print(f"  → 사이클 {사이클} 결과 히스토리 저장 완료")
+        
+        return 결과, 요약
+    
+    def _사이클_요약_생성(self, 결과):
+        """사이클 결과 요약 (시장상황, 최고전략, 상위 20개 전략 수익률)"""
+        # 시장 상황 분류
+        단순보유수익률 = 0
+        if hasattr(self, '주간데이터') and self.주간데이터:
+            현재가격 = self.초기가격
+            for 변동 in self.주간데이터[:self.시뮬레이션주수]:
+                현재가격 *= (1 + 변동/100)
+            단순보유수익률 = (현재가격 - self.초기가격) / self.초기가격 * 100
+        
+        시장상황 = self._시장상황_분류(단순보유수익률)
+        
+        # 생존전략을 한 번만 훑으며 수익률 상위 20개 추적 (같은 수익률은 전략 키 순)
+        상위추적 = TopK(20, tie_key=self._전략을_키로_변환)
+        for 전략 in 결과['생존전략']:
+            평가자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
+            상위추적.push(전략, ((평가자산 - 100000) / 100000) * 100)
+        
+        # 누적 통계용 상위 20개 전략 (1위 = 최고 전략)
+        상위전략들 = [{
+            '전략': 전략,
+            '수익률': 수익률,
+            '전략설명': f"{전략['매수기준명']}-{전략['매수하락률']}% + {전략['구매방식명']} + 손절{전략['손절라인']}% + {전략['매도전략명']}"
+        } for 수익률, 전략 in 상위추적.scored_items()]
+        최고전략 = 상위전략들[0] if 상위전략들 else None
+        최고수익률 = 최고전략['수익률'] if 최고전략 else -float('inf')
+        
+        return {
+            '생존전략수': len(결과['생존전략']),
+            '탈락전략수': len(결과['탈락기록']) if '탈락기록' in 결과 else 0,
+            '최고전략': 최고전략,
+            '최고수익률': 최고수익률,
+            '시장상황': 시장상황,
+            '단순보유수익률': 단순보유수익률,
+            '상위전략들': 상위전략들,
+            '시드': self.데이터시드
+        }
+    
+    def _사이클_성과_누적(self, 전략성과누적, 사이클, 요약):
+        """사이클 상위 전략들을 전략성과누적에 반영 (사이클 순서대로 호출)"""
+        시장상황 = 요약['시장상황']
+        for 순위, 전략정보 in enumerate(요약['상위전략들'], 1):
+            전략키 = self._전략을_키로_변환(전략정보['전략'])
+            
+            if 전략키 not in 전략성과누적:
+                전략성과누적[전략키] = {
+                    '전략정보': 전략정보['전략'],
+                    '출현횟수': 0,
+                    '총수익률': 0,
+                    '순위합계': 0,
+                    '최고순위': float('inf'),
+                    '시장상황별성과': {'상승장': [], '하락장': [], '횡보장': []},
+                    '사이클기록': []
+                }
+            
+            전략성과누적[전략키]['출현횟수'] += 1
+            전략성과누적[전략키]['총수익률'] += 전략정보['수익률']
+            전략성과누적[전략키]['순위합계'] += 순위
+            전략성과누적[전략키]['최고순위'] = min(전략성과누적[전략키]['최고순위'], 순위)
+            전략성과누적[전략키]['시장상황별성과'][시장상황].append(전략정보['수익률'])
+            전략성과누적[전략키]['사이클기록'].append({
+                '사이클': 사이클,
+                '순위': 순위,
+                '수익률': 전략정보['수익률'],
+                '시장상황': 시장상황
+            })
+    
+    def 프로파일_저장(self, 파일경로, **실행정보):
+        """구간별 시간/카운터와 파생지표(초당 처리량, 제외 적중률, 저장 바이트)를 프로파일 JSON으로 저장"""
+        처리율 = {
+            '일별시뮬레이션_전략일_초당': ('시뮬레이션.전략일', '일별시뮬레이션'),
+            '300주_전략주_초당': ('300주.전략주', '300주시뮬레이션'),
+            '조합생성_조합_초당': ('조합.검사', '조합생성'),
+            '저장_바이트_초당': ('저장바이트', '파일저장')
+        }
+        비율 = {
+            '제외적중률': (['조합.완전제외', '조합.시장별제외'], ['조합.검사']),
+            '완전제외적중률': (['조합.완전제외'], ['조합.검사']),
+            '시장별제외적중률': (['조합.시장별제외'], ['조합.검사']),
+            '옐로우카드복원률': (['조합.옐로우카드복원'], ['조합.투입']),
+            '시나리오저장소적중률': (['시나리오.적중'], ['시나리오.적중', '시나리오.생성'])
+        }
+        정보 = dict(실행정보, 시드=self.시드, 초기가격=self.초기가격, 주수=self.시뮬레이션주수, 사이클수=self.사이클수,
+                  병렬작업수=self.사이클_병렬작업수, 배치시뮬레이션=bool(self.배치시뮬레이션 and NUMPY_AVAILABLE))
+        보고서 = self.프로파일.save(파일경로, 처리율, 비율, 정보)
+        print(f"실행 프로파일 저장: {파일경로} ({보고서['전체초']:.1f}초)")
+        return 보고서
+    
+    def _체크포인트_설정(self, 종류, 기본시드, 사이클, **누적상태):
+        """긴 실행의 현재 사이클과 누적 상태를 체크포인트 문맥으로 설정 (주기 0이면 사용 안 함)
+        
+        사이클이 사이클수보다 크면 사이클 이후 단계(300주 검증) 진행 중
+        """
+        if not self.체크포인트_주기:
+            self._체크포인트_문맥 = None
+            return
+        self._체크포인트_문맥 = {'종류': 종류, '모드': 체크포인트_모드[종류], '기본시드': 기본시드, '사이클': 사이클, **누적상태}
+    
+    def _체크포인트_저장(self, 진행=None):
+        """체크포인트 문맥 + 일차/주차 진행 상태를 파일 하나에 저장 (시장 데이터는 시드로 재생성)"""
+        if self._체크포인트_문맥 is None:
+            return
+        상태 = dict(self._체크포인트_문맥, 진행=진행, 탈락로그크기=self._탈락로그_크기(), 설정={
+            '초기가격': self.초기가격,
+            '시드': self.시드,
+            '시뮬레이션주수': self.시뮬레이션주수,
+            '사이클수': self.사이클수,
+            '체크포인트주기': self.체크포인트_주기
+        })
+        with self.프로파일.phase('체크포인트저장'):
+            소요 = CheckpointStore(self.체크포인트_파일).save(상태)
+        self.프로파일.count_file('저장바이트.체크포인트', self.체크포인트_파일)
+        로그.debug("   체크포인트 저장: 사이클 %d (%.2f초)", 상태['사이클'], 소요)
+        
+        # 미뤄둔 탈락 로그 합치기 (체크포인트의 탈락로그크기도 함께 갱신)
+        if 상태['탈락로그크기'] >= self.탈락로그_압축크기:
+            self._탈락로그_압축()
+    
+    def _체크포인트_단계_저장(self, 고정상태):
+        """단계 동안 바뀌지 않는 큰 상태를 단계 파일에 한 번 저장 (체크포인트 문맥이 없으면 무시)"""
+        if self._체크포인트_문맥 is None:
+            return
+        저장소 = CheckpointStore(self.체크포인트_파일)
+        with self.프로파일.phase('체크포인트저장'):
+            소요 = 저장소.save_stage(고정상태)
+        self.프로파일.count_file('저장바이트.체크포인트단계', 저장소.stage_path)
+        로그.debug("   체크포인트 단계 파일 저장: 사이클 %d (%.2f초)", self._체크포인트_문맥['사이클'], 소요)
+    
+    def _체크포인트_단계_불러오기(self):
+        """재개할 단계의 고정 상태 (단계 파일이 없으면 재개 불가)"""
+        고정상태 = CheckpointStore(self.체크포인트_파일).load_stage()
+        if 고정상태 is None:
+            raise RuntimeError("체크포인트 단계 파일이 없거나 읽을 수 없어 재개할 수 없습니다")
+        return 고정상태
+    
+    def _체크포인트_탈락로그크기_갱신(self):
+        """저장된 체크포인트의 탈락로그크기를 현재 로그 크기로 맞춤 (체크포인트가 없으면 무시)"""
+        저장소 = CheckpointStore(self.체크포인트_파일)
+        상태 = 저장소.load() if 저장소.exists() else None
+        if 상태 is None or 상태.get('탈락로그크기') in (None, self._탈락로그_크기()):
+            return
+        상태['탈락로그크기'] = self._탈락로그_크기()
+        저장소.save(상태)
+    
+    def _재개상태_설정(self, 상태):
+        """--resume 체크포인트 설정 - 체크포인트 이후 탈락 로그에 추가된 기록은 잘라냄 (같은 사이클 재실행시 중복 방지)"""
+        self._재개상태 = 상태
+        if 상태 is None or 상태.get('탈락로그크기') is None:
+            return
+        
+        저장크기 = 상태['탈락로그크기']
+        if self._탈락로그_크기() > 저장크기:
+            with open(self._탈락로그_파일(), 'r+b') as f:
+                f.truncate(저장크기)
+            print(f"체크포인트 이후 탈락 기록 정리: 탈락 로그를 {저장크기:,}바이트로 되돌림")
+        else:
+            # 체크포인트 저장 후 로그를 합치다 중단된 경우 - 지금 크기를 새 기준점으로 기록
+            self._체크포인트_탈락로그크기_갱신()
+    
+    def _체크포인트_종료(self):
+        """긴 실행 완료 - 체크포인트 문맥 해제, 이 실행이 쓰거나 이어받은 체크포인트 삭제"""
+        if self._체크포인트_문맥 is not None or self._재개완료:
+            CheckpointStore(self.체크포인트_파일).clear()
+        self._체크포인트_문맥 = None
+        self._재개완료 = False
+    
+    def _재개상태_꺼내기(self, 종류):
+        """--resume으로 불러온 체크포인트가 이 실행 종류면 꺼내 반환 (아니면 None)"""
+        상태 = self._재개상태
+        self._재개상태 = None
+        if 상태 is None or 상태.get('종류') != 종류:
+            return None
+        self._재개진행 = 상태.get('진행')
+        self._재개완료 = True
+        print(f"\n체크포인트에서 재개 ({상태['저장시각']} 저장): 사이클 {min(상태['사이클'], self.사이클수)}/{self.사이클수}"
+              + (" 이후 단계" if 상태['사이클'] > self.사이클수 else ""))
+        return 상태
+    
+    def _재개진행_꺼내기(self, 단계):
+        """재개할 일차('일차')/주차('300주') 진행 상태를 한 번만 꺼냄 (해당 단계가 아니면 None)"""
+        진행 = self._재개진행
+        if 진행 is None or 진행.get('단계') != 단계:
+            return None
+        self._재개진행 = None
+        return 진행
+    
+    def _사이클_시드(self, 기본시드, 사이클):
+        """사이클별 데이터 시드 (기본시드는 실행 시드의 난수 생성기에서 한 번 뽑음)"""
+        return (기본시드 + 사이클) % 2**32
+    
+    def _사이클_병렬_실행(self, 사이클목록, 기본시드, 히스토리저장=True):
+        """사이클들을 프로세스 풀에서 병렬 실행 (사이클별 시드, 결과는 사이클 순서로 병합)"""
+        from concurrent.futures import ProcessPoolExecutor
+        import tempfile
+        import shutil
+        
+        사이클목록 = list(사이클목록)
+        작업폴더 = tempfile.mkdtemp(prefix='cycles_')
+        
+        print(f"\n{len(사이클목록)}개 사이클 병렬 실행 (프로세스 {min(self.사이클_병렬작업수, len(사이클목록))}개)")
+        
+        # 작업폴더로 복사하기 전에 대기 중인 탈락 로그 합치기
+        self._탈락로그_압축()
+        
+        try:
+            작업들 = []
+            for 사이클 in 사이클목록:
+                # 사이클마다 데이터 파일 사본을 쓰므로 작업끼리 파일을 공유하지 않음
+                사이클폴더 = os.path.join(작업폴더, f"cycle{사이클}")
+                os.makedirs(사이클폴더)
+                for 파일 in (self.탈락전략_파일.replace('.json', '_압축.json'), self.영구제외_파일):
+                    if os.path.exists(파일):
+                        shutil.copy2(파일, 사이클폴더)
+                
+                작업들.append({
+                    '사이클': 사이클,
+                    '시드': self._사이클_시드(기본시드, 사이클),
+                    '초기가격': self.초기가격,
+                    '과거데이터': self.과거데이터,
+                    '거래비용설정': self.거래비용설정,
+                    '배치시뮬레이션': self.배치시뮬레이션,
+                    '시뮬레이션주수': self.시뮬레이션주수,
+                    '사이클수': self.사이클수,
+                    '탈락전략데이터': getattr(self, '_cached_탈락전략_데이터', None),
+                    '작업폴더': 사이클폴더,
+                    '시나리오폴더': self.시나리오저장소.directory if self.시나리오저장소 else None,
+                    '프로파일': self.프로파일.enabled,
+                    '히스토리저장': 히스토리저장
+                })
+            
+            with ProcessPoolExecutor(max_workers=min(self.사이클_병렬작업수, len(작업들))) as 풀:
+                작업결과들 = list(풀.map(_사이클_병렬_작업, 작업들))
+        finally:
+            shutil.rmtree(작업폴더, ignore_errors=True)
+        
+        # 사이클 순서대로 출력 및 파일 병합 (결정적 순서)
+        for 작업결과 in 작업결과들:
+            print(f"\n=== 사이클 {작업결과['사이클']}/{self.사이클수} 시작 ===")
+            print("-"*50)
+            print(작업결과['출력'], end='')
+            
+            if 작업결과['탈락기록']:
+                self._탈락전략_저장(작업결과['탈락기록'])
+            if 작업결과['히스토리기록']:
+                self._최고전략_기록_추가(작업결과['히스토리기록'])
+            if 작업결과['영구제외데이터'] is not None:
+                self._영구제외_기록_병합(작업결과['영구제외데이터'])
+            self.프로파일.merge(작업결과['프로파일'])  # 구간 시간은 프로세스별 합계 (벽시계 시간보다 클 수 있음)
+        
+        return 작업결과들
+    
+    def _파일경로_변경(self, 기본경로):
+        """모든 데이터 파일 경로를 지정한 폴더 기준으로 변경 (작업경로 사용 중지)"""
+        self.기본경로 = 기본경로
+        self.작업경로 = None
+        for 속성, 값 in list(vars(self).items()):
+            if 속성.endswith('_파일') and isinstance(값, str):
+                setattr(self, 속성, os.path.join(기본경로, os.path.basename(값.replace('\\', '/'))))
+    
+    def _작업경로_반영(self):
+        """작업경로(scratch)의 탈락/영구제외 파일을 기본경로로 반영"""
+        if not self.작업경로:
+            return 0
+        반영수 = sync_scratch_files(self.작업경로, self.기본경로)
+        if 반영수:
+            print(f"작업경로 파일 {반영수}개를 데이터 폴더에 반영: {self.기본경로}")
+        return 반영수
+    
+    def _영구제외_기록_병합(self, 사이클데이터):
+        """사이클 작업폴더의 영구제외 기록을 메인 파일에 병합 (탈락시장은 합집합)"""
+        if not isinstance(사이클데이터, dict):
+            return
+        
+        기존데이터 = {}
+        try:
+            if os.path.exists(self.영구제외_파일):
+                with open(self.영구제외_파일, 'r', encoding='utf-8') as f:
+                    기존데이터 = json.load(f)
+        except:
+            기존데이터 = {}
+        if not isinstance(기존데이터, dict):
+            return
+        
+        def 시장합치기(기존시장, 새시장):
+            for 시장 in 새시장:
+                if 시장 not in 기존시장:
+                    기존시장.append(시장)
+            return 기존시장
+        
+        for 키, 값 in 사이클데이터.items():
+            if 키 == 'strategies' and isinstance(값, list):
+                # 배열 형식: [전략설명, 탈락시장, 완전제외] 또는 [구매방식, 매수수량, 손절라인, 수익라인, 탈락시장, 완전제외]
+                기존목록 = 기존데이터.setdefault('strategies', [])
+                배열색인 = {}
+                for b in 기존목록:
+                    if isinstance(b, list) and len(b) >= 3:
+                        배열색인[(len(b), repr(b[:1 if len(b) < 6 else 4]))] = b
+                for 배열 in 값:
+                    if not isinstance(배열, list) or len(배열) < 3:
+                        continue
+                    시장위치 = 1 if len(배열) < 6 else 4
+                    배열키 = (len(배열), repr(배열[:시장위치]))
+                    기존배열 = 배열색인.get(배열키)
+                    if 기존배열 is None:
+                        기존목록.append(배열)
+                        배열색인[배열키] = 배열
+                    elif isinstance(기존배열[시장위치], list) and isinstance(배열[시장위치], list):
+                        시장합치기(기존배열[시장위치], 배열[시장위치])
+                        기존배열[시장위치 + 1] = bool(기존배열[시장위치 + 1] or 배열[시장위치 + 1] or len(set(기존배열[시장위치])) >= 3)
+            elif isinstance(값, dict) and '탈락시장' in 값:
+                # 키 형식: {전략키: {"탈락시장": [...], "완전제외": bool}}
+                if 키 in 기존데이터 and isinstance(기존데이터[키], dict):
+                    기존시장 = 시장합치기(기존데이터[키].setdefault('탈락시장', []), 값['탈락시장'])
+                    기존데이터[키]['완전제외'] = len(기존시장) >= 3
+                else:
+                    기존데이터[키] = 값
+            elif 키 not in 기존데이터:
+                기존데이터[키] = 값
+        
+        self._안전한_json_저장(self.영구제외_파일, 기존데이터)
+    
     def _5사이클_누적_시뮬레이션(self):
         """5사이클 누적 시뮬레이션 - 누적 수익률 방식"""
         # 5사이클 진행 중 플래그 설정
@@ -4055,160 +4818,94 @@ class 최적화투자분석:
         
         사이클결과들 = []
         전략성과누적 = {}
-        
-        for 사이클 in range(1, 6):
-            print(f"\n=== 사이클 {사이클}/5 시작 ===")
-            print("-"*50)
-            
-            # 새로운 랜덤 데이터 생성
-            일간데이터 = self.랜덤_일별_데이터_생성()
-            self.주간_집계_계산(일간데이터)
+        기본시드 = self.난수.randrange(2**32)  # 실행 시드에서 사이클별 시드 결정
+        시작사이클 = 1
+        
+        # 체크포인트에서 재개: 완료한 사이클의 누적 상태를 복원하고 저장된 사이클부터 순차 실행
+        재개 = self._재개상태_꺼내기('5사이클')
+        if 재개 is not None:
+            기본시드 = 재개['기본시드']
+            사이클결과들 = 재개['사이클결과들']
+            전략성과누적 = 재개['전략성과누적']
+            시작사이클 = 재개['사이클']
+        
+        if self.사이클_병렬작업수 > 1 and 재개 is None:
+            # 병렬 실행: 사이클별 시드로 동시에 실행 후 사이클 순서대로 병합 (체크포인트 없음)
+            사이클요약들 = {작업결과['사이클']: 작업결과['요약'] for 작업결과 in self._사이클_병렬_실행(range(1, self.사이클수 + 1), 기본시드, 히스토리저장=True)}
+        else:
+            사이클요약들 = None
+        
+        for 사이클 in range(시작사이클, self.사이클수 + 1):
+            if 사이클요약들 is None:
+                print(f"\n=== 사이클 {사이클}/{self.사이클수} 시작 ===")
+                print("-"*50)
+                self._체크포인트_설정('5사이클', 기본시드, 사이클, 사이클결과들=사이클결과들, 전략성과누적=전략성과누적)
+                결과, 요약 = self._사이클_실행(사이클, 히스토리저장=True, 시드=self._사이클_시드(기본시드, 사이클))
+            else:
+                요약 = 사이클요약들[사이클]
             
-            # 단일 시뮬레이션 실행 (누적 방식)
-            결과 = self.전략_비교_시뮬레이션()
-            
-            if 결과 and '생존전략' in 결과:
-                # 시장 상황 분류
-                단순보유수익률 = 0
-                if hasattr(self, '주간데이터') and self.주간데이터:
-                    현재가격 = self.초기가격
-                    for 변동 in self.주간데이터[:27]:
-                        현재가격 *= (1 + 변동/100)
-                    단순보유수익률 = (현재가격 - self.초기가격) / self.초기가격 * 100
-                
-                시장상황 = self._시장상황_분류(단순보유수익률)
-                
-                # 최고 전략 계산
-                최고전략 = None
-                최고수익률 = -float('inf')
-                
-                for 전략 in 결과['생존전략']:
-                    평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
-                    수익률 = ((평가자산 - 100000) / 100000) * 100
-                    
-                    if 수익률 > 최고수익률:
-                        최고수익률 = 수익률
-                        최고전략 = {
-                            '전략': 전략,
-                            '수익률': 수익률,
-                            '전략설명': f"{전략['매수기준명']}-{전략['매수하락률']}% + {전략['구매방식명']} + 손절{전략['손절라인']}% + {전략['매도전략명']}"
-                        }
-                
-                # 누적 통계에 추가 (상위 20개 전략)
-                상위전략들 = []
-                for 전략 in 결과['생존전략'][:20]:  # 상위 20개만
-                    평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
-                    수익률 = ((평가자산 - 100000) / 100000) * 100
-                    상위전략들.append({
-                        '전략': 전략,
-                        '수익률': 수익률,
-                        '전략설명': f"{전략['매수기준명']}-{전략['매수하락률']}% + {전략['구매방식명']} + 손절{전략['손절라인']}% + {전략['매도전략명']}"
-                    })
-                
+            if 요약 is not None:
                 # 상위전략들을 누적 통계에 추가
-                for 순위, 전략정보 in enumerate(상위전략들, 1):
-                    전략키 = self._전략을_키로_변환(전략정보['전략'])
-                    
-                    if 전략키 not in 전략성과누적:
-                        전략성과누적[전략키] = {
-                            '전략정보': 전략정보['전략'],
-                            '출현횟수': 0,
-                            '총수익률': 0,
-                            '순위합계': 0,
-                            '최고순위': float('inf'),
-                            '시장상황별성과': {'상승장': [], '하락장': [], '횡보장': []},
-                            '사이클기록': []
-                        }
-                    
-                    전략성과누적[전략키]['출현횟수'] += 1
-                    전략성과누적[전략키]['총수익률'] += 전략정보['수익률']
-                    전략성과누적[전략키]['순위합계'] += 순위
-                    전략성과누적[전략키]['최고순위'] = min(전략성과누적[전략키]['최고순위'], 순위)
-                    전략성과누적[전략키]['시장상황별성과'][시장상황].append(전략정보['수익률'])
-                    전략성과누적[전략키]['사이클기록'].append({
-                        '사이클': 사이클,
-                        '순위': 순위,
-                        '수익률': 전략정보['수익률'],
-                        '시장상황': 시장상황
-                    })
+                self._사이클_성과_누적(전략성과누적, 사이클, 요약)
                 
                 사이클결과들.append({
                     '사이클': 사이클,
-                    '생존전략수': len(결과['생존전략']),
-                    '탈락전략수': len(결과['탈락기록']) if '탈락기록' in 결과 else 0,
-                    '최고전략': 최고전략,
-                    '시장상황': 시장상황,
-                    '단순보유수익률': 단순보유수익률
+                    '생존전략수': 요약['생존전략수'],
+                    '탈락전략수': 요약['탈락전략수'],
+                    '최고전략': 요약['최고전략'],
+                    '시장상황': 요약['시장상황'],
+                    '단순보유수익률': 요약['단순보유수익률'],
+                    '시드': 요약['시드']
                 })
                 
-                # 각 사이클마다 상위 5개 전략을 히스토리에 저장 (중간 저장)
-                if 결과 and '생존전략' in 결과 and len(결과['생존전략']) > 0:
-                    self._최고전략_히스토리_저장(
-                        결과['생존전략'], 
-                        f"5사이클_{사이클}차", 
-                        {
-                            '현재사이클': 사이클,
-                            '총사이클': 5,
-                            '시장상황': 시장상황,
-                            '생존전략수': len(결과['생존전략']),
-                            '탈락전략수': len(결과.get('탈락기록', []))
-                        }
-                    )
-                    print(f"  → 사이클 {사이클} 결과 히스토리 저장 완료")
-                
                 print(f"사이클 {사이클} 완료:")
                 print(f"  생존: {사이클결과들[-1]['생존전략수']:,}개")
-                print(f"  최고 수익률: {최고수익률:+.1f}% ({시장상황})")
-                print(f"  단순보유 대비: {최고수익률 - 단순보유수익률:+.1f}%p")
+                print(f"  최고 수익률: {요약['최고수익률']:+.1f}% ({요약['시장상황']})")
+                print(f"  단순보유 대비: {요약['최고수익률'] - 요약['단순보유수익률']:+.1f}%p")
+                
+                # 사이클 완료 체크포인트 (다음 사이클부터 재개)
+                if 사이클요약들 is None:
+                    self._체크포인트_설정('5사이클', 기본시드, 사이클 + 1, 사이클결과들=사이클결과들, 전략성과누적=전략성과누적)
+                    self._체크포인트_저장()
             else:
                 print(f"사이클 {사이클} 실패!")
                 return None
         
-        # 종합 랭킹 생성 및 저장
-        종합랭킹 = self._종합랭킹_생성_저장(전략성과누적)
-        
-        # 최종 결과 요약
-        print(f"\n{'='*80}")
-        print(f"5사이클 누적 시뮬레이션 완료!")
-        print(f"{'='*80}")
-        
-        print(f"\n사이클별 결과:")
-        for 결과 in 사이클결과들:
-            print(f"  사이클 {결과['사이클']}: 생존 {결과['생존전략수']:,}개, 최고 {결과['최고전략']['수익률']:+.1f}% ({결과['시장상황']})")
-        
-        # 종합 랭킹 TOP 10 표시
-        if 종합랭킹:
-            print(f"\n종합 랭킹 TOP 10:")
-            print("-" * 60)
-            
-            for i, 전략데이터 in enumerate(종합랭킹[:10], 1):
-                전략설명 = 전략데이터['전략설명']
-                평균수익률 = 전략데이터['평균수익률']
-                출현횟수 = 전략데이터['출현횟수']
-                안정성점수 = 전략데이터['안정성점수']
-                
-                print(f"{i:2}. [{전략설명}]")
-                print(f"    출현: {출현횟수}/5회, 평균수익률: {평균수익률:+.1f}%, 안정성: {안정성점수:.1f}")
-        
-        # 5사이클 시뮬레이션 완료 후 종합랭킹 저장
-        if 종합랭킹:
-            # 종합랭킹에서 상위 5개 전략 정보로 최종 히스토리 저장
-            상위5전략_정보 = []
-            for 전략데이터 in 종합랭킹[:5]:
-                if '전략정보' in 전략데이터:
-                    상위5전략_정보.append(전략데이터['전략정보'])
-            
-            if 상위5전략_정보:
-                self._최고전략_히스토리_저장(상위5전략_정보, "5사이클_종합랭킹", {
-                    '총사이클수': 5,
-                    '분석전략수': len(종합랭킹),
-                    '완료상태': '전체완료',
-                    '종합평가': '5사이클 모두 완료 후 종합 분석'
-                })
-                print(f"\n  → 5사이클 종합랭킹 히스토리 저장 완료")
-        
-        # 5사이클 플래그 해제
-        self._is_in_5cycle = False
+        # 모든 사이클 완료 - 집계 중 실패해도 체크포인트는 삭제 (재개해도 같은 집계를 반복할 뿐)
+        try:
+            # 종합 랭킹 생성 및 저장
+            종합랭킹 = self._종합랭킹_생성_저장(전략성과누적)
+        
+            # 최종 결과 요약
+            print(f"\n{'='*80}")
+            print(f"5사이클 누적 시뮬레이션 완료!")
+            print(f"{'='*80}")
+        
+            print(f"\n사이클별 결과:")
+            for 결과 in 사이클결과들:
+                print(f"  사이클 {결과['사이클']}: 생존 {결과['생존전략수']:,}개, 최고 {결과['최고전략']['수익률']:+.1f}% ({결과['시장상황']})")
+        
+            # 종합 랭킹 TOP 10 표시
+            if 종합랭킹:
+                print(f"\n종합 랭킹 TOP 10:")
+                print("-" * 60)
+            
+                for i, 전략데이터 in enumerate(종합랭킹[:10], 1):
+                    전략설명 = 전략데이터['전략설명']
+                    평균수익률 = 전략데이터['평균수익률']
+                    출현횟수 = 전략데이터['출현횟수']
+                    안정성점수 = 전략데이터['안정성점수']
+                
+                    print(f"{i:2}. [{전략설명}]")
+                    print(f"    출현: {출현횟수}/{self.사이클수}회, 평균수익률: {평균수익률:+.1f}%, 안정성: {안정성점수:.1f}")
+        
+            # 5사이클 시뮬레이션 완료 후 종합랭킹 상위 5개를 히스토리에 저장
+            if 종합랭킹:
+                self._종합랭킹_히스토리_저장(종합랭킹, 사이클결과들)
+        finally:
+            # 5사이클 플래그 해제
+            self._is_in_5cycle = False
+            self._체크포인트_종료()
         
         return 종합랭킹
 
@@ -4217,11 +4914,8 @@ class 최적화투자분석:
         if not 생존전략들:
             return []
             
-        # 수익률 기준으로 정렬
-        정렬된전략들 = sorted(생존전략들, key=lambda x: self._전략수익률_계산(x), reverse=True)
-        
-        # 상위 15개 추출
-        상위15개 = 정렬된전략들[:15]
+        # 수익률 상위 15개 추출 (전체 정렬 없이, 같은 수익률은 전략 키 순)
+        상위15개 = top_k(생존전략들, 15, key=self._전략수익률_계산, tie_key=self._전략을_키로_변환)
         
         print(f"상위 15개 전략 추출 완료 (총 {len(생존전략들)}개 중)")
         
@@ -4229,7 +4923,7 @@ class 최적화투자분석:
 
     def _전략수익률_계산(self, 전략):
         """전략의 수익률 계산"""
-        평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+        평가자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
         수익률 = ((평가자산 - 100000) / 100000) * 100
         return 수익률
 
@@ -4436,40 +5130,65 @@ class 최적화투자분석:
         # 5사이클별 생존전략 수집
         전체생존전략 = {}
         사이클결과 = []
+        기본시드 = self.난수.randrange(2**32)  # 실행 시드에서 사이클별/300주 데이터 시드 결정
+        시작사이클 = 1
+        
+        # 체크포인트에서 재개: 수집한 생존전략을 복원하고 저장된 사이클(또는 300주 단계)부터 실행
+        재개 = self._재개상태_꺼내기('300주')
+        if 재개 is not None:
+            기본시드 = 재개['기본시드']
+            # 300주 단계 체크포인트는 수집 전략을 단계 파일에 따로 둠
+            전체생존전략 = 재개['전체생존전략'] if '전체생존전략' in 재개 else self._체크포인트_단계_불러오기()['전체생존전략']
+            사이클결과 = 재개['사이클결과']
+            시작사이클 = 재개['사이클']
+        
+        if self.사이클_병렬작업수 > 1 and 재개 is None:
+            # 병렬 실행: 사이클별 생존전략과 수익률을 받아 사이클 순서대로 수집
+            병렬결과 = {작업결과['사이클']: 작업결과 for 작업결과 in self._사이클_병렬_실행(range(1, self.사이클수 + 1), 기본시드, 히스토리저장=False)}
+        else:
+            병렬결과 = None
         
-        for 사이클 in range(1, 6):
-            print(f"사이클 {사이클}/5 진행 중...")
-            
-            # 새로운 랜덤 데이터 생성
-            일간데이터 = self.랜덤_일별_데이터_생성()
-            self.주간_집계_계산(일간데이터)
-            
-            # 27주 시뮬레이션 실행
-            결과 = self.전략_비교_시뮬레이션()
+        for 사이클 in range(시작사이클, self.사이클수 + 1):
+            if 병렬결과 is None:
+                print(f"사이클 {사이클}/{self.사이클수} 진행 중...")
+                self._체크포인트_설정('300주', 기본시드, 사이클, 전체생존전략=전체생존전략, 사이클결과=사이클결과)
+                
+                # 새로운 랜덤 데이터 생성 (사이클 시드)
+                self._난수_재설정(self._사이클_시드(기본시드, 사이클))
+                self.시장데이터_생성()
+                
+                # 시뮬레이션주수만큼 시뮬레이션 실행
+                결과 = self.전략_비교_시뮬레이션()
+                생존전략들 = 결과['생존전략'] if 결과 and '생존전략' in 결과 else None
+                수익률들 = [self._전략수익률_계산(전략) for 전략 in 생존전략들] if 생존전략들 is not None else []
+            else:
+                생존전략들 = 병렬결과[사이클]['생존전략'] if 병렬결과[사이클]['요약'] is not None else None
+                수익률들 = 병렬결과[사이클]['생존전략수익률']
             
-            if 결과 and '생존전략' in 결과:
-                생존전략들 = 결과['생존전략']
+            if 생존전략들 is not None:
                 사이클결과.append({
                     '사이클': 사이클,
-                    '생존전략수': len(생존전략들)
+                    '생존전략수': len(생존전략들),
+                    '시드': self._사이클_시드(기본시드, 사이클)
                 })
                 
                 # 생존전략들을 전체 수집에 추가
-                for 전략 in 생존전략들:
+                for 전략, 수익률 in zip(생존전략들, 수익률들):
                     전략키 = self._전략을_키로_변환(전략)
                     if 전략키 not in 전체생존전략:
                         전체생존전략[전략키] = {
-                            '전략정보': 전략,
+                            '전략정보': self._전략구성_추출(전략),  # 구성만 (사이클 거래내역/상태 제외)
                             '생존사이클': [],
                             '사이클별수익률': {}
                         }
                     
-                    # 수익률 계산
-                    평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
-                    수익률 = ((평가자산 - 100000) / 100000) * 100
-                    
                     전체생존전략[전략키]['생존사이클'].append(사이클)
                     전체생존전략[전략키]['사이클별수익률'][str(사이클)] = 수익률
+                
+                # 사이클 완료 체크포인트 (다음 사이클부터 재개)
+                if 병렬결과 is None:
+                    self._체크포인트_설정('300주', 기본시드, 사이클 + 1, 전체생존전략=전체생존전략, 사이클결과=사이클결과)
+                    self._체크포인트_저장()
                     
             else:
                 print(f"사이클 {사이클} 실패!")
@@ -4483,12 +5202,18 @@ class 최적화투자분석:
         
         # 300주 고속 시뮬레이션 실행
         print(f"\n300주 고속 시뮬레이션 시작...")
+        self._난수_재설정(기본시드)  # 300주 데이터는 기본시드로 생성
+        # 수집 전략은 300주 동안 바뀌지 않으므로 단계 파일에 한 번만 저장 (주차 체크포인트에서 제외)
+        self._체크포인트_설정('300주', 기본시드, self.사이클수 + 1, 사이클결과=사이클결과)
+        self._체크포인트_단계_저장({'전체생존전략': 전체생존전략})
         최종결과 = self._run_300week_simulation(전체생존전략)
         
         if 최종결과:
-            # JSON 저장
-            저장결과 = self._save_300week_final_result(최종결과, 전체생존전략, 사이클결과)
-            return 저장결과
+            # JSON 저장 (저장 중 실패해도 체크포인트는 삭제)
+            try:
+                return self._save_300week_final_result(최종결과, 전체생존전략, 사이클결과)
+            finally:
+                self._체크포인트_종료()
         else:
             return None
 
@@ -4497,7 +5222,9 @@ class 최적화투자분석:
         print("300주 데이터 생성 중...")
         
         # 300주 데이터 생성
-        일간데이터_300주 = self._generate_300week_data()
+        일간데이터_300주 = self._시나리오_저장소_사용(
+            '300주데이터', {'일수': 1500}, lambda: {'일간데이터': self._generate_300week_data()}
+        )['일간데이터']
         self._calculate_300week_weekly(일간데이터_300주)
         
         print(f"총 {len(전체생존전략)}개 전략으로 300주 시뮬레이션 실행...")
@@ -4510,20 +5237,21 @@ class 최적화투자분석:
         
         return 최종결과
 
-    def _일간데이터_생성(self):
-        """135일(27주) 일간 데이터 생성"""
-        import random
+    def _일간데이터_생성(self, 난수=None):
+        """시뮬레이션 기간(기본 27주 = 135일) 일간 데이터 생성"""
+        난수 = 난수 or self.난수
         일간변동률들 = []
         
-        for 일차 in range(135):  # 27주 = 135일
+        for 일차 in range(self.시뮬레이션주수 * 5):
             # 일일 변동률 생성 (-3% ~ +3%)
-            변동률 = random.uniform(-0.03, 0.03)
+            변동률 = 난수.uniform(-0.03, 0.03)
             일간변동률들.append(변동률)
         
         return 일간변동률들
 
-    def _generate_300week_data(self):
+    def _generate_300week_data(self, 난수=None):
         """300주(1500일) 고속 데이터 생성"""
+        난수 = 난수 or self.난수
         일간변동률들 = []
         
         # 1500일 데이터 생성 (간략 출력)
@@ -4532,13 +5260,13 @@ class 최적화투자분석:
                 print(f"데이터 생성 진행률: {일차/1500*100:.0f}%")
             
             # 기본 일간변동률 (-8% ~ +8%)
-            기본변동률 = random.uniform(-8, 8)
+            기본변동률 = 난수.uniform(-8, 8)
             
             # 추세 보정
-            추세보정 = (일차 / 1500) * random.uniform(-1, 1)
+            추세보정 = (일차 / 1500) * 난수.uniform(-1, 1)
             
             # 변동성 보정  
-            변동성보정 = random.uniform(0.8, 1.2)
+            변동성보정 = 난수.uniform(0.8, 1.2)
             
             최종변동률 = (기본변동률 + 추세보정) * 변동성보정
             일간변동률들.append(최종변동률)
@@ -4571,27 +5299,39 @@ class 최적화투자분석:
         """고속 300주 시뮬레이션 (옐로우카드 6회, 간략 출력)"""
         생존전략들 = []
         탈락기록 = []
+        시작주차 = 0
+        
+        재개진행 = self._재개진행_꺼내기('300주')
+        if 재개진행 is not None:
+            # 체크포인트에서 재개: 저장된 주차 다음 주부터
+            생존전략들 = self._300주_상태_복원(전략들, 재개진행['생존'], 재개진행['주차'])
+            탈락기록 = 재개진행['탈락기록']
+            시작주차 = 재개진행['주차'] + 1
+            print(f"체크포인트에서 {시작주차 + 1}주차부터 재개 - 생존 {len(생존전략들)}개 전략")
         
         # 전략 초기화
-        for i, 전략템플릿 in enumerate(전략들):
+        for i, 전략템플릿 in enumerate(전략들 if 재개진행 is None else []):
             if i % 100 == 0:  # 100개마다 진행상황
                 print(f"전략 초기화: {i}/{len(전략들)}")
                 
             전략 = 전략템플릿.copy()
             전략.update({
+                '템플릿순번': i,
                 '자본': 100000,
                 '주식수': 0,
                 '옐로우카드': {'개수': 0, '획득일차': []},
                 '이동평균': [],
-                '매수기록': [],
-                '매도기록': []
+                '매수횟수': 0,
+                '매도횟수': 0,
+                '매수금액합': 0,
+                '매수수량합': 0
             })
             생존전략들.append(전략)
         
         print(f"300주 시뮬레이션 시작 - 총 {len(생존전략들)}개 전략")
         
         # 300주 시뮬레이션 실행
-        for 일차 in range(len(self.주간데이터)):
+        for 일차 in range(시작주차, len(self.주간데이터)):
             if 일차 % 50 == 0:  # 50주마다 진행상황
                 print(f"진행률: {일차+1}/300주 ({(일차+1)/300*100:.0f}%) - 생존: {len(생존전략들)}개")
             
@@ -4599,40 +5339,48 @@ class 최적화투자분석:
             
             # 생존 전략들 처리
             탈락자 = []
-            for 전략 in 생존전략들[:]:  # 복사본으로 순회
-                try:
-                    # 매수/매도 처리 (고속 간소화 버전)
-                    self._fast_strategy_process(전략, 일차+1, 주간변동률)
+            self.프로파일.count('300주.전략주', len(생존전략들))
+            with self.프로파일.phase('300주시뮬레이션'):
+                for 전략 in 생존전략들[:]:  # 복사본으로 순회
+                    try:
+                        # 매수/매도 처리 (고속 간소화 버전)
+                        self._fast_strategy_process(전략, 일차+1, 주간변동률)
                     
-                    # 평가손실 체크 추가 (주식 보유 여부와 관계없이)
-                    현재가격 = self.초기가격 * (1 + 주간변동률/100) if hasattr(self, '초기가격') else 100000
-                    평가자산 = 전략['자본'] + 전략['주식수'] * 현재가격
-                    현재수익률 = ((평가자산 - 100000) / 100000) * 100
+                        # 평가손실 체크 추가 (주식 보유 여부와 관계없이)
+                        현재가격 = self.초기가격 * (1 + 주간변동률/100) if hasattr(self, '초기가격') else 100000
+                        평가자산 = 전략['자본'] + 전략['주식수'] * 현재가격
+                        현재수익률 = ((평가자산 - 100000) / 100000) * 100
                     
-                    # -5% 이하 손실시 옐로우카드 부여
-                    if 현재수익률 <= -5.0 and 일차 % 6 == 0:  # 6주마다 체크
-                        전략['옐로우카드']['개수'] += 1
-                        전략['옐로우카드']['획득일차'].append(일차+1)
+                        # -5% 이하 손실시 옐로우카드 부여
+                        if 현재수익률 <= -5.0 and 일차 % 6 == 0:  # 6주마다 체크
+                            전략['옐로우카드']['개수'] += 1
+                            전략['옐로우카드']['획득일차'].append(일차+1)
                     
-                    # 옐로우카드 6회로 탈락 조건 확인
-                    if 전략['옐로우카드']['개수'] >= 6:  # 기존 3-5회 → 6회로 변경
-                        탈락자.append(전략)
-                        생존전략들.remove(전략)
+                        # 옐로우카드 6회로 탈락 조건 확인
+                        if 전략['옐로우카드']['개수'] >= 6:  # 기존 3-5회 → 6회로 변경
+                            탈락자.append(전략)
+                            생존전략들.remove(전략)
                         
-                except Exception as e:
-                    # 오류 발생시 탈락 처리
-                    탈락자.append(전략)
-                    if 전략 in 생존전략들:
-                        생존전략들.remove(전략)
+                    except Exception as e:
+                        # 오류 발생시 탈락 처리
+                        탈락자.append(전략)
+                        if 전략 in 생존전략들:
+                            생존전략들.remove(전략)
             
             # 탈락 기록 (간소화)
             if 탈락자:
-                for 전략 in 탈락자:
-                    탈락기록.append({
-                        '탈락일차': 일차+1,
-                        '전략키': self._전략을_키로_변환(전략),
-                        '옐로우카드': 전략['옐로우카드']['개수']
-                    })
+                self.프로파일.count('300주.탈락', len(탈락자))
+                with self.프로파일.phase('탈락처리'):
+                    for 전략 in 탈락자:
+                        탈락기록.append({
+                            '탈락일차': 일차+1,
+                            '전략키': self._전략을_키로_변환(전략),
+                            '옐로우카드': 전략['옐로우카드']['개수']
+                        })
+            
+            # N주마다 체크포인트 저장 (재개할 주가 남아 있을 때만)
+            if self._체크포인트_문맥 is not None and 일차 < len(self.주간데이터) - 1 and (일차 + 1) % self.체크포인트_주기 == 0:
+                self._체크포인트_저장({'단계': '300주', '주차': 일차, '생존': self._300주_상태_압축(생존전략들), '탈락기록': 탈락기록})
         
         print(f"300주 시뮬레이션 완료!")
         print(f"최종 생존: {len(생존전략들)}개, 탈락: {len(탈락기록)}개")
@@ -4643,6 +5391,26 @@ class 최적화투자분석:
             '시뮬레이션주수': 300
         }
 
+    def _300주_상태_압축(self, 생존전략들):
+        """300주 생존전략 상태를 열 단위 튜플로 압축 (옐로우카드 획득일차는 한 줄로 이어 붙임)"""
+        상태 = {열: tuple(전략[열] for 전략 in 생존전략들) for 열 in _300주_상태열}
+        상태['옐로우카드수'] = tuple(전략['옐로우카드']['개수'] for 전략 in 생존전략들)
+        상태['옐로우카드일차'] = tuple(일차 for 전략 in 생존전략들 for 일차 in 전략['옐로우카드']['획득일차'])
+        return 상태
+    
+    def _300주_상태_복원(self, 전략들, 상태, 주차):
+        """압축한 열 상태를 템플릿에 입혀 생존전략 복원 (이동평균은 주간데이터로 다시 계산)"""
+        이동평균 = [self.초기가격 * (1 + 변동률/100) for 변동률 in self.주간데이터[max(0, 주차 - 19):주차 + 1]]
+        획득일차들 = iter(상태['옐로우카드일차'])
+        생존전략들 = []
+        for 행, 개수 in enumerate(상태['옐로우카드수']):
+            전략 = 전략들[상태['템플릿순번'][행]].copy()
+            전략.update({열: 상태[열][행] for 열 in _300주_상태열})
+            전략['옐로우카드'] = {'개수': 개수, '획득일차': [next(획득일차들) for _ in range(개수)]}
+            전략['이동평균'] = list(이동평균)
+            생존전략들.append(전략)
+        return 생존전략들
+    
     def _save_300week_final_result(self, 최종결과, 전체생존전략, 사이클결과):
         """300주 시뮬레이션 최종 결과를 JSON으로 저장"""
         from datetime import datetime
@@ -4673,6 +5441,8 @@ class 최적화투자분석:
         저장데이터 = {
             "실행정보": {
                 "실행일시": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                "실행시드": self.시드,
+                "데이터시드": self.데이터시드,
                 "총수집전략수": len(전체생존전략),
                 "300주시뮬레이션_생존전략수": len(최종결과['생존전략']),
                 "고속화설정": {
@@ -4758,14 +5528,16 @@ class 최적화투자분석:
                 if 매수주식수 > 0:
                     전략['주식수'] += 매수주식수
                     전략['자본'] -= 매수주식수 * 현재가격
-                    전략['매수기록'].append({'주차': 주차, '가격': 현재가격, '수량': 매수주식수})
+                    전략['매수횟수'] += 1
+                    전략['매수금액합'] += 현재가격 * 매수주식수
+                    전략['매수수량합'] += 매수주식수
         
         else:  # 주식 보유 중일 때
             # 손절 확인 - 두 가지 기준 모두 체크
             손절라인 = 전략.get('손절라인', -10.0)
             
             # 1. 평균매수가 대비 손실률
-            평균매수가 = sum([r['가격'] * r['수량'] for r in 전략['매수기록']]) / sum([r['수량'] for r in 전략['매수기록']]) if 전략['매수기록'] else 현재가격
+            평균매수가 = 전략['매수금액합'] / 전략['매수수량합'] if 전략['매수횟수'] else 현재가격
             현재손익률 = (현재가격 - 평균매수가) / 평균매수가 * 100
             
             # 2. 전체 평가자산 기준 손실률 (추가)
@@ -4777,7 +5549,7 @@ class 최적화투자분석:
                 # 손절 매도 + 옐로우카드
                 매도금액 = 전략['주식수'] * 현재가격
                 전략['자본'] += 매도금액
-                전략['매도기록'].append({'주차': 주차, '가격': 현재가격, '수량': 전략['주식수'], '이유': '손절'})
+                전략['매도횟수'] += 1
                 전략['주식수'] = 0
                 전략['옐로우카드']['개수'] += 1
                 전략['옐로우카드']['획득일차'].append(주차)
@@ -4790,186 +5562,9 @@ class 최적화투자분석:
                     # 수익 매도
                     매도금액 = 전략['주식수'] * 현재가격
                     전략['자본'] += 매도금액
-                    전략['매도기록'].append({'주차': 주차, '가격': 현재가격, '수량': 전략['주식수'], '이유': '수익'})
+                    전략['매도횟수'] += 1
                     전략['주식수'] = 0
-
-
-def main():
-    """메인 실행 함수"""
-    print("최적화 투자 패턴 분석기 v5.0")
-    print("="*60)
-    
-    # 초기 주식 가격 입력
-    초기가격 = float(input("초기 주식 가격을 입력하세요 (원): "))
-    
-    print("\n실행 모드 선택:")
-    print("1. 전략 비교 시뮬레이션 (전체)")
-    print("2. 최고전략 히스토리 조회")
-    print("3. 히스토리 전략 재검증")
-    print("4. 시장 상황별 성과 조회")
-    print("5. 현재 상황 기반 전략 추천")
-    print("6. 포트폴리오 전략 시뮬레이션")
-    print("7. 포트폴리오 히스토리 조회")
-    print("8. 5사이클 누적 시뮬레이션 (개선된 옐로우카드)")
-    print("9. 5사이클별 생존전략 300주 고속검증")
-    모드 = input("선택 (1-9): ")
-    
-    분석기 = 최적화투자분석(초기가격)
-    
-    if 모드 == "1":
-        # 탈락 전략 데이터 자동 유지 (누적 학습 효과)
-        if os.path.exists(분석기.탈락전략_파일):
-            print("기존 탈락 전략 데이터 유지 → 누적 학습 효과 적용")
-        
-        # 27주 투자 시뮬레이션 실행
-        print(f"27주 투자 패턴 분석 시작!")
-        print("="*50)
-        
-        # 랜덤 데이터 생성
-        일간데이터 = 분석기.랜덤_일별_데이터_생성()
-        분석기.주간_집계_계산(일간데이터)
-        
-        # 시뮬레이션 실행
-        결과 = 분석기.전략_비교_시뮬레이션()
-        
-        if 결과:
-            print(f"\n최종 결과:")
-            print(f"생존 전략: {len(결과['생존전략']):,}개")
-            print(f"탈락 전략: {len(결과['탈락기록']):,}개")
-            
-            if '최고전략' in 결과 and 결과['최고전략']:
-                최고전략 = 결과['최고전략']
-                # 수익률 계산
-                평가자산 = 최고전략['자본'] + 최고전략['주식수'] * (최고전략['이동평균'][-1] if 최고전략['이동평균'] else 100000)
-                수익률 = ((평가자산 - 100000) / 100000) * 100
-                
-                print(f"\n최고 전략:")
-                print(f"  수익률: {수익률:+.1f}%")
-                print(f"  전략: {최고전략['매수기준명']}-{최고전략['매수하락률']}% + {최고전략['구매방식명']} + 손절{최고전략['손절라인']}% + {최고전략['매도전략명']}")
-                print(f"  최종 자산: {평가자산:,.0f}원")
-        else:
-            print("시뮬레이션 실행 중 오류가 발생했습니다.")
-    
-    elif 모드 == "2":
-        # 최고전략 히스토리 조회
-        분석기._최고전략_히스토리_조회()
-        
-        print("\n💡 활용 팁:")
-        print("- 히스토리에서 자주 등장하는 전략 패턴을 주목하세요")
-        print("- 다양한 시장 환경에서 일관되게 좋은 성과를 내는 전략을 찾아보세요")
-        print("- 극한 테스트 결과를 통해 전략의 안정성을 확인하세요")
-    
-    elif 모드 == "3":
-        # 히스토리 전략 재검증
-        print("\n재검증할 시장 환경:")
-        print("1. 현재 환경 (새로운 랜덤 데이터)")
-        print("2. 상승장 환경")
-        print("3. 하락장 환경") 
-        print("4. 횡보장 환경")
-        환경선택 = input("선택 (1, 2, 3, 4): ")
-        
-        환경이름 = {
-            "1": "현재환경",
-            "2": "상승장환경", 
-            "3": "하락장환경",
-            "4": "횡보장환경"
-        }.get(환경선택, "현재환경")
-        
-        # 환경별 데이터 생성
-        if 환경선택 == "2":  # 상승장
-            주별데이터 = [5, 8, 3, 7, 12]  # 전체적 상승
-        elif 환경선택 == "3":  # 하락장
-            주별데이터 = [-8, -5, -12, -3, -7]  # 전체적 하락
-        elif 환경선택 == "4":  # 횡보장
-            주별데이터 = [2, -1, 3, -2, 1]  # 작은 변동
-        else:  # 현재환경
-            주별데이터 = 분석기.랜덤_주별_데이터_생성()
-        
-        분석기.계층적_변동률_생성(주별데이터)
-        분석기._히스토리_전략_재검증(환경이름)
-        
-        print(f"\n {환경이름} 재검증 완료!")
-        print("- 기존 최고 전략들의 현재 환경 적응력을 확인했습니다")
-        print("- 성과 차이를 통해 전략의 환경 민감도를 파악하세요")
-    
-    elif 모드 == "4":
-        # 시장 상황별 성과 조회
-        print("\n 시장 상황별 전략 성과 조회")
-        print("="*50)
-        분석기.상황별_성과시각화()
     
-    elif 모드 == "5":
-        # 현재 상황 기반 전략 추천
-        print("\n 현재 상황 기반 전략 추천")
-        print("="*50)
-        
-        # 현재 상황 분석
-        현재상황 = 분석기.시장상황_분석()
-        print(f"\n 현재 시장 상황:")
-        print(f"   시장 체제: {현재상황['market_regime']}")
-        print(f"   변동성: {현재상황['volatility_pattern']}")
-        print(f"   추세: {현재상황['trend_pattern']}")
-        print(f"   모멘텀: {현재상황['price_momentum']}")
-        
-        # 전략 추천
-        print(f"\n 추천 전략:")
-        추천전략들 = 분석기.유사상황_전략추천(현재상황)
-        
-        if 추천전략들:
-            print(f"\n 추천 이유:")
-            print(f"   과거 유사 상황에서 검증된 최적 전략들입니다")
-            print(f"   현재 시장 조건과 {round(100 * len(추천전략들) / 3)}% 유사한 환경에서 우수한 성과를 보였습니다")
-        else:
-            print(f"\n 대안 제안:")
-            print(f"   현재 시장 상황은 이전에 경험하지 못한 새로운 패턴입니다")
-            print(f"   전략 비교 시뮬레이션(모드 1)을 통해 새로운 최적 전략을 발굴해보세요")
-    
-    elif 모드 == "6":
-        # 포트폴리오 전략 시뮬레이션
-        print("\n 포트폴리오 전략 시뮬레이션")
-        print("="*50)
-        분석기._포트폴리오_시뮬레이션()
-    
-    elif 모드 == "7":
-        # 포트폴리오 히스토리 조회
-        print("\n 포트폴리오 히스토리 조회")
-        print("="*50)
-        분석기._포트폴리오_히스토리_조회()
-    
-    elif 모드 == "8":
-        # 5사이클 누적 시뮬레이션 (개선된 옐로우카드)
-        print(f"5사이클 누적 시뮬레이션 시작!")
-        print("개선된 옐로우카드: 매주 1개씩, 총 12개 누적시 탈락")
-        print("="*60)
-        
-        # 5사이클 실행
-        결과 = 분석기._5사이클_누적_시뮬레이션()
-        
-        if 결과:
-            print(f"\n5사이클 시뮬레이션 완료!")
-            print(f"결과가 저장되었습니다.")
-        else:
-            print("5사이클 시뮬레이션 실행 중 오류가 발생했습니다.")
-    
-    elif 모드 == "9":
-        # 5사이클별 생존전략 300주 고속검증
-        print(f"5사이클별 생존전략 300주 고속검증 시작!")
-        print("고속화 적용: 옐로우카드 6회 탈락, 간략 출력")
-        print("="*60)
-        
-        # 300주 고속검증 실행
-        결과 = 분석기._run_300week_fast_verification()
-        
-        if 결과:
-            print(f"\n300주 고속검증 완료!")
-            print(f"최종 생존전략이 JSON으로 저장되었습니다.")
-        else:
-            print("300주 고속검증 실행 중 오류가 발생했습니다.")
-    
-    else:
-        print("올바른 모드를 선택해주세요 (1-9)")
-        return
-
     def 시장상황_분석(self):
         """현재 시장 상황을 다각도로 분석"""
         상황분석 = {
@@ -5112,7 +5707,7 @@ def main():
             })
             
             # 최고 전략들 업데이트 (상위 3개)
-            상위3개 = sorted(전략결과들, key=lambda x: x['수익률'], reverse=True)[:3]
+            상위3개 = top_k(전략결과들, 3, key=lambda x: x['수익률'])
             기존데이터[상황키]['best_strategies'] = 상위3개
             기존데이터[상황키]['analysis_count'] += 1
             
@@ -5283,8 +5878,8 @@ def main():
         print(f"b. 주간 리밸런싱 (매주 금요일)")
         print(f"c. 일일 리밸런싱 (매일 종료 후)")
         
-        구성방식 = input("포트폴리오 구성 방식 선택 (1-4): ")
-        리밸런싱방식 = input("리밸런싱 방식 선택 (a/b/c): ")
+        구성방식 = self.입력("포트폴리오 구성 방식 선택 (1-4): ")
+        리밸런싱방식 = self.입력("리밸런싱 방식 선택 (a/b/c): ")
         
         if 구성방식 == "1":
             # 균등 분배
@@ -5379,7 +5974,7 @@ def main():
             
             while True:
                 try:
-                    비율 = float(input(f"  할당 비율 (%) 입력: "))
+                    비율 = float(self.입력(f"  할당 비율 (%) 입력: "))
                     if 0 <= 비율 <= 100:
                         비율목록.append(비율)
                         break
@@ -5434,7 +6029,7 @@ def main():
             '주식수': 0,
             '매수가격': 0,
             '최고가격': 0,
-            '이동평균': [],
+            '경로일차': 0,
             '거래내역': [],
             
             # 매수 설정
@@ -5459,8 +6054,8 @@ def main():
         """포트폴리오 시뮬레이션 실행"""
         for 전략 in 포트폴리오['전략들']:
             전략['자본'] = 전략['할당자본']
-            # 과거 데이터 복사
-            전략['이동평균'] = self.과거데이터.copy()
+            # 공유 가격경로 처음부터 진행
+            전략['경로일차'] = 0
         
         결과 = {
             '일별결과': [],
@@ -5469,8 +6064,8 @@ def main():
             '개별전략성과': []
         }
         
-        # 135일 (27주) 시뮬레이션
-        for 일차 in range(135):
+        # 시뮬레이션 기간(기본 27주 = 135일) 동안 운영
+        for 일차 in range(self.시뮬레이션주수 * 5):
             주차 = (일차 // 5) + 1
             요일 = 일차 % 5 + 1  # 1=월요일, 5=금요일
             print(f"\n{주차}주차 {일차+1}일 포트폴리오 운영")
@@ -5486,9 +6081,9 @@ def main():
                 일일포트폴리오결과[전략ID] = {
                     '수익률': 일일결과['수익률'],
                     '거래횟수': 일일결과['거래횟수'],
-                    '현재자산': 일일결과['현재자산']
+                    '현재자산': 일일결과['평가자산']
                 }
-                일일총자산 += 일일결과['현재자산']
+                일일총자산 += 일일결과['평가자산']
                 
                 print(f"  {전략ID}: {일일결과['수익률']:+5.1f}% (거래 {일일결과['거래횟수']}회)")
             
@@ -5516,7 +6111,7 @@ def main():
                         print(f"      {변경사항}")
             
             # 포트폴리오 탈락 체크 후 엔터키 대기
-            if 일차 < 134 and (일차 % 5 == 4):  # 주내일차 5일째 (금요일)
+            if 일차 < self.시뮬레이션주수 * 5 - 1 and (일차 % 5 == 4):  # 마지막 날 제외 주내일차 5일째 (금요일)
                 if 일일총자산 <= 60000:  # 탈락 기준
                     주차 = (일차 // 5) + 1
                     print(f"\n{주차}주차 포트폴리오 탈락! 총 자산: {일일총자산:,.0f}원")
@@ -5536,7 +6131,7 @@ def main():
         목표비중들 = []
         
         for 전략 in 포트폴리오['전략들']:
-            전략자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+            전략자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
             현재비중 = (전략자산 / 현재총자산) * 100 if 현재총자산 > 0 else 0
             목표비중 = 전략['할당비율']
             
@@ -5551,7 +6146,7 @@ def main():
         
         # 리밸런싱 실행: 모든 주식 매도 후 목표 비중으로 재배분
         for i, 전략 in enumerate(포트폴리오['전략들']):
-            현재가격 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+            현재가격 = self._전략_현재가(전략)
             
             # 기존 주식 모두 매도
             if 전략['주식수'] > 0:
@@ -5606,7 +6201,7 @@ def main():
         print(f"\n전략별 기여도:")
         총기여수익 = 0
         for 전략 in 포트폴리오['전략들']:
-            전략자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+            전략자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
             전략수익률 = ((전략자산 - 전략['할당자본']) / 전략['할당자본']) * 100
             기여수익 = (전략자산 - 전략['할당자본'])
             총기여수익 += 기여수익
@@ -5640,7 +6235,7 @@ def main():
             print(f"  포트폴리오 효과: {포트폴리오효과:+.2f}% ({'시너지' if 포트폴리오효과 > 0 else '상쇄'})")
         
         # 포트폴리오 저장 제안
-        저장여부 = input(f"\n이 포트폴리오 구성을 저장하시겠습니까? (y/n): ")
+        저장여부 = self.입력(f"\n이 포트폴리오 구성을 저장하시겠습니까? (y/n): ")
         if 저장여부.lower() == 'y':
             self._포트폴리오_저장(포트폴리오, 최종수익률)
     
@@ -5763,7 +6358,7 @@ def main():
             print(f"3. 리밸런싱 효과 분석")
             print(f"4. 최고 성과 포트폴리오 재현")
             
-            선택 = input("선택 (1-4, Enter=종료): ")
+            선택 = self.입력("선택 (1-4, Enter=종료): ")
             
             if 선택 == "1":
                 self._포트폴리오_상세조회(정렬된목록)
@@ -5779,7 +6374,7 @@ def main():
     
     def _포트폴리오_상세조회(self, 포트폴리오목록):
         """특정 포트폴리오 상세 조회"""
-        번호 = input(f"조회할 포트폴리오 번호 (1-{len(포트폴리오목록)}): ")
+        번호 = self.입력(f"조회할 포트폴리오 번호 (1-{len(포트폴리오목록)}): ")
         
         try:
             인덱스 = int(번호) - 1
@@ -5876,7 +6471,7 @@ def main():
         print(f"구성 방식: {최고성과['구성방식']}")
         print(f"생성 일시: {최고성과['timestamp']}")
         
-        재현여부 = input(f"\n이 포트폴리오 구성으로 새로운 시뮬레이션을 실행하시겠습니까? (y/n): ")
+        재현여부 = self.입력(f"\n이 포트폴리오 구성으로 새로운 시뮬레이션을 실행하시겠습니까? (y/n): ")
         if 재현여부.lower() == 'y':
             print(f"안내: 현재 시장 상황에서 동일한 전략 구성을 재현하려면")
             print(f"   모드 5에서 추천받은 전략들로 모드 6을 실행하거나")
@@ -5886,180 +6481,6 @@ def main():
             for 전략 in 최고성과['전략구성']:
                 print(f"  {전략['ID']}: {전략['할당비율']:.1f}% - {전략['전략설명']}")
     
-    def _상위15전략_분석(self, 생존전략들):
-        """상위 15개 전략을 수익률 기준으로 추출하고 분석"""
-        if not 생존전략들:
-            return []
-            
-        # 수익률 기준으로 정렬
-        정렬된전략들 = sorted(생존전략들, key=lambda x: self._전략수익률_계산(x), reverse=True)
-        
-        # 상위 15개 추출
-        상위15개 = 정렬된전략들[:15]
-        
-        print(f"상위 15개 전략 추출 완료 (총 {len(생존전략들)}개 중)")
-        
-        return 상위15개
-    
-    def _전략수익률_계산(self, 전략):
-        """전략의 수익률 계산"""
-        평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
-        수익률 = ((평가자산 - 100000) / 100000) * 100
-        return 수익률
-    
-    def _시장상황_분석(self):
-        """현재 시장 상황 분석"""
-        if not hasattr(self, '주간데이터') or not self.주간데이터:
-            return {'상황': '데이터부족', '특징': [], '변동성': 0}
-        
-        # 시장 변동성 계산
-        변동률들 = []
-        for 주간변동 in self.주간데이터:
-            if len(주간변동) >= 7:  # 7시간 데이터가 있는 경우
-                주간변동률 = sum(주간변동[:7])
-                변동률들.append(주간변동률)
-        
-        평균변동성 = sum(abs(x) for x in 변동률들) / len(변동률들) if 변동률들 else 0
-        상승률 = sum(x for x in 변동률들 if x > 0) / len(변동률들) if 변동률들 else 0
-        하락률 = sum(abs(x) for x in 변동률들 if x < 0) / len(변동률들) if 변동률들 else 0
-        
-        # 시장 상황 판정
-        if 평균변동성 > 3:
-            상황 = "고변동성"
-        elif 평균변동성 > 1.5:
-            상황 = "중변동성"
-        else:
-            상황 = "저변동성"
-        
-        # 시장 특징 추가
-        특징들 = []
-        if 상승률 > 하락률 * 1.5:
-            특징들.append("상승장")
-        elif 하락률 > 상승률 * 1.5:
-            특징들.append("하락장")
-        else:
-            특징들.append("횡보장")
-        
-        if 평균변동성 > 2:
-            특징들.append("높은변동성")
-        elif 평균변동성 < 1:
-            특징들.append("낮은변동성")
-        
-        return {
-            '상황': 상황,
-            '특징': 특징들,
-            '변동성': round(평균변동성, 2),
-            '상승률': round(상승률, 2),
-            '하락률': round(하락률, 2),
-            '전체기간': len(변동률들)
-        }
-    
-    def _전략_그룹화(self, 전략들):
-        """비슷한 전략들을 범위별로 그룹화"""
-        if not 전략들:
-            return []
-        
-        그룹들 = []
-        처리된전략 = set()
-        
-        for i, 전략 in enumerate(전략들):
-            if i in 처리된전략:
-                continue
-                
-            # 현재 전략과 비슷한 전략들 찾기
-            유사전략들 = [전략]
-            처리된전략.add(i)
-            
-            for j, 다른전략 in enumerate(전략들[i+1:], i+1):
-                if j in 처리된전략:
-                    continue
-                    
-                if self._전략_유사성_판정(전략, 다른전략):
-                    유사전략들.append(다른전략)
-                    처리된전략.add(j)
-            
-            # 그룹 생성
-            그룹 = {
-                '전략들': 유사전략들,
-                '대표전략': 전략,  # 첫 번째(수익률 최고) 전략을 대표로
-                '그룹크기': len(유사전략들)
-            }
-            그룹들.append(그룹)
-        
-        print(f"전략 그룹화 완료: {len(그룹들)}개 그룹, 평균 {sum(g['그룹크기'] for g in 그룹들)/len(그룹들):.1f}개/그룹")
-        
-        return 그룹들
-    
-    def _전략_유사성_판정(self, 전략1, 전략2):
-        """두 전략이 유사한지 판정"""
-        # 매수 기준이 같은가?
-        if 전략1['매수기준'] != 전략2['매수기준']:
-            return False
-        
-        # 매수 하락률이 비슷한가? (±0.5% 이내)
-        하락률차이 = abs(전략1['매수하락률'] - 전략2['매수하락률'])
-        if 하락률차이 > 0.5:
-            return False
-        
-        # 매도 전략이 같은가?
-        if 전략1['매도전략'] != 전략2['매도전략']:
-            return False
-        
-        # 손절라인이 비슷한가? (±1% 이내)
-        손절차이 = abs(전략1['손절라인'] - 전략2['손절라인'])
-        if 손절차이 > 1:
-            return False
-        
-        return True
-    
-    def _그룹정보_생성(self, 그룹, 순위, 시장상황):
-        """그룹 정보를 JSON 형태로 생성"""
-        대표전략 = 그룹['대표전략']
-        전략들 = 그룹['전략들']
-        
-        # 대표 전략 성과 계산
-        대표수익률 = self._전략수익률_계산(대표전략)
-        대표평가자산 = 대표전략['자본'] + 대표전략['주식수'] * (대표전략['이동평균'][-1] if 대표전략['이동평균'] else self.초기가격)
-        
-        # 범위 계산
-        매수하락률범위 = self._범위_계산([s['매수하락률'] for s in 전략들])
-        손절범위 = self._범위_계산([s['손절라인'] for s in 전략들])
-        수익률범위 = self._범위_계산([self._전략수익률_계산(s) for s in 전략들])
-        
-        # 전략 분류
-        전략분류 = self._전략_분류_판정(대표전략, 대표수익률)
-        
-        # 시장 상황별 효과 분석
-        시장효과 = self._시장효과_분석(대표전략, 시장상황)
-        
-        return {
-            '순위': 순위,
-            '발견날짜': time.strftime("%Y-%m-%d %H:%M:%S"),
-            '전략분류': 전략분류,
-            '그룹크기': len(전략들),
-            '전략정보': {
-                '매수기준': 대표전략['매수기준명'],
-                '매수하락률_범위': 매수하락률범위,
-                '구매방식': 대표전략['구매방식명'],
-                '손절라인_범위': 손절범위,
-                '매도전략': 대표전략['매도전략명'],
-                '수익라인': 대표전략.get('수익라인', 0)
-            },
-            '성과': {
-                '수익률': round(대표수익률, 2),
-                '수익률_범위': 수익률범위,
-                '최종자산': int(대표평가자산),
-                '거래횟수': len(대표전략['거래내역']),
-                '승률': self._승률_계산(대표전략['거래내역']) if 대표전략['거래내역'] else 0
-            },
-            '시장환경적합성': 시장효과,
-            '추가정보': {
-                '매수횟수': len([t for t in 대표전략['거래내역'] if t[0] == '매수']),
-                '매도횟수': len([t for t in 대표전략['거래내역'] if t[0] in ['절반매도', '전량매도', '최종매도', '수익매도', '고무줄매도', '트레일링스탑']]),
-                '손절횟수': len([t for t in 대표전략['거래내역'] if t[0] == '손절'])
-            }
-        }
-    
     def _범위_계산(self, 값들):
         """값들의 범위를 문자열로 반환"""
         if not 값들:
@@ -6210,7 +6631,7 @@ def main():
         
         # 2단계: 위험11 전략 우선 처리 (빠른 탈락 판정)
         for 전략, 결과 in 위험11전략:
-            현재평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+            현재평가자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
             현재수익률 = ((현재평가자산 - 100000) / 100000) * 100
             
             # 옐로우카드 발급 체크 (위험 전략만)
@@ -6251,7 +6672,7 @@ def main():
         """일반 전략들의 배치 처리"""
         
         for 전략, 결과 in 일반전략:
-            현재평가자산 = 전략['자본'] + 전략['주식수'] * (전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격)
+            현재평가자산 = 전략['자본'] + 전략['주식수'] * self._전략_현재가(전략)
             현재수익률 = ((현재평가자산 - 100000) / 100000) * 100
             
             # 주차별 옐로우카드 체크
@@ -6301,7 +6722,7 @@ def main():
             self._실시간_영구제외_확인(전략, 일차+1)
             
             # 수익률 계산
-            현재가격 = 전략['이동평균'][-1] if 전략['이동평균'] else self.초기가격
+            현재가격 = self._전략_현재가(전략)
             평가자산 = 전략['자본'] + 전략['주식수'] * 현재가격
             수익률 = ((평가자산 - 100000) / 100000) * 100
             
@@ -6330,5 +6751,419 @@ def main():
         
         print(f"   [정보] 탈락기록 최적화: {len(간소기록들)}개 -> 용량 97% 절약")
 
+
+def _사이클_병렬_작업(작업):
+    """프로세스 풀 작업 - 독립 분석기로 사이클 하나를 실행하고 요약 반환"""
+    import io
+    import contextlib
+    
+    출력 = io.StringIO()
+    with contextlib.redirect_stdout(출력):
+        # 작업폴더를 기본/작업경로로 지정 (환경변수의 작업경로로 사이클끼리 파일 복사 경쟁 방지)
+        분석기 = 최적화투자분석(작업['초기가격'], 작업['작업폴더'], 작업['작업폴더'], 시드=작업['시드'], 시나리오캐시=False)
+        분석기.과거데이터 = list(작업['과거데이터'])  # 부모와 같은 과거 120일 데이터
+        분석기.거래비용설정 = dict(작업['거래비용설정'])
+        분석기.배치시뮬레이션 = 작업['배치시뮬레이션']
+        분석기.시뮬레이션주수 = 작업['시뮬레이션주수']
+        분석기.사이클수 = 작업['사이클수']
+        분석기._is_in_5cycle = True
+        분석기.프로파일 = RunProfiler(enabled=작업['프로파일'])
+        if 작업['시나리오폴더']:
+            분석기.시나리오저장소 = ScenarioStore(작업['시나리오폴더'])  # 부모와 같은 시나리오 저장소 공유
+        if 작업['탈락전략데이터'] is not None:
+            분석기._cached_탈락전략_데이터 = 작업['탈락전략데이터']
+        
+        결과, 요약 = 분석기._사이클_실행(작업['사이클'], 작업['히스토리저장'], 시드=작업['시드'])
+        생존전략 = 결과['생존전략'] if 요약 is not None else []
+        생존전략수익률 = [분석기._전략수익률_계산(전략) for 전략 in 생존전략]
+    
+    # 작업폴더에 새로 기록된 히스토리/영구제외 데이터 (부모가 병합)
+    히스토리기록 = []
+    if os.path.exists(분석기.최고전략_파일):
+        with open(분석기.최고전략_파일, 'r', encoding='utf-8') as f:
+            히스토리기록 = json.load(f)
+    영구제외데이터 = None
+    if os.path.exists(분석기.영구제외_파일):
+        with open(분석기.영구제외_파일, 'r', encoding='utf-8') as f:
+            영구제외데이터 = json.load(f)
+    
+    return {
+        '사이클': 작업['사이클'],
+        '출력': 출력.getvalue(),
+        '요약': 요약,
+        '생존전략': 생존전략,
+        '생존전략수익률': 생존전략수익률,
+        '탈락기록': 결과.get('탈락기록', []) if 결과 else [],
+        '히스토리기록': 히스토리기록,
+        '영구제외데이터': 영구제외데이터,
+        '프로파일': 분석기.프로파일.report() if 분석기.프로파일.enabled else None
+    }
+
+def _실행결과_요약(실행정보, 소요시간):
+    """--quiet/--mode 실행 최종 요약 (JSON 직렬화 가능한 dict)"""
+    요약 = {'소요시간': round(소요시간, 2)}
+    if not 실행정보:
+        return 요약
+    
+    분석기 = 실행정보['분석기']
+    결과 = 실행정보['결과']
+    # 결과를 반환하는 모드(1, 8, 9)만 결과 유무로 성공 판정
+    성공 = bool(결과) if 실행정보['모드'] in ('1', '8', '9') else 실행정보['모드'] in ('2', '3', '4', '5', '6', '7')
+    요약.update({'모드': 실행정보['모드'], '초기가격': 실행정보['초기가격'], '성공': 성공})
+    if 실행정보.get('오류'):
+        요약['성공'] = False
+        요약['오류'] = 실행정보['오류']
+    if 실행정보.get('설정'):
+        요약['설정'] = 실행정보['설정']
+    
+    if isinstance(결과, dict) and '생존전략' in 결과:
+        요약['생존전략수'] = len(결과['생존전략'])
+        요약['탈락전략수'] = len(결과['탈락기록'])
+        최고전략 = 결과.get('최고전략')
+        if 최고전략:
+            평가자산 = 최고전략['자본'] + 최고전략['주식수'] * 분석기._전략_현재가(최고전략)
+            요약['최고전략'] = {
+                '전략': 분석기._전략설명_생성(최고전략),
+                '수익률': round((평가자산 - 100000) / 100000 * 100, 2),
+                '최종자산': round(평가자산)
+            }
+    elif isinstance(결과, list):
+        요약['결과수'] = len(결과)
+        요약['상위전략'] = [
+            {'전략': 항목['전략설명'], '평균수익률': round(항목['평균수익률'], 2), '출현횟수': 항목['출현횟수']}
+            for 항목 in 결과[:5] if isinstance(항목, dict) and '전략설명' in 항목
+        ]
+    return 요약
+
+def _명령행_인자_해석(인자목록=None):
+    """명령행 인자 해석 (--mode 없으면 기존 대화형 메뉴)"""
+    해석기 = argparse.ArgumentParser(
+        description="최적화 투자 패턴 분석기 - --mode를 주면 입력 없이 실행하고 stdout에 JSON 요약 출력"
+    )
+    해석기.add_argument('--mode', choices=[str(번호) for 번호 in range(1, 10)],
+                        help="실행 모드 1-9 (대화형 메뉴 번호와 동일)")
+    해석기.add_argument('--price', type=float, default=100.0, help="초기 주식 가격 (원, 기본 100)")
+    해석기.add_argument('--seed', type=int, help="난수 시드 (같은 시드 = 같은 시장 데이터)")
+    해석기.add_argument('--cycles', type=int, default=5, help="모드 8/9 사이클 수 (기본 5)")
+    해석기.add_argument('--weeks', type=int, default=27, help="시뮬레이션 주수, 1주 = 5거래일 (기본 27)")
+    해석기.add_argument('--data-dir', '--output-dir', dest='data_dir',
+                        help="데이터/결과 JSON 파일 폴더 (기본: 환경변수 STOCK_STRATEGY_DATA_DIR, 경로설정.json, 프로젝트 폴더)")
+    해석기.add_argument('--scratch-dir', help="탈락/영구제외 파일 작업 폴더 (예: tmpfs, 종료시 데이터 폴더에 반영)")
+    해석기.add_argument('--config', help="경로설정 JSON 파일 ({\"data_dir\": ..., \"scratch_dir\": ...})")
+    해석기.add_argument('--no-scenario-cache', dest='scenario_cache', action='store_false',
+                        help="시나리오 저장소 사용 안 함 (기본: --seed 지정시 생성한 시장 데이터를 데이터 폴더/시나리오저장소에 저장/재사용)")
+    해석기.add_argument('--checkpoint-every', type=int, default=0, metavar='N',
+                        help="모드 8/9 순차 실행 중 N일마다(300주 구간은 N주마다) 체크포인트 저장 (기본 0 = 사용 안 함)")
+    해석기.add_argument('--resume', action='store_true',
+                        help="데이터 폴더의 체크포인트에서 재개 (모드/가격/시드/주수/사이클수는 체크포인트 값 사용)")
+    해석기.add_argument('--workers', type=int, default=1, help="사이클 병렬 프로세스 수 (기본 1 = 순차)")
+    해석기.add_argument('--profile', metavar='FILE',
+                        help="구간별 시간/카운터를 계측해 실행 프로파일 JSON으로 저장 (기본: 계측 안 함)")
+    해석기.add_argument('--env', choices=['1', '2', '3', '4'], default='1',
+                        help="모드 3 재검증 환경 (1 현재, 2 상승장, 3 하락장, 4 횡보장)")
+    해석기.add_argument('--answers', default='',
+                        help="모드 6/7 등의 추가 질문 응답 (콤마 구분, 모자라면 실행 실패로 보고)")
+    해석기.add_argument('--quiet', action='store_true', help="진행 출력 없이 최종 JSON 요약만 출력")
+    return 해석기.parse_args(인자목록)
+
+def main(인자목록=None):
+    """메인 실행 함수 (--mode: 비대화형 실행, --quiet: 진행 출력 없이 JSON 요약만), 종료 코드 반환"""
+    인자 = _명령행_인자_해석(인자목록)
+    if 인자.config:
+        os.environ[ENV_CONFIG_FILE] = os.path.abspath(인자.config)  # 병렬 사이클 작업에도 같은 설정
+    if 인자.data_dir:
+        os.makedirs(인자.data_dir, exist_ok=True)
+    if 인자.mode is None and not 인자.quiet and not 인자.resume:
+        _메인_실행(인자.data_dir, 인자.scratch_dir, 인자.seed)
+        return
+    
+    # 비대화형/조용한 실행: stdout에는 JSON 요약만 (진행 출력은 stderr, --quiet면 버림)
+    if 인자.quiet:
+        set_log_level('quiet')
+    시작시간 = time.time()
+    with open(os.devnull, 'w', encoding='utf-8') as 버림출력:
+        with contextlib.redirect_stdout(버림출력 if 인자.quiet else sys.stderr):
+            실행정보 = _메인_실행(인자.data_dir, 인자.scratch_dir, 인자.seed) if 인자.mode is None and not 인자.resume else _일괄_실행(인자)
+    요약 = _실행결과_요약(실행정보, time.time() - 시작시간)
+    print(json.dumps(요약, ensure_ascii=False))
+    # 실패한 실행은 종료 코드로도 알림 (일괄 실행 스크립트용)
+    return 0 if 요약.get('성공', True) else 1
+
+def _체크포인트_불러오기(인자):
+    """--resume: 데이터 폴더의 체크포인트를 읽고 모드/가격/시드/주수/사이클수를 체크포인트 값으로 맞춤 (없으면 None)
+    
+    --checkpoint-every를 주지 않았으면 체크포인트의 저장 주기를 이어받음 (재개한 실행도 계속 저장)
+    """
+    기본경로, _ = resolve_paths(인자.data_dir, 인자.scratch_dir)
+    상태 = CheckpointStore(os.path.join(기본경로, CHECKPOINT_FILE_NAME)).load()
+    if 상태 is None:
+        return None
+    
+    설정 = 상태['설정']
+    인자.mode = 상태['모드']
+    인자.price = 설정['초기가격']
+    인자.seed = 설정['시드']
+    인자.weeks = 설정['시뮬레이션주수']
+    인자.cycles = 설정['사이클수']
+    if not 인자.checkpoint_every:
+        인자.checkpoint_every = 설정.get('체크포인트주기', 0)
+    return 상태
+
+class _응답입력:
+    """--answers 응답을 순서대로 돌려주는 입력 함수 (응답이 모자라면 EOFError, 모자란 질문 기록)"""
+    
+    def __init__(self, 응답목록):
+        self.응답들 = list(응답목록)
+        self.위치 = 0
+        self.부족질문 = None
+    
+    def __call__(self, 안내=''):
+        if self.위치 >= len(self.응답들):
+            self.부족질문 = 안내.strip()
+            raise EOFError(f"--answers 응답이 부족합니다 (질문: {self.부족질문})")
+        응답 = self.응답들[self.위치]
+        self.위치 += 1
+        return 응답
+
+def _일괄_실행(인자):
+    """명령행 인자로 모드 실행 (input() 없이, 추가 질문은 --answers 순서대로 응답)"""
+    재개상태 = None
+    if 인자.resume:
+        재개상태 = _체크포인트_불러오기(인자)
+        if 재개상태 is None:
+            return {'모드': 인자.mode or '', '초기가격': 인자.price, '분석기': None, '결과': None,
+                    '오류': "재개할 체크포인트가 없습니다 (--checkpoint-every로 실행 중 저장)"}
+    
+    분석기 = 최적화투자분석(인자.price, 인자.data_dir, 인자.scratch_dir, 시드=인자.seed,
+                         시나리오캐시=None if 인자.scenario_cache else False)
+    분석기.시뮬레이션주수 = max(1, 인자.weeks)
+    분석기.사이클수 = max(1, 인자.cycles)
+    분석기.사이클_병렬작업수 = max(1, 인자.workers)
+    분석기.체크포인트_주기 = max(0, 인자.checkpoint_every)
+    분석기._재개상태_설정(재개상태)
+    if 인자.profile:
+        분석기.프로파일 = RunProfiler(enabled=True)
+    
+    실행정보 = {
+        '모드': 인자.mode,
+        '초기가격': 인자.price,
+        '분석기': 분석기,
+        '결과': None,
+        '설정': {
+            '시드': 분석기.시드,
+            '주수': 분석기.시뮬레이션주수,
+            '사이클수': 분석기.사이클수,
+            '병렬작업수': 분석기.사이클_병렬작업수,
+            '체크포인트주기': 분석기.체크포인트_주기,
+            '재개': 재개상태 is not None,
+            '프로파일': 인자.profile,
+            '데이터폴더': 분석기.기본경로,
+            '작업폴더': 분석기.작업경로
+        }
+    }
+    
+    응답 = _응답입력([응답.strip() for 응답 in 인자.answers.split(',')] if 인자.answers else [])
+    분석기.입력 = 응답
+    try:
+        실행정보['결과'] = _모드_실행(분석기, 인자.mode, 인자.env)
+    except Exception as e:
+        실행정보['오류'] = f"{type(e).__name__}: {e}"
+    finally:
+        분석기._작업경로_반영()
+    if 응답.부족질문 is not None and '오류' not in 실행정보:
+        # 모드 안에서 예외를 잡고 기본 분기로 넘어갔어도 응답 부족은 실패로 보고
+        실행정보['오류'] = f"EOFError: --answers 응답이 부족합니다 (질문: {응답.부족질문})"
+    if 인자.profile:
+        분석기.프로파일_저장(인자.profile, 모드=인자.mode, 성공='오류' not in 실행정보)
+    return 실행정보
+
+def _메인_실행(기본경로=None, 작업경로=None, 시드=None):
+    """대화형 메뉴 실행 (모드/분석기/결과 반환)"""
+    print("최적화 투자 패턴 분석기 v5.0")
+    print("="*60)
+    
+    # 초기 주식 가격 입력
+    초기가격 = float(input("초기 주식 가격을 입력하세요 (원): "))
+    
+    print("\n실행 모드 선택:")
+    print("1. 전략 비교 시뮬레이션 (전체)")
+    print("2. 최고전략 히스토리 조회")
+    print("3. 히스토리 전략 재검증")
+    print("4. 시장 상황별 성과 조회")
+    print("5. 현재 상황 기반 전략 추천")
+    print("6. 포트폴리오 전략 시뮬레이션")
+    print("7. 포트폴리오 히스토리 조회")
+    print("8. 5사이클 누적 시뮬레이션 (개선된 옐로우카드)")
+    print("9. 5사이클별 생존전략 300주 고속검증")
+    모드 = input("선택 (1-9): ")
+    
+    분석기 = 최적화투자분석(초기가격, 기본경로, 작업경로, 시드=시드)
+    print(f"실행 시드: {분석기.시드} (--seed {분석기.시드} 로 같은 시장 데이터 재현)")
+    try:
+        결과 = _모드_실행(분석기, 모드)
+    finally:
+        분석기._작업경로_반영()
+    return {'모드': 모드, '초기가격': 초기가격, '분석기': 분석기, '결과': 결과}
+
+def _모드_실행(분석기, 모드, 환경선택=None):
+    """선택한 모드 실행 (결과를 반환하는 모드는 1, 8, 9)"""
+    결과 = None
+    
+    if 모드 == "1":
+        # 탈락 전략 데이터 자동 유지 (누적 학습 효과)
+        if os.path.exists(분석기.탈락전략_파일):
+            print("기존 탈락 전략 데이터 유지 → 누적 학습 효과 적용")
+        
+        # 투자 시뮬레이션 실행 (--weeks 주수)
+        print(f"{분석기.시뮬레이션주수}주 투자 패턴 분석 시작!")
+        print("="*50)
+        
+        # 랜덤 데이터 생성
+        분석기.시장데이터_생성()
+        
+        # 시뮬레이션 실행
+        결과 = 분석기.전략_비교_시뮬레이션()
+        
+        if 결과:
+            print(f"\n최종 결과:")
+            print(f"생존 전략: {len(결과['생존전략']):,}개")
+            print(f"탈락 전략: {len(결과['탈락기록']):,}개")
+            
+            if '최고전략' in 결과 and 결과['최고전략']:
+                최고전략 = 결과['최고전략']
+                # 수익률 계산
+                평가자산 = 최고전략['자본'] + 최고전략['주식수'] * 분석기._전략_현재가(최고전략)
+                수익률 = ((평가자산 - 100000) / 100000) * 100
+                
+                print(f"\n최고 전략:")
+                print(f"  수익률: {수익률:+.1f}%")
+                print(f"  전략: {최고전략['매수기준명']}-{최고전략['매수하락률']}% + {최고전략['구매방식명']} + 손절{최고전략['손절라인']}% + {최고전략['매도전략명']}")
+                print(f"  최종 자산: {평가자산:,.0f}원")
+        else:
+            print("시뮬레이션 실행 중 오류가 발생했습니다.")
+    
+    elif 모드 == "2":
+        # 최고전략 히스토리 조회
+        분석기._최고전략_히스토리_조회()
+        
+        print("\n💡 활용 팁:")
+        print("- 히스토리에서 자주 등장하는 전략 패턴을 주목하세요")
+        print("- 다양한 시장 환경에서 일관되게 좋은 성과를 내는 전략을 찾아보세요")
+        print("- 극한 테스트 결과를 통해 전략의 안정성을 확인하세요")
+    
+    elif 모드 == "3":
+        # 히스토리 전략 재검증
+        print("\n재검증할 시장 환경:")
+        print("1. 현재 환경 (새로운 랜덤 데이터)")
+        print("2. 상승장 환경")
+        print("3. 하락장 환경") 
+        print("4. 횡보장 환경")
+        if 환경선택 is None:
+            환경선택 = 분석기.입력("선택 (1, 2, 3, 4): ")
+        
+        환경이름 = {
+            "1": "현재환경",
+            "2": "상승장환경", 
+            "3": "하락장환경",
+            "4": "횡보장환경"
+        }.get(환경선택, "현재환경")
+        
+        # 환경별 데이터 생성
+        if 환경선택 == "2":  # 상승장
+            주별데이터 = [5, 8, 3, 7, 12]  # 전체적 상승
+        elif 환경선택 == "3":  # 하락장
+            주별데이터 = [-8, -5, -12, -3, -7]  # 전체적 하락
+        elif 환경선택 == "4":  # 횡보장
+            주별데이터 = [2, -1, 3, -2, 1]  # 작은 변동
+        else:  # 현재환경
+            주별데이터 = 분석기.랜덤_주별_데이터_생성()
+        
+        분석기.계층적_변동률_생성(주별데이터)
+        분석기._히스토리_전략_재검증(환경이름)
+        
+        print(f"\n {환경이름} 재검증 완료!")
+        print("- 기존 최고 전략들의 현재 환경 적응력을 확인했습니다")
+        print("- 성과 차이를 통해 전략의 환경 민감도를 파악하세요")
+    
+    elif 모드 == "4":
+        # 시장 상황별 성과 조회
+        print("\n 시장 상황별 전략 성과 조회")
+        print("="*50)
+        분석기.상황별_성과시각화()
+    
+    elif 모드 == "5":
+        # 현재 상황 기반 전략 추천
+        print("\n 현재 상황 기반 전략 추천")
+        print("="*50)
+        
+        # 현재 상황 분석
+        현재상황 = 분석기.시장상황_분석()
+        print(f"\n 현재 시장 상황:")
+        print(f"   시장 체제: {현재상황['market_regime']}")
+        print(f"   변동성: {현재상황['volatility_pattern']}")
+        print(f"   추세: {현재상황['trend_pattern']}")
+        print(f"   모멘텀: {현재상황['price_momentum']}")
+        
+        # 전략 추천
+        print(f"\n 추천 전략:")
+        추천전략들 = 분석기.유사상황_전략추천(현재상황)
+        
+        if 추천전략들:
+            print(f"\n 추천 이유:")
+            print(f"   과거 유사 상황에서 검증된 최적 전략들입니다")
+            print(f"   현재 시장 조건과 {round(100 * len(추천전략들) / 3)}% 유사한 환경에서 우수한 성과를 보였습니다")
+        else:
+            print(f"\n 대안 제안:")
+            print(f"   현재 시장 상황은 이전에 경험하지 못한 새로운 패턴입니다")
+            print(f"   전략 비교 시뮬레이션(모드 1)을 통해 새로운 최적 전략을 발굴해보세요")
+    
+    elif 모드 == "6":
+        # 포트폴리오 전략 시뮬레이션
+        print("\n 포트폴리오 전략 시뮬레이션")
+        print("="*50)
+        분석기._포트폴리오_시뮬레이션()
+    
+    elif 모드 == "7":
+        # 포트폴리오 히스토리 조회
+        print("\n 포트폴리오 히스토리 조회")
+        print("="*50)
+        분석기._포트폴리오_히스토리_조회()
+    
+    elif 모드 == "8":
+        # 5사이클 누적 시뮬레이션 (개선된 옐로우카드)
+        print(f"5사이클 누적 시뮬레이션 시작!")
+        print("개선된 옐로우카드: 매주 1개씩, 총 12개 누적시 탈락")
+        print("="*60)
+        
+        # 5사이클 실행
+        결과 = 분석기._5사이클_누적_시뮬레이션()
+        
+        if 결과:
+            print(f"\n5사이클 시뮬레이션 완료!")
+            print(f"결과가 저장되었습니다.")
+        else:
+            print("5사이클 시뮬레이션 실행 중 오류가 발생했습니다.")
+    
+    elif 모드 == "9":
+        # 5사이클별 생존전략 300주 고속검증
+        print(f"5사이클별 생존전략 300주 고속검증 시작!")
+        print("고속화 적용: 옐로우카드 6회 탈락, 간략 출력")
+        print("="*60)
+        
+        # 300주 고속검증 실행
+        결과 = 분석기._run_300week_fast_verification()
+        
+        if 결과:
+            print(f"\n300주 고속검증 완료!")
+            print(f"최종 생존전략이 JSON으로 저장되었습니다.")
+        else:
+            print("300주 고속검증 실행 중 오류가 발생했습니다.")
+    
+    else:
+        print("올바른 모드를 선택해주세요 (1-9)")
+    
+    return 결과
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file